@@ -0,0 +1,135 @@
+"""Time rendering the full channels list, per-item (before) against batched (now).
+
+    python benchmarks/bench_channel_render.py [--repeat 20] [--channels resources/channels.json]
+
+The xbmc modules come from kodi_stubs, which count calls into Kodi, so the
+timings cover the addon's own Python work per listing and the call counts
+show how many round trips into Kodi each path makes.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from dataclasses import asdict
+from urllib.parse import urlencode
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.abspath(os.path.join(BENCH_DIR, os.pardir, 'plugin.video.dlv2'))
+sys.path.insert(0, ADDON_DIR)
+
+
+def install_stubs():
+    sys.path.insert(0, os.path.join(BENCH_DIR, 'kodi_stubs'))
+    sys.argv = ['plugin://plugin.video.dlv2/', '1', '?mode=channels']
+
+
+def per_item_channels(channels: list, saved_favs: list):
+    """get_channels, create_listitem and set_info as they were before batching.
+    saved_favs are [title, link] pairs, as read_favourites returned them."""
+    import xbmc
+    import xbmcgui
+    import xbmcplugin
+    import variables as var
+    from models import Item, Channel
+
+    def set_info(liz, infolabels, cast=None):
+        cast = cast or []
+        i = liz.getVideoInfoTag()
+        i.setMediaType(infolabels.get("mediatype", "video"))
+        i.setTitle(infolabels.get("title", "Unknown"))
+        i.setPlot(infolabels.get("plot", infolabels.get("title", "")))
+        i.setTagLine(infolabels.get("tagline", ""))
+        i.setPremiered(infolabels.get("premiered", ""))
+        i.setGenres(infolabels.get("genre", []))
+        i.setMpaa(infolabels.get("mpaa", ""))
+        i.setDirectors(infolabels.get("director", []))
+        i.setWriters(infolabels.get("writer", []))
+        i.setRating(infolabels.get("rating", 0))
+        i.setVotes(infolabels.get("votes", 0))
+        i.setStudios(infolabels.get("studio", []))
+        i.setCountries(infolabels.get("country", []))
+        i.setSet(infolabels.get("set", ""))
+        i.setTvShowStatus(infolabels.get("status", ""))
+        i.setDuration(infolabels.get("duration", 0))
+        i.setTrailer(infolabels.get("trailer", ""))
+        i.setCast([xbmc.Actor(name=a.get("name", "")) for a in cast])
+
+    def url_encode(item):
+        return urlencode({k: v for k, v in asdict(item).items() if v})
+
+    def create_listitem(item):
+        is_folder = item.type == 'dir'
+        list_item = xbmcgui.ListItem(label=item.title)
+        list_item.setArt({'thumb': item.thumbnail, 'icon': item.thumbnail, 'poster': item.thumbnail, 'fanart': item.fanart})
+        set_info(list_item, {'mediatype': 'video', 'title': item.title, 'plot': item.title})
+        if is_folder is False and item.is_media is True and item.is_search is False:
+            list_item.setProperty('IsPlayable', 'true')
+        list_item.addContextMenuItems(item.contextmenu)
+        xbmcplugin.addDirectoryItem(var.handle, f'{var.plugin_url}?{url_encode(item)}', list_item, is_folder)
+
+    password = var.get_setting('adult_pw')
+    for item in channels:
+        title = item['title']
+        if '18+' in title and password != 'xxXXxx':
+            continue
+        link = item['link']
+        if link not in str(saved_favs):
+            cm_label, cm_mode = 'Add to favourite channels', 'add_fav'
+        else:
+            cm_label, cm_mode = 'Remove from favourite channels', 'remove_fav'
+        cm_url = f'RunPlugin({var.plugin_url}?{url_encode(Item(title=title, mode=cm_mode, link=link))})'
+        create_listitem(Channel(title=title, link=json.dumps([[title, link]]), contextmenu=[(cm_label, cm_url)]))
+
+
+def batched_channels(channels: list, saved_favs: list):
+    """main.get_channels, with the store reads answering as they would for
+    channels: read_channels leaves out the adult ones in SQL."""
+    import data
+    import main
+    show_adult = data.show_adult()
+    visible = [c for c in channels if show_adult or '18+' not in c['title']]
+    data.read_channels = lambda: visible
+    data.read_favourite_links = lambda: {link for _, link in saved_favs}
+    main.get_channels()
+
+
+def measure(render, channels: list, saved_favs: list, repeat: int) -> dict:
+    from xbmc import calls
+    calls.clear()
+    render(channels, saved_favs)
+    counted = dict(calls)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(channels, saved_favs)
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        'median_ms': round(statistics.median(times), 2),
+        'min_ms': round(min(times), 2),
+        'listitems': counted.get('ListItem', 0),
+        'info_setters': sum(v for k, v in counted.items() if k.startswith('InfoTagVideo.')),
+        'add_calls': counted.get('addDirectoryItem', 0) + counted.get('addDirectoryItems', 0)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--channels', default=os.path.join(ADDON_DIR, 'resources', 'channels.json'))
+    parser.add_argument('--favourites', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    install_stubs()
+    with open(args.channels, 'r', encoding='utf-8') as f:
+        channels = json.load(f)
+    saved_favs = [[c['title'], c['link']] for c in channels[::max(1, len(channels) // args.favourites)]]
+
+    print(f'{len(channels)} channels, {len(saved_favs)} favourites, {args.repeat} runs')
+    for name, render in (('per-item', per_item_channels), ('batched', batched_channels)):
+        print(f'{name:>9}: {json.dumps(measure(render, channels, saved_favs, args.repeat))}')
+
+
+if __name__ == '__main__':
+    main()
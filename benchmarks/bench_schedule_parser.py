@@ -0,0 +1,149 @@
+"""Compare the streaming ScheduleParser with the old BeautifulSoup extraction.
+
+    python benchmarks/bench_schedule_parser.py [--html index.php] [--days 3] [--events 400]
+
+Without --html a synthetic index.php with the same markup is generated.
+Each parser runs in its own subprocess so peak RSS is not shared, and the
+two outputs are checked to serialize to identical json.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from urllib.parse import urlparse, parse_qsl
+
+ADDON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'plugin.video.dlv2')
+sys.path.insert(0, os.path.abspath(ADDON_DIR))
+
+CHUNK_SIZE = 16384
+
+
+def bs4_extract(html: str) -> dict:
+    """The fetch_schedule body as it was before the streaming parser."""
+    from bs4 import BeautifulSoup
+    schedule_dict = {}
+    soup = BeautifulSoup(html, 'html.parser')
+    for schedule in soup.select('.schedule__day'):
+        if categories := schedule.find_all(class_='schedule__category is-expanded'):
+            s_date = schedule.select_one('.schedule__dayTitle').get_text(strip=True)
+            s_date = s_date.split(' -', 1)[0].strip()
+            dict_date = schedule_dict[s_date] = {}
+        else:
+            continue
+        for cat in categories:
+            cat_name = cat.select_one('.card__meta').get_text(strip=True)
+            events = dict_date[cat_name] = []
+            for event in cat.select('.schedule__event'):
+                e_time = event.select_one('.schedule__time').get_text(strip=True)
+                title = event.select_one('.schedule__eventTitle').get_text(strip=True)
+                channels = []
+                for channel in event.select_one('.schedule__channels').find_all('a'):
+                    link = f"https://dlhd.dad{channel['href']}"
+                    channel_id = dict(parse_qsl(urlparse(link).query))['id']
+                    channels.append({
+                        'channel_name': channel.get_text(strip=True),
+                        'channel_id': channel_id
+                    })
+                events.append({
+                    'time': e_time,
+                    'event': title,
+                    'channels': channels,
+                    'channels2': []
+                })
+    return schedule_dict
+
+
+def stream_extract(html: str) -> dict:
+    from schedule_parser import parse_schedule
+    return parse_schedule(html[i:i + CHUNK_SIZE] for i in range(0, len(html), CHUNK_SIZE))
+
+
+def generate(days: int, events: int, seed: int=1) -> str:
+    rnd = random.Random(seed)
+    sports = ['Soccer', 'Tennis', 'Basketball', 'Ice Hockey', 'Cricket', 'Motorsport', 'Darts', 'Rugby Union']
+    teams = ['Arsenal', 'Chelsea', 'Real Madrid', 'Bayern München', 'Inter &amp; Co', 'Boca Juniors', 'Lakers', 'Celtics']
+    out = ['<!DOCTYPE html><html><head><meta charset="utf-8"><title>Schedule</title>',
+           '<script>var x = "<div class=\\"schedule__day\\">";</script></head><body><main>']
+    for d in range(days):
+        out.append('<div class="schedule__day">')
+        out.append(f'<div class="schedule__dayTitle">Saturday {18 + d}th Oct 2025 - Schedule Time UK GMT</div>')
+        for sport in sports:
+            expanded = ' is-expanded' if rnd.random() > 0.1 else ''
+            out.append(f'<div class="schedule__category{expanded}"><div class="schedule__catHeader">')
+            out.append(f'<div class="card__meta"> {sport} <!-- c --></div></div><div class="schedule__events">')
+            for _ in range(events // len(sports)):
+                home, away = rnd.sample(teams, 2)
+                out.append('<div class="schedule__event"><div class="schedule__eventHeader">')
+                out.append(f'<span class="schedule__time" data-time="x">{rnd.randint(0, 23):02d}:{rnd.choice(["00", "15", "30", "45"])}</span>')
+                out.append(f'<span class="schedule__eventTitle">{home} vs <b>{away}</b></span></div>')
+                out.append('<div class="schedule__channels">')
+                for _ in range(rnd.randint(1, 5)):
+                    cid = rnd.randint(1, 900)
+                    out.append(f'<a href="/watch.php?id={cid}" target="_blank" rel="noopener">Channel {cid}<br> HD</a>')
+                out.append('</div></div>')
+            out.append('</div></div>')
+        out.append('</div>')
+    out.append('</main></body></html>')
+    return '\n'.join(out)
+
+
+def run_one(name: str, path: str):
+    html = open(path, encoding='utf-8').read()
+    extract = {'bs4': bs4_extract, 'stream': stream_extract}[name]
+    extract(html[:2000])
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = extract(html)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        'elapsed': elapsed,
+        'peak_alloc': peak,
+        'max_rss_kb': rss,
+        'output': json.dumps(result, indent=2)
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--html')
+    parser.add_argument('--days', type=int, default=3)
+    parser.add_argument('--events', type=int, default=400)
+    parser.add_argument('--run', choices=('bs4', 'stream'))
+    args = parser.parse_args()
+    if args.run:
+        run_one(args.run, args.html)
+        return
+
+    path = args.html
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schedule_synthetic.html')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(generate(args.days, args.events))
+    results = {}
+    for name in ('bs4', 'stream'):
+        out = subprocess.run(
+            [sys.executable, __file__, '--run', name, '--html', path],
+            check=True, capture_output=True, text=True
+        ).stdout
+        results[name] = json.loads(out)
+
+    print(f'{"parser":<8} {"time ms":>10} {"peak alloc KiB":>15} {"max RSS KiB":>12}')
+    for name, r in results.items():
+        print(f'{name:<8} {r["elapsed"] * 1000:>10.1f} {r["peak_alloc"] / 1024:>15.0f} {r["max_rss_kb"]:>12}')
+    same = results['bs4']['output'] == results['stream']['output']
+    print(f'identical json: {same}')
+    if args.html is None:
+        os.remove(path)
+    sys.exit(0 if same else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+"""Offline benchmark and regression suite for the scrapers, store, listings and resolver.
+
+    python benchmarks/bench_suite.py [--repeat 10] [--only resolve_link] [--save-baseline]
+
+Runs against the Kodi stubs in kodi_stubs and the fixtures served by
+standin.py, so neither Kodi nor the live site is needed. Each benchmark is
+checked for a sane result, timed over --repeat runs after a warm-up and run
+once more under tracemalloc for its peak allocation.
+
+--save-baseline writes the results to --baseline. Later runs compare against
+it and exit 1 when a median or a peak grows by more than --tolerance.
+Baselines are only comparable on the machine that recorded them.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.abspath(os.path.join(BENCH_DIR, os.pardir, 'plugin.video.dlv2'))
+sys.path[:0] = [os.path.join(BENCH_DIR, 'kodi_stubs'), ADDON_DIR]
+
+import xbmcaddon
+import xbmcgui
+import xbmcplugin
+from standin import StandIn, route
+
+PLAYER_URL = 'https://dlhd.dad/stream/stream-51.php'
+SEARCH_QUERY = 'real madrid'
+MIN_REGRESSION_MS = 2.0
+
+
+def setup(standin: StandIn):
+    sys.argv = ['plugin://plugin.video.dlv2/', '1', '']
+    xbmcaddon.Addon()
+    xbmcaddon.settings.update(resolve_cache='false', trace_hops='false', adult_pw='')
+    xbmcgui.input_text = SEARCH_QUERY
+    import functions as func
+    import session
+    route(session.get_session(), standin.url)
+    func.write_schedule()
+    func.write_channels()
+    # fetch_* only read the page validators; without them every run is a full download
+    func.get_store().set_meta('schedule_page', '{}')
+    func.get_store().set_meta('channels_page', '{}')
+
+
+def bench_fetch_schedule():
+    import functions as func
+    schedule, validators = func.fetch_schedule()
+    assert schedule and validators, 'no schedule parsed'
+    return sum(len(events) for day in schedule.values() for events in day.values())
+
+
+def bench_fetch_channels():
+    import functions as func
+    channels, validators = func.fetch_channels()
+    assert channels and validators, 'no channels parsed'
+    return len(channels)
+
+
+def bench_search():
+    import data
+    results = data.get_search_results()
+    assert results['events'], 'search found no events'
+    return len(results['events']) + len(results['channels'])
+
+
+def bench_get_channels():
+    import main
+    del xbmcplugin.items[:]
+    main.get_channels()
+    assert xbmcplugin.items, 'no channels listed'
+    return len(xbmcplugin.items)
+
+
+def bench_channel_page():
+    import main
+    del xbmcplugin.items[:]
+    main.get_channel_page('S', 0)
+    assert xbmcplugin.items, 'no channels in bucket S'
+    return len(xbmcplugin.items)
+
+
+def bench_resolve_link():
+    import functions as func
+    m3u8 = func.resolve_link(PLAYER_URL)
+    assert m3u8 and m3u8.startswith('https://zekonew.newkso.ru/zeko/premium51/mono.m3u8|'), m3u8
+    return 1
+
+
+BENCHMARKS = {
+    'fetch_schedule': bench_fetch_schedule,
+    'fetch_channels': bench_fetch_channels,
+    'get_search_results': bench_search,
+    'get_channels': bench_get_channels,
+    'get_channel_page': bench_channel_page,
+    'resolve_link': bench_resolve_link
+}
+
+
+def measure(fn, repeat: int) -> dict:
+    items = fn()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'items': items,
+        'median_ms': round(statistics.median(times), 2),
+        'p95_ms': round(sorted(times)[max(0, int(len(times) * 0.95 + 0.5) - 1)], 2),
+        'peak_kib': round(peak / 1024, 1)
+    }
+
+
+def regressions(results: dict, baseline: dict, tolerance: float) -> list:
+    found = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        limit = base['median_ms'] * (1 + tolerance)
+        if result['median_ms'] > limit and result['median_ms'] - base['median_ms'] > MIN_REGRESSION_MS:
+            found.append(f"{name}: median {result['median_ms']} ms, baseline {base['median_ms']} ms")
+        if result['peak_kib'] > base['peak_kib'] * (1 + tolerance):
+            found.append(f"{name}: peak {result['peak_kib']} KiB, baseline {base['peak_kib']} KiB")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--only', action='append', choices=sorted(BENCHMARKS))
+    parser.add_argument('--baseline', default=os.path.join(BENCH_DIR, 'baseline.json'))
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = {}
+    with StandIn() as standin:
+        setup(standin)
+        for name in args.only or BENCHMARKS:
+            results[name] = measure(BENCHMARKS[name], args.repeat)
+
+    print(f'{"benchmark":<20} {"items":>6} {"median ms":>10} {"p95 ms":>9} {"peak KiB":>10}')
+    for name, r in results.items():
+        print(f'{name:<20} {r["items"]:>6} {r["median_ms"]:>10.2f} {r["p95_ms"]:>9.2f} {r["peak_kib"]:>10.1f}')
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f'baseline saved to {args.baseline}')
+        return
+    if not os.path.exists(args.baseline):
+        print('no baseline yet, run with --save-baseline to record one')
+        return
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        found = regressions(results, json.load(f), args.tolerance)
+    for line in found:
+        print(f'REGRESSION {line}')
+    if not found:
+        print(f'no regressions against {args.baseline} (tolerance {args.tolerance:.0%})')
+    sys.exit(1 if found else 0)
+
+
+if __name__ == '__main__':
+    main()
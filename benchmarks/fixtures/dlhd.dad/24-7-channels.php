@@ -0,0 +1,892 @@
+<!DOCTYPE html><html><head><meta charset="utf-8"><title>24/7 Channels</title></head><body><script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<main><div class="grid">
+<a class="card" href="/watch.php?id=51" data-title="abc usa"><div class="card__title">ABC USA</div><div class="card__meta">ID: 51</div></a>
+<a class="card" href="/watch.php?id=206" data-title="ahc (american heroes channel)"><div class="card__title">AHC (American Heroes Channel)</div><div class="card__meta">ID: 206</div></a>
+<a class="card" href="/watch.php?id=283" data-title="antenna tv usa"><div class="card__title">Antenna TV USA</div><div class="card__meta">ID: 283</div></a>
+<a class="card" href="/watch.php?id=302" data-title="a&e usa"><div class="card__title">A&E USA</div><div class="card__meta">ID: 302</div></a>
+<a class="card" href="/watch.php?id=303" data-title="amc usa"><div class="card__title">AMC USA</div><div class="card__meta">ID: 303</div></a>
+<a class="card" href="/watch.php?id=304" data-title="animal planet"><div class="card__title">Animal Planet</div><div class="card__meta">ID: 304</div></a>
+<a class="card" href="/watch.php?id=123" data-title="astro supersport 1"><div class="card__title">Astro SuperSport 1</div><div class="card__meta">ID: 123</div></a>
+<a class="card" href="/watch.php?id=124" data-title="astro supersport 2"><div class="card__title">Astro SuperSport 2</div><div class="card__meta">ID: 124</div></a>
+<a class="card" href="/watch.php?id=125" data-title="astro supersport 3"><div class="card__title">Astro SuperSport 3</div><div class="card__meta">ID: 125</div></a>
+<a class="card" href="/watch.php?id=126" data-title="astro supersport 4"><div class="card__title">Astro SuperSport 4</div><div class="card__meta">ID: 126</div></a>
+<a class="card" href="/watch.php?id=134" data-title="arena sport 1 premium"><div class="card__title">Arena Sport 1 Premium</div><div class="card__meta">ID: 134</div></a>
+<a class="card" href="/watch.php?id=135" data-title="arena sport 2 premium"><div class="card__title">Arena Sport 2 Premium</div><div class="card__meta">ID: 135</div></a>
+<a class="card" href="/watch.php?id=139" data-title="arena sport 3 premium"><div class="card__title">Arena Sport 3 Premium</div><div class="card__meta">ID: 139</div></a>
+<a class="card" href="/watch.php?id=429" data-title="arena sport 1 serbia"><div class="card__title">Arena Sport 1 Serbia</div><div class="card__meta">ID: 429</div></a>
+<a class="card" href="/watch.php?id=430" data-title="arena sport 2 serbia"><div class="card__title">Arena Sport 2 Serbia</div><div class="card__meta">ID: 430</div></a>
+<a class="card" href="/watch.php?id=431" data-title="arena sport 3 serbia"><div class="card__title">Arena Sport 3 Serbia</div><div class="card__meta">ID: 431</div></a>
+<a class="card" href="/watch.php?id=581" data-title="arena sport 4 serbia"><div class="card__title">Arena Sport 4 Serbia</div><div class="card__meta">ID: 581</div></a>
+<a class="card" href="/watch.php?id=432" data-title="arena sport 1 croatia"><div class="card__title">Arena Sport 1 Croatia</div><div class="card__meta">ID: 432</div></a>
+<a class="card" href="/watch.php?id=433" data-title="arena sport 2 croatia"><div class="card__title">Arena Sport 2 Croatia</div><div class="card__meta">ID: 433</div></a>
+<a class="card" href="/watch.php?id=434" data-title="arena sport 3 croatia"><div class="card__title">Arena Sport 3 Croatia</div><div class="card__meta">ID: 434</div></a>
+<a class="card" href="/watch.php?id=580" data-title="arena sport 4 croatia"><div class="card__title">Arena Sport 4 Croatia</div><div class="card__meta">ID: 580</div></a>
+<a class="card" href="/watch.php?id=781" data-title="alkass one"><div class="card__title">Alkass One</div><div class="card__meta">ID: 781</div></a>
+<a class="card" href="/watch.php?id=782" data-title="alkass two"><div class="card__title">Alkass Two</div><div class="card__meta">ID: 782</div></a>
+<a class="card" href="/watch.php?id=783" data-title="alkass three"><div class="card__title">Alkass Three</div><div class="card__meta">ID: 783</div></a>
+<a class="card" href="/watch.php?id=784" data-title="alkass four"><div class="card__title">Alkass Four</div><div class="card__meta">ID: 784</div></a>
+<a class="card" href="/watch.php?id=579" data-title="arena sport 1 bih"><div class="card__title">Arena Sport 1 BiH</div><div class="card__meta">ID: 579</div></a>
+<a class="card" href="/watch.php?id=600" data-title="abu dhabi sports 1 uae"><div class="card__title">Abu Dhabi Sports 1 UAE</div><div class="card__meta">ID: 600</div></a>
+<a class="card" href="/watch.php?id=601" data-title="abu dhabi sports 2 uae"><div class="card__title">Abu Dhabi Sports 2 UAE</div><div class="card__meta">ID: 601</div></a>
+<a class="card" href="/watch.php?id=609" data-title="abu dhabi sports 1 premium"><div class="card__title">Abu Dhabi Sports 1 Premium</div><div class="card__meta">ID: 609</div></a>
+<a class="card" href="/watch.php?id=610" data-title="abu dhabi sports 2 premium"><div class="card__title">Abu Dhabi Sports 2 Premium</div><div class="card__meta">ID: 610</div></a>
+<a class="card" href="/watch.php?id=370" data-title="astro cricket"><div class="card__title">Astro Cricket</div><div class="card__meta">ID: 370</div></a>
+<a class="card" href="/watch.php?id=531" data-title="antena 3 spain"><div class="card__title">Antena 3 Spain</div><div class="card__meta">ID: 531</div></a>
+<a class="card" href="/watch.php?id=612" data-title="arena sports tenis serbia"><div class="card__title">Arena Sports Tenis Serbia</div><div class="card__meta">ID: 612</div></a>
+<a class="card" href="/watch.php?id=664" data-title="acc network usa"><div class="card__title">ACC Network USA</div><div class="card__meta">ID: 664</div></a>
+<a class="card" href="/watch.php?id=295" data-title="adult swim"><div class="card__title">Adult Swim</div><div class="card__meta">ID: 295</div></a>
+<a class="card" href="/watch.php?id=269" data-title="a sport pk"><div class="card__title">A Sport PK</div><div class="card__meta">ID: 269</div></a>
+<a class="card" href="/watch.php?id=717" data-title="axn movies portugal"><div class="card__title">AXN Movies Portugal</div><div class="card__meta">ID: 717</div></a>
+<a class="card" href="/watch.php?id=725" data-title="arte de"><div class="card__title">Arte DE</div><div class="card__meta">ID: 725</div></a>
+<a class="card" href="/watch.php?id=742" data-title="axs tv usa"><div class="card__title">AXS TV USA</div><div class="card__meta">ID: 742</div></a>
+<a class="card" href="/watch.php?id=766" data-title="abc ny usa"><div class="card__title">ABC NY USA</div><div class="card__meta">ID: 766</div></a>
+<a class="card" href="/watch.php?id=844" data-title="azteca 7 mx"><div class="card__title">Azteca 7 MX</div><div class="card__meta">ID: 844</div></a>
+<a class="card" href="/watch.php?id=923" data-title="altitude sports"><div class="card__title">Altitude Sports</div><div class="card__meta">ID: 923</div></a>
+<a class="card" href="/watch.php?id=934" data-title="azteca uno mx"><div class="card__title">Azteca Uno MX</div><div class="card__meta">ID: 934</div></a>
+<a class="card" href="/watch.php?id=940" data-title="arena sport 5 serbia"><div class="card__title">Arena Sport 5 Serbia</div><div class="card__meta">ID: 940</div></a>
+<a class="card" href="/watch.php?id=941" data-title="arena sport 6 serbia"><div class="card__title">Arena Sport 6 Serbia</div><div class="card__meta">ID: 941</div></a>
+<a class="card" href="/watch.php?id=942" data-title="arena sport 7 serbia"><div class="card__title">Arena Sport 7 Serbia</div><div class="card__meta">ID: 942</div></a>
+<a class="card" href="/watch.php?id=943" data-title="arena sport 8 serbia"><div class="card__title">Arena Sport 8 Serbia</div><div class="card__meta">ID: 943</div></a>
+<a class="card" href="/watch.php?id=944" data-title="arena sport 9 serbia"><div class="card__title">Arena Sport 9 Serbia</div><div class="card__meta">ID: 944</div></a>
+<a class="card" href="/watch.php?id=945" data-title="arena sport 10 serbia"><div class="card__title">Arena Sport 10 Serbia</div><div class="card__meta">ID: 945</div></a>
+<a class="card" href="/watch.php?id=958" data-title="arte france"><div class="card__title">Arte France</div><div class="card__meta">ID: 958</div></a>
+<a class="card" href="/watch.php?id=961" data-title="automoto la chaîne"><div class="card__title">Automoto La chaîne</div><div class="card__meta">ID: 961</div></a>
+<a class="card" href="/watch.php?id=1000" data-title="atv turkey"><div class="card__title">ATV Turkey</div><div class="card__meta">ID: 1000</div></a>
+<a class="card" href="/watch.php?id=1011" data-title="a spor turkey"><div class="card__title">A Spor Turkey</div><div class="card__meta">ID: 1011</div></a>
+<a class="card" href="/watch.php?id=61" data-title="bein sports mena english 1"><div class="card__title">beIN Sports MENA English 1</div><div class="card__meta">ID: 61</div></a>
+<a class="card" href="/watch.php?id=90" data-title="bein sports mena english 2"><div class="card__title">beIN Sports MENA English 2</div><div class="card__meta">ID: 90</div></a>
+<a class="card" href="/watch.php?id=91" data-title="bein sports 1 arabic"><div class="card__title">beIN Sports 1 Arabic</div><div class="card__meta">ID: 91</div></a>
+<a class="card" href="/watch.php?id=92" data-title="bein sports 2 arabic"><div class="card__title">beIN Sports 2 Arabic</div><div class="card__meta">ID: 92</div></a>
+<a class="card" href="/watch.php?id=93" data-title="bein sports 3 arabic"><div class="card__title">beIN Sports 3 Arabic</div><div class="card__meta">ID: 93</div></a>
+<a class="card" href="/watch.php?id=94" data-title="bein sports 4 arabic"><div class="card__title">beIN Sports 4 Arabic</div><div class="card__meta">ID: 94</div></a>
+<a class="card" href="/watch.php?id=95" data-title="bein sports 5 arabic"><div class="card__title">beIN Sports 5 Arabic</div><div class="card__meta">ID: 95</div></a>
+<a class="card" href="/watch.php?id=96" data-title="bein sports 6 arabic"><div class="card__title">beIN Sports 6 Arabic</div><div class="card__meta">ID: 96</div></a>
+<a class="card" href="/watch.php?id=97" data-title="bein sports 7 arabic"><div class="card__title">beIN Sports 7 Arabic</div><div class="card__meta">ID: 97</div></a>
+<a class="card" href="/watch.php?id=98" data-title="bein sports 8 arabic"><div class="card__title">beIN Sports 8 Arabic</div><div class="card__meta">ID: 98</div></a>
+<a class="card" href="/watch.php?id=99" data-title="bein sports 9 arabic"><div class="card__title">beIN Sports 9 Arabic</div><div class="card__meta">ID: 99</div></a>
+<a class="card" href="/watch.php?id=100" data-title="bein sports xtra 1"><div class="card__title">beIN SPORTS XTRA 1</div><div class="card__meta">ID: 100</div></a>
+<a class="card" href="/watch.php?id=494" data-title="bein sports max 4 france"><div class="card__title">beIN Sports MAX 4 France</div><div class="card__meta">ID: 494</div></a>
+<a class="card" href="/watch.php?id=495" data-title="bein sports max 5 france"><div class="card__title">beIN Sports MAX 5 France</div><div class="card__meta">ID: 495</div></a>
+<a class="card" href="/watch.php?id=496" data-title="bein sports max 6 france"><div class="card__title">beIN Sports MAX 6 France</div><div class="card__meta">ID: 496</div></a>
+<a class="card" href="/watch.php?id=497" data-title="bein sports max 7 france"><div class="card__title">beIN Sports MAX 7 France</div><div class="card__meta">ID: 497</div></a>
+<a class="card" href="/watch.php?id=498" data-title="bein sports max 8 france"><div class="card__title">beIN Sports MAX 8 France</div><div class="card__meta">ID: 498</div></a>
+<a class="card" href="/watch.php?id=499" data-title="bein sports max 9 france"><div class="card__title">beIN Sports MAX 9 France</div><div class="card__meta">ID: 499</div></a>
+<a class="card" href="/watch.php?id=500" data-title="bein sports max 10 france"><div class="card__title">beIN Sports MAX 10 France</div><div class="card__meta">ID: 500</div></a>
+<a class="card" href="/watch.php?id=116" data-title="bein sports 1 france"><div class="card__title">beIN SPORTS 1 France</div><div class="card__meta">ID: 116</div></a>
+<a class="card" href="/watch.php?id=117" data-title="bein sports 2 france"><div class="card__title">beIN SPORTS 2 France</div><div class="card__meta">ID: 117</div></a>
+<a class="card" href="/watch.php?id=118" data-title="bein sports 3 france"><div class="card__title">beIN SPORTS 3 France</div><div class="card__meta">ID: 118</div></a>
+<a class="card" href="/watch.php?id=62" data-title="bein sports 1 turkey"><div class="card__title">beIN SPORTS 1 Turkey</div><div class="card__meta">ID: 62</div></a>
+<a class="card" href="/watch.php?id=63" data-title="bein sports 2 turkey"><div class="card__title">beIN SPORTS 2 Turkey</div><div class="card__meta">ID: 63</div></a>
+<a class="card" href="/watch.php?id=64" data-title="bein sports 3 turkey"><div class="card__title">beIN SPORTS 3 Turkey</div><div class="card__meta">ID: 64</div></a>
+<a class="card" href="/watch.php?id=67" data-title="bein sports 4 turkey"><div class="card__title">beIN SPORTS 4 Turkey</div><div class="card__meta">ID: 67</div></a>
+<a class="card" href="/watch.php?id=578" data-title="bein sports hd qatar"><div class="card__title">BeIN Sports HD Qatar</div><div class="card__meta">ID: 578</div></a>
+<a class="card" href="/watch.php?id=425" data-title="bein sports usa"><div class="card__title">BeIN SPORTS USA</div><div class="card__meta">ID: 425</div></a>
+<a class="card" href="/watch.php?id=372" data-title="bein sports en espa単ol"><div class="card__title">beIN SPORTS en Espa単ol</div><div class="card__meta">ID: 372</div></a>
+<a class="card" href="/watch.php?id=491" data-title="bein sports australia 1"><div class="card__title">beIN SPORTS Australia 1</div><div class="card__meta">ID: 491</div></a>
+<a class="card" href="/watch.php?id=492" data-title="bein sports australia 2"><div class="card__title">beIN SPORTS Australia 2</div><div class="card__meta">ID: 492</div></a>
+<a class="card" href="/watch.php?id=493" data-title="bein sports australia 3"><div class="card__title">beIN SPORTS Australia 3</div><div class="card__meta">ID: 493</div></a>
+<a class="card" href="/watch.php?id=522" data-title="barca tv spain"><div class="card__title">Barca TV Spain</div><div class="card__meta">ID: 522</div></a>
+<a class="card" href="/watch.php?id=380" data-title="benfica tv pt"><div class="card__title">Benfica TV PT</div><div class="card__meta">ID: 380</div></a>
+<a class="card" href="/watch.php?id=648" data-title="boomerang"><div class="card__title">Boomerang</div><div class="card__meta">ID: 648</div></a>
+<a class="card" href="/watch.php?id=476" data-title="bnt 1 bulgaria"><div class="card__title">BNT 1 Bulgaria</div><div class="card__meta">ID: 476</div></a>
+<a class="card" href="/watch.php?id=477" data-title="bnt 2 bulgaria"><div class="card__title">BNT 2 Bulgaria</div><div class="card__meta">ID: 477</div></a>
+<a class="card" href="/watch.php?id=478" data-title="bnt 3 bulgaria"><div class="card__title">BNT 3 Bulgaria</div><div class="card__meta">ID: 478</div></a>
+<a class="card" href="/watch.php?id=737" data-title="br fernsehen de"><div class="card__title">BR Fernsehen DE</div><div class="card__meta">ID: 737</div></a>
+<a class="card" href="/watch.php?id=479" data-title="btv bulgaria"><div class="card__title">bTV Bulgaria</div><div class="card__meta">ID: 479</div></a>
+<a class="card" href="/watch.php?id=481" data-title="btv action bulgaria"><div class="card__title">bTV Action Bulgaria</div><div class="card__meta">ID: 481</div></a>
+<a class="card" href="/watch.php?id=484" data-title="btv lady bulgaria"><div class="card__title">bTV Lady Bulgaria</div><div class="card__meta">ID: 484</div></a>
+<a class="card" href="/watch.php?id=305" data-title="bbc america (bbca)"><div class="card__title">BBC America (BBCA)</div><div class="card__meta">ID: 305</div></a>
+<a class="card" href="/watch.php?id=306" data-title="bet usa"><div class="card__title">BET USA</div><div class="card__meta">ID: 306</div></a>
+<a class="card" href="/watch.php?id=307" data-title="bravo usa"><div class="card__title">Bravo USA</div><div class="card__meta">ID: 307</div></a>
+<a class="card" href="/watch.php?id=349" data-title="bbc news channel hd"><div class="card__title">BBC News Channel HD</div><div class="card__meta">ID: 349</div></a>
+<a class="card" href="/watch.php?id=356" data-title="bbc one uk"><div class="card__title">BBC One UK</div><div class="card__meta">ID: 356</div></a>
+<a class="card" href="/watch.php?id=357" data-title="bbc two uk"><div class="card__title">BBC Two UK</div><div class="card__meta">ID: 357</div></a>
+<a class="card" href="/watch.php?id=358" data-title="bbc three uk"><div class="card__title">BBC Three UK</div><div class="card__meta">ID: 358</div></a>
+<a class="card" href="/watch.php?id=359" data-title="bbc four uk"><div class="card__title">BBC Four UK</div><div class="card__meta">ID: 359</div></a>
+<a class="card" href="/watch.php?id=397" data-title="big ten network (btn usa)"><div class="card__title">BIG TEN Network (BTN USA)</div><div class="card__meta">ID: 397</div></a>
+<a class="card" href="/watch.php?id=712" data-title="bein sports 1 malaysia"><div class="card__title">beIN Sports 1 Malaysia</div><div class="card__meta">ID: 712</div></a>
+<a class="card" href="/watch.php?id=713" data-title="bein sports 2 malaysia"><div class="card__title">beIN Sports 2 Malaysia</div><div class="card__meta">ID: 713</div></a>
+<a class="card" href="/watch.php?id=714" data-title="bein sports 3 malaysia"><div class="card__title">beIN Sports 3 Malaysia</div><div class="card__meta">ID: 714</div></a>
+<a class="card" href="/watch.php?id=957" data-title="bfm tv france"><div class="card__title">BFM TV France</div><div class="card__meta">ID: 957</div></a>
+<a class="card" href="/watch.php?id=1010" data-title="bein sports 5 turkey"><div class="card__title">bein Sports 5 Turkey</div><div class="card__meta">ID: 1010</div></a>
+<a class="card" href="/watch.php?id=275" data-title="bandsports brasil"><div class="card__title">Bandsports Brasil</div><div class="card__meta">ID: 275</div></a>
+<a class="card" href="/watch.php?id=271" data-title="canal+ motogp france"><div class="card__title">Canal+ MotoGP France</div><div class="card__meta">ID: 271</div></a>
+<a class="card" href="/watch.php?id=273" data-title="canal+ formula 1"><div class="card__title">Canal+ Formula 1</div><div class="card__meta">ID: 273</div></a>
+<a class="card" href="/watch.php?id=280" data-title="cw pix 11 usa"><div class="card__title">CW PIX 11 USA</div><div class="card__meta">ID: 280</div></a>
+<a class="card" href="/watch.php?id=52" data-title="cbs usa"><div class="card__title">CBS USA</div><div class="card__meta">ID: 52</div></a>
+<a class="card" href="/watch.php?id=281" data-title="court tv usa"><div class="card__title">Court TV USA</div><div class="card__meta">ID: 281</div></a>
+<a class="card" href="/watch.php?id=300" data-title="cw usa"><div class="card__title">CW USA</div><div class="card__meta">ID: 300</div></a>
+<a class="card" href="/watch.php?id=309" data-title="cnbc usa"><div class="card__title">CNBC USA</div><div class="card__meta">ID: 309</div></a>
+<a class="card" href="/watch.php?id=310" data-title="comedy central"><div class="card__title">Comedy Central</div><div class="card__meta">ID: 310</div></a>
+<a class="card" href="/watch.php?id=339" data-title="cartoon network"><div class="card__title">Cartoon Network</div><div class="card__meta">ID: 339</div></a>
+<a class="card" href="/watch.php?id=345" data-title="cnn usa"><div class="card__title">CNN USA</div><div class="card__meta">ID: 345</div></a>
+<a class="card" href="/watch.php?id=374" data-title="cinemax usa"><div class="card__title">Cinemax USA</div><div class="card__meta">ID: 374</div></a>
+<a class="card" href="/watch.php?id=535" data-title="cuatro spain"><div class="card__title">Cuatro Spain</div><div class="card__meta">ID: 535</div></a>
+<a class="card" href="/watch.php?id=354" data-title="channel 4 uk"><div class="card__title">Channel 4 UK</div><div class="card__meta">ID: 354</div></a>
+<a class="card" href="/watch.php?id=355" data-title="channel 5 uk"><div class="card__title">Channel 5 UK</div><div class="card__meta">ID: 355</div></a>
+<a class="card" href="/watch.php?id=308" data-title="cbs sports network (cbssn)"><div class="card__title">CBS Sports Network (CBSSN)</div><div class="card__meta">ID: 308</div></a>
+<a class="card" href="/watch.php?id=121" data-title="canal+ france"><div class="card__title">Canal+ France</div><div class="card__meta">ID: 121</div></a>
+<a class="card" href="/watch.php?id=122" data-title="canal+ sport france"><div class="card__title">Canal+ Sport France</div><div class="card__meta">ID: 122</div></a>
+<a class="card" href="/watch.php?id=463" data-title="canal+ foot france"><div class="card__title">Canal+ Foot France</div><div class="card__meta">ID: 463</div></a>
+<a class="card" href="/watch.php?id=464" data-title="canal+ sport360"><div class="card__title">Canal+ Sport360</div><div class="card__meta">ID: 464</div></a>
+<a class="card" href="/watch.php?id=540" data-title="canal 11 portugal"><div class="card__title">Canal 11 Portugal</div><div class="card__meta">ID: 540</div></a>
+<a class="card" href="/watch.php?id=48" data-title="canal+ sport poland"><div class="card__title">Canal+ Sport Poland</div><div class="card__meta">ID: 48</div></a>
+<a class="card" href="/watch.php?id=73" data-title="canal+ sport 2 poland"><div class="card__title">Canal+ Sport 2 Poland</div><div class="card__meta">ID: 73</div></a>
+<a class="card" href="/watch.php?id=259" data-title="canal+ sport 3 poland"><div class="card__title">Canal+ Sport 3 Poland</div><div class="card__meta">ID: 259</div></a>
+<a class="card" href="/watch.php?id=75" data-title="canal+ sport 5 poland"><div class="card__title">Canal+ Sport 5 Poland</div><div class="card__meta">ID: 75</div></a>
+<a class="card" href="/watch.php?id=566" data-title="canal+ premium poland"><div class="card__title">Canal+ Premium Poland</div><div class="card__meta">ID: 566</div></a>
+<a class="card" href="/watch.php?id=567" data-title="canal+ family poland"><div class="card__title">Canal+ Family Poland</div><div class="card__meta">ID: 567</div></a>
+<a class="card" href="/watch.php?id=570" data-title="canal+ seriale poland"><div class="card__title">Canal+ Seriale Poland</div><div class="card__meta">ID: 570</div></a>
+<a class="card" href="/watch.php?id=486" data-title="canal+ sport 1 afrique"><div class="card__title">Canal+ Sport 1 Afrique</div><div class="card__meta">ID: 486</div></a>
+<a class="card" href="/watch.php?id=487" data-title="canal+ sport 2 afrique"><div class="card__title">Canal+ Sport 2 Afrique</div><div class="card__meta">ID: 487</div></a>
+<a class="card" href="/watch.php?id=488" data-title="canal+ sport 3 afrique"><div class="card__title">Canal+ Sport 3 Afrique</div><div class="card__meta">ID: 488</div></a>
+<a class="card" href="/watch.php?id=489" data-title="canal+ sport 4 afrique"><div class="card__title">Canal+ Sport 4 Afrique</div><div class="card__meta">ID: 489</div></a>
+<a class="card" href="/watch.php?id=490" data-title="canal+ sport 5 afrique"><div class="card__title">Canal+ Sport 5 Afrique</div><div class="card__meta">ID: 490</div></a>
+<a class="card" href="/watch.php?id=805" data-title="canal 9 denmark"><div class="card__title">CANAL 9 Denmark</div><div class="card__meta">ID: 805</div></a>
+<a class="card" href="/watch.php?id=89" data-title="combate brasil"><div class="card__title">Combate Brasil</div><div class="card__meta">ID: 89</div></a>
+<a class="card" href="/watch.php?id=622" data-title="cosmote sport 1 hd"><div class="card__title">Cosmote Sport 1 HD</div><div class="card__meta">ID: 622</div></a>
+<a class="card" href="/watch.php?id=623" data-title="cosmote sport 2 hd"><div class="card__title">Cosmote Sport 2 HD</div><div class="card__meta">ID: 623</div></a>
+<a class="card" href="/watch.php?id=624" data-title="cosmote sport 3 hd"><div class="card__title">Cosmote Sport 3 HD</div><div class="card__meta">ID: 624</div></a>
+<a class="card" href="/watch.php?id=625" data-title="cosmote sport 4 hd"><div class="card__title">Cosmote Sport 4 HD</div><div class="card__meta">ID: 625</div></a>
+<a class="card" href="/watch.php?id=626" data-title="cosmote sport 5 hd"><div class="card__title">Cosmote Sport 5 HD</div><div class="card__meta">ID: 626</div></a>
+<a class="card" href="/watch.php?id=627" data-title="cosmote sport 6 hd"><div class="card__title">Cosmote Sport 6 HD</div><div class="card__meta">ID: 627</div></a>
+<a class="card" href="/watch.php?id=628" data-title="cosmote sport 7 hd"><div class="card__title">Cosmote Sport 7 HD</div><div class="card__meta">ID: 628</div></a>
+<a class="card" href="/watch.php?id=629" data-title="cosmote sport 8 hd"><div class="card__title">Cosmote Sport 8 HD</div><div class="card__meta">ID: 629</div></a>
+<a class="card" href="/watch.php?id=630" data-title="cosmote sport 9 hd"><div class="card__title">Cosmote Sport 9 HD</div><div class="card__meta">ID: 630</div></a>
+<a class="card" href="/watch.php?id=546" data-title="channel 9 israel"><div class="card__title">Channel 9 Israel</div><div class="card__meta">ID: 546</div></a>
+<a class="card" href="/watch.php?id=547" data-title="channel 10 israe"><div class="card__title">Channel 10 Israe</div><div class="card__meta">ID: 547</div></a>
+<a class="card" href="/watch.php?id=548" data-title="channel 11 israel"><div class="card__title">Channel 11 Israel</div><div class="card__meta">ID: 548</div></a>
+<a class="card" href="/watch.php?id=549" data-title="channel 12 israel"><div class="card__title">Channel 12 Israel</div><div class="card__meta">ID: 549</div></a>
+<a class="card" href="/watch.php?id=551" data-title="channel 13 israel"><div class="card__title">Channel 13 Israel</div><div class="card__meta">ID: 551</div></a>
+<a class="card" href="/watch.php?id=552" data-title="channel 14 israel"><div class="card__title">Channel 14 Israel</div><div class="card__meta">ID: 552</div></a>
+<a class="card" href="/watch.php?id=812" data-title="c more first sweden"><div class="card__title">C More First Sweden</div><div class="card__meta">ID: 812</div></a>
+<a class="card" href="/watch.php?id=813" data-title="c more hits sweden"><div class="card__title">C More Hits Sweden</div><div class="card__meta">ID: 813</div></a>
+<a class="card" href="/watch.php?id=814" data-title="c more series sweden"><div class="card__title">C More Series Sweden</div><div class="card__meta">ID: 814</div></a>
+<a class="card" href="/watch.php?id=748" data-title="cozi tv usa"><div class="card__title">COZI TV USA</div><div class="card__meta">ID: 748</div></a>
+<a class="card" href="/watch.php?id=647" data-title="cmt usa"><div class="card__title">CMT USA</div><div class="card__meta">ID: 647</div></a>
+<a class="card" href="/watch.php?id=602" data-title="ctv canada"><div class="card__title">CTV Canada</div><div class="card__meta">ID: 602</div></a>
+<a class="card" href="/watch.php?id=838" data-title="ctv 2 canada"><div class="card__title">CTV 2 Canada</div><div class="card__meta">ID: 838</div></a>
+<a class="card" href="/watch.php?id=669" data-title="crime+ investigation usa"><div class="card__title">Crime+ Investigation USA</div><div class="card__meta">ID: 669</div></a>
+<a class="card" href="/watch.php?id=696" data-title="comet usa"><div class="card__title">Comet USA</div><div class="card__meta">ID: 696</div></a>
+<a class="card" href="/watch.php?id=697" data-title="cooking channel usa"><div class="card__title">Cooking Channel USA</div><div class="card__meta">ID: 697</div></a>
+<a class="card" href="/watch.php?id=715" data-title="cleo tv"><div class="card__title">Cleo TV</div><div class="card__meta">ID: 715</div></a>
+<a class="card" href="/watch.php?id=750" data-title="c span 1"><div class="card__title">C SPAN 1</div><div class="card__meta">ID: 750</div></a>
+<a class="card" href="/watch.php?id=767" data-title="cbsny usa"><div class="card__title">CBSNY USA</div><div class="card__meta">ID: 767</div></a>
+<a class="card" href="/watch.php?id=776" data-title="chicago sports network"><div class="card__title">Chicago Sports Network</div><div class="card__meta">ID: 776</div></a>
+<a class="card" href="/watch.php?id=831" data-title="citytv"><div class="card__title">Citytv</div><div class="card__meta">ID: 831</div></a>
+<a class="card" href="/watch.php?id=832" data-title="cbc ca"><div class="card__title">CBC CA</div><div class="card__meta">ID: 832</div></a>
+<a class="card" href="/watch.php?id=933" data-title="claro sports mx"><div class="card__title">Claro Sports MX</div><div class="card__meta">ID: 933</div></a>
+<a class="card" href="/watch.php?id=936" data-title="canal5 mx"><div class="card__title">Canal5 MX</div><div class="card__meta">ID: 936</div></a>
+<a class="card" href="/watch.php?id=956" data-title="c8 france"><div class="card__title">C8 France</div><div class="card__meta">ID: 956</div></a>
+<a class="card" href="/watch.php?id=964" data-title="cnews france"><div class="card__title">CNews France</div><div class="card__meta">ID: 964</div></a>
+<a class="card" href="/watch.php?id=1020" data-title="canal+ sport cz"><div class="card__title">Canal+ Sport CZ</div><div class="card__meta">ID: 1020</div></a>
+<a class="card" href="/watch.php?id=1033" data-title="ct sport cz"><div class="card__title">CT Sport CZ</div><div class="card__meta">ID: 1033</div></a>
+<a class="card" href="/watch.php?id=910" data-title="cbs sports golazo"><div class="card__title">CBS Sports Golazo</div><div class="card__meta">ID: 910</div></a>
+<a class="card" href="/watch.php?id=790" data-title="cmtv portugal"><div class="card__title">CMTV Portugal</div><div class="card__meta">ID: 790</div></a>
+<a class="card" href="/watch.php?id=911" data-title="cytavision sports 1 cyprus"><div class="card__title">Cytavision Sports 1 Cyprus</div><div class="card__meta">ID: 911</div></a>
+<a class="card" href="/watch.php?id=912" data-title="cytavision sports 2 cyprus"><div class="card__title">Cytavision Sports 2 Cyprus</div><div class="card__meta">ID: 912</div></a>
+<a class="card" href="/watch.php?id=913" data-title="cytavision sports 3 cyprus"><div class="card__title">Cytavision Sports 3 Cyprus</div><div class="card__meta">ID: 913</div></a>
+<a class="card" href="/watch.php?id=914" data-title="cytavision sports 4 cyprus"><div class="card__title">Cytavision Sports 4 Cyprus</div><div class="card__meta">ID: 914</div></a>
+<a class="card" href="/watch.php?id=915" data-title="cytavision sports 5 cyprus"><div class="card__title">Cytavision Sports 5 Cyprus</div><div class="card__meta">ID: 915</div></a>
+<a class="card" href="/watch.php?id=916" data-title="cytavision sports 6 cyprus"><div class="card__title">Cytavision Sports 6 Cyprus</div><div class="card__meta">ID: 916</div></a>
+<a class="card" href="/watch.php?id=917" data-title="cytavision sports 7 cyprus"><div class="card__title">Cytavision Sports 7 Cyprus</div><div class="card__meta">ID: 917</div></a>
+<a class="card" href="/watch.php?id=230" data-title="dazn 1 uk"><div class="card__title">DAZN 1 UK</div><div class="card__meta">ID: 230</div></a>
+<a class="card" href="/watch.php?id=285" data-title="discovery velocity ca"><div class="card__title">Discovery Velocity CA</div><div class="card__meta">ID: 285</div></a>
+<a class="card" href="/watch.php?id=426" data-title="dazn 1 bar de"><div class="card__title">DAZN 1 Bar DE</div><div class="card__meta">ID: 426</div></a>
+<a class="card" href="/watch.php?id=427" data-title="dazn 2 bar de"><div class="card__title">DAZN 2 Bar DE</div><div class="card__meta">ID: 427</div></a>
+<a class="card" href="/watch.php?id=445" data-title="dazn 1 spain"><div class="card__title">DAZN 1 Spain</div><div class="card__meta">ID: 445</div></a>
+<a class="card" href="/watch.php?id=446" data-title="dazn 2 spain"><div class="card__title">DAZN 2 Spain</div><div class="card__meta">ID: 446</div></a>
+<a class="card" href="/watch.php?id=447" data-title="dazn 3 spain"><div class="card__title">DAZN 3 Spain</div><div class="card__meta">ID: 447</div></a>
+<a class="card" href="/watch.php?id=448" data-title="dazn 4 spain"><div class="card__title">DAZN 4 Spain</div><div class="card__meta">ID: 448</div></a>
+<a class="card" href="/watch.php?id=537" data-title="dazn f1 es"><div class="card__title">DAZN F1 ES</div><div class="card__meta">ID: 537</div></a>
+<a class="card" href="/watch.php?id=538" data-title="dazn laliga"><div class="card__title">DAZN LaLiga</div><div class="card__meta">ID: 538</div></a>
+<a class="card" href="/watch.php?id=918" data-title="dazn portugal fifa mundial de clubes"><div class="card__title">DAZN Portugal FIFA Mundial de Clubes</div><div class="card__meta">ID: 918</div></a>
+<a class="card" href="/watch.php?id=801" data-title="dr1 denmark"><div class="card__title">DR1 Denmark</div><div class="card__meta">ID: 801</div></a>
+<a class="card" href="/watch.php?id=802" data-title="dr2 denmark"><div class="card__title">DR2 Denmark</div><div class="card__meta">ID: 802</div></a>
+<a class="card" href="/watch.php?id=960" data-title="dazn ligue 1 france"><div class="card__title">DAZN Ligue 1 France</div><div class="card__meta">ID: 960</div></a>
+<a class="card" href="/watch.php?id=400" data-title="digi sport 1 romania"><div class="card__title">Digi Sport 1 Romania</div><div class="card__meta">ID: 400</div></a>
+<a class="card" href="/watch.php?id=401" data-title="digi sport 2 romania"><div class="card__title">Digi Sport 2 Romania</div><div class="card__meta">ID: 401</div></a>
+<a class="card" href="/watch.php?id=402" data-title="digi sport 3 romania"><div class="card__title">Digi Sport 3 Romania</div><div class="card__meta">ID: 402</div></a>
+<a class="card" href="/watch.php?id=403" data-title="digi sport 4 romania"><div class="card__title">Digi Sport 4 Romania</div><div class="card__meta">ID: 403</div></a>
+<a class="card" href="/watch.php?id=465" data-title="diema sport bulgaria"><div class="card__title">Diema Sport Bulgaria</div><div class="card__meta">ID: 465</div></a>
+<a class="card" href="/watch.php?id=466" data-title="diema sport 2 bulgaria"><div class="card__title">Diema Sport 2 Bulgaria</div><div class="card__meta">ID: 466</div></a>
+<a class="card" href="/watch.php?id=467" data-title="diema sport 3 bulgaria"><div class="card__title">Diema Sport 3 Bulgaria</div><div class="card__meta">ID: 467</div></a>
+<a class="card" href="/watch.php?id=482" data-title="diema bulgaria"><div class="card__title">Diema Bulgaria</div><div class="card__meta">ID: 482</div></a>
+<a class="card" href="/watch.php?id=485" data-title="diema family bulgaria"><div class="card__title">Diema Family Bulgaria</div><div class="card__meta">ID: 485</div></a>
+<a class="card" href="/watch.php?id=604" data-title="dubai sports 1 uae"><div class="card__title">Dubai Sports 1 UAE</div><div class="card__meta">ID: 604</div></a>
+<a class="card" href="/watch.php?id=605" data-title="dubai sports 2 uae"><div class="card__title">Dubai Sports 2 UAE</div><div class="card__meta">ID: 605</div></a>
+<a class="card" href="/watch.php?id=606" data-title="dubai sports 3 uae"><div class="card__title">Dubai Sports 3 UAE</div><div class="card__meta">ID: 606</div></a>
+<a class="card" href="/watch.php?id=608" data-title="dubai racing 2 uae"><div class="card__title">Dubai Racing 2 UAE</div><div class="card__meta">ID: 608</div></a>
+<a class="card" href="/watch.php?id=786" data-title="dstv mzansi magic"><div class="card__title">DSTV Mzansi Magic</div><div class="card__meta">ID: 786</div></a>
+<a class="card" href="/watch.php?id=827" data-title="dstv m-net"><div class="card__title">DSTV M-Net</div><div class="card__meta">ID: 827</div></a>
+<a class="card" href="/watch.php?id=828" data-title="dstv kyknet & kie"><div class="card__title">DSTV kykNET & kie</div><div class="card__meta">ID: 828</div></a>
+<a class="card" href="/watch.php?id=877" data-title="dazn zona italy"><div class="card__title">DAZN ZONA Italy</div><div class="card__meta">ID: 877</div></a>
+<a class="card" href="/watch.php?id=311" data-title="discovery life channel"><div class="card__title">Discovery Life Channel</div><div class="card__meta">ID: 311</div></a>
+<a class="card" href="/watch.php?id=312" data-title="disney channel"><div class="card__title">Disney Channel</div><div class="card__meta">ID: 312</div></a>
+<a class="card" href="/watch.php?id=313" data-title="discovery channel"><div class="card__title">Discovery Channel</div><div class="card__meta">ID: 313</div></a>
+<a class="card" href="/watch.php?id=657" data-title="discovery family"><div class="card__title">Discovery Family</div><div class="card__meta">ID: 657</div></a>
+<a class="card" href="/watch.php?id=314" data-title="disney xd"><div class="card__title">Disney XD</div><div class="card__meta">ID: 314</div></a>
+<a class="card" href="/watch.php?id=651" data-title="destination america"><div class="card__title">Destination America</div><div class="card__meta">ID: 651</div></a>
+<a class="card" href="/watch.php?id=652" data-title="disney jr"><div class="card__title">Disney JR</div><div class="card__meta">ID: 652</div></a>
+<a class="card" href="/watch.php?id=348" data-title="dave"><div class="card__title">Dave</div><div class="card__meta">ID: 348</div></a>
+<a class="card" href="/watch.php?id=44" data-title="espn usa"><div class="card__title">ESPN USA</div><div class="card__meta">ID: 44</div></a>
+<a class="card" href="/watch.php?id=45" data-title="espn2 usa"><div class="card__title">ESPN2 USA</div><div class="card__meta">ID: 45</div></a>
+<a class="card" href="/watch.php?id=316" data-title="espnu usa"><div class="card__title">ESPNU USA</div><div class="card__meta">ID: 316</div></a>
+<a class="card" href="/watch.php?id=379" data-title="espn 1 nl"><div class="card__title">ESPN 1 NL</div><div class="card__meta">ID: 379</div></a>
+<a class="card" href="/watch.php?id=386" data-title="espn 2 nl"><div class="card__title">ESPN 2 NL</div><div class="card__meta">ID: 386</div></a>
+<a class="card" href="/watch.php?id=71" data-title="eleven sports 1 poland"><div class="card__title">Eleven Sports 1 Poland</div><div class="card__meta">ID: 71</div></a>
+<a class="card" href="/watch.php?id=72" data-title="eleven sports 2 poland"><div class="card__title">Eleven Sports 2 Poland</div><div class="card__meta">ID: 72</div></a>
+<a class="card" href="/watch.php?id=428" data-title="eleven sports 3 poland"><div class="card__title">Eleven Sports 3 Poland</div><div class="card__meta">ID: 428</div></a>
+<a class="card" href="/watch.php?id=455" data-title="eleven sports 1 portugal"><div class="card__title">Eleven Sports 1 Portugal</div><div class="card__meta">ID: 455</div></a>
+<a class="card" href="/watch.php?id=456" data-title="eleven sports 2 portugal"><div class="card__title">Eleven Sports 2 Portugal</div><div class="card__meta">ID: 456</div></a>
+<a class="card" href="/watch.php?id=457" data-title="eleven sports 3 portugal"><div class="card__title">Eleven Sports 3 Portugal</div><div class="card__meta">ID: 457</div></a>
+<a class="card" href="/watch.php?id=458" data-title="eleven sports 4 portugal"><div class="card__title">Eleven Sports 4 Portugal</div><div class="card__meta">ID: 458</div></a>
+<a class="card" href="/watch.php?id=459" data-title="eleven sports 5 portugal"><div class="card__title">Eleven Sports 5 Portugal</div><div class="card__meta">ID: 459</div></a>
+<a class="card" href="/watch.php?id=41" data-title="eurosport 1 greece"><div class="card__title">EuroSport 1 Greece</div><div class="card__meta">ID: 41</div></a>
+<a class="card" href="/watch.php?id=42" data-title="eurosport 2 greece"><div class="card__title">EuroSport 2 Greece</div><div class="card__meta">ID: 42</div></a>
+<a class="card" href="/watch.php?id=57" data-title="eurosport 1 poland"><div class="card__title">EuroSport 1 Poland</div><div class="card__meta">ID: 57</div></a>
+<a class="card" href="/watch.php?id=58" data-title="eurosport 2 poland"><div class="card__title">EuroSport 2 Poland</div><div class="card__meta">ID: 58</div></a>
+<a class="card" href="/watch.php?id=231" data-title="eurosport 1 sw"><div class="card__title">Eurosport 1 SW</div><div class="card__meta">ID: 231</div></a>
+<a class="card" href="/watch.php?id=232" data-title="eurosport 2 sw"><div class="card__title">Eurosport 2 SW</div><div class="card__meta">ID: 232</div></a>
+<a class="card" href="/watch.php?id=233" data-title="eurosport 1 nl"><div class="card__title">Eurosport 1 NL</div><div class="card__meta">ID: 233</div></a>
+<a class="card" href="/watch.php?id=234" data-title="eurosport 2 nl"><div class="card__title">Eurosport 2 NL</div><div class="card__meta">ID: 234</div></a>
+<a class="card" href="/watch.php?id=524" data-title="eurosport 1 spain"><div class="card__title">EuroSport 1 Spain</div><div class="card__meta">ID: 524</div></a>
+<a class="card" href="/watch.php?id=525" data-title="eurosport 2 spain"><div class="card__title">EuroSport 2 Spain</div><div class="card__meta">ID: 525</div></a>
+<a class="card" href="/watch.php?id=878" data-title="eurosport 1 italy"><div class="card__title">EuroSport 1 Italy</div><div class="card__meta">ID: 878</div></a>
+<a class="card" href="/watch.php?id=879" data-title="eurosport 2 italy"><div class="card__title">EuroSport 2 Italy</div><div class="card__meta">ID: 879</div></a>
+<a class="card" href="/watch.php?id=387" data-title="espn premium argentina"><div class="card__title">ESPN Premium Argentina</div><div class="card__meta">ID: 387</div></a>
+<a class="card" href="/watch.php?id=81" data-title="espn brasil"><div class="card__title">ESPN Brasil</div><div class="card__meta">ID: 81</div></a>
+<a class="card" href="/watch.php?id=82" data-title="espn2 brasil"><div class="card__title">ESPN2 Brasil</div><div class="card__meta">ID: 82</div></a>
+<a class="card" href="/watch.php?id=83" data-title="espn3 brasil"><div class="card__title">ESPN3 Brasil</div><div class="card__meta">ID: 83</div></a>
+<a class="card" href="/watch.php?id=85" data-title="espn4 brasil"><div class="card__title">ESPN4 Brasil</div><div class="card__meta">ID: 85</div></a>
+<a class="card" href="/watch.php?id=149" data-title="espn argentina"><div class="card__title">ESPN Argentina</div><div class="card__meta">ID: 149</div></a>
+<a class="card" href="/watch.php?id=150" data-title="espn2 argentina"><div class="card__title">ESPN2 Argentina</div><div class="card__meta">ID: 150</div></a>
+<a class="card" href="/watch.php?id=375" data-title="espn deportes"><div class="card__title">ESPN Deportes</div><div class="card__meta">ID: 375</div></a>
+<a class="card" href="/watch.php?id=288" data-title="espnews"><div class="card__title">ESPNews</div><div class="card__meta">ID: 288</div></a>
+<a class="card" href="/watch.php?id=315" data-title="e! entertainment television"><div class="card__title">E! Entertainment Television</div><div class="card__meta">ID: 315</div></a>
+<a class="card" href="/watch.php?id=363" data-title="e4 channel"><div class="card__title">E4 Channel</div><div class="card__meta">ID: 363</div></a>
+<a class="card" href="/watch.php?id=888" data-title="espn 3 nl"><div class="card__title">ESPN 3 NL</div><div class="card__meta">ID: 888</div></a>
+<a class="card" href="/watch.php?id=774" data-title="ert 1 greece"><div class="card__title">ERT 1 Greece</div><div class="card__meta">ID: 774</div></a>
+<a class="card" href="/watch.php?id=772" data-title="eurosport 1 france"><div class="card__title">Eurosport 1 France</div><div class="card__meta">ID: 772</div></a>
+<a class="card" href="/watch.php?id=773" data-title="eurosport 2 france"><div class="card__title">Eurosport 2 France</div><div class="card__meta">ID: 773</div></a>
+<a class="card" href="/watch.php?id=798" data-title="espn3 argentina"><div class="card__title">ESPN3 Argentina</div><div class="card__meta">ID: 798</div></a>
+<a class="card" href="/watch.php?id=925" data-title="espn 1 mx"><div class="card__title">ESPN 1 MX</div><div class="card__meta">ID: 925</div></a>
+<a class="card" href="/watch.php?id=926" data-title="espn 2 mx"><div class="card__title">ESPN 2 MX</div><div class="card__meta">ID: 926</div></a>
+<a class="card" href="/watch.php?id=927" data-title="espn 3 mx"><div class="card__title">ESPN 3 MX</div><div class="card__meta">ID: 927</div></a>
+<a class="card" href="/watch.php?id=928" data-title="espn 4 mx"><div class="card__title">ESPN 4 MX</div><div class="card__meta">ID: 928</div></a>
+<a class="card" href="/watch.php?id=279" data-title="fuse tv usa"><div class="card__title">FUSE TV USA</div><div class="card__meta">ID: 279</div></a>
+<a class="card" href="/watch.php?id=39" data-title="fox sports 1 usa"><div class="card__title">Fox Sports 1 USA</div><div class="card__meta">ID: 39</div></a>
+<a class="card" href="/watch.php?id=758" data-title="fox sports 2 usa"><div class="card__title">Fox Sports 2 USA</div><div class="card__meta">ID: 758</div></a>
+<a class="card" href="/watch.php?id=756" data-title="fox soccer plus"><div class="card__title">FOX Soccer Plus</div><div class="card__meta">ID: 756</div></a>
+<a class="card" href="/watch.php?id=369" data-title="fox cricket"><div class="card__title">Fox Cricket</div><div class="card__meta">ID: 369</div></a>
+<a class="card" href="/watch.php?id=643" data-title="fox deportes usa"><div class="card__title">FOX Deportes USA</div><div class="card__meta">ID: 643</div></a>
+<a class="card" href="/watch.php?id=820" data-title="fox sports 502 au"><div class="card__title">FOX Sports 502 AU</div><div class="card__meta">ID: 820</div></a>
+<a class="card" href="/watch.php?id=821" data-title="fox sports 503 au"><div class="card__title">FOX Sports 503 AU</div><div class="card__meta">ID: 821</div></a>
+<a class="card" href="/watch.php?id=822" data-title="fox sports 504 au"><div class="card__title">FOX Sports 504 AU</div><div class="card__meta">ID: 822</div></a>
+<a class="card" href="/watch.php?id=823" data-title="fox sports 505 au"><div class="card__title">FOX Sports 505 AU</div><div class="card__meta">ID: 823</div></a>
+<a class="card" href="/watch.php?id=824" data-title="fox sports 506 au"><div class="card__title">FOX Sports 506 AU</div><div class="card__meta">ID: 824</div></a>
+<a class="card" href="/watch.php?id=825" data-title="fox sports 507 au"><div class="card__title">FOX Sports 507 AU</div><div class="card__meta">ID: 825</div></a>
+<a class="card" href="/watch.php?id=929" data-title="fox sports 1 mx"><div class="card__title">Fox Sports 1 MX</div><div class="card__meta">ID: 929</div></a>
+<a class="card" href="/watch.php?id=930" data-title="fox sports 2 mx"><div class="card__title">Fox Sports 2 MX</div><div class="card__meta">ID: 930</div></a>
+<a class="card" href="/watch.php?id=931" data-title="fox sports 3 mx"><div class="card__title">Fox Sports 3 MX</div><div class="card__meta">ID: 931</div></a>
+<a class="card" href="/watch.php?id=787" data-title="fox sports argentina"><div class="card__title">Fox Sports Argentina</div><div class="card__meta">ID: 787</div></a>
+<a class="card" href="/watch.php?id=788" data-title="fox sports 2 argentina"><div class="card__title">Fox Sports 2 Argentina</div><div class="card__meta">ID: 788</div></a>
+<a class="card" href="/watch.php?id=789" data-title="fox sports 3 argentina"><div class="card__title">Fox Sports 3 Argentina</div><div class="card__meta">ID: 789</div></a>
+<a class="card" href="/watch.php?id=830" data-title="fox sports premium mx"><div class="card__title">Fox Sports Premium MX</div><div class="card__meta">ID: 830</div></a>
+<a class="card" href="/watch.php?id=568" data-title="filmbox premium poland"><div class="card__title">FilmBox Premium Poland</div><div class="card__meta">ID: 568</div></a>
+<a class="card" href="/watch.php?id=757" data-title="fight network"><div class="card__title">Fight Network</div><div class="card__meta">ID: 757</div></a>
+<a class="card" href="/watch.php?id=297" data-title="fox business"><div class="card__title">Fox Business</div><div class="card__meta">ID: 297</div></a>
+<a class="card" href="/watch.php?id=483" data-title="fox hd bulgaria"><div class="card__title">FOX HD Bulgaria</div><div class="card__meta">ID: 483</div></a>
+<a class="card" href="/watch.php?id=54" data-title="fox usa"><div class="card__title">FOX USA</div><div class="card__meta">ID: 54</div></a>
+<a class="card" href="/watch.php?id=317" data-title="fx usa"><div class="card__title">FX USA</div><div class="card__meta">ID: 317</div></a>
+<a class="card" href="/watch.php?id=298" data-title="fxx usa"><div class="card__title">FXX USA</div><div class="card__meta">ID: 298</div></a>
+<a class="card" href="/watch.php?id=301" data-title="freeform"><div class="card__title">Freeform</div><div class="card__meta">ID: 301</div></a>
+<a class="card" href="/watch.php?id=347" data-title="fox news"><div class="card__title">Fox News</div><div class="card__meta">ID: 347</div></a>
+<a class="card" href="/watch.php?id=381" data-title="fx movie channel"><div class="card__title">FX Movie Channel</div><div class="card__meta">ID: 381</div></a>
+<a class="card" href="/watch.php?id=665" data-title="fyi"><div class="card__title">FYI</div><div class="card__meta">ID: 665</div></a>
+<a class="card" href="/watch.php?id=688" data-title="film4 uk"><div class="card__title">Film4 UK</div><div class="card__meta">ID: 688</div></a>
+<a class="card" href="/watch.php?id=744" data-title="fashion tv"><div class="card__title">Fashion TV</div><div class="card__meta">ID: 744</div></a>
+<a class="card" href="/watch.php?id=751" data-title="fetv - family entertainment television"><div class="card__title">FETV - Family Entertainment Television</div><div class="card__meta">ID: 751</div></a>
+<a class="card" href="/watch.php?id=768" data-title="foxny usa"><div class="card__title">FOXNY USA</div><div class="card__meta">ID: 768</div></a>
+<a class="card" href="/watch.php?id=775" data-title="fox weather channel"><div class="card__title">Fox Weather Channel</div><div class="card__meta">ID: 775</div></a>
+<a class="card" href="/watch.php?id=890" data-title="fanduel sports network arizona"><div class="card__title">FanDuel Sports Network Arizona</div><div class="card__meta">ID: 890</div></a>
+<a class="card" href="/watch.php?id=891" data-title="fanduel sports network detroit"><div class="card__title">FanDuel Sports Network Detroit</div><div class="card__meta">ID: 891</div></a>
+<a class="card" href="/watch.php?id=892" data-title="fanduel sports network florida"><div class="card__title">FanDuel Sports Network Florida</div><div class="card__meta">ID: 892</div></a>
+<a class="card" href="/watch.php?id=893" data-title="fanduel sports network great lakes"><div class="card__title">FanDuel Sports Network Great Lakes</div><div class="card__meta">ID: 893</div></a>
+<a class="card" href="/watch.php?id=894" data-title="fanduel sports network indiana"><div class="card__title">FanDuel Sports Network Indiana</div><div class="card__meta">ID: 894</div></a>
+<a class="card" href="/watch.php?id=895" data-title="fanduel sports network kansas city"><div class="card__title">FanDuel Sports Network Kansas City</div><div class="card__meta">ID: 895</div></a>
+<a class="card" href="/watch.php?id=896" data-title="fanduel sports network midwest"><div class="card__title">FanDuel Sports Network Midwest</div><div class="card__meta">ID: 896</div></a>
+<a class="card" href="/watch.php?id=897" data-title="fanduel sports network new orleans"><div class="card__title">FanDuel Sports Network New Orleans</div><div class="card__meta">ID: 897</div></a>
+<a class="card" href="/watch.php?id=898" data-title="fanduel sports network north"><div class="card__title">FanDuel Sports Network North</div><div class="card__meta">ID: 898</div></a>
+<a class="card" href="/watch.php?id=899" data-title="fanduel sports network ohio"><div class="card__title">FanDuel Sports Network Ohio</div><div class="card__meta">ID: 899</div></a>
+<a class="card" href="/watch.php?id=900" data-title="fanduel sports network oklahoma"><div class="card__title">FanDuel Sports Network Oklahoma</div><div class="card__meta">ID: 900</div></a>
+<a class="card" href="/watch.php?id=902" data-title="fanduel sports network socal"><div class="card__title">FanDuel Sports Network SoCal</div><div class="card__meta">ID: 902</div></a>
+<a class="card" href="/watch.php?id=903" data-title="fanduel sports network south"><div class="card__title">FanDuel Sports Network South</div><div class="card__meta">ID: 903</div></a>
+<a class="card" href="/watch.php?id=904" data-title="fanduel sports network southeast"><div class="card__title">FanDuel Sports Network Southeast</div><div class="card__meta">ID: 904</div></a>
+<a class="card" href="/watch.php?id=905" data-title="fanduel sports network sun"><div class="card__title">FanDuel Sports Network Sun</div><div class="card__meta">ID: 905</div></a>
+<a class="card" href="/watch.php?id=906" data-title="fanduel sports network west"><div class="card__title">FanDuel Sports Network West</div><div class="card__meta">ID: 906</div></a>
+<a class="card" href="/watch.php?id=907" data-title="fanduel sports network wisconsin"><div class="card__title">FanDuel Sports Network Wisconsin</div><div class="card__meta">ID: 907</div></a>
+<a class="card" href="/watch.php?id=950" data-title="france 2"><div class="card__title">France 2</div><div class="card__meta">ID: 950</div></a>
+<a class="card" href="/watch.php?id=951" data-title="france 3"><div class="card__title">France 3</div><div class="card__meta">ID: 951</div></a>
+<a class="card" href="/watch.php?id=952" data-title="france 4"><div class="card__title">France 4</div><div class="card__meta">ID: 952</div></a>
+<a class="card" href="/watch.php?id=953" data-title="france 5"><div class="card__title">France 5</div><div class="card__meta">ID: 953</div></a>
+<a class="card" href="/watch.php?id=530" data-title="gol play spain"><div class="card__title">GOL PLAY Spain</div><div class="card__meta">ID: 530</div></a>
+<a class="card" href="/watch.php?id=318" data-title="golf channel usa"><div class="card__title">GOLF Channel USA</div><div class="card__meta">ID: 318</div></a>
+<a class="card" href="/watch.php?id=319" data-title="game show network"><div class="card__title">Game Show Network</div><div class="card__meta">ID: 319</div></a>
+<a class="card" href="/watch.php?id=597" data-title="goltv usa"><div class="card__title">GOLTV USA</div><div class="card__meta">ID: 597</div></a>
+<a class="card" href="/watch.php?id=687" data-title="gold uk"><div class="card__title">Gold UK</div><div class="card__meta">ID: 687</div></a>
+<a class="card" href="/watch.php?id=699" data-title="great american family channel (gac)"><div class="card__title">Great American Family Channel (GAC)</div><div class="card__meta">ID: 699</div></a>
+<a class="card" href="/watch.php?id=743" data-title="galavisi贸n usa"><div class="card__title">Galavisi贸n USA</div><div class="card__meta">ID: 743</div></a>
+<a class="card" href="/watch.php?id=752" data-title="grit channel"><div class="card__title">Grit Channel</div><div class="card__meta">ID: 752</div></a>
+<a class="card" href="/watch.php?id=760" data-title="globo sp"><div class="card__title">Globo SP</div><div class="card__meta">ID: 760</div></a>
+<a class="card" href="/watch.php?id=761" data-title="globo rio"><div class="card__title">Globo RIO</div><div class="card__meta">ID: 761</div></a>
+<a class="card" href="/watch.php?id=836" data-title="global ca"><div class="card__title">Global CA</div><div class="card__meta">ID: 836</div></a>
+<a class="card" href="/watch.php?id=320" data-title="the hallmark channel"><div class="card__title">The Hallmark Channel</div><div class="card__meta">ID: 320</div></a>
+<a class="card" href="/watch.php?id=296" data-title="hallmark movies & mysterie"><div class="card__title">Hallmark Movies & Mysterie</div><div class="card__meta">ID: 296</div></a>
+<a class="card" href="/watch.php?id=282" data-title="heroes & icons (h&i) usa"><div class="card__title">Heroes & Icons (H&I) USA</div><div class="card__meta">ID: 282</div></a>
+<a class="card" href="/watch.php?id=321" data-title="hbo usa"><div class="card__title">HBO USA</div><div class="card__meta">ID: 321</div></a>
+<a class="card" href="/watch.php?id=689" data-title="hbo2 usa"><div class="card__title">HBO2 USA</div><div class="card__meta">ID: 689</div></a>
+<a class="card" href="/watch.php?id=690" data-title="hbo comedy usa"><div class="card__title">HBO Comedy USA</div><div class="card__meta">ID: 690</div></a>
+<a class="card" href="/watch.php?id=691" data-title="hbo family usa"><div class="card__title">HBO Family USA</div><div class="card__meta">ID: 691</div></a>
+<a class="card" href="/watch.php?id=692" data-title="hbo latino usa"><div class="card__title">HBO Latino USA</div><div class="card__meta">ID: 692</div></a>
+<a class="card" href="/watch.php?id=693" data-title="hbo signature usa"><div class="card__title">HBO Signature USA</div><div class="card__meta">ID: 693</div></a>
+<a class="card" href="/watch.php?id=694" data-title="hbo zone usa"><div class="card__title">HBO Zone USA</div><div class="card__meta">ID: 694</div></a>
+<a class="card" href="/watch.php?id=569" data-title="hbo poland"><div class="card__title">HBO Poland</div><div class="card__meta">ID: 569</div></a>
+<a class="card" href="/watch.php?id=322" data-title="history usa"><div class="card__title">History USA</div><div class="card__meta">ID: 322</div></a>
+<a class="card" href="/watch.php?id=323" data-title="headline news"><div class="card__title">Headline News</div><div class="card__meta">ID: 323</div></a>
+<a class="card" href="/watch.php?id=382" data-title="hgtv"><div class="card__title">HGTV</div><div class="card__meta">ID: 382</div></a>
+<a class="card" href="/watch.php?id=846" data-title="happy tv serbia"><div class="card__title">Happy TV Serbia</div><div class="card__meta">ID: 846</div></a>
+<a class="card" href="/watch.php?id=553" data-title="hot3 israel"><div class="card__title">HOT3 Israel</div><div class="card__meta">ID: 553</div></a>
+<a class="card" href="/watch.php?id=350" data-title="itv 1 uk"><div class="card__title">ITV 1 UK</div><div class="card__meta">ID: 350</div></a>
+<a class="card" href="/watch.php?id=351" data-title="itv 2 uk"><div class="card__title">ITV 2 UK</div><div class="card__meta">ID: 351</div></a>
+<a class="card" href="/watch.php?id=352" data-title="itv 3 uk"><div class="card__title">ITV 3 UK</div><div class="card__meta">ID: 352</div></a>
+<a class="card" href="/watch.php?id=353" data-title="itv 4 uk"><div class="card__title">ITV 4 UK</div><div class="card__meta">ID: 353</div></a>
+<a class="card" href="/watch.php?id=876" data-title="itvbe"><div class="card__title">ITVBE</div><div class="card__meta">ID: 876</div></a>
+<a class="card" href="/watch.php?id=854" data-title="italia 1 italy"><div class="card__title">Italia 1 Italy</div><div class="card__meta">ID: 854</div></a>
+<a class="card" href="/watch.php?id=324" data-title="investigation discovery (id usa)"><div class="card__title">Investigation Discovery (ID USA)</div><div class="card__meta">ID: 324</div></a>
+<a class="card" href="/watch.php?id=325" data-title="ion usa"><div class="card__title">ION USA</div><div class="card__meta">ID: 325</div></a>
+<a class="card" href="/watch.php?id=656" data-title="ifc tv usa"><div class="card__title">IFC TV USA</div><div class="card__meta">ID: 656</div></a>
+<a class="card" href="/watch.php?id=803" data-title="kanal 4 denmark"><div class="card__title">Kanal 4 Denmark</div><div class="card__meta">ID: 803</div></a>
+<a class="card" href="/watch.php?id=804" data-title="kanal 5 denmark"><div class="card__title">Kanal 5 Denmark</div><div class="card__meta">ID: 804</div></a>
+<a class="card" href="/watch.php?id=731" data-title="kabel eins (kabel 1) de"><div class="card__title">Kabel Eins (Kabel 1) DE</div><div class="card__meta">ID: 731</div></a>
+<a class="card" href="/watch.php?id=1001" data-title="kanal d turkey"><div class="card__title">Kanal D Turkey</div><div class="card__meta">ID: 1001</div></a>
+<a class="card" href="/watch.php?id=276" data-title="laligatv uk"><div class="card__title">LaLigaTV UK</div><div class="card__meta">ID: 276</div></a>
+<a class="card" href="/watch.php?id=278" data-title="law & crime network"><div class="card__title">Law & Crime Network</div><div class="card__meta">ID: 278</div></a>
+<a class="card" href="/watch.php?id=539" data-title="laliga smartbank tv"><div class="card__title">LaLiga SmartBank TV</div><div class="card__meta">ID: 539</div></a>
+<a class="card" href="/watch.php?id=645" data-title="l'equipe france"><div class="card__title">L'Equipe France</div><div class="card__meta">ID: 645</div></a>
+<a class="card" href="/watch.php?id=534" data-title="la sexta spain"><div class="card__title">La Sexta Spain</div><div class="card__meta">ID: 534</div></a>
+<a class="card" href="/watch.php?id=826" data-title="liverpool tv (lfc tv)"><div class="card__title">Liverpool TV (LFC TV)</div><div class="card__meta">ID: 826</div></a>
+<a class="card" href="/watch.php?id=849" data-title="logo tv usa"><div class="card__title">Logo TV USA</div><div class="card__meta">ID: 849</div></a>
+<a class="card" href="/watch.php?id=924" data-title="las estrellas"><div class="card__title">Las Estrellas</div><div class="card__meta">ID: 924</div></a>
+<a class="card" href="/watch.php?id=962" data-title="lci france"><div class="card__title">LCI France</div><div class="card__meta">ID: 962</div></a>
+<a class="card" href="/watch.php?id=326" data-title="lifetime network"><div class="card__title">Lifetime Network</div><div class="card__meta">ID: 326</div></a>
+<a class="card" href="/watch.php?id=389" data-title="lifetime movies network"><div class="card__title">Lifetime Movies Network</div><div class="card__meta">ID: 389</div></a>
+<a class="card" href="/watch.php?id=855" data-title="la7 italy"><div class="card__title">La7 Italy</div><div class="card__meta">ID: 855</div></a>
+<a class="card" href="/watch.php?id=856" data-title="la7d hd+ italy"><div class="card__title">LA7d HD+ Italy</div><div class="card__meta">ID: 856</div></a>
+<a class="card" href="/watch.php?id=136" data-title="match football 1 russia"><div class="card__title">Match Football 1 Russia</div><div class="card__meta">ID: 136</div></a>
+<a class="card" href="/watch.php?id=137" data-title="match football 2 russia"><div class="card__title">Match Football 2 Russia</div><div class="card__meta">ID: 137</div></a>
+<a class="card" href="/watch.php?id=138" data-title="match football 3 russia"><div class="card__title">Match Football 3 Russia</div><div class="card__meta">ID: 138</div></a>
+<a class="card" href="/watch.php?id=573" data-title="match premier russia"><div class="card__title">Match Premier Russia</div><div class="card__meta">ID: 573</div></a>
+<a class="card" href="/watch.php?id=127" data-title="match tv russia"><div class="card__title">Match TV Russia</div><div class="card__meta">ID: 127</div></a>
+<a class="card" href="/watch.php?id=395" data-title="матч! боец russia"><div class="card__title">МАТЧ! БОЕЦ Russia</div><div class="card__meta">ID: 395</div></a>
+<a class="card" href="/watch.php?id=84" data-title="movistar laliga"><div class="card__title">Movistar Laliga</div><div class="card__meta">ID: 84</div></a>
+<a class="card" href="/watch.php?id=435" data-title="movistar liga de campeones"><div class="card__title">Movistar Liga de Campeones</div><div class="card__meta">ID: 435</div></a>
+<a class="card" href="/watch.php?id=436" data-title="movistar deportes spain"><div class="card__title">Movistar Deportes Spain</div><div class="card__meta">ID: 436</div></a>
+<a class="card" href="/watch.php?id=438" data-title="movistar deportes 2 spain"><div class="card__title">Movistar Deportes 2 Spain</div><div class="card__meta">ID: 438</div></a>
+<a class="card" href="/watch.php?id=526" data-title="movistar deportes 3 spain"><div class="card__title">Movistar Deportes 3 Spain</div><div class="card__meta">ID: 526</div></a>
+<a class="card" href="/watch.php?id=527" data-title="movistar deportes 4 spain"><div class="card__title">Movistar Deportes 4 Spain</div><div class="card__meta">ID: 527</div></a>
+<a class="card" href="/watch.php?id=528" data-title="movistar golf spain"><div class="card__title">Movistar Golf Spain</div><div class="card__meta">ID: 528</div></a>
+<a class="card" href="/watch.php?id=563" data-title="motowizja poland"><div class="card__title">Motowizja Poland</div><div class="card__meta">ID: 563</div></a>
+<a class="card" href="/watch.php?id=765" data-title="msg usa"><div class="card__title">MSG USA</div><div class="card__meta">ID: 765</div></a>
+<a class="card" href="/watch.php?id=327" data-title="msnbc"><div class="card__title">MSNBC</div><div class="card__meta">ID: 327</div></a>
+<a class="card" href="/watch.php?id=299" data-title="magnolia network"><div class="card__title">Magnolia Network</div><div class="card__meta">ID: 299</div></a>
+<a class="card" href="/watch.php?id=265" data-title="m4 sports hungary"><div class="card__title">M4 Sports Hungary</div><div class="card__meta">ID: 265</div></a>
+<a class="card" href="/watch.php?id=437" data-title="movistar supercopa de españa"><div class="card__title">Movistar Supercopa de España</div><div class="card__meta">ID: 437</div></a>
+<a class="card" href="/watch.php?id=367" data-title="mtv uk"><div class="card__title">MTV UK</div><div class="card__meta">ID: 367</div></a>
+<a class="card" href="/watch.php?id=371" data-title="mtv usa"><div class="card__title">MTV USA</div><div class="card__meta">ID: 371</div></a>
+<a class="card" href="/watch.php?id=377" data-title="mutv uk"><div class="card__title">MUTV UK</div><div class="card__meta">ID: 377</div></a>
+<a class="card" href="/watch.php?id=470" data-title="m6 france"><div class="card__title">M6 France</div><div class="card__meta">ID: 470</div></a>
+<a class="card" href="/watch.php?id=646" data-title="mavtv usa"><div class="card__title">MAVTV USA</div><div class="card__meta">ID: 646</div></a>
+<a class="card" href="/watch.php?id=779" data-title="max sport 1 croatia"><div class="card__title">Max Sport 1 Croatia</div><div class="card__meta">ID: 779</div></a>
+<a class="card" href="/watch.php?id=780" data-title="max sport 2 croatia"><div class="card__title">Max Sport 2 Croatia</div><div class="card__meta">ID: 780</div></a>
+<a class="card" href="/watch.php?id=770" data-title="marquee sports network"><div class="card__title">Marquee Sports Network</div><div class="card__meta">ID: 770</div></a>
+<a class="card" href="/watch.php?id=472" data-title="max sport 1 bulgaria"><div class="card__title">Max Sport 1 Bulgaria</div><div class="card__meta">ID: 472</div></a>
+<a class="card" href="/watch.php?id=473" data-title="max sport 2 bulgaria"><div class="card__title">Max Sport 2 Bulgaria</div><div class="card__meta">ID: 473</div></a>
+<a class="card" href="/watch.php?id=474" data-title="max sport 3 bulgaria"><div class="card__title">Max Sport 3 Bulgaria</div><div class="card__meta">ID: 474</div></a>
+<a class="card" href="/watch.php?id=475" data-title="max sport 4 bulgaria"><div class="card__title">Max Sport 4 Bulgaria</div><div class="card__meta">ID: 475</div></a>
+<a class="card" href="/watch.php?id=399" data-title="mlb network usa"><div class="card__title">MLB Network USA</div><div class="card__meta">ID: 399</div></a>
+<a class="card" href="/watch.php?id=829" data-title="masn usa"><div class="card__title">MASN USA</div><div class="card__meta">ID: 829</div></a>
+<a class="card" href="/watch.php?id=654" data-title="my9tv usa"><div class="card__title">MY9TV USA</div><div class="card__meta">ID: 654</div></a>
+<a class="card" href="/watch.php?id=661" data-title="motor trend"><div class="card__title">Motor Trend</div><div class="card__meta">ID: 661</div></a>
+<a class="card" href="/watch.php?id=662" data-title="metv usa"><div class="card__title">METV USA</div><div class="card__meta">ID: 662</div></a>
+<a class="card" href="/watch.php?id=733" data-title="mdr de"><div class="card__title">MDR DE</div><div class="card__meta">ID: 733</div></a>
+<a class="card" href="/watch.php?id=749" data-title="mundotoro tv spain"><div class="card__title">Mundotoro TV Spain</div><div class="card__meta">ID: 749</div></a>
+<a class="card" href="/watch.php?id=778" data-title="monumental sports network"><div class="card__title">Monumental Sports Network</div><div class="card__meta">ID: 778</div></a>
+<a class="card" href="/watch.php?id=806" data-title="mtv denmark"><div class="card__title">MTV Denmark</div><div class="card__meta">ID: 806</div></a>
+<a class="card" href="/watch.php?id=791" data-title="mgm+ usa / epix"><div class="card__title">MGM+ USA / Epix</div><div class="card__meta">ID: 791</div></a>
+<a class="card" href="/watch.php?id=277" data-title="nbc10 philadelphia"><div class="card__title">NBC10 Philadelphia</div><div class="card__meta">ID: 277</div></a>
+<a class="card" href="/watch.php?id=663" data-title="nhl network usa"><div class="card__title">NHL Network USA</div><div class="card__meta">ID: 663</div></a>
+<a class="card" href="/watch.php?id=667" data-title="nfl redzone"><div class="card__title">NFL RedZone</div><div class="card__meta">ID: 667</div></a>
+<a class="card" href="/watch.php?id=468" data-title="nova sport bulgaria"><div class="card__title">Nova Sport Bulgaria</div><div class="card__meta">ID: 468</div></a>
+<a class="card" href="/watch.php?id=582" data-title="nova sport serbia"><div class="card__title">Nova Sport Serbia</div><div class="card__meta">ID: 582</div></a>
+<a class="card" href="/watch.php?id=631" data-title="nova sports 1 greece"><div class="card__title">Nova Sports 1 Greece</div><div class="card__meta">ID: 631</div></a>
+<a class="card" href="/watch.php?id=632" data-title="nova sports 2 greece"><div class="card__title">Nova Sports 2 Greece</div><div class="card__meta">ID: 632</div></a>
+<a class="card" href="/watch.php?id=633" data-title="nova sports 3 greece"><div class="card__title">Nova Sports 3 Greece</div><div class="card__meta">ID: 633</div></a>
+<a class="card" href="/watch.php?id=634" data-title="nova sports 4 greece"><div class="card__title">Nova Sports 4 Greece</div><div class="card__meta">ID: 634</div></a>
+<a class="card" href="/watch.php?id=635" data-title="nova sports 5 greece"><div class="card__title">Nova Sports 5 Greece</div><div class="card__meta">ID: 635</div></a>
+<a class="card" href="/watch.php?id=636" data-title="nova sports 6 greece"><div class="card__title">Nova Sports 6 Greece</div><div class="card__meta">ID: 636</div></a>
+<a class="card" href="/watch.php?id=599" data-title="nova sports premier league greece"><div class="card__title">Nova Sports Premier League Greece</div><div class="card__meta">ID: 599</div></a>
+<a class="card" href="/watch.php?id=637" data-title="nova sports start greece"><div class="card__title">Nova Sports Start Greece</div><div class="card__meta">ID: 637</div></a>
+<a class="card" href="/watch.php?id=638" data-title="nova sports prime greece"><div class="card__title">Nova Sports Prime Greece</div><div class="card__meta">ID: 638</div></a>
+<a class="card" href="/watch.php?id=639" data-title="nova sports news greece"><div class="card__title">Nova Sports News Greece</div><div class="card__meta">ID: 639</div></a>
+<a class="card" href="/watch.php?id=666" data-title="nick music"><div class="card__title">Nick Music</div><div class="card__meta">ID: 666</div></a>
+<a class="card" href="/watch.php?id=762" data-title="nesn usa"><div class="card__title">NESN USA</div><div class="card__meta">ID: 762</div></a>
+<a class="card" href="/watch.php?id=53" data-title="nbc usa"><div class="card__title">NBC USA</div><div class="card__meta">ID: 53</div></a>
+<a class="card" href="/watch.php?id=404" data-title="nba tv usa"><div class="card__title">NBA TV USA</div><div class="card__meta">ID: 404</div></a>
+<a class="card" href="/watch.php?id=777" data-title="nbc sports philadelphia"><div class="card__title">NBC Sports Philadelphia</div><div class="card__meta">ID: 777</div></a>
+<a class="card" href="/watch.php?id=405" data-title="nfl network"><div class="card__title">NFL Network</div><div class="card__meta">ID: 405</div></a>
+<a class="card" href="/watch.php?id=753" data-title="nbc sports bay area"><div class="card__title">NBC Sports Bay Area</div><div class="card__meta">ID: 753</div></a>
+<a class="card" href="/watch.php?id=754" data-title="nbc sports boston"><div class="card__title">NBC Sports Boston</div><div class="card__meta">ID: 754</div></a>
+<a class="card" href="/watch.php?id=755" data-title="nbc sports california"><div class="card__title">NBC Sports California</div><div class="card__meta">ID: 755</div></a>
+<a class="card" href="/watch.php?id=769" data-title="nbcny usa"><div class="card__title">NBCNY USA</div><div class="card__meta">ID: 769</div></a>
+<a class="card" href="/watch.php?id=480" data-title="nova tv bulgaria"><div class="card__title">Nova TV Bulgaria</div><div class="card__meta">ID: 480</div></a>
+<a class="card" href="/watch.php?id=847" data-title="nova s serbia"><div class="card__title">Nova S Serbia</div><div class="card__meta">ID: 847</div></a>
+<a class="card" href="/watch.php?id=292" data-title="newsnation usa"><div class="card__title">NewsNation USA</div><div class="card__meta">ID: 292</div></a>
+<a class="card" href="/watch.php?id=328" data-title="national geographic (ngc)"><div class="card__title">National Geographic (NGC)</div><div class="card__meta">ID: 328</div></a>
+<a class="card" href="/watch.php?id=329" data-title="nick jr"><div class="card__title">NICK JR</div><div class="card__meta">ID: 329</div></a>
+<a class="card" href="/watch.php?id=330" data-title="nick"><div class="card__title">NICK</div><div class="card__meta">ID: 330</div></a>
+<a class="card" href="/watch.php?id=649" data-title="nicktoons"><div class="card__title">Nicktoons</div><div class="card__meta">ID: 649</div></a>
+<a class="card" href="/watch.php?id=736" data-title="ndr de"><div class="card__title">NDR DE</div><div class="card__meta">ID: 736</div></a>
+<a class="card" href="/watch.php?id=613" data-title="newsmax usa"><div class="card__title">Newsmax USA</div><div class="card__meta">ID: 613</div></a>
+<a class="card" href="/watch.php?id=745" data-title="nat geo wild usa"><div class="card__title">Nat Geo Wild USA</div><div class="card__meta">ID: 745</div></a>
+<a class="card" href="/watch.php?id=835" data-title="noovo ca"><div class="card__title">Noovo CA</div><div class="card__meta">ID: 835</div></a>
+<a class="card" href="/watch.php?id=845" data-title="nbc universo"><div class="card__title">NBC Universo</div><div class="card__meta">ID: 845</div></a>
+<a class="card" href="/watch.php?id=1003" data-title="now tv turkey"><div class="card__title">NOW TV Turkey</div><div class="card__meta">ID: 1003</div></a>
+<a class="card" href="/watch.php?id=1021" data-title="nova sport 1 cz"><div class="card__title">Nova Sport 1 CZ</div><div class="card__meta">ID: 1021</div></a>
+<a class="card" href="/watch.php?id=1022" data-title="nova sport 2 cz"><div class="card__title">Nova Sport 2 CZ</div><div class="card__meta">ID: 1022</div></a>
+<a class="card" href="/watch.php?id=1023" data-title="nova sport 3 cz"><div class="card__title">Nova Sport 3 CZ</div><div class="card__meta">ID: 1023</div></a>
+<a class="card" href="/watch.php?id=1024" data-title="nova sport 4 cz"><div class="card__title">Nova Sport 4 CZ</div><div class="card__meta">ID: 1024</div></a>
+<a class="card" href="/watch.php?id=1025" data-title="nova sport 5 cz"><div class="card__title">Nova Sport 5 CZ</div><div class="card__meta">ID: 1025</div></a>
+<a class="card" href="/watch.php?id=1026" data-title="nova sport 6 cz"><div class="card__title">Nova Sport 6 CZ</div><div class="card__meta">ID: 1026</div></a>
+<a class="card" href="/watch.php?id=611" data-title="ontime sports"><div class="card__title">OnTime Sports</div><div class="card__meta">ID: 611</div></a>
+<a class="card" href="/watch.php?id=541" data-title="one 1 hd israel"><div class="card__title">ONE 1 HD Israel</div><div class="card__meta">ID: 541</div></a>
+<a class="card" href="/watch.php?id=542" data-title="one 2 hd israel"><div class="card__title">ONE 2 HD Israel</div><div class="card__meta">ID: 542</div></a>
+<a class="card" href="/watch.php?id=439" data-title="orange sport 1 romania"><div class="card__title">Orange Sport 1 Romania</div><div class="card__meta">ID: 439</div></a>
+<a class="card" href="/watch.php?id=440" data-title="orange sport 2 romania"><div class="card__title">Orange Sport 2 Romania</div><div class="card__meta">ID: 440</div></a>
+<a class="card" href="/watch.php?id=441" data-title="orange sport 3 romania"><div class="card__title">Orange Sport 3 Romania</div><div class="card__meta">ID: 441</div></a>
+<a class="card" href="/watch.php?id=442" data-title="orange sport 4 romania"><div class="card__title">Orange Sport 4 Romania</div><div class="card__meta">ID: 442</div></a>
+<a class="card" href="/watch.php?id=331" data-title="oprah winfrey network (own)"><div class="card__title">Oprah Winfrey Network (OWN)</div><div class="card__meta">ID: 331</div></a>
+<a class="card" href="/watch.php?id=332" data-title="oxygen true crime"><div class="card__title">Oxygen True Crime</div><div class="card__meta">ID: 332</div></a>
+<a class="card" href="/watch.php?id=848" data-title="outdoor channel usa"><div class="card__title">Outdoor Channel USA</div><div class="card__meta">ID: 848</div></a>
+<a class="card" href="/watch.php?id=1027" data-title="oneplay sport 1 cz"><div class="card__title">Oneplay Sport 1 CZ</div><div class="card__meta">ID: 1027</div></a>
+<a class="card" href="/watch.php?id=1028" data-title="oneplay sport 2 cz"><div class="card__title">Oneplay Sport 2 CZ</div><div class="card__meta">ID: 1028</div></a>
+<a class="card" href="/watch.php?id=1029" data-title="oneplay sport 3 cz"><div class="card__title">Oneplay Sport 3 CZ</div><div class="card__meta">ID: 1029</div></a>
+<a class="card" href="/watch.php?id=562" data-title="polsat poland"><div class="card__title">Polsat Poland</div><div class="card__meta">ID: 562</div></a>
+<a class="card" href="/watch.php?id=47" data-title="polsat sport poland"><div class="card__title">Polsat Sport Poland</div><div class="card__meta">ID: 47</div></a>
+<a class="card" href="/watch.php?id=50" data-title="polsat sport 2 poland"><div class="card__title">Polsat Sport 2 Poland</div><div class="card__meta">ID: 50</div></a>
+<a class="card" href="/watch.php?id=129" data-title="polsat sport 3 poland"><div class="card__title">Polsat Sport 3 Poland</div><div class="card__meta">ID: 129</div></a>
+<a class="card" href="/watch.php?id=443" data-title="polsat news poland"><div class="card__title">Polsat News Poland</div><div class="card__meta">ID: 443</div></a>
+<a class="card" href="/watch.php?id=564" data-title="polsat film poland"><div class="card__title">Polsat Film Poland</div><div class="card__meta">ID: 564</div></a>
+<a class="card" href="/watch.php?id=718" data-title="porto canal portugal"><div class="card__title">Porto Canal Portugal</div><div class="card__meta">ID: 718</div></a>
+<a class="card" href="/watch.php?id=730" data-title="prosieben (pro7) de"><div class="card__title">ProSieben (PRO7) DE</div><div class="card__meta">ID: 730</div></a>
+<a class="card" href="/watch.php?id=771" data-title="premier sports ireland 1"><div class="card__title">Premier Sports Ireland 1</div><div class="card__meta">ID: 771</div></a>
+<a class="card" href="/watch.php?id=450" data-title="ptv sports"><div class="card__title">PTV Sports</div><div class="card__meta">ID: 450</div></a>
+<a class="card" href="/watch.php?id=43" data-title="pdc tv"><div class="card__title">PDC TV</div><div class="card__meta">ID: 43</div></a>
+<a class="card" href="/watch.php?id=88" data-title="premier brasil"><div class="card__title">Premier Brasil</div><div class="card__meta">ID: 88</div></a>
+<a class="card" href="/watch.php?id=583" data-title="prima sport 1"><div class="card__title">Prima Sport 1</div><div class="card__meta">ID: 583</div></a>
+<a class="card" href="/watch.php?id=584" data-title="prima sport 2"><div class="card__title">Prima Sport 2</div><div class="card__meta">ID: 584</div></a>
+<a class="card" href="/watch.php?id=585" data-title="prima sport 3"><div class="card__title">Prima Sport 3</div><div class="card__meta">ID: 585</div></a>
+<a class="card" href="/watch.php?id=586" data-title="prima sport 4"><div class="card__title">Prima Sport 4</div><div class="card__meta">ID: 586</div></a>
+<a class="card" href="/watch.php?id=334" data-title="paramount network"><div class="card__title">Paramount Network</div><div class="card__meta">ID: 334</div></a>
+<a class="card" href="/watch.php?id=653" data-title="pop tv usa"><div class="card__title">POP TV USA</div><div class="card__meta">ID: 653</div></a>
+<a class="card" href="/watch.php?id=799" data-title="premier sports ireland 2"><div class="card__title">Premier Sports Ireland 2</div><div class="card__meta">ID: 799</div></a>
+<a class="card" href="/watch.php?id=843" data-title="prima tv ro"><div class="card__title">Prima TV RO</div><div class="card__meta">ID: 843</div></a>
+<a class="card" href="/watch.php?id=1030" data-title="premier sport 1 cz"><div class="card__title">Premier Sport 1 CZ</div><div class="card__meta">ID: 1030</div></a>
+<a class="card" href="/watch.php?id=1031" data-title="premier sport 2 cz"><div class="card__title">Premier Sport 2 CZ</div><div class="card__meta">ID: 1031</div></a>
+<a class="card" href="/watch.php?id=1032" data-title="premier sport 3 cz"><div class="card__title">Premier Sport 3 CZ</div><div class="card__meta">ID: 1032</div></a>
+<a class="card" href="/watch.php?id=287" data-title="pac-12 network usa"><div class="card__title">Pac-12 Network USA</div><div class="card__meta">ID: 287</div></a>
+<a class="card" href="/watch.php?id=210" data-title="pbs usa"><div class="card__title">PBS USA</div><div class="card__meta">ID: 210</div></a>
+<a class="card" href="/watch.php?id=293" data-title="reelz channel"><div class="card__title">Reelz Channel</div><div class="card__meta">ID: 293</div></a>
+<a class="card" href="/watch.php?id=364" data-title="rte 1"><div class="card__title">RTE 1</div><div class="card__meta">ID: 364</div></a>
+<a class="card" href="/watch.php?id=365" data-title="rte 2"><div class="card__title">RTE 2</div><div class="card__meta">ID: 365</div></a>
+<a class="card" href="/watch.php?id=119" data-title="rmc sport 1 france"><div class="card__title">RMC Sport 1 France</div><div class="card__meta">ID: 119</div></a>
+<a class="card" href="/watch.php?id=120" data-title="rmc sport 2 france"><div class="card__title">RMC Sport 2 France</div><div class="card__meta">ID: 120</div></a>
+<a class="card" href="/watch.php?id=954" data-title="rmc story france"><div class="card__title">RMC Story France</div><div class="card__meta">ID: 954</div></a>
+<a class="card" href="/watch.php?id=719" data-title="rtp 1 portugal"><div class="card__title">RTP 1 Portugal</div><div class="card__meta">ID: 719</div></a>
+<a class="card" href="/watch.php?id=720" data-title="rtp 2 portugal"><div class="card__title">RTP 2 Portugal</div><div class="card__meta">ID: 720</div></a>
+<a class="card" href="/watch.php?id=721" data-title="rtp 3 portugal"><div class="card__title">RTP 3 Portugal</div><div class="card__meta">ID: 721</div></a>
+<a class="card" href="/watch.php?id=850" data-title="rai 1 italy"><div class="card__title">Rai 1 Italy</div><div class="card__meta">ID: 850</div></a>
+<a class="card" href="/watch.php?id=851" data-title="rai 2 italy"><div class="card__title">Rai 2 Italy</div><div class="card__meta">ID: 851</div></a>
+<a class="card" href="/watch.php?id=852" data-title="rai 3 italy"><div class="card__title">Rai 3 Italy</div><div class="card__meta">ID: 852</div></a>
+<a class="card" href="/watch.php?id=853" data-title="rai 4 italy"><div class="card__title">Rai 4 Italy</div><div class="card__meta">ID: 853</div></a>
+<a class="card" href="/watch.php?id=882" data-title="rai sport italy"><div class="card__title">Rai Sport Italy</div><div class="card__meta">ID: 882</div></a>
+<a class="card" href="/watch.php?id=858" data-title="rai premium italy"><div class="card__title">Rai Premium Italy</div><div class="card__meta">ID: 858</div></a>
+<a class="card" href="/watch.php?id=523" data-title="real madrid tv spain"><div class="card__title">Real Madrid TV Spain</div><div class="card__meta">ID: 523</div></a>
+<a class="card" href="/watch.php?id=740" data-title="rtl de"><div class="card__title">RTL DE</div><div class="card__meta">ID: 740</div></a>
+<a class="card" href="/watch.php?id=839" data-title="rds ca"><div class="card__title">RDS CA</div><div class="card__meta">ID: 839</div></a>
+<a class="card" href="/watch.php?id=840" data-title="rds 2 ca"><div class="card__title">RDS 2 CA</div><div class="card__meta">ID: 840</div></a>
+<a class="card" href="/watch.php?id=841" data-title="rds info ca"><div class="card__title">RDS Info CA</div><div class="card__meta">ID: 841</div></a>
+<a class="card" href="/watch.php?id=471" data-title="ring bulgaria"><div class="card__title">Ring Bulgaria</div><div class="card__meta">ID: 471</div></a>
+<a class="card" href="/watch.php?id=390" data-title="rtl7 netherland"><div class="card__title">RTL7 Netherland</div><div class="card__meta">ID: 390</div></a>
+<a class="card" href="/watch.php?id=555" data-title="racing tv uk"><div class="card__title">Racing Tv UK</div><div class="card__meta">ID: 555</div></a>
+<a class="card" href="/watch.php?id=607" data-title="rally tv"><div class="card__title">Rally Tv</div><div class="card__meta">ID: 607</div></a>
+<a class="card" href="/watch.php?id=920" data-title="root sports northwest"><div class="card__title">Root Sports Northwest</div><div class="card__meta">ID: 920</div></a>
+<a class="card" href="/watch.php?id=35" data-title="sky sports football uk"><div class="card__title">Sky Sports Football UK</div><div class="card__meta">ID: 35</div></a>
+<a class="card" href="/watch.php?id=36" data-title="sky sports+ plus"><div class="card__title">Sky Sports+ Plus</div><div class="card__meta">ID: 36</div></a>
+<a class="card" href="/watch.php?id=37" data-title="sky sports action uk"><div class="card__title">Sky Sports Action UK</div><div class="card__meta">ID: 37</div></a>
+<a class="card" href="/watch.php?id=38" data-title="sky sports main event"><div class="card__title">Sky Sports Main Event</div><div class="card__meta">ID: 38</div></a>
+<a class="card" href="/watch.php?id=46" data-title="sky sports tennis uk"><div class="card__title">Sky Sports Tennis UK</div><div class="card__meta">ID: 46</div></a>
+<a class="card" href="/watch.php?id=130" data-title="sky sports premier league"><div class="card__title">Sky sports Premier League</div><div class="card__meta">ID: 130</div></a>
+<a class="card" href="/watch.php?id=60" data-title="sky sports f1 uk"><div class="card__title">Sky Sports F1 UK</div><div class="card__meta">ID: 60</div></a>
+<a class="card" href="/watch.php?id=65" data-title="sky sports cricket"><div class="card__title">Sky Sports Cricket</div><div class="card__meta">ID: 65</div></a>
+<a class="card" href="/watch.php?id=70" data-title="sky sports golf uk"><div class="card__title">Sky Sports Golf UK</div><div class="card__meta">ID: 70</div></a>
+<a class="card" href="/watch.php?id=240" data-title="sky sports 1 de"><div class="card__title">Sky Sports 1 DE</div><div class="card__meta">ID: 240</div></a>
+<a class="card" href="/watch.php?id=241" data-title="sky sports 2 de"><div class="card__title">Sky Sports 2 DE</div><div class="card__meta">ID: 241</div></a>
+<a class="card" href="/watch.php?id=574" data-title="sky sports golf italy"><div class="card__title">Sky Sports Golf Italy</div><div class="card__meta">ID: 574</div></a>
+<a class="card" href="/watch.php?id=575" data-title="sky sport motogp italy"><div class="card__title">Sky Sport MotoGP Italy</div><div class="card__meta">ID: 575</div></a>
+<a class="card" href="/watch.php?id=576" data-title="sky sport tennis italy"><div class="card__title">Sky Sport Tennis Italy</div><div class="card__meta">ID: 576</div></a>
+<a class="card" href="/watch.php?id=577" data-title="sky sport f1 italy"><div class="card__title">Sky Sport F1 Italy</div><div class="card__meta">ID: 577</div></a>
+<a class="card" href="/watch.php?id=366" data-title="sky sports news uk"><div class="card__title">Sky Sports News UK</div><div class="card__meta">ID: 366</div></a>
+<a class="card" href="/watch.php?id=449" data-title="sky sports mix uk"><div class="card__title">Sky Sports MIX UK</div><div class="card__meta">ID: 449</div></a>
+<a class="card" href="/watch.php?id=556" data-title="sky sport top event de"><div class="card__title">Sky Sport Top Event DE</div><div class="card__meta">ID: 556</div></a>
+<a class="card" href="/watch.php?id=557" data-title="sky sport mix de"><div class="card__title">Sky Sport Mix DE</div><div class="card__meta">ID: 557</div></a>
+<a class="card" href="/watch.php?id=558" data-title="sky sport bundesliga 1 hd"><div class="card__title">Sky Sport Bundesliga 1 HD</div><div class="card__meta">ID: 558</div></a>
+<a class="card" href="/watch.php?id=559" data-title="sky sport austria 1 hd"><div class="card__title">Sky Sport Austria 1 HD</div><div class="card__meta">ID: 559</div></a>
+<a class="card" href="/watch.php?id=759" data-title="sportsnet new york (sny)"><div class="card__title">SportsNet New York (SNY)</div><div class="card__meta">ID: 759</div></a>
+<a class="card" href="/watch.php?id=460" data-title="sky sport max italy"><div class="card__title">Sky Sport MAX Italy</div><div class="card__meta">ID: 460</div></a>
+<a class="card" href="/watch.php?id=461" data-title="sky sport uno italy"><div class="card__title">Sky Sport UNO Italy</div><div class="card__meta">ID: 461</div></a>
+<a class="card" href="/watch.php?id=462" data-title="sky sport arena italy"><div class="card__title">Sky Sport Arena Italy</div><div class="card__meta">ID: 462</div></a>
+<a class="card" href="/watch.php?id=554" data-title="sky sports racing uk"><div class="card__title">Sky Sports Racing UK</div><div class="card__meta">ID: 554</div></a>
+<a class="card" href="/watch.php?id=881" data-title="sky uno italy"><div class="card__title">Sky UNO Italy</div><div class="card__meta">ID: 881</div></a>
+<a class="card" href="/watch.php?id=885" data-title="sony ten 1"><div class="card__title">SONY TEN 1</div><div class="card__meta">ID: 885</div></a>
+<a class="card" href="/watch.php?id=886" data-title="sony ten 2"><div class="card__title">SONY TEN 2</div><div class="card__meta">ID: 886</div></a>
+<a class="card" href="/watch.php?id=887" data-title="sony ten 3"><div class="card__title">SONY TEN 3</div><div class="card__meta">ID: 887</div></a>
+<a class="card" href="/watch.php?id=946" data-title="sky sport bundesliga 2"><div class="card__title">Sky Sport Bundesliga 2</div><div class="card__meta">ID: 946</div></a>
+<a class="card" href="/watch.php?id=947" data-title="sky sport bundesliga 3"><div class="card__title">Sky Sport Bundesliga 3</div><div class="card__meta">ID: 947</div></a>
+<a class="card" href="/watch.php?id=948" data-title="sky sport bundesliga 4"><div class="card__title">Sky Sport Bundesliga 4</div><div class="card__meta">ID: 948</div></a>
+<a class="card" href="/watch.php?id=949" data-title="sky sport bundesliga 5"><div class="card__title">Sky Sport Bundesliga 5</div><div class="card__meta">ID: 949</div></a>
+<a class="card" href="/watch.php?id=965" data-title="sport en france"><div class="card__title">Sport en France</div><div class="card__meta">ID: 965</div></a>
+<a class="card" href="/watch.php?id=970" data-title="starz cinema"><div class="card__title">Starz Cinema</div><div class="card__meta">ID: 970</div></a>
+<a class="card" href="/watch.php?id=971" data-title="starz comedy"><div class="card__title">Starz Comedy</div><div class="card__meta">ID: 971</div></a>
+<a class="card" href="/watch.php?id=972" data-title="starz edge"><div class="card__title">Starz Edge</div><div class="card__meta">ID: 972</div></a>
+<a class="card" href="/watch.php?id=973" data-title="starz in black"><div class="card__title">Starz In Black</div><div class="card__meta">ID: 973</div></a>
+<a class="card" href="/watch.php?id=974" data-title="starz kids & family"><div class="card__title">Starz Kids & Family</div><div class="card__meta">ID: 974</div></a>
+<a class="card" href="/watch.php?id=975" data-title="starz encore"><div class="card__title">Starz Encore</div><div class="card__meta">ID: 975</div></a>
+<a class="card" href="/watch.php?id=976" data-title="starz encore action"><div class="card__title">Starz Encore Action</div><div class="card__meta">ID: 976</div></a>
+<a class="card" href="/watch.php?id=977" data-title="starz encore black"><div class="card__title">Starz Encore Black</div><div class="card__meta">ID: 977</div></a>
+<a class="card" href="/watch.php?id=978" data-title="starz encore classic"><div class="card__title">Starz Encore Classic</div><div class="card__meta">ID: 978</div></a>
+<a class="card" href="/watch.php?id=979" data-title="starz encore family"><div class="card__title">Starz Encore Family</div><div class="card__meta">ID: 979</div></a>
+<a class="card" href="/watch.php?id=980" data-title="starz encore suspense"><div class="card__title">Starz Encore Suspense</div><div class="card__meta">ID: 980</div></a>
+<a class="card" href="/watch.php?id=981" data-title="starz encore westerns"><div class="card__title">Starz Encore Westerns</div><div class="card__meta">ID: 981</div></a>
+<a class="card" href="/watch.php?id=982" data-title="spectrum sportsnet usa"><div class="card__title">Spectrum SportsNet USA</div><div class="card__meta">ID: 982</div></a>
+<a class="card" href="/watch.php?id=588" data-title="sky sport 1 nz"><div class="card__title">Sky Sport 1 NZ</div><div class="card__meta">ID: 588</div></a>
+<a class="card" href="/watch.php?id=589" data-title="sky sport 2 nz"><div class="card__title">Sky Sport 2 NZ</div><div class="card__meta">ID: 589</div></a>
+<a class="card" href="/watch.php?id=590" data-title="sky sport 3 nz"><div class="card__title">Sky Sport 3 NZ</div><div class="card__meta">ID: 590</div></a>
+<a class="card" href="/watch.php?id=591" data-title="sky sport 4 nz"><div class="card__title">Sky Sport 4 NZ</div><div class="card__meta">ID: 591</div></a>
+<a class="card" href="/watch.php?id=592" data-title="sky sport 5 nz"><div class="card__title">Sky Sport 5 NZ</div><div class="card__meta">ID: 592</div></a>
+<a class="card" href="/watch.php?id=593" data-title="sky sport 6 nz"><div class="card__title">Sky Sport 6 NZ</div><div class="card__meta">ID: 593</div></a>
+<a class="card" href="/watch.php?id=594" data-title="sky sport 7 nz"><div class="card__title">Sky Sport 7 NZ</div><div class="card__meta">ID: 594</div></a>
+<a class="card" href="/watch.php?id=595" data-title="sky sport 8 nz"><div class="card__title">Sky Sport 8 NZ</div><div class="card__meta">ID: 595</div></a>
+<a class="card" href="/watch.php?id=596" data-title="sky sport 9 nz"><div class="card__title">Sky Sport 9 NZ</div><div class="card__meta">ID: 596</div></a>
+<a class="card" href="/watch.php?id=587" data-title="sky sport select nz"><div class="card__title">Sky Sport Select NZ</div><div class="card__meta">ID: 587</div></a>
+<a class="card" href="/watch.php?id=49" data-title="sport tv1 portugal"><div class="card__title">Sport TV1 Portugal</div><div class="card__meta">ID: 49</div></a>
+<a class="card" href="/watch.php?id=74" data-title="sport tv2 portugal"><div class="card__title">Sport TV2 Portugal</div><div class="card__meta">ID: 74</div></a>
+<a class="card" href="/watch.php?id=289" data-title="sport tv4 portugal"><div class="card__title">Sport TV4 Portugal</div><div class="card__meta">ID: 289</div></a>
+<a class="card" href="/watch.php?id=454" data-title="sport tv3 portugal"><div class="card__title">Sport TV3 Portugal</div><div class="card__meta">ID: 454</div></a>
+<a class="card" href="/watch.php?id=290" data-title="sport tv5 portugal"><div class="card__title">Sport TV5 Portugal</div><div class="card__meta">ID: 290</div></a>
+<a class="card" href="/watch.php?id=291" data-title="sport tv6 portugal"><div class="card__title">Sport TV6 Portugal</div><div class="card__meta">ID: 291</div></a>
+<a class="card" href="/watch.php?id=722" data-title="sic portugal"><div class="card__title">SIC Portugal</div><div class="card__meta">ID: 722</div></a>
+<a class="card" href="/watch.php?id=385" data-title="sec network usa"><div class="card__title">SEC Network USA</div><div class="card__meta">ID: 385</div></a>
+<a class="card" href="/watch.php?id=78" data-title="sportv brasil"><div class="card__title">SporTV Brasil</div><div class="card__meta">ID: 78</div></a>
+<a class="card" href="/watch.php?id=79" data-title="sportv2 brasil"><div class="card__title">SporTV2 Brasil</div><div class="card__meta">ID: 79</div></a>
+<a class="card" href="/watch.php?id=80" data-title="sportv3 brasil"><div class="card__title">SporTV3 Brasil</div><div class="card__meta">ID: 80</div></a>
+<a class="card" href="/watch.php?id=101" data-title="sport klub 1 serbia"><div class="card__title">Sport Klub 1 Serbia</div><div class="card__meta">ID: 101</div></a>
+<a class="card" href="/watch.php?id=102" data-title="sport klub 2 serbia"><div class="card__title">Sport Klub 2 Serbia</div><div class="card__meta">ID: 102</div></a>
+<a class="card" href="/watch.php?id=103" data-title="sport klub 3 serbia"><div class="card__title">Sport Klub 3 Serbia</div><div class="card__meta">ID: 103</div></a>
+<a class="card" href="/watch.php?id=104" data-title="sport klub 4 serbia"><div class="card__title">Sport Klub 4 Serbia</div><div class="card__meta">ID: 104</div></a>
+<a class="card" href="/watch.php?id=453" data-title="sport klub hd serbia"><div class="card__title">Sport Klub HD Serbia</div><div class="card__meta">ID: 453</div></a>
+<a class="card" href="/watch.php?id=406" data-title="sportsnet ontario"><div class="card__title">Sportsnet Ontario</div><div class="card__meta">ID: 406</div></a>
+<a class="card" href="/watch.php?id=411" data-title="sportsnet one"><div class="card__title">Sportsnet One</div><div class="card__meta">ID: 411</div></a>
+<a class="card" href="/watch.php?id=407" data-title="sportsnet west"><div class="card__title">Sportsnet West</div><div class="card__meta">ID: 407</div></a>
+<a class="card" href="/watch.php?id=408" data-title="sportsnet east"><div class="card__title">Sportsnet East</div><div class="card__meta">ID: 408</div></a>
+<a class="card" href="/watch.php?id=409" data-title="sportsnet 360"><div class="card__title">Sportsnet 360</div><div class="card__meta">ID: 409</div></a>
+<a class="card" href="/watch.php?id=410" data-title="sportsnet world"><div class="card__title">Sportsnet World</div><div class="card__meta">ID: 410</div></a>
+<a class="card" href="/watch.php?id=412" data-title="supersport grandstand"><div class="card__title">SuperSport Grandstand</div><div class="card__meta">ID: 412</div></a>
+<a class="card" href="/watch.php?id=413" data-title="supersport psl"><div class="card__title">SuperSport PSL</div><div class="card__meta">ID: 413</div></a>
+<a class="card" href="/watch.php?id=414" data-title="supersport premier league"><div class="card__title">SuperSport Premier league</div><div class="card__meta">ID: 414</div></a>
+<a class="card" href="/watch.php?id=415" data-title="supersport laliga"><div class="card__title">SuperSport LaLiga</div><div class="card__meta">ID: 415</div></a>
+<a class="card" href="/watch.php?id=416" data-title="supersport variety 1"><div class="card__title">SuperSport Variety 1</div><div class="card__meta">ID: 416</div></a>
+<a class="card" href="/watch.php?id=417" data-title="supersport variety 2"><div class="card__title">SuperSport Variety 2</div><div class="card__meta">ID: 417</div></a>
+<a class="card" href="/watch.php?id=418" data-title="supersport variety 3"><div class="card__title">SuperSport Variety 3</div><div class="card__meta">ID: 418</div></a>
+<a class="card" href="/watch.php?id=419" data-title="supersport variety 4"><div class="card__title">SuperSport Variety 4</div><div class="card__meta">ID: 419</div></a>
+<a class="card" href="/watch.php?id=420" data-title="supersport action"><div class="card__title">SuperSport Action</div><div class="card__meta">ID: 420</div></a>
+<a class="card" href="/watch.php?id=421" data-title="supersport rugby"><div class="card__title">SuperSport Rugby</div><div class="card__meta">ID: 421</div></a>
+<a class="card" href="/watch.php?id=422" data-title="supersport golf"><div class="card__title">SuperSport Golf</div><div class="card__meta">ID: 422</div></a>
+<a class="card" href="/watch.php?id=423" data-title="supersport tennis"><div class="card__title">SuperSport Tennis</div><div class="card__meta">ID: 423</div></a>
+<a class="card" href="/watch.php?id=424" data-title="supersport motorsport"><div class="card__title">SuperSport Motorsport</div><div class="card__meta">ID: 424</div></a>
+<a class="card" href="/watch.php?id=56" data-title="supersport football"><div class="card__title">Supersport Football</div><div class="card__meta">ID: 56</div></a>
+<a class="card" href="/watch.php?id=368" data-title="supersport cricket"><div class="card__title">SuperSport Cricket</div><div class="card__meta">ID: 368</div></a>
+<a class="card" href="/watch.php?id=572" data-title="supersport maximo 1"><div class="card__title">SuperSport MaXimo 1</div><div class="card__meta">ID: 572</div></a>
+<a class="card" href="/watch.php?id=716" data-title="sporting tv portugal"><div class="card__title">Sporting TV Portugal</div><div class="card__meta">ID: 716</div></a>
+<a class="card" href="/watch.php?id=571" data-title="sportdigital fussball"><div class="card__title">SportDigital Fussball</div><div class="card__meta">ID: 571</div></a>
+<a class="card" href="/watch.php?id=764" data-title="spectrum sportsnet la"><div class="card__title">Spectrum Sportsnet LA</div><div class="card__meta">ID: 764</div></a>
+<a class="card" href="/watch.php?id=640" data-title="sportdigital1+ germany"><div class="card__title">Sportdigital1+ Germany</div><div class="card__meta">ID: 640</div></a>
+<a class="card" href="/watch.php?id=641" data-title="sport1 germany"><div class="card__title">Sport1 Germany</div><div class="card__meta">ID: 641</div></a>
+<a class="card" href="/watch.php?id=670" data-title="s4c uk"><div class="card__title">S4C UK</div><div class="card__meta">ID: 670</div></a>
+<a class="card" href="/watch.php?id=710" data-title="sport klub golf croatia"><div class="card__title">Sport KLUB Golf Croatia</div><div class="card__meta">ID: 710</div></a>
+<a class="card" href="/watch.php?id=729" data-title="sat.1 de"><div class="card__title">SAT.1 DE</div><div class="card__meta">ID: 729</div></a>
+<a class="card" href="/watch.php?id=671" data-title="sky cinema premiere uk"><div class="card__title">Sky Cinema Premiere UK</div><div class="card__meta">ID: 671</div></a>
+<a class="card" href="/watch.php?id=672" data-title="sky cinema select uk"><div class="card__title">Sky Cinema Select UK</div><div class="card__meta">ID: 672</div></a>
+<a class="card" href="/watch.php?id=673" data-title="sky cinema hits uk"><div class="card__title">Sky Cinema Hits UK</div><div class="card__meta">ID: 673</div></a>
+<a class="card" href="/watch.php?id=674" data-title="sky cinema greats uk"><div class="card__title">Sky Cinema Greats UK</div><div class="card__meta">ID: 674</div></a>
+<a class="card" href="/watch.php?id=675" data-title="sky cinema animation uk"><div class="card__title">Sky Cinema Animation UK</div><div class="card__meta">ID: 675</div></a>
+<a class="card" href="/watch.php?id=676" data-title="sky cinema family uk"><div class="card__title">Sky Cinema Family UK</div><div class="card__meta">ID: 676</div></a>
+<a class="card" href="/watch.php?id=677" data-title="sky cinema action uk"><div class="card__title">Sky Cinema Action UK</div><div class="card__meta">ID: 677</div></a>
+<a class="card" href="/watch.php?id=678" data-title="sky cinema comedy uk"><div class="card__title">Sky Cinema Comedy UK</div><div class="card__meta">ID: 678</div></a>
+<a class="card" href="/watch.php?id=679" data-title="sky cinema thriller uk"><div class="card__title">Sky Cinema Thriller UK</div><div class="card__meta">ID: 679</div></a>
+<a class="card" href="/watch.php?id=680" data-title="sky cinema drama uk"><div class="card__title">Sky Cinema Drama UK</div><div class="card__meta">ID: 680</div></a>
+<a class="card" href="/watch.php?id=681" data-title="sky cinema sci-fi horror uk"><div class="card__title">Sky Cinema Sci-Fi Horror UK</div><div class="card__meta">ID: 681</div></a>
+<a class="card" href="/watch.php?id=695" data-title="showtime shoxbet usa"><div class="card__title">Showtime SHOxBET USA</div><div class="card__meta">ID: 695</div></a>
+<a class="card" href="/watch.php?id=811" data-title="see denmark"><div class="card__title">SEE Denmark</div><div class="card__meta">ID: 811</div></a>
+<a class="card" href="/watch.php?id=859" data-title="sky cinema collection italy"><div class="card__title">Sky Cinema Collection Italy</div><div class="card__meta">ID: 859</div></a>
+<a class="card" href="/watch.php?id=860" data-title="sky cinema uno italy"><div class="card__title">Sky Cinema Uno Italy</div><div class="card__meta">ID: 860</div></a>
+<a class="card" href="/watch.php?id=861" data-title="sky cinema action italy"><div class="card__title">Sky Cinema Action Italy</div><div class="card__meta">ID: 861</div></a>
+<a class="card" href="/watch.php?id=862" data-title="sky cinema comedy italy"><div class="card__title">Sky Cinema Comedy Italy</div><div class="card__meta">ID: 862</div></a>
+<a class="card" href="/watch.php?id=863" data-title="sky cinema uno +24 italy"><div class="card__title">Sky Cinema Uno +24 Italy</div><div class="card__meta">ID: 863</div></a>
+<a class="card" href="/watch.php?id=864" data-title="sky cinema romance italy"><div class="card__title">Sky Cinema Romance Italy</div><div class="card__meta">ID: 864</div></a>
+<a class="card" href="/watch.php?id=865" data-title="sky cinema family italy"><div class="card__title">Sky Cinema Family Italy</div><div class="card__meta">ID: 865</div></a>
+<a class="card" href="/watch.php?id=866" data-title="sky cinema due +24 italy"><div class="card__title">Sky Cinema Due +24 Italy</div><div class="card__meta">ID: 866</div></a>
+<a class="card" href="/watch.php?id=867" data-title="sky cinema drama italy"><div class="card__title">Sky Cinema Drama Italy</div><div class="card__meta">ID: 867</div></a>
+<a class="card" href="/watch.php?id=868" data-title="8sky cinema suspense italy"><div class="card__title">8Sky Cinema Suspense Italy</div><div class="card__meta">ID: 868</div></a>
+<a class="card" href="/watch.php?id=869" data-title="sky sport 24 italy"><div class="card__title">Sky Sport 24 Italy</div><div class="card__meta">ID: 869</div></a>
+<a class="card" href="/watch.php?id=870" data-title="sky sport calcio italy"><div class="card__title">Sky Sport Calcio Italy</div><div class="card__meta">ID: 870</div></a>
+<a class="card" href="/watch.php?id=871" data-title="sky calcio 1 (251) italy"><div class="card__title">Sky Calcio 1 (251) Italy</div><div class="card__meta">ID: 871</div></a>
+<a class="card" href="/watch.php?id=872" data-title="sky calcio 2 (252) italy"><div class="card__title">Sky Calcio 2 (252) Italy</div><div class="card__meta">ID: 872</div></a>
+<a class="card" href="/watch.php?id=873" data-title="sky calcio 3 (253) italy"><div class="card__title">Sky Calcio 3 (253) Italy</div><div class="card__meta">ID: 873</div></a>
+<a class="card" href="/watch.php?id=874" data-title="sky calcio 4 (254) italy"><div class="card__title">Sky Calcio 4 (254) Italy</div><div class="card__meta">ID: 874</div></a>
+<a class="card" href="/watch.php?id=875" data-title="sky sport basket italy"><div class="card__title">Sky Sport Basket Italy</div><div class="card__meta">ID: 875</div></a>
+<a class="card" href="/watch.php?id=880" data-title="sky serie italy"><div class="card__title">Sky Serie Italy</div><div class="card__meta">ID: 880</div></a>
+<a class="card" href="/watch.php?id=284" data-title="starzplay criclife 1 hd"><div class="card__title">StarzPlay CricLife 1 HD</div><div class="card__meta">ID: 284</div></a>
+<a class="card" href="/watch.php?id=682" data-title="sky showcase uk"><div class="card__title">Sky Showcase UK</div><div class="card__meta">ID: 682</div></a>
+<a class="card" href="/watch.php?id=683" data-title="sky arts uk"><div class="card__title">Sky Arts UK</div><div class="card__meta">ID: 683</div></a>
+<a class="card" href="/watch.php?id=684" data-title="sky comedy uk"><div class="card__title">Sky Comedy UK</div><div class="card__meta">ID: 684</div></a>
+<a class="card" href="/watch.php?id=685" data-title="sky crime"><div class="card__title">Sky Crime</div><div class="card__meta">ID: 685</div></a>
+<a class="card" href="/watch.php?id=686" data-title="sky history"><div class="card__title">Sky History</div><div class="card__meta">ID: 686</div></a>
+<a class="card" href="/watch.php?id=708" data-title="sky max uk"><div class="card__title">Sky MAX UK</div><div class="card__meta">ID: 708</div></a>
+<a class="card" href="/watch.php?id=614" data-title="ssc sport 1"><div class="card__title">SSC Sport 1</div><div class="card__meta">ID: 614</div></a>
+<a class="card" href="/watch.php?id=615" data-title="ssc sport 2"><div class="card__title">SSC Sport 2</div><div class="card__meta">ID: 615</div></a>
+<a class="card" href="/watch.php?id=616" data-title="ssc sport 3"><div class="card__title">SSC Sport 3</div><div class="card__meta">ID: 616</div></a>
+<a class="card" href="/watch.php?id=617" data-title="ssc sport 4"><div class="card__title">SSC Sport 4</div><div class="card__meta">ID: 617</div></a>
+<a class="card" href="/watch.php?id=618" data-title="ssc sport 5"><div class="card__title">SSC Sport 5</div><div class="card__meta">ID: 618</div></a>
+<a class="card" href="/watch.php?id=619" data-title="ssc sport extra 1"><div class="card__title">SSC Sport Extra 1</div><div class="card__meta">ID: 619</div></a>
+<a class="card" href="/watch.php?id=620" data-title="ssc sport extra 2"><div class="card__title">SSC Sport Extra 2</div><div class="card__meta">ID: 620</div></a>
+<a class="card" href="/watch.php?id=621" data-title="ssc sport extra 3"><div class="card__title">SSC Sport Extra 3</div><div class="card__meta">ID: 621</div></a>
+<a class="card" href="/watch.php?id=140" data-title="sport 1 israel"><div class="card__title">Sport 1 Israel</div><div class="card__meta">ID: 140</div></a>
+<a class="card" href="/watch.php?id=141" data-title="sport 2 israel"><div class="card__title">Sport 2 Israel</div><div class="card__meta">ID: 141</div></a>
+<a class="card" href="/watch.php?id=142" data-title="sport 3 israel"><div class="card__title">Sport 3 Israel</div><div class="card__meta">ID: 142</div></a>
+<a class="card" href="/watch.php?id=143" data-title="sport 4 israel"><div class="card__title">Sport 4 Israel</div><div class="card__meta">ID: 143</div></a>
+<a class="card" href="/watch.php?id=144" data-title="sport 5 israel"><div class="card__title">Sport 5 Israel</div><div class="card__meta">ID: 144</div></a>
+<a class="card" href="/watch.php?id=145" data-title="sport 5 plus israel"><div class="card__title">Sport 5 PLUS Israel</div><div class="card__meta">ID: 145</div></a>
+<a class="card" href="/watch.php?id=146" data-title="sport 5 live israel"><div class="card__title">Sport 5 Live Israel</div><div class="card__meta">ID: 146</div></a>
+<a class="card" href="/watch.php?id=147" data-title="sport 5 star israel"><div class="card__title">Sport 5 Star Israel</div><div class="card__meta">ID: 147</div></a>
+<a class="card" href="/watch.php?id=148" data-title="sport 5 gold israel"><div class="card__title">Sport 5 Gold Israel</div><div class="card__meta">ID: 148</div></a>
+<a class="card" href="/watch.php?id=294" data-title="science channel"><div class="card__title">Science Channel</div><div class="card__meta">ID: 294</div></a>
+<a class="card" href="/watch.php?id=333" data-title="showtime usa"><div class="card__title">Showtime USA</div><div class="card__meta">ID: 333</div></a>
+<a class="card" href="/watch.php?id=335" data-title="starz"><div class="card__title">Starz</div><div class="card__meta">ID: 335</div></a>
+<a class="card" href="/watch.php?id=361" data-title="sky witness hd"><div class="card__title">Sky Witness HD</div><div class="card__meta">ID: 361</div></a>
+<a class="card" href="/watch.php?id=732" data-title="sixx de"><div class="card__title">Sixx DE</div><div class="card__meta">ID: 732</div></a>
+<a class="card" href="/watch.php?id=362" data-title="sky atlantic"><div class="card__title">Sky Atlantic</div><div class="card__meta">ID: 362</div></a>
+<a class="card" href="/watch.php?id=373" data-title="syfy usa"><div class="card__title">SYFY USA</div><div class="card__meta">ID: 373</div></a>
+<a class="card" href="/watch.php?id=658" data-title="sundance tv"><div class="card__title">Sundance TV</div><div class="card__meta">ID: 658</div></a>
+<a class="card" href="/watch.php?id=735" data-title="swr de"><div class="card__title">SWR DE</div><div class="card__meta">ID: 735</div></a>
+<a class="card" href="/watch.php?id=738" data-title="super rtl de"><div class="card__title">SUPER RTL DE</div><div class="card__meta">ID: 738</div></a>
+<a class="card" href="/watch.php?id=739" data-title="sr fernsehen de"><div class="card__title">SR Fernsehen DE</div><div class="card__meta">ID: 739</div></a>
+<a class="card" href="/watch.php?id=785" data-title="sky sports golf de"><div class="card__title">Sky Sports Golf DE</div><div class="card__meta">ID: 785</div></a>
+<a class="card" href="/watch.php?id=603" data-title="smithsonian channel"><div class="card__title">Smithsonian Channel</div><div class="card__meta">ID: 603</div></a>
+<a class="card" href="/watch.php?id=274" data-title="sky sports f1 de"><div class="card__title">Sky Sports F1 DE</div><div class="card__meta">ID: 274</div></a>
+<a class="card" href="/watch.php?id=884" data-title="sky sports tennis de"><div class="card__title">Sky Sports Tennis DE</div><div class="card__meta">ID: 884</div></a>
+<a class="card" href="/watch.php?id=883" data-title="sbs6 nl"><div class="card__title">SBS6 NL</div><div class="card__meta">ID: 883</div></a>
+<a class="card" href="/watch.php?id=811" data-title="see denmark"><div class="card__title">SEE Denmark</div><div class="card__meta">ID: 811</div></a>
+<a class="card" href="/watch.php?id=267" data-title="star sports 1 in"><div class="card__title">Star Sports 1 IN</div><div class="card__meta">ID: 267</div></a>
+<a class="card" href="/watch.php?id=268" data-title="star sports hindi in"><div class="card__title">Star Sports Hindi IN</div><div class="card__meta">ID: 268</div></a>
+<a class="card" href="/watch.php?id=792" data-title="showtime 2 usa (sho2) usa"><div class="card__title">Showtime 2 USA (SHO2) USA</div><div class="card__meta">ID: 792</div></a>
+<a class="card" href="/watch.php?id=793" data-title="showtime showcase usa"><div class="card__title">Showtime Showcase USA</div><div class="card__meta">ID: 793</div></a>
+<a class="card" href="/watch.php?id=794" data-title="showtime extreme usa"><div class="card__title">Showtime Extreme USA</div><div class="card__meta">ID: 794</div></a>
+<a class="card" href="/watch.php?id=795" data-title="showtime family zone (sho family zone) usa"><div class="card__title">Showtime Family Zone (SHO Family Zone) USA</div><div class="card__meta">ID: 795</div></a>
+<a class="card" href="/watch.php?id=796" data-title="showtime next (sho next) usa"><div class="card__title">Showtime Next (SHO Next) USA</div><div class="card__meta">ID: 796</div></a>
+<a class="card" href="/watch.php?id=797" data-title="showtime women usa"><div class="card__title">Showtime Women USA</div><div class="card__meta">ID: 797</div></a>
+<a class="card" href="/watch.php?id=921" data-title="space city home network"><div class="card__title">Space City Home Network</div><div class="card__meta">ID: 921</div></a>
+<a class="card" href="/watch.php?id=922" data-title="sportsnet pittsburgh"><div class="card__title">SportsNet Pittsburgh</div><div class="card__meta">ID: 922</div></a>
+<a class="card" href="/watch.php?id=1002" data-title="show tv turkey"><div class="card__title">Show TV Turkey</div><div class="card__meta">ID: 1002</div></a>
+<a class="card" href="/watch.php?id=1004" data-title="star tv turkey"><div class="card__title">Star TV Turkey</div><div class="card__meta">ID: 1004</div></a>
+<a class="card" href="/watch.php?id=31" data-title="tnt sports 1 uk"><div class="card__title">TNT Sports 1 UK</div><div class="card__meta">ID: 31</div></a>
+<a class="card" href="/watch.php?id=32" data-title="tnt sports 2 uk"><div class="card__title">TNT Sports 2 UK</div><div class="card__meta">ID: 32</div></a>
+<a class="card" href="/watch.php?id=33" data-title="tnt sports 3 uk"><div class="card__title">TNT Sports 3 UK</div><div class="card__meta">ID: 33</div></a>
+<a class="card" href="/watch.php?id=34" data-title="tnt sports 4 uk"><div class="card__title">TNT Sports 4 UK</div><div class="card__meta">ID: 34</div></a>
+<a class="card" href="/watch.php?id=111" data-title="tsn1"><div class="card__title">TSN1</div><div class="card__meta">ID: 111</div></a>
+<a class="card" href="/watch.php?id=112" data-title="tsn2"><div class="card__title">TSN2</div><div class="card__meta">ID: 112</div></a>
+<a class="card" href="/watch.php?id=113" data-title="tsn3"><div class="card__title">TSN3</div><div class="card__meta">ID: 113</div></a>
+<a class="card" href="/watch.php?id=114" data-title="tsn4"><div class="card__title">TSN4</div><div class="card__meta">ID: 114</div></a>
+<a class="card" href="/watch.php?id=115" data-title="tsn5"><div class="card__title">TSN5</div><div class="card__meta">ID: 115</div></a>
+<a class="card" href="/watch.php?id=565" data-title="tvn hd poland"><div class="card__title">TVN HD Poland</div><div class="card__meta">ID: 565</div></a>
+<a class="card" href="/watch.php?id=444" data-title="tvn24 poland"><div class="card__title">TVN24 Poland</div><div class="card__meta">ID: 444</div></a>
+<a class="card" href="/watch.php?id=560" data-title="tvp1 poland"><div class="card__title">TVP1 Poland</div><div class="card__meta">ID: 560</div></a>
+<a class="card" href="/watch.php?id=561" data-title="tvp2 poland"><div class="card__title">TVP2 Poland</div><div class="card__meta">ID: 561</div></a>
+<a class="card" href="/watch.php?id=532" data-title="telecinco spain"><div class="card__title">Telecinco Spain</div><div class="card__meta">ID: 532</div></a>
+<a class="card" href="/watch.php?id=533" data-title="tve la 1 spain"><div class="card__title">TVE La 1 Spain</div><div class="card__meta">ID: 533</div></a>
+<a class="card" href="/watch.php?id=536" data-title="tve la 2 spain"><div class="card__title">TVE La 2 Spain</div><div class="card__meta">ID: 536</div></a>
+<a class="card" href="/watch.php?id=723" data-title="tvi portugal"><div class="card__title">TVI Portugal</div><div class="card__meta">ID: 723</div></a>
+<a class="card" href="/watch.php?id=724" data-title="tvi reality portugal"><div class="card__title">TVI Reality Portugal</div><div class="card__meta">ID: 724</div></a>
+<a class="card" href="/watch.php?id=529" data-title="teledeporte spain (tdp)"><div class="card__title">Teledeporte Spain (TDP)</div><div class="card__meta">ID: 529</div></a>
+<a class="card" href="/watch.php?id=746" data-title="tyc sports argentina"><div class="card__title">TYC Sports Argentina</div><div class="card__meta">ID: 746</div></a>
+<a class="card" href="/watch.php?id=128" data-title="tvp sport poland"><div class="card__title">TVP Sport Poland</div><div class="card__meta">ID: 128</div></a>
+<a class="card" href="/watch.php?id=87" data-title="tnt brasil"><div class="card__title">TNT Brasil</div><div class="card__meta">ID: 87</div></a>
+<a class="card" href="/watch.php?id=388" data-title="tnt sports argentina"><div class="card__title">TNT Sports Argentina</div><div class="card__meta">ID: 388</div></a>
+<a class="card" href="/watch.php?id=642" data-title="tnt sports hd chile"><div class="card__title">TNT Sports HD Chile</div><div class="card__meta">ID: 642</div></a>
+<a class="card" href="/watch.php?id=40" data-title="tennis channel"><div class="card__title">Tennis Channel</div><div class="card__meta">ID: 40</div></a>
+<a class="card" href="/watch.php?id=741" data-title="ten sports pk"><div class="card__title">Ten Sports PK</div><div class="card__meta">ID: 741</div></a>
+<a class="card" href="/watch.php?id=66" data-title="tudn usa"><div class="card__title">TUDN USA</div><div class="card__meta">ID: 66</div></a>
+<a class="card" href="/watch.php?id=131" data-title="telemundo"><div class="card__title">Telemundo</div><div class="card__meta">ID: 131</div></a>
+<a class="card" href="/watch.php?id=336" data-title="tbs usa"><div class="card__title">TBS USA</div><div class="card__meta">ID: 336</div></a>
+<a class="card" href="/watch.php?id=337" data-title="tlc"><div class="card__title">TLC</div><div class="card__meta">ID: 337</div></a>
+<a class="card" href="/watch.php?id=338" data-title="tnt usa"><div class="card__title">TNT USA</div><div class="card__meta">ID: 338</div></a>
+<a class="card" href="/watch.php?id=469" data-title="tf1 france"><div class="card__title">TF1 France</div><div class="card__meta">ID: 469</div></a>
+<a class="card" href="/watch.php?id=833" data-title="tva sports"><div class="card__title">TVA Sports</div><div class="card__meta">ID: 833</div></a>
+<a class="card" href="/watch.php?id=834" data-title="tva sports 2"><div class="card__title">TVA Sports 2</div><div class="card__meta">ID: 834</div></a>
+<a class="card" href="/watch.php?id=932" data-title="tvc deportes mx"><div class="card__title">TVC Deportes MX</div><div class="card__meta">ID: 932</div></a>
+<a class="card" href="/watch.php?id=935" data-title="tudn mx"><div class="card__title">TUDN MX</div><div class="card__meta">ID: 935</div></a>
+<a class="card" href="/watch.php?id=955" data-title="tmc france"><div class="card__title">TMC France</div><div class="card__meta">ID: 955</div></a>
+<a class="card" href="/watch.php?id=340" data-title="travel channel"><div class="card__title">Travel Channel</div><div class="card__meta">ID: 340</div></a>
+<a class="card" href="/watch.php?id=341" data-title="trutv usa"><div class="card__title">TruTV USA</div><div class="card__meta">ID: 341</div></a>
+<a class="card" href="/watch.php?id=342" data-title="tvland"><div class="card__title">TVLAND</div><div class="card__meta">ID: 342</div></a>
+<a class="card" href="/watch.php?id=644" data-title="tcm usa"><div class="card__title">TCM USA</div><div class="card__meta">ID: 644</div></a>
+<a class="card" href="/watch.php?id=698" data-title="tmc channel usa"><div class="card__title">TMC Channel USA</div><div class="card__meta">ID: 698</div></a>
+<a class="card" href="/watch.php?id=384" data-title="the food network"><div class="card__title">The Food Network</div><div class="card__meta">ID: 384</div></a>
+<a class="card" href="/watch.php?id=394" data-title="the weather channel"><div class="card__title">The Weather Channel</div><div class="card__meta">ID: 394</div></a>
+<a class="card" href="/watch.php?id=452" data-title="tvp info"><div class="card__title">TVP INFO</div><div class="card__meta">ID: 452</div></a>
+<a class="card" href="/watch.php?id=650" data-title="teennick"><div class="card__title">TeenNick</div><div class="card__meta">ID: 650</div></a>
+<a class="card" href="/watch.php?id=660" data-title="tv one usa"><div class="card__title">TV ONE USA</div><div class="card__meta">ID: 660</div></a>
+<a class="card" href="/watch.php?id=807" data-title="tv2 bornholm denmark"><div class="card__title">TV2 Bornholm Denmark</div><div class="card__meta">ID: 807</div></a>
+<a class="card" href="/watch.php?id=808" data-title="tv2 sport x denmark"><div class="card__title">TV2 Sport X Denmark</div><div class="card__meta">ID: 808</div></a>
+<a class="card" href="/watch.php?id=809" data-title="tv3 sport denmark"><div class="card__title">TV3 Sport Denmark</div><div class="card__meta">ID: 809</div></a>
+<a class="card" href="/watch.php?id=810" data-title="tv2 sport denmark"><div class="card__title">TV2 Sport Denmark</div><div class="card__meta">ID: 810</div></a>
+<a class="card" href="/watch.php?id=817" data-title="tv2 denmark"><div class="card__title">TV2 Denmark</div><div class="card__meta">ID: 817</div></a>
+<a class="card" href="/watch.php?id=818" data-title="tv2 zulu"><div class="card__title">TV2 Zulu</div><div class="card__meta">ID: 818</div></a>
+<a class="card" href="/watch.php?id=819" data-title="tv3+ denmark"><div class="card__title">TV3+ Denmark</div><div class="card__meta">ID: 819</div></a>
+<a class="card" href="/watch.php?id=842" data-title="tvo ca"><div class="card__title">TVO CA</div><div class="card__meta">ID: 842</div></a>
+<a class="card" href="/watch.php?id=1005" data-title="tv8 turkey"><div class="card__title">TV8 Turkey</div><div class="card__meta">ID: 1005</div></a>
+<a class="card" href="/watch.php?id=700" data-title="tv4 hockey"><div class="card__title">TV4 Hockey</div><div class="card__meta">ID: 700</div></a>
+<a class="card" href="/watch.php?id=223" data-title="tv3 max denmark"><div class="card__title">TV3 Max Denmark</div><div class="card__meta">ID: 223</div></a>
+<a class="card" href="/watch.php?id=270" data-title="t sports bd"><div class="card__title">T Sports BD</div><div class="card__meta">ID: 270</div></a>
+<a class="card" href="/watch.php?id=701" data-title="tv4 tennis"><div class="card__title">TV4 Tennis</div><div class="card__meta">ID: 701</div></a>
+<a class="card" href="/watch.php?id=702" data-title="tv4 motor"><div class="card__title">TV4 Motor</div><div class="card__meta">ID: 702</div></a>
+<a class="card" href="/watch.php?id=703" data-title="tv4 sport live 1"><div class="card__title">TV4 Sport Live 1</div><div class="card__meta">ID: 703</div></a>
+<a class="card" href="/watch.php?id=704" data-title="tv4 sport live 2"><div class="card__title">TV4 Sport Live 2</div><div class="card__meta">ID: 704</div></a>
+<a class="card" href="/watch.php?id=705" data-title="tv4 sport live 3"><div class="card__title">TV4 Sport Live 3</div><div class="card__meta">ID: 705</div></a>
+<a class="card" href="/watch.php?id=706" data-title="tv4 sport live 4"><div class="card__title">TV4 Sport Live 4</div><div class="card__meta">ID: 706</div></a>
+<a class="card" href="/watch.php?id=707" data-title="tv4 sportkanalen"><div class="card__title">TV4 Sportkanalen</div><div class="card__meta">ID: 707</div></a>
+<a class="card" href="/watch.php?id=747" data-title="tv4 football sweden"><div class="card__title">TV4 Football Sweden</div><div class="card__meta">ID: 747</div></a>
+<a class="card" href="/watch.php?id=709" data-title="tennis+ 10"><div class="card__title">Tennis+ 10</div><div class="card__meta">ID: 709</div></a>
+<a class="card" href="/watch.php?id=711" data-title="tennis+ 12"><div class="card__title">Tennis+ 12</div><div class="card__meta">ID: 711</div></a>
+<a class="card" href="/watch.php?id=889" data-title="trt spor tr"><div class="card__title">TRT Spor TR</div><div class="card__meta">ID: 889</div></a>
+<a class="card" href="/watch.php?id=343" data-title="usa network"><div class="card__title">USA Network</div><div class="card__meta">ID: 343</div></a>
+<a class="card" href="/watch.php?id=668" data-title="universal kids usa"><div class="card__title">Universal Kids USA</div><div class="card__meta">ID: 668</div></a>
+<a class="card" href="/watch.php?id=132" data-title="univision"><div class="card__title">Univision</div><div class="card__meta">ID: 132</div></a>
+<a class="card" href="/watch.php?id=133" data-title="unimas"><div class="card__title">Unimas</div><div class="card__meta">ID: 133</div></a>
+<a class="card" href="/watch.php?id=451" data-title="viaplay sports 1 uk"><div class="card__title">Viaplay Sports 1 UK</div><div class="card__meta">ID: 451</div></a>
+<a class="card" href="/watch.php?id=550" data-title="viaplay sports 2 uk"><div class="card__title">Viaplay Sports 2 UK</div><div class="card__meta">ID: 550</div></a>
+<a class="card" href="/watch.php?id=521" data-title="#vamos spain"><div class="card__title">#Vamos Spain</div><div class="card__meta">ID: 521</div></a>
+<a class="card" href="/watch.php?id=815" data-title="v film premiere"><div class="card__title">V Film Premiere</div><div class="card__meta">ID: 815</div></a>
+<a class="card" href="/watch.php?id=816" data-title="v film family"><div class="card__title">V Film Family</div><div class="card__meta">ID: 816</div></a>
+<a class="card" href="/watch.php?id=260" data-title="vodafone sport"><div class="card__title">Vodafone Sport</div><div class="card__meta">ID: 260</div></a>
+<a class="card" href="/watch.php?id=272" data-title="v sport motor sweden"><div class="card__title">V Sport Motor Sweden</div><div class="card__meta">ID: 272</div></a>
+<a class="card" href="/watch.php?id=344" data-title="vh1 usa"><div class="card__title">VH1 USA</div><div class="card__meta">ID: 344</div></a>
+<a class="card" href="/watch.php?id=378" data-title="veronica nl netherland"><div class="card__title">Veronica NL Netherland</div><div class="card__meta">ID: 378</div></a>
+<a class="card" href="/watch.php?id=391" data-title="vtv+ uruguay"><div class="card__title">VTV+ Uruguay</div><div class="card__meta">ID: 391</div></a>
+<a class="card" href="/watch.php?id=659" data-title="vice tv"><div class="card__title">VICE TV</div><div class="card__meta">ID: 659</div></a>
+<a class="card" href="/watch.php?id=346" data-title="willow cricket"><div class="card__title">Willow Cricket</div><div class="card__meta">ID: 346</div></a>
+<a class="card" href="/watch.php?id=598" data-title="willow xtra"><div class="card__title">Willow XTRA</div><div class="card__meta">ID: 598</div></a>
+<a class="card" href="/watch.php?id=376" data-title="wwe network"><div class="card__title">WWE Network</div><div class="card__meta">ID: 376</div></a>
+<a class="card" href="/watch.php?id=392" data-title="win sports+ columbia"><div class="card__title">Win Sports+ Columbia</div><div class="card__meta">ID: 392</div></a>
+<a class="card" href="/watch.php?id=655" data-title="wetv usa"><div class="card__title">WETV USA</div><div class="card__meta">ID: 655</div></a>
+<a class="card" href="/watch.php?id=734" data-title="wdr de"><div class="card__title">WDR DE</div><div class="card__meta">ID: 734</div></a>
+<a class="card" href="/watch.php?id=959" data-title="w9 france"><div class="card__title">W9 France</div><div class="card__meta">ID: 959</div></a>
+<a class="card" href="/watch.php?id=286" data-title="ytv ca"><div class="card__title">YTV CA</div><div class="card__meta">ID: 286</div></a>
+<a class="card" href="/watch.php?id=763" data-title="yes network usa"><div class="card__title">YES Network USA</div><div class="card__meta">ID: 763</div></a>
+<a class="card" href="/watch.php?id=543" data-title="yes movies action israel"><div class="card__title">Yes Movies Action Israel</div><div class="card__meta">ID: 543</div></a>
+<a class="card" href="/watch.php?id=544" data-title="yes movies kids israel"><div class="card__title">Yes Movies Kids Israel</div><div class="card__meta">ID: 544</div></a>
+<a class="card" href="/watch.php?id=545" data-title="yes movies comedy israel"><div class="card__title">Yes Movies Comedy Israel</div><div class="card__meta">ID: 545</div></a>
+<a class="card" href="/watch.php?id=837" data-title="yes tv ca"><div class="card__title">Yes TV CA</div><div class="card__meta">ID: 837</div></a>
+<a class="card" href="/watch.php?id=393" data-title="ziggo sport nl"><div class="card__title">Ziggo Sport NL</div><div class="card__meta">ID: 393</div></a>
+<a class="card" href="/watch.php?id=398" data-title="ziggo sport 2 nl"><div class="card__title">Ziggo Sport 2 NL</div><div class="card__meta">ID: 398</div></a>
+<a class="card" href="/watch.php?id=919" data-title="ziggo sport 3 nl"><div class="card__title">Ziggo Sport 3 NL</div><div class="card__meta">ID: 919</div></a>
+<a class="card" href="/watch.php?id=396" data-title="ziggo sport 4 nl"><div class="card__title">Ziggo Sport 4 NL</div><div class="card__meta">ID: 396</div></a>
+<a class="card" href="/watch.php?id=383" data-title="ziggo sport 5 nl"><div class="card__title">Ziggo Sport 5 NL</div><div class="card__meta">ID: 383</div></a>
+<a class="card" href="/watch.php?id=901" data-title="ziggo sport 6 nl"><div class="card__title">Ziggo Sport 6 NL</div><div class="card__meta">ID: 901</div></a>
+<a class="card" href="/watch.php?id=727" data-title="zdf de"><div class="card__title">ZDF DE</div><div class="card__meta">ID: 727</div></a>
+<a class="card" href="/watch.php?id=728" data-title="zdf info de"><div class="card__title">ZDF Info DE</div><div class="card__meta">ID: 728</div></a>
+<a class="card" href="/watch.php?id=963" data-title="6ter france"><div class="card__title">6ter France</div><div class="card__meta">ID: 963</div></a>
+<a class="card" href="/watch.php?id=857" data-title="20 mediaset italy"><div class="card__title">20 Mediaset Italy</div><div class="card__meta">ID: 857</div></a>
+<a class="card" href="/watch.php?id=800" data-title="6'eren denmark"><div class="card__title">6'eren Denmark</div><div class="card__meta">ID: 800</div></a>
+<a class="card" href="/watch.php?id=360" data-title="5 usa"><div class="card__title">5 USA</div><div class="card__meta">ID: 360</div></a>
+<a class="card" href="/watch.php?id=726" data-title="3sat de"><div class="card__title">3sat DE</div><div class="card__meta">ID: 726</div></a>
+<a class="card" href="/watch.php?id=501" data-title="18+ (player-01)"><div class="card__title">18+ (Player-01)</div><div class="card__meta">ID: 501</div></a>
+<a class="card" href="/watch.php?id=502" data-title="18+ (player-02)"><div class="card__title">18+ (Player-02)</div><div class="card__meta">ID: 502</div></a>
+<a class="card" href="/watch.php?id=503" data-title="18+ (player-03)"><div class="card__title">18+ (Player-03)</div><div class="card__meta">ID: 503</div></a>
+<a class="card" href="/watch.php?id=504" data-title="18+ (player-04)"><div class="card__title">18+ (Player-04)</div><div class="card__meta">ID: 504</div></a>
+<a class="card" href="/watch.php?id=505" data-title="18+ (player-05)"><div class="card__title">18+ (Player-05)</div><div class="card__meta">ID: 505</div></a>
+<a class="card" href="/watch.php?id=506" data-title="18+ (player-06)"><div class="card__title">18+ (Player-06)</div><div class="card__meta">ID: 506</div></a>
+<a class="card" href="/watch.php?id=507" data-title="18+ (player-07)"><div class="card__title">18+ (Player-07)</div><div class="card__meta">ID: 507</div></a>
+<a class="card" href="/watch.php?id=508" data-title="18+ (player-08)"><div class="card__title">18+ (Player-08)</div><div class="card__meta">ID: 508</div></a>
+<a class="card" href="/watch.php?id=509" data-title="18+ (player-09)"><div class="card__title">18+ (Player-09)</div><div class="card__meta">ID: 509</div></a>
+<a class="card" href="/watch.php?id=510" data-title="18+ (player-10)"><div class="card__title">18+ (Player-10)</div><div class="card__meta">ID: 510</div></a>
+<a class="card" href="/watch.php?id=511" data-title="18+ (player-11)"><div class="card__title">18+ (Player-11)</div><div class="card__meta">ID: 511</div></a>
+<a class="card" href="/watch.php?id=512" data-title="18+ (player-12)"><div class="card__title">18+ (Player-12)</div><div class="card__meta">ID: 512</div></a>
+<a class="card" href="/watch.php?id=513" data-title="18+ (player-13)"><div class="card__title">18+ (Player-13)</div><div class="card__meta">ID: 513</div></a>
+<a class="card" href="/watch.php?id=514" data-title="18+ (player-14)"><div class="card__title">18+ (Player-14)</div><div class="card__meta">ID: 514</div></a>
+<a class="card" href="/watch.php?id=515" data-title="18+ (player-15)"><div class="card__title">18+ (Player-15)</div><div class="card__meta">ID: 515</div></a>
+<a class="card" href="/watch.php?id=516" data-title="18+ (player-16)"><div class="card__title">18+ (Player-16)</div><div class="card__meta">ID: 516</div></a>
+<a class="card" href="/watch.php?id=517" data-title="18+ (player-17)"><div class="card__title">18+ (Player-17)</div><div class="card__meta">ID: 517</div></a>
+<a class="card" href="/watch.php?id=518" data-title="18+ (player-18)"><div class="card__title">18+ (Player-18)</div><div class="card__meta">ID: 518</div></a>
+<a class="card" href="/watch.php?id=519" data-title="18+ (player-19)"><div class="card__title">18+ (Player-19)</div><div class="card__meta">ID: 519</div></a>
+<a class="card" href="/watch.php?id=520" data-title="18+ (player-20)"><div class="card__title">18+ (Player-20)</div><div class="card__meta">ID: 520</div></a>
+</div></main></body></html>
\ No newline at end of file
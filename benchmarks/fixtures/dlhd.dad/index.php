@@ -0,0 +1,5757 @@
+<!DOCTYPE html><html><head><meta charset="utf-8"><title>Schedule</title>
+<script>var x = "<div class=\"schedule__day\">";</script></head><body><main>
+<div class="schedule__day">
+<div class="schedule__dayTitle">Saturday 18th Oct 2025 - Schedule Time UK GMT</div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Soccer <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=484" target="_blank" rel="noopener">Channel 484<br> HD</a>
+<a href="/watch.php?id=668" target="_blank" rel="noopener">Channel 668<br> HD</a>
+<a href="/watch.php?id=389" target="_blank" rel="noopener">Channel 389<br> HD</a>
+<a href="/watch.php?id=808" target="_blank" rel="noopener">Channel 808<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=444" target="_blank" rel="noopener">Channel 444<br> HD</a>
+<a href="/watch.php?id=623" target="_blank" rel="noopener">Channel 623<br> HD</a>
+<a href="/watch.php?id=781" target="_blank" rel="noopener">Channel 781<br> HD</a>
+<a href="/watch.php?id=786" target="_blank" rel="noopener">Channel 786<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=606" target="_blank" rel="noopener">Channel 606<br> HD</a>
+<a href="/watch.php?id=105" target="_blank" rel="noopener">Channel 105<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=10" target="_blank" rel="noopener">Channel 10<br> HD</a>
+<a href="/watch.php?id=391" target="_blank" rel="noopener">Channel 391<br> HD</a>
+<a href="/watch.php?id=703" target="_blank" rel="noopener">Channel 703<br> HD</a>
+<a href="/watch.php?id=222" target="_blank" rel="noopener">Channel 222<br> HD</a>
+<a href="/watch.php?id=433" target="_blank" rel="noopener">Channel 433<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=567" target="_blank" rel="noopener">Channel 567<br> HD</a>
+<a href="/watch.php?id=239" target="_blank" rel="noopener">Channel 239<br> HD</a>
+<a href="/watch.php?id=354" target="_blank" rel="noopener">Channel 354<br> HD</a>
+<a href="/watch.php?id=237" target="_blank" rel="noopener">Channel 237<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=427" target="_blank" rel="noopener">Channel 427<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:30</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=761" target="_blank" rel="noopener">Channel 761<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=850" target="_blank" rel="noopener">Channel 850<br> HD</a>
+<a href="/watch.php?id=687" target="_blank" rel="noopener">Channel 687<br> HD</a>
+<a href="/watch.php?id=195" target="_blank" rel="noopener">Channel 195<br> HD</a>
+<a href="/watch.php?id=311" target="_blank" rel="noopener">Channel 311<br> HD</a>
+<a href="/watch.php?id=291" target="_blank" rel="noopener">Channel 291<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=874" target="_blank" rel="noopener">Channel 874<br> HD</a>
+<a href="/watch.php?id=36" target="_blank" rel="noopener">Channel 36<br> HD</a>
+<a href="/watch.php?id=492" target="_blank" rel="noopener">Channel 492<br> HD</a>
+<a href="/watch.php?id=249" target="_blank" rel="noopener">Channel 249<br> HD</a>
+<a href="/watch.php?id=762" target="_blank" rel="noopener">Channel 762<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=562" target="_blank" rel="noopener">Channel 562<br> HD</a>
+<a href="/watch.php?id=720" target="_blank" rel="noopener">Channel 720<br> HD</a>
+<a href="/watch.php?id=795" target="_blank" rel="noopener">Channel 795<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=534" target="_blank" rel="noopener">Channel 534<br> HD</a>
+<a href="/watch.php?id=861" target="_blank" rel="noopener">Channel 861<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=45" target="_blank" rel="noopener">Channel 45<br> HD</a>
+<a href="/watch.php?id=316" target="_blank" rel="noopener">Channel 316<br> HD</a>
+<a href="/watch.php?id=721" target="_blank" rel="noopener">Channel 721<br> HD</a>
+<a href="/watch.php?id=869" target="_blank" rel="noopener">Channel 869<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=233" target="_blank" rel="noopener">Channel 233<br> HD</a>
+<a href="/watch.php?id=13" target="_blank" rel="noopener">Channel 13<br> HD</a>
+<a href="/watch.php?id=790" target="_blank" rel="noopener">Channel 790<br> HD</a>
+<a href="/watch.php?id=205" target="_blank" rel="noopener">Channel 205<br> HD</a>
+<a href="/watch.php?id=553" target="_blank" rel="noopener">Channel 553<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=362" target="_blank" rel="noopener">Channel 362<br> HD</a>
+<a href="/watch.php?id=471" target="_blank" rel="noopener">Channel 471<br> HD</a>
+<a href="/watch.php?id=276" target="_blank" rel="noopener">Channel 276<br> HD</a>
+<a href="/watch.php?id=676" target="_blank" rel="noopener">Channel 676<br> HD</a>
+<a href="/watch.php?id=562" target="_blank" rel="noopener">Channel 562<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:15</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=797" target="_blank" rel="noopener">Channel 797<br> HD</a>
+<a href="/watch.php?id=575" target="_blank" rel="noopener">Channel 575<br> HD</a>
+<a href="/watch.php?id=211" target="_blank" rel="noopener">Channel 211<br> HD</a>
+<a href="/watch.php?id=437" target="_blank" rel="noopener">Channel 437<br> HD</a>
+<a href="/watch.php?id=58" target="_blank" rel="noopener">Channel 58<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=424" target="_blank" rel="noopener">Channel 424<br> HD</a>
+<a href="/watch.php?id=497" target="_blank" rel="noopener">Channel 497<br> HD</a>
+<a href="/watch.php?id=833" target="_blank" rel="noopener">Channel 833<br> HD</a>
+<a href="/watch.php?id=366" target="_blank" rel="noopener">Channel 366<br> HD</a>
+<a href="/watch.php?id=425" target="_blank" rel="noopener">Channel 425<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=615" target="_blank" rel="noopener">Channel 615<br> HD</a>
+<a href="/watch.php?id=29" target="_blank" rel="noopener">Channel 29<br> HD</a>
+<a href="/watch.php?id=824" target="_blank" rel="noopener">Channel 824<br> HD</a>
+<a href="/watch.php?id=236" target="_blank" rel="noopener">Channel 236<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=818" target="_blank" rel="noopener">Channel 818<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=889" target="_blank" rel="noopener">Channel 889<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=276" target="_blank" rel="noopener">Channel 276<br> HD</a>
+<a href="/watch.php?id=113" target="_blank" rel="noopener">Channel 113<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=164" target="_blank" rel="noopener">Channel 164<br> HD</a>
+<a href="/watch.php?id=262" target="_blank" rel="noopener">Channel 262<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=720" target="_blank" rel="noopener">Channel 720<br> HD</a>
+<a href="/watch.php?id=330" target="_blank" rel="noopener">Channel 330<br> HD</a>
+<a href="/watch.php?id=509" target="_blank" rel="noopener">Channel 509<br> HD</a>
+<a href="/watch.php?id=486" target="_blank" rel="noopener">Channel 486<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=432" target="_blank" rel="noopener">Channel 432<br> HD</a>
+<a href="/watch.php?id=816" target="_blank" rel="noopener">Channel 816<br> HD</a>
+<a href="/watch.php?id=193" target="_blank" rel="noopener">Channel 193<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=443" target="_blank" rel="noopener">Channel 443<br> HD</a>
+<a href="/watch.php?id=837" target="_blank" rel="noopener">Channel 837<br> HD</a>
+<a href="/watch.php?id=22" target="_blank" rel="noopener">Channel 22<br> HD</a>
+<a href="/watch.php?id=231" target="_blank" rel="noopener">Channel 231<br> HD</a>
+<a href="/watch.php?id=19" target="_blank" rel="noopener">Channel 19<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=722" target="_blank" rel="noopener">Channel 722<br> HD</a>
+<a href="/watch.php?id=519" target="_blank" rel="noopener">Channel 519<br> HD</a>
+<a href="/watch.php?id=695" target="_blank" rel="noopener">Channel 695<br> HD</a>
+<a href="/watch.php?id=437" target="_blank" rel="noopener">Channel 437<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=537" target="_blank" rel="noopener">Channel 537<br> HD</a>
+<a href="/watch.php?id=665" target="_blank" rel="noopener">Channel 665<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=61" target="_blank" rel="noopener">Channel 61<br> HD</a>
+<a href="/watch.php?id=756" target="_blank" rel="noopener">Channel 756<br> HD</a>
+<a href="/watch.php?id=306" target="_blank" rel="noopener">Channel 306<br> HD</a>
+<a href="/watch.php?id=129" target="_blank" rel="noopener">Channel 129<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=318" target="_blank" rel="noopener">Channel 318<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=259" target="_blank" rel="noopener">Channel 259<br> HD</a>
+<a href="/watch.php?id=134" target="_blank" rel="noopener">Channel 134<br> HD</a>
+<a href="/watch.php?id=9" target="_blank" rel="noopener">Channel 9<br> HD</a>
+<a href="/watch.php?id=575" target="_blank" rel="noopener">Channel 575<br> HD</a>
+<a href="/watch.php?id=900" target="_blank" rel="noopener">Channel 900<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=848" target="_blank" rel="noopener">Channel 848<br> HD</a>
+<a href="/watch.php?id=889" target="_blank" rel="noopener">Channel 889<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Tennis <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=211" target="_blank" rel="noopener">Channel 211<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=682" target="_blank" rel="noopener">Channel 682<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=334" target="_blank" rel="noopener">Channel 334<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=879" target="_blank" rel="noopener">Channel 879<br> HD</a>
+<a href="/watch.php?id=336" target="_blank" rel="noopener">Channel 336<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=691" target="_blank" rel="noopener">Channel 691<br> HD</a>
+<a href="/watch.php?id=99" target="_blank" rel="noopener">Channel 99<br> HD</a>
+<a href="/watch.php?id=858" target="_blank" rel="noopener">Channel 858<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=241" target="_blank" rel="noopener">Channel 241<br> HD</a>
+<a href="/watch.php?id=67" target="_blank" rel="noopener">Channel 67<br> HD</a>
+<a href="/watch.php?id=743" target="_blank" rel="noopener">Channel 743<br> HD</a>
+<a href="/watch.php?id=42" target="_blank" rel="noopener">Channel 42<br> HD</a>
+<a href="/watch.php?id=87" target="_blank" rel="noopener">Channel 87<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=778" target="_blank" rel="noopener">Channel 778<br> HD</a>
+<a href="/watch.php?id=341" target="_blank" rel="noopener">Channel 341<br> HD</a>
+<a href="/watch.php?id=615" target="_blank" rel="noopener">Channel 615<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=299" target="_blank" rel="noopener">Channel 299<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=594" target="_blank" rel="noopener">Channel 594<br> HD</a>
+<a href="/watch.php?id=565" target="_blank" rel="noopener">Channel 565<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=390" target="_blank" rel="noopener">Channel 390<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=630" target="_blank" rel="noopener">Channel 630<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=84" target="_blank" rel="noopener">Channel 84<br> HD</a>
+<a href="/watch.php?id=274" target="_blank" rel="noopener">Channel 274<br> HD</a>
+<a href="/watch.php?id=374" target="_blank" rel="noopener">Channel 374<br> HD</a>
+<a href="/watch.php?id=303" target="_blank" rel="noopener">Channel 303<br> HD</a>
+<a href="/watch.php?id=578" target="_blank" rel="noopener">Channel 578<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=848" target="_blank" rel="noopener">Channel 848<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=424" target="_blank" rel="noopener">Channel 424<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=805" target="_blank" rel="noopener">Channel 805<br> HD</a>
+<a href="/watch.php?id=601" target="_blank" rel="noopener">Channel 601<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=698" target="_blank" rel="noopener">Channel 698<br> HD</a>
+<a href="/watch.php?id=248" target="_blank" rel="noopener">Channel 248<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=826" target="_blank" rel="noopener">Channel 826<br> HD</a>
+<a href="/watch.php?id=556" target="_blank" rel="noopener">Channel 556<br> HD</a>
+<a href="/watch.php?id=838" target="_blank" rel="noopener">Channel 838<br> HD</a>
+<a href="/watch.php?id=302" target="_blank" rel="noopener">Channel 302<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=213" target="_blank" rel="noopener">Channel 213<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=744" target="_blank" rel="noopener">Channel 744<br> HD</a>
+<a href="/watch.php?id=611" target="_blank" rel="noopener">Channel 611<br> HD</a>
+<a href="/watch.php?id=328" target="_blank" rel="noopener">Channel 328<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=66" target="_blank" rel="noopener">Channel 66<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=221" target="_blank" rel="noopener">Channel 221<br> HD</a>
+<a href="/watch.php?id=804" target="_blank" rel="noopener">Channel 804<br> HD</a>
+<a href="/watch.php?id=633" target="_blank" rel="noopener">Channel 633<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=555" target="_blank" rel="noopener">Channel 555<br> HD</a>
+<a href="/watch.php?id=213" target="_blank" rel="noopener">Channel 213<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=840" target="_blank" rel="noopener">Channel 840<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=659" target="_blank" rel="noopener">Channel 659<br> HD</a>
+<a href="/watch.php?id=348" target="_blank" rel="noopener">Channel 348<br> HD</a>
+<a href="/watch.php?id=233" target="_blank" rel="noopener">Channel 233<br> HD</a>
+<a href="/watch.php?id=400" target="_blank" rel="noopener">Channel 400<br> HD</a>
+<a href="/watch.php?id=315" target="_blank" rel="noopener">Channel 315<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=311" target="_blank" rel="noopener">Channel 311<br> HD</a>
+<a href="/watch.php?id=252" target="_blank" rel="noopener">Channel 252<br> HD</a>
+<a href="/watch.php?id=343" target="_blank" rel="noopener">Channel 343<br> HD</a>
+<a href="/watch.php?id=104" target="_blank" rel="noopener">Channel 104<br> HD</a>
+<a href="/watch.php?id=558" target="_blank" rel="noopener">Channel 558<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=412" target="_blank" rel="noopener">Channel 412<br> HD</a>
+<a href="/watch.php?id=75" target="_blank" rel="noopener">Channel 75<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=651" target="_blank" rel="noopener">Channel 651<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=884" target="_blank" rel="noopener">Channel 884<br> HD</a>
+<a href="/watch.php?id=880" target="_blank" rel="noopener">Channel 880<br> HD</a>
+<a href="/watch.php?id=158" target="_blank" rel="noopener">Channel 158<br> HD</a>
+<a href="/watch.php?id=104" target="_blank" rel="noopener">Channel 104<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:15</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=795" target="_blank" rel="noopener">Channel 795<br> HD</a>
+<a href="/watch.php?id=154" target="_blank" rel="noopener">Channel 154<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=727" target="_blank" rel="noopener">Channel 727<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Basketball <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=740" target="_blank" rel="noopener">Channel 740<br> HD</a>
+<a href="/watch.php?id=33" target="_blank" rel="noopener">Channel 33<br> HD</a>
+<a href="/watch.php?id=799" target="_blank" rel="noopener">Channel 799<br> HD</a>
+<a href="/watch.php?id=324" target="_blank" rel="noopener">Channel 324<br> HD</a>
+<a href="/watch.php?id=841" target="_blank" rel="noopener">Channel 841<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=162" target="_blank" rel="noopener">Channel 162<br> HD</a>
+<a href="/watch.php?id=50" target="_blank" rel="noopener">Channel 50<br> HD</a>
+<a href="/watch.php?id=732" target="_blank" rel="noopener">Channel 732<br> HD</a>
+<a href="/watch.php?id=883" target="_blank" rel="noopener">Channel 883<br> HD</a>
+<a href="/watch.php?id=684" target="_blank" rel="noopener">Channel 684<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=563" target="_blank" rel="noopener">Channel 563<br> HD</a>
+<a href="/watch.php?id=257" target="_blank" rel="noopener">Channel 257<br> HD</a>
+<a href="/watch.php?id=555" target="_blank" rel="noopener">Channel 555<br> HD</a>
+<a href="/watch.php?id=450" target="_blank" rel="noopener">Channel 450<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=265" target="_blank" rel="noopener">Channel 265<br> HD</a>
+<a href="/watch.php?id=498" target="_blank" rel="noopener">Channel 498<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=20" target="_blank" rel="noopener">Channel 20<br> HD</a>
+<a href="/watch.php?id=64" target="_blank" rel="noopener">Channel 64<br> HD</a>
+<a href="/watch.php?id=709" target="_blank" rel="noopener">Channel 709<br> HD</a>
+<a href="/watch.php?id=364" target="_blank" rel="noopener">Channel 364<br> HD</a>
+<a href="/watch.php?id=594" target="_blank" rel="noopener">Channel 594<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=849" target="_blank" rel="noopener">Channel 849<br> HD</a>
+<a href="/watch.php?id=284" target="_blank" rel="noopener">Channel 284<br> HD</a>
+<a href="/watch.php?id=408" target="_blank" rel="noopener">Channel 408<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=498" target="_blank" rel="noopener">Channel 498<br> HD</a>
+<a href="/watch.php?id=8" target="_blank" rel="noopener">Channel 8<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=245" target="_blank" rel="noopener">Channel 245<br> HD</a>
+<a href="/watch.php?id=321" target="_blank" rel="noopener">Channel 321<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=346" target="_blank" rel="noopener">Channel 346<br> HD</a>
+<a href="/watch.php?id=574" target="_blank" rel="noopener">Channel 574<br> HD</a>
+<a href="/watch.php?id=626" target="_blank" rel="noopener">Channel 626<br> HD</a>
+<a href="/watch.php?id=746" target="_blank" rel="noopener">Channel 746<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=782" target="_blank" rel="noopener">Channel 782<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:15</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=306" target="_blank" rel="noopener">Channel 306<br> HD</a>
+<a href="/watch.php?id=710" target="_blank" rel="noopener">Channel 710<br> HD</a>
+<a href="/watch.php?id=307" target="_blank" rel="noopener">Channel 307<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=88" target="_blank" rel="noopener">Channel 88<br> HD</a>
+<a href="/watch.php?id=877" target="_blank" rel="noopener">Channel 877<br> HD</a>
+<a href="/watch.php?id=127" target="_blank" rel="noopener">Channel 127<br> HD</a>
+<a href="/watch.php?id=621" target="_blank" rel="noopener">Channel 621<br> HD</a>
+<a href="/watch.php?id=527" target="_blank" rel="noopener">Channel 527<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=223" target="_blank" rel="noopener">Channel 223<br> HD</a>
+<a href="/watch.php?id=584" target="_blank" rel="noopener">Channel 584<br> HD</a>
+<a href="/watch.php?id=737" target="_blank" rel="noopener">Channel 737<br> HD</a>
+<a href="/watch.php?id=776" target="_blank" rel="noopener">Channel 776<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=394" target="_blank" rel="noopener">Channel 394<br> HD</a>
+<a href="/watch.php?id=528" target="_blank" rel="noopener">Channel 528<br> HD</a>
+<a href="/watch.php?id=866" target="_blank" rel="noopener">Channel 866<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=93" target="_blank" rel="noopener">Channel 93<br> HD</a>
+<a href="/watch.php?id=828" target="_blank" rel="noopener">Channel 828<br> HD</a>
+<a href="/watch.php?id=262" target="_blank" rel="noopener">Channel 262<br> HD</a>
+<a href="/watch.php?id=644" target="_blank" rel="noopener">Channel 644<br> HD</a>
+<a href="/watch.php?id=104" target="_blank" rel="noopener">Channel 104<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=863" target="_blank" rel="noopener">Channel 863<br> HD</a>
+<a href="/watch.php?id=676" target="_blank" rel="noopener">Channel 676<br> HD</a>
+<a href="/watch.php?id=704" target="_blank" rel="noopener">Channel 704<br> HD</a>
+<a href="/watch.php?id=718" target="_blank" rel="noopener">Channel 718<br> HD</a>
+<a href="/watch.php?id=84" target="_blank" rel="noopener">Channel 84<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=407" target="_blank" rel="noopener">Channel 407<br> HD</a>
+<a href="/watch.php?id=169" target="_blank" rel="noopener">Channel 169<br> HD</a>
+<a href="/watch.php?id=334" target="_blank" rel="noopener">Channel 334<br> HD</a>
+<a href="/watch.php?id=449" target="_blank" rel="noopener">Channel 449<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=442" target="_blank" rel="noopener">Channel 442<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=255" target="_blank" rel="noopener">Channel 255<br> HD</a>
+<a href="/watch.php?id=388" target="_blank" rel="noopener">Channel 388<br> HD</a>
+<a href="/watch.php?id=768" target="_blank" rel="noopener">Channel 768<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=22" target="_blank" rel="noopener">Channel 22<br> HD</a>
+<a href="/watch.php?id=32" target="_blank" rel="noopener">Channel 32<br> HD</a>
+<a href="/watch.php?id=643" target="_blank" rel="noopener">Channel 643<br> HD</a>
+<a href="/watch.php?id=621" target="_blank" rel="noopener">Channel 621<br> HD</a>
+<a href="/watch.php?id=249" target="_blank" rel="noopener">Channel 249<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=556" target="_blank" rel="noopener">Channel 556<br> HD</a>
+<a href="/watch.php?id=206" target="_blank" rel="noopener">Channel 206<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=811" target="_blank" rel="noopener">Channel 811<br> HD</a>
+<a href="/watch.php?id=882" target="_blank" rel="noopener">Channel 882<br> HD</a>
+<a href="/watch.php?id=829" target="_blank" rel="noopener">Channel 829<br> HD</a>
+<a href="/watch.php?id=876" target="_blank" rel="noopener">Channel 876<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=877" target="_blank" rel="noopener">Channel 877<br> HD</a>
+<a href="/watch.php?id=125" target="_blank" rel="noopener">Channel 125<br> HD</a>
+<a href="/watch.php?id=788" target="_blank" rel="noopener">Channel 788<br> HD</a>
+<a href="/watch.php?id=214" target="_blank" rel="noopener">Channel 214<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=121" target="_blank" rel="noopener">Channel 121<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:15</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=513" target="_blank" rel="noopener">Channel 513<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=694" target="_blank" rel="noopener">Channel 694<br> HD</a>
+<a href="/watch.php?id=366" target="_blank" rel="noopener">Channel 366<br> HD</a>
+<a href="/watch.php?id=777" target="_blank" rel="noopener">Channel 777<br> HD</a>
+<a href="/watch.php?id=542" target="_blank" rel="noopener">Channel 542<br> HD</a>
+<a href="/watch.php?id=332" target="_blank" rel="noopener">Channel 332<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=313" target="_blank" rel="noopener">Channel 313<br> HD</a>
+<a href="/watch.php?id=553" target="_blank" rel="noopener">Channel 553<br> HD</a>
+<a href="/watch.php?id=409" target="_blank" rel="noopener">Channel 409<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=664" target="_blank" rel="noopener">Channel 664<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=651" target="_blank" rel="noopener">Channel 651<br> HD</a>
+<a href="/watch.php?id=613" target="_blank" rel="noopener">Channel 613<br> HD</a>
+<a href="/watch.php?id=740" target="_blank" rel="noopener">Channel 740<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=720" target="_blank" rel="noopener">Channel 720<br> HD</a>
+<a href="/watch.php?id=175" target="_blank" rel="noopener">Channel 175<br> HD</a>
+<a href="/watch.php?id=461" target="_blank" rel="noopener">Channel 461<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Ice Hockey <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=594" target="_blank" rel="noopener">Channel 594<br> HD</a>
+<a href="/watch.php?id=437" target="_blank" rel="noopener">Channel 437<br> HD</a>
+<a href="/watch.php?id=415" target="_blank" rel="noopener">Channel 415<br> HD</a>
+<a href="/watch.php?id=345" target="_blank" rel="noopener">Channel 345<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=645" target="_blank" rel="noopener">Channel 645<br> HD</a>
+<a href="/watch.php?id=22" target="_blank" rel="noopener">Channel 22<br> HD</a>
+<a href="/watch.php?id=417" target="_blank" rel="noopener">Channel 417<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=786" target="_blank" rel="noopener">Channel 786<br> HD</a>
+<a href="/watch.php?id=76" target="_blank" rel="noopener">Channel 76<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=311" target="_blank" rel="noopener">Channel 311<br> HD</a>
+<a href="/watch.php?id=156" target="_blank" rel="noopener">Channel 156<br> HD</a>
+<a href="/watch.php?id=474" target="_blank" rel="noopener">Channel 474<br> HD</a>
+<a href="/watch.php?id=853" target="_blank" rel="noopener">Channel 853<br> HD</a>
+<a href="/watch.php?id=266" target="_blank" rel="noopener">Channel 266<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=523" target="_blank" rel="noopener">Channel 523<br> HD</a>
+<a href="/watch.php?id=101" target="_blank" rel="noopener">Channel 101<br> HD</a>
+<a href="/watch.php?id=763" target="_blank" rel="noopener">Channel 763<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=21" target="_blank" rel="noopener">Channel 21<br> HD</a>
+<a href="/watch.php?id=169" target="_blank" rel="noopener">Channel 169<br> HD</a>
+<a href="/watch.php?id=520" target="_blank" rel="noopener">Channel 520<br> HD</a>
+<a href="/watch.php?id=728" target="_blank" rel="noopener">Channel 728<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=620" target="_blank" rel="noopener">Channel 620<br> HD</a>
+<a href="/watch.php?id=312" target="_blank" rel="noopener">Channel 312<br> HD</a>
+<a href="/watch.php?id=214" target="_blank" rel="noopener">Channel 214<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=77" target="_blank" rel="noopener">Channel 77<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=305" target="_blank" rel="noopener">Channel 305<br> HD</a>
+<a href="/watch.php?id=669" target="_blank" rel="noopener">Channel 669<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=575" target="_blank" rel="noopener">Channel 575<br> HD</a>
+<a href="/watch.php?id=410" target="_blank" rel="noopener">Channel 410<br> HD</a>
+<a href="/watch.php?id=177" target="_blank" rel="noopener">Channel 177<br> HD</a>
+<a href="/watch.php?id=496" target="_blank" rel="noopener">Channel 496<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=265" target="_blank" rel="noopener">Channel 265<br> HD</a>
+<a href="/watch.php?id=625" target="_blank" rel="noopener">Channel 625<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=413" target="_blank" rel="noopener">Channel 413<br> HD</a>
+<a href="/watch.php?id=325" target="_blank" rel="noopener">Channel 325<br> HD</a>
+<a href="/watch.php?id=443" target="_blank" rel="noopener">Channel 443<br> HD</a>
+<a href="/watch.php?id=780" target="_blank" rel="noopener">Channel 780<br> HD</a>
+<a href="/watch.php?id=255" target="_blank" rel="noopener">Channel 255<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=455" target="_blank" rel="noopener">Channel 455<br> HD</a>
+<a href="/watch.php?id=596" target="_blank" rel="noopener">Channel 596<br> HD</a>
+<a href="/watch.php?id=746" target="_blank" rel="noopener">Channel 746<br> HD</a>
+<a href="/watch.php?id=152" target="_blank" rel="noopener">Channel 152<br> HD</a>
+<a href="/watch.php?id=621" target="_blank" rel="noopener">Channel 621<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=798" target="_blank" rel="noopener">Channel 798<br> HD</a>
+<a href="/watch.php?id=142" target="_blank" rel="noopener">Channel 142<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=119" target="_blank" rel="noopener">Channel 119<br> HD</a>
+<a href="/watch.php?id=736" target="_blank" rel="noopener">Channel 736<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=109" target="_blank" rel="noopener">Channel 109<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=192" target="_blank" rel="noopener">Channel 192<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=700" target="_blank" rel="noopener">Channel 700<br> HD</a>
+<a href="/watch.php?id=36" target="_blank" rel="noopener">Channel 36<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=679" target="_blank" rel="noopener">Channel 679<br> HD</a>
+<a href="/watch.php?id=858" target="_blank" rel="noopener">Channel 858<br> HD</a>
+<a href="/watch.php?id=282" target="_blank" rel="noopener">Channel 282<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=228" target="_blank" rel="noopener">Channel 228<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=769" target="_blank" rel="noopener">Channel 769<br> HD</a>
+<a href="/watch.php?id=173" target="_blank" rel="noopener">Channel 173<br> HD</a>
+<a href="/watch.php?id=238" target="_blank" rel="noopener">Channel 238<br> HD</a>
+<a href="/watch.php?id=242" target="_blank" rel="noopener">Channel 242<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=463" target="_blank" rel="noopener">Channel 463<br> HD</a>
+<a href="/watch.php?id=733" target="_blank" rel="noopener">Channel 733<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=81" target="_blank" rel="noopener">Channel 81<br> HD</a>
+<a href="/watch.php?id=48" target="_blank" rel="noopener">Channel 48<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=393" target="_blank" rel="noopener">Channel 393<br> HD</a>
+<a href="/watch.php?id=869" target="_blank" rel="noopener">Channel 869<br> HD</a>
+<a href="/watch.php?id=595" target="_blank" rel="noopener">Channel 595<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=813" target="_blank" rel="noopener">Channel 813<br> HD</a>
+<a href="/watch.php?id=32" target="_blank" rel="noopener">Channel 32<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=389" target="_blank" rel="noopener">Channel 389<br> HD</a>
+<a href="/watch.php?id=261" target="_blank" rel="noopener">Channel 261<br> HD</a>
+<a href="/watch.php?id=134" target="_blank" rel="noopener">Channel 134<br> HD</a>
+<a href="/watch.php?id=82" target="_blank" rel="noopener">Channel 82<br> HD</a>
+<a href="/watch.php?id=474" target="_blank" rel="noopener">Channel 474<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=861" target="_blank" rel="noopener">Channel 861<br> HD</a>
+<a href="/watch.php?id=133" target="_blank" rel="noopener">Channel 133<br> HD</a>
+<a href="/watch.php?id=44" target="_blank" rel="noopener">Channel 44<br> HD</a>
+<a href="/watch.php?id=281" target="_blank" rel="noopener">Channel 281<br> HD</a>
+<a href="/watch.php?id=800" target="_blank" rel="noopener">Channel 800<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=512" target="_blank" rel="noopener">Channel 512<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=400" target="_blank" rel="noopener">Channel 400<br> HD</a>
+<a href="/watch.php?id=338" target="_blank" rel="noopener">Channel 338<br> HD</a>
+<a href="/watch.php?id=647" target="_blank" rel="noopener">Channel 647<br> HD</a>
+<a href="/watch.php?id=275" target="_blank" rel="noopener">Channel 275<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=62" target="_blank" rel="noopener">Channel 62<br> HD</a>
+<a href="/watch.php?id=603" target="_blank" rel="noopener">Channel 603<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Cricket <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=561" target="_blank" rel="noopener">Channel 561<br> HD</a>
+<a href="/watch.php?id=423" target="_blank" rel="noopener">Channel 423<br> HD</a>
+<a href="/watch.php?id=552" target="_blank" rel="noopener">Channel 552<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=731" target="_blank" rel="noopener">Channel 731<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=182" target="_blank" rel="noopener">Channel 182<br> HD</a>
+<a href="/watch.php?id=99" target="_blank" rel="noopener">Channel 99<br> HD</a>
+<a href="/watch.php?id=155" target="_blank" rel="noopener">Channel 155<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=653" target="_blank" rel="noopener">Channel 653<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=380" target="_blank" rel="noopener">Channel 380<br> HD</a>
+<a href="/watch.php?id=102" target="_blank" rel="noopener">Channel 102<br> HD</a>
+<a href="/watch.php?id=321" target="_blank" rel="noopener">Channel 321<br> HD</a>
+<a href="/watch.php?id=42" target="_blank" rel="noopener">Channel 42<br> HD</a>
+<a href="/watch.php?id=130" target="_blank" rel="noopener">Channel 130<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:15</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=782" target="_blank" rel="noopener">Channel 782<br> HD</a>
+<a href="/watch.php?id=725" target="_blank" rel="noopener">Channel 725<br> HD</a>
+<a href="/watch.php?id=457" target="_blank" rel="noopener">Channel 457<br> HD</a>
+<a href="/watch.php?id=26" target="_blank" rel="noopener">Channel 26<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=310" target="_blank" rel="noopener">Channel 310<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=321" target="_blank" rel="noopener">Channel 321<br> HD</a>
+<a href="/watch.php?id=753" target="_blank" rel="noopener">Channel 753<br> HD</a>
+<a href="/watch.php?id=134" target="_blank" rel="noopener">Channel 134<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=97" target="_blank" rel="noopener">Channel 97<br> HD</a>
+<a href="/watch.php?id=436" target="_blank" rel="noopener">Channel 436<br> HD</a>
+<a href="/watch.php?id=862" target="_blank" rel="noopener">Channel 862<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=347" target="_blank" rel="noopener">Channel 347<br> HD</a>
+<a href="/watch.php?id=522" target="_blank" rel="noopener">Channel 522<br> HD</a>
+<a href="/watch.php?id=803" target="_blank" rel="noopener">Channel 803<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=669" target="_blank" rel="noopener">Channel 669<br> HD</a>
+<a href="/watch.php?id=835" target="_blank" rel="noopener">Channel 835<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=762" target="_blank" rel="noopener">Channel 762<br> HD</a>
+<a href="/watch.php?id=161" target="_blank" rel="noopener">Channel 161<br> HD</a>
+<a href="/watch.php?id=205" target="_blank" rel="noopener">Channel 205<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=420" target="_blank" rel="noopener">Channel 420<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=308" target="_blank" rel="noopener">Channel 308<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=280" target="_blank" rel="noopener">Channel 280<br> HD</a>
+<a href="/watch.php?id=334" target="_blank" rel="noopener">Channel 334<br> HD</a>
+<a href="/watch.php?id=767" target="_blank" rel="noopener">Channel 767<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:15</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=745" target="_blank" rel="noopener">Channel 745<br> HD</a>
+<a href="/watch.php?id=334" target="_blank" rel="noopener">Channel 334<br> HD</a>
+<a href="/watch.php?id=804" target="_blank" rel="noopener">Channel 804<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=492" target="_blank" rel="noopener">Channel 492<br> HD</a>
+<a href="/watch.php?id=466" target="_blank" rel="noopener">Channel 466<br> HD</a>
+<a href="/watch.php?id=373" target="_blank" rel="noopener">Channel 373<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=50" target="_blank" rel="noopener">Channel 50<br> HD</a>
+<a href="/watch.php?id=537" target="_blank" rel="noopener">Channel 537<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=765" target="_blank" rel="noopener">Channel 765<br> HD</a>
+<a href="/watch.php?id=347" target="_blank" rel="noopener">Channel 347<br> HD</a>
+<a href="/watch.php?id=371" target="_blank" rel="noopener">Channel 371<br> HD</a>
+<a href="/watch.php?id=817" target="_blank" rel="noopener">Channel 817<br> HD</a>
+<a href="/watch.php?id=659" target="_blank" rel="noopener">Channel 659<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=349" target="_blank" rel="noopener">Channel 349<br> HD</a>
+<a href="/watch.php?id=545" target="_blank" rel="noopener">Channel 545<br> HD</a>
+<a href="/watch.php?id=520" target="_blank" rel="noopener">Channel 520<br> HD</a>
+<a href="/watch.php?id=172" target="_blank" rel="noopener">Channel 172<br> HD</a>
+<a href="/watch.php?id=30" target="_blank" rel="noopener">Channel 30<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=137" target="_blank" rel="noopener">Channel 137<br> HD</a>
+<a href="/watch.php?id=116" target="_blank" rel="noopener">Channel 116<br> HD</a>
+<a href="/watch.php?id=190" target="_blank" rel="noopener">Channel 190<br> HD</a>
+<a href="/watch.php?id=785" target="_blank" rel="noopener">Channel 785<br> HD</a>
+<a href="/watch.php?id=421" target="_blank" rel="noopener">Channel 421<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=210" target="_blank" rel="noopener">Channel 210<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=814" target="_blank" rel="noopener">Channel 814<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=605" target="_blank" rel="noopener">Channel 605<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=206" target="_blank" rel="noopener">Channel 206<br> HD</a>
+<a href="/watch.php?id=613" target="_blank" rel="noopener">Channel 613<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=692" target="_blank" rel="noopener">Channel 692<br> HD</a>
+<a href="/watch.php?id=376" target="_blank" rel="noopener">Channel 376<br> HD</a>
+<a href="/watch.php?id=558" target="_blank" rel="noopener">Channel 558<br> HD</a>
+<a href="/watch.php?id=194" target="_blank" rel="noopener">Channel 194<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=207" target="_blank" rel="noopener">Channel 207<br> HD</a>
+<a href="/watch.php?id=9" target="_blank" rel="noopener">Channel 9<br> HD</a>
+<a href="/watch.php?id=765" target="_blank" rel="noopener">Channel 765<br> HD</a>
+<a href="/watch.php?id=545" target="_blank" rel="noopener">Channel 545<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=631" target="_blank" rel="noopener">Channel 631<br> HD</a>
+<a href="/watch.php?id=523" target="_blank" rel="noopener">Channel 523<br> HD</a>
+<a href="/watch.php?id=816" target="_blank" rel="noopener">Channel 816<br> HD</a>
+<a href="/watch.php?id=593" target="_blank" rel="noopener">Channel 593<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=195" target="_blank" rel="noopener">Channel 195<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=123" target="_blank" rel="noopener">Channel 123<br> HD</a>
+<a href="/watch.php?id=842" target="_blank" rel="noopener">Channel 842<br> HD</a>
+<a href="/watch.php?id=310" target="_blank" rel="noopener">Channel 310<br> HD</a>
+<a href="/watch.php?id=525" target="_blank" rel="noopener">Channel 525<br> HD</a>
+<a href="/watch.php?id=765" target="_blank" rel="noopener">Channel 765<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Motorsport <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=646" target="_blank" rel="noopener">Channel 646<br> HD</a>
+<a href="/watch.php?id=596" target="_blank" rel="noopener">Channel 596<br> HD</a>
+<a href="/watch.php?id=316" target="_blank" rel="noopener">Channel 316<br> HD</a>
+<a href="/watch.php?id=464" target="_blank" rel="noopener">Channel 464<br> HD</a>
+<a href="/watch.php?id=310" target="_blank" rel="noopener">Channel 310<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=792" target="_blank" rel="noopener">Channel 792<br> HD</a>
+<a href="/watch.php?id=167" target="_blank" rel="noopener">Channel 167<br> HD</a>
+<a href="/watch.php?id=259" target="_blank" rel="noopener">Channel 259<br> HD</a>
+<a href="/watch.php?id=652" target="_blank" rel="noopener">Channel 652<br> HD</a>
+<a href="/watch.php?id=10" target="_blank" rel="noopener">Channel 10<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=431" target="_blank" rel="noopener">Channel 431<br> HD</a>
+<a href="/watch.php?id=412" target="_blank" rel="noopener">Channel 412<br> HD</a>
+<a href="/watch.php?id=289" target="_blank" rel="noopener">Channel 289<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=276" target="_blank" rel="noopener">Channel 276<br> HD</a>
+<a href="/watch.php?id=476" target="_blank" rel="noopener">Channel 476<br> HD</a>
+<a href="/watch.php?id=279" target="_blank" rel="noopener">Channel 279<br> HD</a>
+<a href="/watch.php?id=816" target="_blank" rel="noopener">Channel 816<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=398" target="_blank" rel="noopener">Channel 398<br> HD</a>
+<a href="/watch.php?id=468" target="_blank" rel="noopener">Channel 468<br> HD</a>
+<a href="/watch.php?id=823" target="_blank" rel="noopener">Channel 823<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=152" target="_blank" rel="noopener">Channel 152<br> HD</a>
+<a href="/watch.php?id=19" target="_blank" rel="noopener">Channel 19<br> HD</a>
+<a href="/watch.php?id=177" target="_blank" rel="noopener">Channel 177<br> HD</a>
+<a href="/watch.php?id=834" target="_blank" rel="noopener">Channel 834<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=265" target="_blank" rel="noopener">Channel 265<br> HD</a>
+<a href="/watch.php?id=527" target="_blank" rel="noopener">Channel 527<br> HD</a>
+<a href="/watch.php?id=295" target="_blank" rel="noopener">Channel 295<br> HD</a>
+<a href="/watch.php?id=758" target="_blank" rel="noopener">Channel 758<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=796" target="_blank" rel="noopener">Channel 796<br> HD</a>
+<a href="/watch.php?id=498" target="_blank" rel="noopener">Channel 498<br> HD</a>
+<a href="/watch.php?id=221" target="_blank" rel="noopener">Channel 221<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=66" target="_blank" rel="noopener">Channel 66<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=106" target="_blank" rel="noopener">Channel 106<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=666" target="_blank" rel="noopener">Channel 666<br> HD</a>
+<a href="/watch.php?id=741" target="_blank" rel="noopener">Channel 741<br> HD</a>
+<a href="/watch.php?id=192" target="_blank" rel="noopener">Channel 192<br> HD</a>
+<a href="/watch.php?id=855" target="_blank" rel="noopener">Channel 855<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=224" target="_blank" rel="noopener">Channel 224<br> HD</a>
+<a href="/watch.php?id=548" target="_blank" rel="noopener">Channel 548<br> HD</a>
+<a href="/watch.php?id=433" target="_blank" rel="noopener">Channel 433<br> HD</a>
+<a href="/watch.php?id=356" target="_blank" rel="noopener">Channel 356<br> HD</a>
+<a href="/watch.php?id=49" target="_blank" rel="noopener">Channel 49<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=272" target="_blank" rel="noopener">Channel 272<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=694" target="_blank" rel="noopener">Channel 694<br> HD</a>
+<a href="/watch.php?id=660" target="_blank" rel="noopener">Channel 660<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=302" target="_blank" rel="noopener">Channel 302<br> HD</a>
+<a href="/watch.php?id=699" target="_blank" rel="noopener">Channel 699<br> HD</a>
+<a href="/watch.php?id=521" target="_blank" rel="noopener">Channel 521<br> HD</a>
+<a href="/watch.php?id=510" target="_blank" rel="noopener">Channel 510<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=153" target="_blank" rel="noopener">Channel 153<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=534" target="_blank" rel="noopener">Channel 534<br> HD</a>
+<a href="/watch.php?id=264" target="_blank" rel="noopener">Channel 264<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=649" target="_blank" rel="noopener">Channel 649<br> HD</a>
+<a href="/watch.php?id=830" target="_blank" rel="noopener">Channel 830<br> HD</a>
+<a href="/watch.php?id=558" target="_blank" rel="noopener">Channel 558<br> HD</a>
+<a href="/watch.php?id=220" target="_blank" rel="noopener">Channel 220<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=776" target="_blank" rel="noopener">Channel 776<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=641" target="_blank" rel="noopener">Channel 641<br> HD</a>
+<a href="/watch.php?id=451" target="_blank" rel="noopener">Channel 451<br> HD</a>
+<a href="/watch.php?id=308" target="_blank" rel="noopener">Channel 308<br> HD</a>
+<a href="/watch.php?id=779" target="_blank" rel="noopener">Channel 779<br> HD</a>
+<a href="/watch.php?id=863" target="_blank" rel="noopener">Channel 863<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:30</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=724" target="_blank" rel="noopener">Channel 724<br> HD</a>
+<a href="/watch.php?id=253" target="_blank" rel="noopener">Channel 253<br> HD</a>
+<a href="/watch.php?id=422" target="_blank" rel="noopener">Channel 422<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=575" target="_blank" rel="noopener">Channel 575<br> HD</a>
+<a href="/watch.php?id=646" target="_blank" rel="noopener">Channel 646<br> HD</a>
+<a href="/watch.php?id=613" target="_blank" rel="noopener">Channel 613<br> HD</a>
+<a href="/watch.php?id=60" target="_blank" rel="noopener">Channel 60<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=713" target="_blank" rel="noopener">Channel 713<br> HD</a>
+<a href="/watch.php?id=314" target="_blank" rel="noopener">Channel 314<br> HD</a>
+<a href="/watch.php?id=274" target="_blank" rel="noopener">Channel 274<br> HD</a>
+<a href="/watch.php?id=504" target="_blank" rel="noopener">Channel 504<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=347" target="_blank" rel="noopener">Channel 347<br> HD</a>
+<a href="/watch.php?id=181" target="_blank" rel="noopener">Channel 181<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=154" target="_blank" rel="noopener">Channel 154<br> HD</a>
+<a href="/watch.php?id=60" target="_blank" rel="noopener">Channel 60<br> HD</a>
+<a href="/watch.php?id=517" target="_blank" rel="noopener">Channel 517<br> HD</a>
+<a href="/watch.php?id=334" target="_blank" rel="noopener">Channel 334<br> HD</a>
+<a href="/watch.php?id=542" target="_blank" rel="noopener">Channel 542<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=506" target="_blank" rel="noopener">Channel 506<br> HD</a>
+<a href="/watch.php?id=492" target="_blank" rel="noopener">Channel 492<br> HD</a>
+<a href="/watch.php?id=338" target="_blank" rel="noopener">Channel 338<br> HD</a>
+<a href="/watch.php?id=122" target="_blank" rel="noopener">Channel 122<br> HD</a>
+<a href="/watch.php?id=131" target="_blank" rel="noopener">Channel 131<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=651" target="_blank" rel="noopener">Channel 651<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=577" target="_blank" rel="noopener">Channel 577<br> HD</a>
+<a href="/watch.php?id=205" target="_blank" rel="noopener">Channel 205<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=842" target="_blank" rel="noopener">Channel 842<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=761" target="_blank" rel="noopener">Channel 761<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Darts <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=125" target="_blank" rel="noopener">Channel 125<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=789" target="_blank" rel="noopener">Channel 789<br> HD</a>
+<a href="/watch.php?id=147" target="_blank" rel="noopener">Channel 147<br> HD</a>
+<a href="/watch.php?id=698" target="_blank" rel="noopener">Channel 698<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=308" target="_blank" rel="noopener">Channel 308<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=32" target="_blank" rel="noopener">Channel 32<br> HD</a>
+<a href="/watch.php?id=81" target="_blank" rel="noopener">Channel 81<br> HD</a>
+<a href="/watch.php?id=143" target="_blank" rel="noopener">Channel 143<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=696" target="_blank" rel="noopener">Channel 696<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=361" target="_blank" rel="noopener">Channel 361<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=696" target="_blank" rel="noopener">Channel 696<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=225" target="_blank" rel="noopener">Channel 225<br> HD</a>
+<a href="/watch.php?id=648" target="_blank" rel="noopener">Channel 648<br> HD</a>
+<a href="/watch.php?id=310" target="_blank" rel="noopener">Channel 310<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=247" target="_blank" rel="noopener">Channel 247<br> HD</a>
+<a href="/watch.php?id=221" target="_blank" rel="noopener">Channel 221<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=552" target="_blank" rel="noopener">Channel 552<br> HD</a>
+<a href="/watch.php?id=278" target="_blank" rel="noopener">Channel 278<br> HD</a>
+<a href="/watch.php?id=543" target="_blank" rel="noopener">Channel 543<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=763" target="_blank" rel="noopener">Channel 763<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=569" target="_blank" rel="noopener">Channel 569<br> HD</a>
+<a href="/watch.php?id=865" target="_blank" rel="noopener">Channel 865<br> HD</a>
+<a href="/watch.php?id=824" target="_blank" rel="noopener">Channel 824<br> HD</a>
+<a href="/watch.php?id=741" target="_blank" rel="noopener">Channel 741<br> HD</a>
+<a href="/watch.php?id=520" target="_blank" rel="noopener">Channel 520<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=160" target="_blank" rel="noopener">Channel 160<br> HD</a>
+<a href="/watch.php?id=77" target="_blank" rel="noopener">Channel 77<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=374" target="_blank" rel="noopener">Channel 374<br> HD</a>
+<a href="/watch.php?id=300" target="_blank" rel="noopener">Channel 300<br> HD</a>
+<a href="/watch.php?id=164" target="_blank" rel="noopener">Channel 164<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=121" target="_blank" rel="noopener">Channel 121<br> HD</a>
+<a href="/watch.php?id=616" target="_blank" rel="noopener">Channel 616<br> HD</a>
+<a href="/watch.php?id=149" target="_blank" rel="noopener">Channel 149<br> HD</a>
+<a href="/watch.php?id=277" target="_blank" rel="noopener">Channel 277<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=10" target="_blank" rel="noopener">Channel 10<br> HD</a>
+<a href="/watch.php?id=835" target="_blank" rel="noopener">Channel 835<br> HD</a>
+<a href="/watch.php?id=659" target="_blank" rel="noopener">Channel 659<br> HD</a>
+<a href="/watch.php?id=136" target="_blank" rel="noopener">Channel 136<br> HD</a>
+<a href="/watch.php?id=389" target="_blank" rel="noopener">Channel 389<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=696" target="_blank" rel="noopener">Channel 696<br> HD</a>
+<a href="/watch.php?id=433" target="_blank" rel="noopener">Channel 433<br> HD</a>
+<a href="/watch.php?id=283" target="_blank" rel="noopener">Channel 283<br> HD</a>
+<a href="/watch.php?id=380" target="_blank" rel="noopener">Channel 380<br> HD</a>
+<a href="/watch.php?id=419" target="_blank" rel="noopener">Channel 419<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=483" target="_blank" rel="noopener">Channel 483<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=852" target="_blank" rel="noopener">Channel 852<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:30</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=278" target="_blank" rel="noopener">Channel 278<br> HD</a>
+<a href="/watch.php?id=802" target="_blank" rel="noopener">Channel 802<br> HD</a>
+<a href="/watch.php?id=582" target="_blank" rel="noopener">Channel 582<br> HD</a>
+<a href="/watch.php?id=671" target="_blank" rel="noopener">Channel 671<br> HD</a>
+<a href="/watch.php?id=365" target="_blank" rel="noopener">Channel 365<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=246" target="_blank" rel="noopener">Channel 246<br> HD</a>
+<a href="/watch.php?id=109" target="_blank" rel="noopener">Channel 109<br> HD</a>
+<a href="/watch.php?id=576" target="_blank" rel="noopener">Channel 576<br> HD</a>
+<a href="/watch.php?id=367" target="_blank" rel="noopener">Channel 367<br> HD</a>
+<a href="/watch.php?id=893" target="_blank" rel="noopener">Channel 893<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=745" target="_blank" rel="noopener">Channel 745<br> HD</a>
+<a href="/watch.php?id=355" target="_blank" rel="noopener">Channel 355<br> HD</a>
+<a href="/watch.php?id=260" target="_blank" rel="noopener">Channel 260<br> HD</a>
+<a href="/watch.php?id=674" target="_blank" rel="noopener">Channel 674<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=368" target="_blank" rel="noopener">Channel 368<br> HD</a>
+<a href="/watch.php?id=301" target="_blank" rel="noopener">Channel 301<br> HD</a>
+<a href="/watch.php?id=773" target="_blank" rel="noopener">Channel 773<br> HD</a>
+<a href="/watch.php?id=836" target="_blank" rel="noopener">Channel 836<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:15</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=532" target="_blank" rel="noopener">Channel 532<br> HD</a>
+<a href="/watch.php?id=148" target="_blank" rel="noopener">Channel 148<br> HD</a>
+<a href="/watch.php?id=58" target="_blank" rel="noopener">Channel 58<br> HD</a>
+<a href="/watch.php?id=350" target="_blank" rel="noopener">Channel 350<br> HD</a>
+<a href="/watch.php?id=690" target="_blank" rel="noopener">Channel 690<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=776" target="_blank" rel="noopener">Channel 776<br> HD</a>
+<a href="/watch.php?id=728" target="_blank" rel="noopener">Channel 728<br> HD</a>
+<a href="/watch.php?id=125" target="_blank" rel="noopener">Channel 125<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=407" target="_blank" rel="noopener">Channel 407<br> HD</a>
+<a href="/watch.php?id=734" target="_blank" rel="noopener">Channel 734<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=673" target="_blank" rel="noopener">Channel 673<br> HD</a>
+<a href="/watch.php?id=252" target="_blank" rel="noopener">Channel 252<br> HD</a>
+<a href="/watch.php?id=804" target="_blank" rel="noopener">Channel 804<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=668" target="_blank" rel="noopener">Channel 668<br> HD</a>
+<a href="/watch.php?id=792" target="_blank" rel="noopener">Channel 792<br> HD</a>
+<a href="/watch.php?id=680" target="_blank" rel="noopener">Channel 680<br> HD</a>
+<a href="/watch.php?id=741" target="_blank" rel="noopener">Channel 741<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=124" target="_blank" rel="noopener">Channel 124<br> HD</a>
+<a href="/watch.php?id=586" target="_blank" rel="noopener">Channel 586<br> HD</a>
+<a href="/watch.php?id=500" target="_blank" rel="noopener">Channel 500<br> HD</a>
+<a href="/watch.php?id=273" target="_blank" rel="noopener">Channel 273<br> HD</a>
+<a href="/watch.php?id=860" target="_blank" rel="noopener">Channel 860<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=112" target="_blank" rel="noopener">Channel 112<br> HD</a>
+<a href="/watch.php?id=819" target="_blank" rel="noopener">Channel 819<br> HD</a>
+<a href="/watch.php?id=27" target="_blank" rel="noopener">Channel 27<br> HD</a>
+<a href="/watch.php?id=669" target="_blank" rel="noopener">Channel 669<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category"><div class="schedule__catHeader">
+<div class="card__meta"> Rugby Union <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=158" target="_blank" rel="noopener">Channel 158<br> HD</a>
+<a href="/watch.php?id=538" target="_blank" rel="noopener">Channel 538<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=831" target="_blank" rel="noopener">Channel 831<br> HD</a>
+<a href="/watch.php?id=650" target="_blank" rel="noopener">Channel 650<br> HD</a>
+<a href="/watch.php?id=722" target="_blank" rel="noopener">Channel 722<br> HD</a>
+<a href="/watch.php?id=754" target="_blank" rel="noopener">Channel 754<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=558" target="_blank" rel="noopener">Channel 558<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=679" target="_blank" rel="noopener">Channel 679<br> HD</a>
+<a href="/watch.php?id=245" target="_blank" rel="noopener">Channel 245<br> HD</a>
+<a href="/watch.php?id=78" target="_blank" rel="noopener">Channel 78<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=223" target="_blank" rel="noopener">Channel 223<br> HD</a>
+<a href="/watch.php?id=438" target="_blank" rel="noopener">Channel 438<br> HD</a>
+<a href="/watch.php?id=242" target="_blank" rel="noopener">Channel 242<br> HD</a>
+<a href="/watch.php?id=814" target="_blank" rel="noopener">Channel 814<br> HD</a>
+<a href="/watch.php?id=42" target="_blank" rel="noopener">Channel 42<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=408" target="_blank" rel="noopener">Channel 408<br> HD</a>
+<a href="/watch.php?id=799" target="_blank" rel="noopener">Channel 799<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=92" target="_blank" rel="noopener">Channel 92<br> HD</a>
+<a href="/watch.php?id=574" target="_blank" rel="noopener">Channel 574<br> HD</a>
+<a href="/watch.php?id=97" target="_blank" rel="noopener">Channel 97<br> HD</a>
+<a href="/watch.php?id=657" target="_blank" rel="noopener">Channel 657<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=22" target="_blank" rel="noopener">Channel 22<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=610" target="_blank" rel="noopener">Channel 610<br> HD</a>
+<a href="/watch.php?id=137" target="_blank" rel="noopener">Channel 137<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=823" target="_blank" rel="noopener">Channel 823<br> HD</a>
+<a href="/watch.php?id=428" target="_blank" rel="noopener">Channel 428<br> HD</a>
+<a href="/watch.php?id=568" target="_blank" rel="noopener">Channel 568<br> HD</a>
+<a href="/watch.php?id=172" target="_blank" rel="noopener">Channel 172<br> HD</a>
+<a href="/watch.php?id=716" target="_blank" rel="noopener">Channel 716<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=837" target="_blank" rel="noopener">Channel 837<br> HD</a>
+<a href="/watch.php?id=286" target="_blank" rel="noopener">Channel 286<br> HD</a>
+<a href="/watch.php?id=369" target="_blank" rel="noopener">Channel 369<br> HD</a>
+<a href="/watch.php?id=156" target="_blank" rel="noopener">Channel 156<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=86" target="_blank" rel="noopener">Channel 86<br> HD</a>
+<a href="/watch.php?id=749" target="_blank" rel="noopener">Channel 749<br> HD</a>
+<a href="/watch.php?id=370" target="_blank" rel="noopener">Channel 370<br> HD</a>
+<a href="/watch.php?id=345" target="_blank" rel="noopener">Channel 345<br> HD</a>
+<a href="/watch.php?id=147" target="_blank" rel="noopener">Channel 147<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=286" target="_blank" rel="noopener">Channel 286<br> HD</a>
+<a href="/watch.php?id=580" target="_blank" rel="noopener">Channel 580<br> HD</a>
+<a href="/watch.php?id=479" target="_blank" rel="noopener">Channel 479<br> HD</a>
+<a href="/watch.php?id=14" target="_blank" rel="noopener">Channel 14<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=73" target="_blank" rel="noopener">Channel 73<br> HD</a>
+<a href="/watch.php?id=821" target="_blank" rel="noopener">Channel 821<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=143" target="_blank" rel="noopener">Channel 143<br> HD</a>
+<a href="/watch.php?id=568" target="_blank" rel="noopener">Channel 568<br> HD</a>
+<a href="/watch.php?id=472" target="_blank" rel="noopener">Channel 472<br> HD</a>
+<a href="/watch.php?id=401" target="_blank" rel="noopener">Channel 401<br> HD</a>
+<a href="/watch.php?id=729" target="_blank" rel="noopener">Channel 729<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=806" target="_blank" rel="noopener">Channel 806<br> HD</a>
+<a href="/watch.php?id=684" target="_blank" rel="noopener">Channel 684<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=428" target="_blank" rel="noopener">Channel 428<br> HD</a>
+<a href="/watch.php?id=699" target="_blank" rel="noopener">Channel 699<br> HD</a>
+<a href="/watch.php?id=141" target="_blank" rel="noopener">Channel 141<br> HD</a>
+<a href="/watch.php?id=606" target="_blank" rel="noopener">Channel 606<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=871" target="_blank" rel="noopener">Channel 871<br> HD</a>
+<a href="/watch.php?id=391" target="_blank" rel="noopener">Channel 391<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=768" target="_blank" rel="noopener">Channel 768<br> HD</a>
+<a href="/watch.php?id=859" target="_blank" rel="noopener">Channel 859<br> HD</a>
+<a href="/watch.php?id=183" target="_blank" rel="noopener">Channel 183<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=504" target="_blank" rel="noopener">Channel 504<br> HD</a>
+<a href="/watch.php?id=549" target="_blank" rel="noopener">Channel 549<br> HD</a>
+<a href="/watch.php?id=299" target="_blank" rel="noopener">Channel 299<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=23" target="_blank" rel="noopener">Channel 23<br> HD</a>
+<a href="/watch.php?id=298" target="_blank" rel="noopener">Channel 298<br> HD</a>
+<a href="/watch.php?id=820" target="_blank" rel="noopener">Channel 820<br> HD</a>
+<a href="/watch.php?id=830" target="_blank" rel="noopener">Channel 830<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=634" target="_blank" rel="noopener">Channel 634<br> HD</a>
+<a href="/watch.php?id=60" target="_blank" rel="noopener">Channel 60<br> HD</a>
+<a href="/watch.php?id=54" target="_blank" rel="noopener">Channel 54<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=875" target="_blank" rel="noopener">Channel 875<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=517" target="_blank" rel="noopener">Channel 517<br> HD</a>
+<a href="/watch.php?id=520" target="_blank" rel="noopener">Channel 520<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=677" target="_blank" rel="noopener">Channel 677<br> HD</a>
+<a href="/watch.php?id=530" target="_blank" rel="noopener">Channel 530<br> HD</a>
+<a href="/watch.php?id=138" target="_blank" rel="noopener">Channel 138<br> HD</a>
+<a href="/watch.php?id=834" target="_blank" rel="noopener">Channel 834<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=782" target="_blank" rel="noopener">Channel 782<br> HD</a>
+<a href="/watch.php?id=577" target="_blank" rel="noopener">Channel 577<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=39" target="_blank" rel="noopener">Channel 39<br> HD</a>
+<a href="/watch.php?id=654" target="_blank" rel="noopener">Channel 654<br> HD</a>
+<a href="/watch.php?id=172" target="_blank" rel="noopener">Channel 172<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=409" target="_blank" rel="noopener">Channel 409<br> HD</a>
+<a href="/watch.php?id=279" target="_blank" rel="noopener">Channel 279<br> HD</a>
+<a href="/watch.php?id=506" target="_blank" rel="noopener">Channel 506<br> HD</a>
+<a href="/watch.php?id=101" target="_blank" rel="noopener">Channel 101<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=772" target="_blank" rel="noopener">Channel 772<br> HD</a>
+<a href="/watch.php?id=46" target="_blank" rel="noopener">Channel 46<br> HD</a>
+<a href="/watch.php?id=501" target="_blank" rel="noopener">Channel 501<br> HD</a>
+<a href="/watch.php?id=220" target="_blank" rel="noopener">Channel 220<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=97" target="_blank" rel="noopener">Channel 97<br> HD</a>
+<a href="/watch.php?id=79" target="_blank" rel="noopener">Channel 79<br> HD</a>
+</div></div>
+</div></div>
+</div>
+<div class="schedule__day">
+<div class="schedule__dayTitle">Saturday 19th Oct 2025 - Schedule Time UK GMT</div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Soccer <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=178" target="_blank" rel="noopener">Channel 178<br> HD</a>
+<a href="/watch.php?id=610" target="_blank" rel="noopener">Channel 610<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=370" target="_blank" rel="noopener">Channel 370<br> HD</a>
+<a href="/watch.php?id=202" target="_blank" rel="noopener">Channel 202<br> HD</a>
+<a href="/watch.php?id=239" target="_blank" rel="noopener">Channel 239<br> HD</a>
+<a href="/watch.php?id=369" target="_blank" rel="noopener">Channel 369<br> HD</a>
+<a href="/watch.php?id=675" target="_blank" rel="noopener">Channel 675<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=855" target="_blank" rel="noopener">Channel 855<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=598" target="_blank" rel="noopener">Channel 598<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=410" target="_blank" rel="noopener">Channel 410<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=51" target="_blank" rel="noopener">Channel 51<br> HD</a>
+<a href="/watch.php?id=566" target="_blank" rel="noopener">Channel 566<br> HD</a>
+<a href="/watch.php?id=893" target="_blank" rel="noopener">Channel 893<br> HD</a>
+<a href="/watch.php?id=489" target="_blank" rel="noopener">Channel 489<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=611" target="_blank" rel="noopener">Channel 611<br> HD</a>
+<a href="/watch.php?id=604" target="_blank" rel="noopener">Channel 604<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=401" target="_blank" rel="noopener">Channel 401<br> HD</a>
+<a href="/watch.php?id=533" target="_blank" rel="noopener">Channel 533<br> HD</a>
+<a href="/watch.php?id=810" target="_blank" rel="noopener">Channel 810<br> HD</a>
+<a href="/watch.php?id=25" target="_blank" rel="noopener">Channel 25<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=341" target="_blank" rel="noopener">Channel 341<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=597" target="_blank" rel="noopener">Channel 597<br> HD</a>
+<a href="/watch.php?id=76" target="_blank" rel="noopener">Channel 76<br> HD</a>
+<a href="/watch.php?id=497" target="_blank" rel="noopener">Channel 497<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=513" target="_blank" rel="noopener">Channel 513<br> HD</a>
+<a href="/watch.php?id=830" target="_blank" rel="noopener">Channel 830<br> HD</a>
+<a href="/watch.php?id=558" target="_blank" rel="noopener">Channel 558<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=150" target="_blank" rel="noopener">Channel 150<br> HD</a>
+<a href="/watch.php?id=595" target="_blank" rel="noopener">Channel 595<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=888" target="_blank" rel="noopener">Channel 888<br> HD</a>
+<a href="/watch.php?id=521" target="_blank" rel="noopener">Channel 521<br> HD</a>
+<a href="/watch.php?id=431" target="_blank" rel="noopener">Channel 431<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=729" target="_blank" rel="noopener">Channel 729<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=773" target="_blank" rel="noopener">Channel 773<br> HD</a>
+<a href="/watch.php?id=407" target="_blank" rel="noopener">Channel 407<br> HD</a>
+<a href="/watch.php?id=564" target="_blank" rel="noopener">Channel 564<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=726" target="_blank" rel="noopener">Channel 726<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=290" target="_blank" rel="noopener">Channel 290<br> HD</a>
+<a href="/watch.php?id=565" target="_blank" rel="noopener">Channel 565<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=740" target="_blank" rel="noopener">Channel 740<br> HD</a>
+<a href="/watch.php?id=492" target="_blank" rel="noopener">Channel 492<br> HD</a>
+<a href="/watch.php?id=49" target="_blank" rel="noopener">Channel 49<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=324" target="_blank" rel="noopener">Channel 324<br> HD</a>
+<a href="/watch.php?id=348" target="_blank" rel="noopener">Channel 348<br> HD</a>
+<a href="/watch.php?id=304" target="_blank" rel="noopener">Channel 304<br> HD</a>
+<a href="/watch.php?id=881" target="_blank" rel="noopener">Channel 881<br> HD</a>
+<a href="/watch.php?id=529" target="_blank" rel="noopener">Channel 529<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=30" target="_blank" rel="noopener">Channel 30<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:15</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=42" target="_blank" rel="noopener">Channel 42<br> HD</a>
+<a href="/watch.php?id=724" target="_blank" rel="noopener">Channel 724<br> HD</a>
+<a href="/watch.php?id=603" target="_blank" rel="noopener">Channel 603<br> HD</a>
+<a href="/watch.php?id=719" target="_blank" rel="noopener">Channel 719<br> HD</a>
+<a href="/watch.php?id=680" target="_blank" rel="noopener">Channel 680<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=602" target="_blank" rel="noopener">Channel 602<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=470" target="_blank" rel="noopener">Channel 470<br> HD</a>
+<a href="/watch.php?id=202" target="_blank" rel="noopener">Channel 202<br> HD</a>
+<a href="/watch.php?id=801" target="_blank" rel="noopener">Channel 801<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=741" target="_blank" rel="noopener">Channel 741<br> HD</a>
+<a href="/watch.php?id=364" target="_blank" rel="noopener">Channel 364<br> HD</a>
+<a href="/watch.php?id=226" target="_blank" rel="noopener">Channel 226<br> HD</a>
+<a href="/watch.php?id=651" target="_blank" rel="noopener">Channel 651<br> HD</a>
+<a href="/watch.php?id=10" target="_blank" rel="noopener">Channel 10<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:15</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=566" target="_blank" rel="noopener">Channel 566<br> HD</a>
+<a href="/watch.php?id=41" target="_blank" rel="noopener">Channel 41<br> HD</a>
+<a href="/watch.php?id=10" target="_blank" rel="noopener">Channel 10<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=541" target="_blank" rel="noopener">Channel 541<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=503" target="_blank" rel="noopener">Channel 503<br> HD</a>
+<a href="/watch.php?id=519" target="_blank" rel="noopener">Channel 519<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=609" target="_blank" rel="noopener">Channel 609<br> HD</a>
+<a href="/watch.php?id=186" target="_blank" rel="noopener">Channel 186<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=437" target="_blank" rel="noopener">Channel 437<br> HD</a>
+<a href="/watch.php?id=629" target="_blank" rel="noopener">Channel 629<br> HD</a>
+<a href="/watch.php?id=486" target="_blank" rel="noopener">Channel 486<br> HD</a>
+<a href="/watch.php?id=373" target="_blank" rel="noopener">Channel 373<br> HD</a>
+<a href="/watch.php?id=24" target="_blank" rel="noopener">Channel 24<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=352" target="_blank" rel="noopener">Channel 352<br> HD</a>
+<a href="/watch.php?id=348" target="_blank" rel="noopener">Channel 348<br> HD</a>
+<a href="/watch.php?id=76" target="_blank" rel="noopener">Channel 76<br> HD</a>
+<a href="/watch.php?id=663" target="_blank" rel="noopener">Channel 663<br> HD</a>
+<a href="/watch.php?id=431" target="_blank" rel="noopener">Channel 431<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Tennis <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=697" target="_blank" rel="noopener">Channel 697<br> HD</a>
+<a href="/watch.php?id=757" target="_blank" rel="noopener">Channel 757<br> HD</a>
+<a href="/watch.php?id=590" target="_blank" rel="noopener">Channel 590<br> HD</a>
+<a href="/watch.php?id=878" target="_blank" rel="noopener">Channel 878<br> HD</a>
+<a href="/watch.php?id=787" target="_blank" rel="noopener">Channel 787<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=692" target="_blank" rel="noopener">Channel 692<br> HD</a>
+<a href="/watch.php?id=840" target="_blank" rel="noopener">Channel 840<br> HD</a>
+<a href="/watch.php?id=538" target="_blank" rel="noopener">Channel 538<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=318" target="_blank" rel="noopener">Channel 318<br> HD</a>
+<a href="/watch.php?id=16" target="_blank" rel="noopener">Channel 16<br> HD</a>
+<a href="/watch.php?id=620" target="_blank" rel="noopener">Channel 620<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=238" target="_blank" rel="noopener">Channel 238<br> HD</a>
+<a href="/watch.php?id=521" target="_blank" rel="noopener">Channel 521<br> HD</a>
+<a href="/watch.php?id=455" target="_blank" rel="noopener">Channel 455<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=394" target="_blank" rel="noopener">Channel 394<br> HD</a>
+<a href="/watch.php?id=884" target="_blank" rel="noopener">Channel 884<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=893" target="_blank" rel="noopener">Channel 893<br> HD</a>
+<a href="/watch.php?id=804" target="_blank" rel="noopener">Channel 804<br> HD</a>
+<a href="/watch.php?id=9" target="_blank" rel="noopener">Channel 9<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=388" target="_blank" rel="noopener">Channel 388<br> HD</a>
+<a href="/watch.php?id=16" target="_blank" rel="noopener">Channel 16<br> HD</a>
+<a href="/watch.php?id=333" target="_blank" rel="noopener">Channel 333<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=734" target="_blank" rel="noopener">Channel 734<br> HD</a>
+<a href="/watch.php?id=84" target="_blank" rel="noopener">Channel 84<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=800" target="_blank" rel="noopener">Channel 800<br> HD</a>
+<a href="/watch.php?id=708" target="_blank" rel="noopener">Channel 708<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=28" target="_blank" rel="noopener">Channel 28<br> HD</a>
+<a href="/watch.php?id=660" target="_blank" rel="noopener">Channel 660<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=301" target="_blank" rel="noopener">Channel 301<br> HD</a>
+<a href="/watch.php?id=388" target="_blank" rel="noopener">Channel 388<br> HD</a>
+<a href="/watch.php?id=431" target="_blank" rel="noopener">Channel 431<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=238" target="_blank" rel="noopener">Channel 238<br> HD</a>
+<a href="/watch.php?id=623" target="_blank" rel="noopener">Channel 623<br> HD</a>
+<a href="/watch.php?id=44" target="_blank" rel="noopener">Channel 44<br> HD</a>
+<a href="/watch.php?id=633" target="_blank" rel="noopener">Channel 633<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=389" target="_blank" rel="noopener">Channel 389<br> HD</a>
+<a href="/watch.php?id=216" target="_blank" rel="noopener">Channel 216<br> HD</a>
+<a href="/watch.php?id=637" target="_blank" rel="noopener">Channel 637<br> HD</a>
+<a href="/watch.php?id=156" target="_blank" rel="noopener">Channel 156<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=730" target="_blank" rel="noopener">Channel 730<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=32" target="_blank" rel="noopener">Channel 32<br> HD</a>
+<a href="/watch.php?id=380" target="_blank" rel="noopener">Channel 380<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=619" target="_blank" rel="noopener">Channel 619<br> HD</a>
+<a href="/watch.php?id=115" target="_blank" rel="noopener">Channel 115<br> HD</a>
+<a href="/watch.php?id=598" target="_blank" rel="noopener">Channel 598<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=12" target="_blank" rel="noopener">Channel 12<br> HD</a>
+<a href="/watch.php?id=863" target="_blank" rel="noopener">Channel 863<br> HD</a>
+<a href="/watch.php?id=319" target="_blank" rel="noopener">Channel 319<br> HD</a>
+<a href="/watch.php?id=771" target="_blank" rel="noopener">Channel 771<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=226" target="_blank" rel="noopener">Channel 226<br> HD</a>
+<a href="/watch.php?id=892" target="_blank" rel="noopener">Channel 892<br> HD</a>
+<a href="/watch.php?id=621" target="_blank" rel="noopener">Channel 621<br> HD</a>
+<a href="/watch.php?id=766" target="_blank" rel="noopener">Channel 766<br> HD</a>
+<a href="/watch.php?id=659" target="_blank" rel="noopener">Channel 659<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=105" target="_blank" rel="noopener">Channel 105<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=224" target="_blank" rel="noopener">Channel 224<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=68" target="_blank" rel="noopener">Channel 68<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=804" target="_blank" rel="noopener">Channel 804<br> HD</a>
+<a href="/watch.php?id=20" target="_blank" rel="noopener">Channel 20<br> HD</a>
+<a href="/watch.php?id=627" target="_blank" rel="noopener">Channel 627<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=273" target="_blank" rel="noopener">Channel 273<br> HD</a>
+<a href="/watch.php?id=303" target="_blank" rel="noopener">Channel 303<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=62" target="_blank" rel="noopener">Channel 62<br> HD</a>
+<a href="/watch.php?id=245" target="_blank" rel="noopener">Channel 245<br> HD</a>
+<a href="/watch.php?id=569" target="_blank" rel="noopener">Channel 569<br> HD</a>
+<a href="/watch.php?id=718" target="_blank" rel="noopener">Channel 718<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=123" target="_blank" rel="noopener">Channel 123<br> HD</a>
+<a href="/watch.php?id=17" target="_blank" rel="noopener">Channel 17<br> HD</a>
+<a href="/watch.php?id=577" target="_blank" rel="noopener">Channel 577<br> HD</a>
+<a href="/watch.php?id=190" target="_blank" rel="noopener">Channel 190<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=181" target="_blank" rel="noopener">Channel 181<br> HD</a>
+<a href="/watch.php?id=312" target="_blank" rel="noopener">Channel 312<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=853" target="_blank" rel="noopener">Channel 853<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=353" target="_blank" rel="noopener">Channel 353<br> HD</a>
+<a href="/watch.php?id=60" target="_blank" rel="noopener">Channel 60<br> HD</a>
+<a href="/watch.php?id=604" target="_blank" rel="noopener">Channel 604<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=123" target="_blank" rel="noopener">Channel 123<br> HD</a>
+<a href="/watch.php?id=59" target="_blank" rel="noopener">Channel 59<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=806" target="_blank" rel="noopener">Channel 806<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Basketball <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=433" target="_blank" rel="noopener">Channel 433<br> HD</a>
+<a href="/watch.php?id=893" target="_blank" rel="noopener">Channel 893<br> HD</a>
+<a href="/watch.php?id=255" target="_blank" rel="noopener">Channel 255<br> HD</a>
+<a href="/watch.php?id=740" target="_blank" rel="noopener">Channel 740<br> HD</a>
+<a href="/watch.php?id=34" target="_blank" rel="noopener">Channel 34<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=366" target="_blank" rel="noopener">Channel 366<br> HD</a>
+<a href="/watch.php?id=466" target="_blank" rel="noopener">Channel 466<br> HD</a>
+<a href="/watch.php?id=783" target="_blank" rel="noopener">Channel 783<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=437" target="_blank" rel="noopener">Channel 437<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=620" target="_blank" rel="noopener">Channel 620<br> HD</a>
+<a href="/watch.php?id=665" target="_blank" rel="noopener">Channel 665<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=546" target="_blank" rel="noopener">Channel 546<br> HD</a>
+<a href="/watch.php?id=312" target="_blank" rel="noopener">Channel 312<br> HD</a>
+<a href="/watch.php?id=344" target="_blank" rel="noopener">Channel 344<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=324" target="_blank" rel="noopener">Channel 324<br> HD</a>
+<a href="/watch.php?id=406" target="_blank" rel="noopener">Channel 406<br> HD</a>
+<a href="/watch.php?id=483" target="_blank" rel="noopener">Channel 483<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=310" target="_blank" rel="noopener">Channel 310<br> HD</a>
+<a href="/watch.php?id=581" target="_blank" rel="noopener">Channel 581<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=469" target="_blank" rel="noopener">Channel 469<br> HD</a>
+<a href="/watch.php?id=661" target="_blank" rel="noopener">Channel 661<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=260" target="_blank" rel="noopener">Channel 260<br> HD</a>
+<a href="/watch.php?id=242" target="_blank" rel="noopener">Channel 242<br> HD</a>
+<a href="/watch.php?id=365" target="_blank" rel="noopener">Channel 365<br> HD</a>
+<a href="/watch.php?id=661" target="_blank" rel="noopener">Channel 661<br> HD</a>
+<a href="/watch.php?id=323" target="_blank" rel="noopener">Channel 323<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=439" target="_blank" rel="noopener">Channel 439<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=866" target="_blank" rel="noopener">Channel 866<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=492" target="_blank" rel="noopener">Channel 492<br> HD</a>
+<a href="/watch.php?id=548" target="_blank" rel="noopener">Channel 548<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:15</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=754" target="_blank" rel="noopener">Channel 754<br> HD</a>
+<a href="/watch.php?id=375" target="_blank" rel="noopener">Channel 375<br> HD</a>
+<a href="/watch.php?id=520" target="_blank" rel="noopener">Channel 520<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=670" target="_blank" rel="noopener">Channel 670<br> HD</a>
+<a href="/watch.php?id=124" target="_blank" rel="noopener">Channel 124<br> HD</a>
+<a href="/watch.php?id=190" target="_blank" rel="noopener">Channel 190<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=253" target="_blank" rel="noopener">Channel 253<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=369" target="_blank" rel="noopener">Channel 369<br> HD</a>
+<a href="/watch.php?id=791" target="_blank" rel="noopener">Channel 791<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=100" target="_blank" rel="noopener">Channel 100<br> HD</a>
+<a href="/watch.php?id=139" target="_blank" rel="noopener">Channel 139<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=167" target="_blank" rel="noopener">Channel 167<br> HD</a>
+<a href="/watch.php?id=234" target="_blank" rel="noopener">Channel 234<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=595" target="_blank" rel="noopener">Channel 595<br> HD</a>
+<a href="/watch.php?id=525" target="_blank" rel="noopener">Channel 525<br> HD</a>
+<a href="/watch.php?id=487" target="_blank" rel="noopener">Channel 487<br> HD</a>
+<a href="/watch.php?id=188" target="_blank" rel="noopener">Channel 188<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=211" target="_blank" rel="noopener">Channel 211<br> HD</a>
+<a href="/watch.php?id=235" target="_blank" rel="noopener">Channel 235<br> HD</a>
+<a href="/watch.php?id=782" target="_blank" rel="noopener">Channel 782<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=498" target="_blank" rel="noopener">Channel 498<br> HD</a>
+<a href="/watch.php?id=372" target="_blank" rel="noopener">Channel 372<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=244" target="_blank" rel="noopener">Channel 244<br> HD</a>
+<a href="/watch.php?id=695" target="_blank" rel="noopener">Channel 695<br> HD</a>
+<a href="/watch.php?id=713" target="_blank" rel="noopener">Channel 713<br> HD</a>
+<a href="/watch.php?id=889" target="_blank" rel="noopener">Channel 889<br> HD</a>
+<a href="/watch.php?id=217" target="_blank" rel="noopener">Channel 217<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=351" target="_blank" rel="noopener">Channel 351<br> HD</a>
+<a href="/watch.php?id=169" target="_blank" rel="noopener">Channel 169<br> HD</a>
+<a href="/watch.php?id=589" target="_blank" rel="noopener">Channel 589<br> HD</a>
+<a href="/watch.php?id=708" target="_blank" rel="noopener">Channel 708<br> HD</a>
+<a href="/watch.php?id=859" target="_blank" rel="noopener">Channel 859<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=38" target="_blank" rel="noopener">Channel 38<br> HD</a>
+<a href="/watch.php?id=54" target="_blank" rel="noopener">Channel 54<br> HD</a>
+<a href="/watch.php?id=874" target="_blank" rel="noopener">Channel 874<br> HD</a>
+<a href="/watch.php?id=376" target="_blank" rel="noopener">Channel 376<br> HD</a>
+<a href="/watch.php?id=512" target="_blank" rel="noopener">Channel 512<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=327" target="_blank" rel="noopener">Channel 327<br> HD</a>
+<a href="/watch.php?id=681" target="_blank" rel="noopener">Channel 681<br> HD</a>
+<a href="/watch.php?id=760" target="_blank" rel="noopener">Channel 760<br> HD</a>
+<a href="/watch.php?id=581" target="_blank" rel="noopener">Channel 581<br> HD</a>
+<a href="/watch.php?id=686" target="_blank" rel="noopener">Channel 686<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=347" target="_blank" rel="noopener">Channel 347<br> HD</a>
+<a href="/watch.php?id=426" target="_blank" rel="noopener">Channel 426<br> HD</a>
+<a href="/watch.php?id=872" target="_blank" rel="noopener">Channel 872<br> HD</a>
+<a href="/watch.php?id=74" target="_blank" rel="noopener">Channel 74<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=185" target="_blank" rel="noopener">Channel 185<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=891" target="_blank" rel="noopener">Channel 891<br> HD</a>
+<a href="/watch.php?id=314" target="_blank" rel="noopener">Channel 314<br> HD</a>
+<a href="/watch.php?id=500" target="_blank" rel="noopener">Channel 500<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=50" target="_blank" rel="noopener">Channel 50<br> HD</a>
+<a href="/watch.php?id=119" target="_blank" rel="noopener">Channel 119<br> HD</a>
+<a href="/watch.php?id=442" target="_blank" rel="noopener">Channel 442<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=787" target="_blank" rel="noopener">Channel 787<br> HD</a>
+<a href="/watch.php?id=670" target="_blank" rel="noopener">Channel 670<br> HD</a>
+<a href="/watch.php?id=737" target="_blank" rel="noopener">Channel 737<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Ice Hockey <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=147" target="_blank" rel="noopener">Channel 147<br> HD</a>
+<a href="/watch.php?id=361" target="_blank" rel="noopener">Channel 361<br> HD</a>
+<a href="/watch.php?id=97" target="_blank" rel="noopener">Channel 97<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=461" target="_blank" rel="noopener">Channel 461<br> HD</a>
+<a href="/watch.php?id=154" target="_blank" rel="noopener">Channel 154<br> HD</a>
+<a href="/watch.php?id=853" target="_blank" rel="noopener">Channel 853<br> HD</a>
+<a href="/watch.php?id=493" target="_blank" rel="noopener">Channel 493<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=759" target="_blank" rel="noopener">Channel 759<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=496" target="_blank" rel="noopener">Channel 496<br> HD</a>
+<a href="/watch.php?id=717" target="_blank" rel="noopener">Channel 717<br> HD</a>
+<a href="/watch.php?id=336" target="_blank" rel="noopener">Channel 336<br> HD</a>
+<a href="/watch.php?id=533" target="_blank" rel="noopener">Channel 533<br> HD</a>
+<a href="/watch.php?id=815" target="_blank" rel="noopener">Channel 815<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=14" target="_blank" rel="noopener">Channel 14<br> HD</a>
+<a href="/watch.php?id=396" target="_blank" rel="noopener">Channel 396<br> HD</a>
+<a href="/watch.php?id=566" target="_blank" rel="noopener">Channel 566<br> HD</a>
+<a href="/watch.php?id=742" target="_blank" rel="noopener">Channel 742<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=861" target="_blank" rel="noopener">Channel 861<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=705" target="_blank" rel="noopener">Channel 705<br> HD</a>
+<a href="/watch.php?id=661" target="_blank" rel="noopener">Channel 661<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=200" target="_blank" rel="noopener">Channel 200<br> HD</a>
+<a href="/watch.php?id=166" target="_blank" rel="noopener">Channel 166<br> HD</a>
+<a href="/watch.php?id=138" target="_blank" rel="noopener">Channel 138<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=346" target="_blank" rel="noopener">Channel 346<br> HD</a>
+<a href="/watch.php?id=828" target="_blank" rel="noopener">Channel 828<br> HD</a>
+<a href="/watch.php?id=178" target="_blank" rel="noopener">Channel 178<br> HD</a>
+<a href="/watch.php?id=583" target="_blank" rel="noopener">Channel 583<br> HD</a>
+<a href="/watch.php?id=503" target="_blank" rel="noopener">Channel 503<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=61" target="_blank" rel="noopener">Channel 61<br> HD</a>
+<a href="/watch.php?id=455" target="_blank" rel="noopener">Channel 455<br> HD</a>
+<a href="/watch.php?id=671" target="_blank" rel="noopener">Channel 671<br> HD</a>
+<a href="/watch.php?id=168" target="_blank" rel="noopener">Channel 168<br> HD</a>
+<a href="/watch.php?id=522" target="_blank" rel="noopener">Channel 522<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=269" target="_blank" rel="noopener">Channel 269<br> HD</a>
+<a href="/watch.php?id=142" target="_blank" rel="noopener">Channel 142<br> HD</a>
+<a href="/watch.php?id=174" target="_blank" rel="noopener">Channel 174<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=568" target="_blank" rel="noopener">Channel 568<br> HD</a>
+<a href="/watch.php?id=724" target="_blank" rel="noopener">Channel 724<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=533" target="_blank" rel="noopener">Channel 533<br> HD</a>
+<a href="/watch.php?id=631" target="_blank" rel="noopener">Channel 631<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=699" target="_blank" rel="noopener">Channel 699<br> HD</a>
+<a href="/watch.php?id=7" target="_blank" rel="noopener">Channel 7<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=753" target="_blank" rel="noopener">Channel 753<br> HD</a>
+<a href="/watch.php?id=184" target="_blank" rel="noopener">Channel 184<br> HD</a>
+<a href="/watch.php?id=633" target="_blank" rel="noopener">Channel 633<br> HD</a>
+<a href="/watch.php?id=451" target="_blank" rel="noopener">Channel 451<br> HD</a>
+<a href="/watch.php?id=461" target="_blank" rel="noopener">Channel 461<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=740" target="_blank" rel="noopener">Channel 740<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=455" target="_blank" rel="noopener">Channel 455<br> HD</a>
+<a href="/watch.php?id=407" target="_blank" rel="noopener">Channel 407<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=199" target="_blank" rel="noopener">Channel 199<br> HD</a>
+<a href="/watch.php?id=605" target="_blank" rel="noopener">Channel 605<br> HD</a>
+<a href="/watch.php?id=461" target="_blank" rel="noopener">Channel 461<br> HD</a>
+<a href="/watch.php?id=501" target="_blank" rel="noopener">Channel 501<br> HD</a>
+<a href="/watch.php?id=400" target="_blank" rel="noopener">Channel 400<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=899" target="_blank" rel="noopener">Channel 899<br> HD</a>
+<a href="/watch.php?id=795" target="_blank" rel="noopener">Channel 795<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=236" target="_blank" rel="noopener">Channel 236<br> HD</a>
+<a href="/watch.php?id=457" target="_blank" rel="noopener">Channel 457<br> HD</a>
+<a href="/watch.php?id=871" target="_blank" rel="noopener">Channel 871<br> HD</a>
+<a href="/watch.php?id=327" target="_blank" rel="noopener">Channel 327<br> HD</a>
+<a href="/watch.php?id=453" target="_blank" rel="noopener">Channel 453<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=766" target="_blank" rel="noopener">Channel 766<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=520" target="_blank" rel="noopener">Channel 520<br> HD</a>
+<a href="/watch.php?id=99" target="_blank" rel="noopener">Channel 99<br> HD</a>
+<a href="/watch.php?id=169" target="_blank" rel="noopener">Channel 169<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=153" target="_blank" rel="noopener">Channel 153<br> HD</a>
+<a href="/watch.php?id=328" target="_blank" rel="noopener">Channel 328<br> HD</a>
+<a href="/watch.php?id=150" target="_blank" rel="noopener">Channel 150<br> HD</a>
+<a href="/watch.php?id=359" target="_blank" rel="noopener">Channel 359<br> HD</a>
+<a href="/watch.php?id=141" target="_blank" rel="noopener">Channel 141<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=106" target="_blank" rel="noopener">Channel 106<br> HD</a>
+<a href="/watch.php?id=716" target="_blank" rel="noopener">Channel 716<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=384" target="_blank" rel="noopener">Channel 384<br> HD</a>
+<a href="/watch.php?id=574" target="_blank" rel="noopener">Channel 574<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=499" target="_blank" rel="noopener">Channel 499<br> HD</a>
+<a href="/watch.php?id=734" target="_blank" rel="noopener">Channel 734<br> HD</a>
+<a href="/watch.php?id=457" target="_blank" rel="noopener">Channel 457<br> HD</a>
+<a href="/watch.php?id=309" target="_blank" rel="noopener">Channel 309<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=870" target="_blank" rel="noopener">Channel 870<br> HD</a>
+<a href="/watch.php?id=772" target="_blank" rel="noopener">Channel 772<br> HD</a>
+<a href="/watch.php?id=297" target="_blank" rel="noopener">Channel 297<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=158" target="_blank" rel="noopener">Channel 158<br> HD</a>
+<a href="/watch.php?id=470" target="_blank" rel="noopener">Channel 470<br> HD</a>
+<a href="/watch.php?id=109" target="_blank" rel="noopener">Channel 109<br> HD</a>
+<a href="/watch.php?id=552" target="_blank" rel="noopener">Channel 552<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:30</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=694" target="_blank" rel="noopener">Channel 694<br> HD</a>
+<a href="/watch.php?id=573" target="_blank" rel="noopener">Channel 573<br> HD</a>
+<a href="/watch.php?id=651" target="_blank" rel="noopener">Channel 651<br> HD</a>
+<a href="/watch.php?id=350" target="_blank" rel="noopener">Channel 350<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=497" target="_blank" rel="noopener">Channel 497<br> HD</a>
+<a href="/watch.php?id=708" target="_blank" rel="noopener">Channel 708<br> HD</a>
+<a href="/watch.php?id=404" target="_blank" rel="noopener">Channel 404<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Cricket <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=252" target="_blank" rel="noopener">Channel 252<br> HD</a>
+<a href="/watch.php?id=53" target="_blank" rel="noopener">Channel 53<br> HD</a>
+<a href="/watch.php?id=800" target="_blank" rel="noopener">Channel 800<br> HD</a>
+<a href="/watch.php?id=329" target="_blank" rel="noopener">Channel 329<br> HD</a>
+<a href="/watch.php?id=635" target="_blank" rel="noopener">Channel 635<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=369" target="_blank" rel="noopener">Channel 369<br> HD</a>
+<a href="/watch.php?id=371" target="_blank" rel="noopener">Channel 371<br> HD</a>
+<a href="/watch.php?id=615" target="_blank" rel="noopener">Channel 615<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=407" target="_blank" rel="noopener">Channel 407<br> HD</a>
+<a href="/watch.php?id=716" target="_blank" rel="noopener">Channel 716<br> HD</a>
+<a href="/watch.php?id=394" target="_blank" rel="noopener">Channel 394<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=803" target="_blank" rel="noopener">Channel 803<br> HD</a>
+<a href="/watch.php?id=799" target="_blank" rel="noopener">Channel 799<br> HD</a>
+<a href="/watch.php?id=631" target="_blank" rel="noopener">Channel 631<br> HD</a>
+<a href="/watch.php?id=860" target="_blank" rel="noopener">Channel 860<br> HD</a>
+<a href="/watch.php?id=228" target="_blank" rel="noopener">Channel 228<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=209" target="_blank" rel="noopener">Channel 209<br> HD</a>
+<a href="/watch.php?id=728" target="_blank" rel="noopener">Channel 728<br> HD</a>
+<a href="/watch.php?id=893" target="_blank" rel="noopener">Channel 893<br> HD</a>
+<a href="/watch.php?id=301" target="_blank" rel="noopener">Channel 301<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:30</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=828" target="_blank" rel="noopener">Channel 828<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=148" target="_blank" rel="noopener">Channel 148<br> HD</a>
+<a href="/watch.php?id=385" target="_blank" rel="noopener">Channel 385<br> HD</a>
+<a href="/watch.php?id=448" target="_blank" rel="noopener">Channel 448<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=199" target="_blank" rel="noopener">Channel 199<br> HD</a>
+<a href="/watch.php?id=163" target="_blank" rel="noopener">Channel 163<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=453" target="_blank" rel="noopener">Channel 453<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=813" target="_blank" rel="noopener">Channel 813<br> HD</a>
+<a href="/watch.php?id=751" target="_blank" rel="noopener">Channel 751<br> HD</a>
+<a href="/watch.php?id=720" target="_blank" rel="noopener">Channel 720<br> HD</a>
+<a href="/watch.php?id=698" target="_blank" rel="noopener">Channel 698<br> HD</a>
+<a href="/watch.php?id=325" target="_blank" rel="noopener">Channel 325<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=241" target="_blank" rel="noopener">Channel 241<br> HD</a>
+<a href="/watch.php?id=710" target="_blank" rel="noopener">Channel 710<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=137" target="_blank" rel="noopener">Channel 137<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=726" target="_blank" rel="noopener">Channel 726<br> HD</a>
+<a href="/watch.php?id=142" target="_blank" rel="noopener">Channel 142<br> HD</a>
+<a href="/watch.php?id=287" target="_blank" rel="noopener">Channel 287<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=542" target="_blank" rel="noopener">Channel 542<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=706" target="_blank" rel="noopener">Channel 706<br> HD</a>
+<a href="/watch.php?id=817" target="_blank" rel="noopener">Channel 817<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=274" target="_blank" rel="noopener">Channel 274<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=340" target="_blank" rel="noopener">Channel 340<br> HD</a>
+<a href="/watch.php?id=108" target="_blank" rel="noopener">Channel 108<br> HD</a>
+<a href="/watch.php?id=457" target="_blank" rel="noopener">Channel 457<br> HD</a>
+<a href="/watch.php?id=736" target="_blank" rel="noopener">Channel 736<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=381" target="_blank" rel="noopener">Channel 381<br> HD</a>
+<a href="/watch.php?id=664" target="_blank" rel="noopener">Channel 664<br> HD</a>
+<a href="/watch.php?id=358" target="_blank" rel="noopener">Channel 358<br> HD</a>
+<a href="/watch.php?id=769" target="_blank" rel="noopener">Channel 769<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=211" target="_blank" rel="noopener">Channel 211<br> HD</a>
+<a href="/watch.php?id=201" target="_blank" rel="noopener">Channel 201<br> HD</a>
+<a href="/watch.php?id=67" target="_blank" rel="noopener">Channel 67<br> HD</a>
+<a href="/watch.php?id=149" target="_blank" rel="noopener">Channel 149<br> HD</a>
+<a href="/watch.php?id=244" target="_blank" rel="noopener">Channel 244<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=804" target="_blank" rel="noopener">Channel 804<br> HD</a>
+<a href="/watch.php?id=632" target="_blank" rel="noopener">Channel 632<br> HD</a>
+<a href="/watch.php?id=452" target="_blank" rel="noopener">Channel 452<br> HD</a>
+<a href="/watch.php?id=582" target="_blank" rel="noopener">Channel 582<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=441" target="_blank" rel="noopener">Channel 441<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=425" target="_blank" rel="noopener">Channel 425<br> HD</a>
+<a href="/watch.php?id=798" target="_blank" rel="noopener">Channel 798<br> HD</a>
+<a href="/watch.php?id=351" target="_blank" rel="noopener">Channel 351<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:15</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=373" target="_blank" rel="noopener">Channel 373<br> HD</a>
+<a href="/watch.php?id=599" target="_blank" rel="noopener">Channel 599<br> HD</a>
+<a href="/watch.php?id=62" target="_blank" rel="noopener">Channel 62<br> HD</a>
+<a href="/watch.php?id=358" target="_blank" rel="noopener">Channel 358<br> HD</a>
+<a href="/watch.php?id=121" target="_blank" rel="noopener">Channel 121<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=153" target="_blank" rel="noopener">Channel 153<br> HD</a>
+<a href="/watch.php?id=825" target="_blank" rel="noopener">Channel 825<br> HD</a>
+<a href="/watch.php?id=20" target="_blank" rel="noopener">Channel 20<br> HD</a>
+<a href="/watch.php?id=375" target="_blank" rel="noopener">Channel 375<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=654" target="_blank" rel="noopener">Channel 654<br> HD</a>
+<a href="/watch.php?id=28" target="_blank" rel="noopener">Channel 28<br> HD</a>
+<a href="/watch.php?id=495" target="_blank" rel="noopener">Channel 495<br> HD</a>
+<a href="/watch.php?id=69" target="_blank" rel="noopener">Channel 69<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=552" target="_blank" rel="noopener">Channel 552<br> HD</a>
+<a href="/watch.php?id=869" target="_blank" rel="noopener">Channel 869<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=536" target="_blank" rel="noopener">Channel 536<br> HD</a>
+<a href="/watch.php?id=389" target="_blank" rel="noopener">Channel 389<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=120" target="_blank" rel="noopener">Channel 120<br> HD</a>
+<a href="/watch.php?id=69" target="_blank" rel="noopener">Channel 69<br> HD</a>
+<a href="/watch.php?id=216" target="_blank" rel="noopener">Channel 216<br> HD</a>
+<a href="/watch.php?id=607" target="_blank" rel="noopener">Channel 607<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=201" target="_blank" rel="noopener">Channel 201<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=525" target="_blank" rel="noopener">Channel 525<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Motorsport <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=64" target="_blank" rel="noopener">Channel 64<br> HD</a>
+<a href="/watch.php?id=588" target="_blank" rel="noopener">Channel 588<br> HD</a>
+<a href="/watch.php?id=440" target="_blank" rel="noopener">Channel 440<br> HD</a>
+<a href="/watch.php?id=574" target="_blank" rel="noopener">Channel 574<br> HD</a>
+<a href="/watch.php?id=306" target="_blank" rel="noopener">Channel 306<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=636" target="_blank" rel="noopener">Channel 636<br> HD</a>
+<a href="/watch.php?id=490" target="_blank" rel="noopener">Channel 490<br> HD</a>
+<a href="/watch.php?id=449" target="_blank" rel="noopener">Channel 449<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=547" target="_blank" rel="noopener">Channel 547<br> HD</a>
+<a href="/watch.php?id=57" target="_blank" rel="noopener">Channel 57<br> HD</a>
+<a href="/watch.php?id=276" target="_blank" rel="noopener">Channel 276<br> HD</a>
+<a href="/watch.php?id=527" target="_blank" rel="noopener">Channel 527<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=303" target="_blank" rel="noopener">Channel 303<br> HD</a>
+<a href="/watch.php?id=600" target="_blank" rel="noopener">Channel 600<br> HD</a>
+<a href="/watch.php?id=605" target="_blank" rel="noopener">Channel 605<br> HD</a>
+<a href="/watch.php?id=187" target="_blank" rel="noopener">Channel 187<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=702" target="_blank" rel="noopener">Channel 702<br> HD</a>
+<a href="/watch.php?id=574" target="_blank" rel="noopener">Channel 574<br> HD</a>
+<a href="/watch.php?id=612" target="_blank" rel="noopener">Channel 612<br> HD</a>
+<a href="/watch.php?id=408" target="_blank" rel="noopener">Channel 408<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=18" target="_blank" rel="noopener">Channel 18<br> HD</a>
+<a href="/watch.php?id=65" target="_blank" rel="noopener">Channel 65<br> HD</a>
+<a href="/watch.php?id=152" target="_blank" rel="noopener">Channel 152<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=866" target="_blank" rel="noopener">Channel 866<br> HD</a>
+<a href="/watch.php?id=859" target="_blank" rel="noopener">Channel 859<br> HD</a>
+<a href="/watch.php?id=317" target="_blank" rel="noopener">Channel 317<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=872" target="_blank" rel="noopener">Channel 872<br> HD</a>
+<a href="/watch.php?id=39" target="_blank" rel="noopener">Channel 39<br> HD</a>
+<a href="/watch.php?id=457" target="_blank" rel="noopener">Channel 457<br> HD</a>
+<a href="/watch.php?id=481" target="_blank" rel="noopener">Channel 481<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:15</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=551" target="_blank" rel="noopener">Channel 551<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=291" target="_blank" rel="noopener">Channel 291<br> HD</a>
+<a href="/watch.php?id=13" target="_blank" rel="noopener">Channel 13<br> HD</a>
+<a href="/watch.php?id=663" target="_blank" rel="noopener">Channel 663<br> HD</a>
+<a href="/watch.php?id=273" target="_blank" rel="noopener">Channel 273<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=702" target="_blank" rel="noopener">Channel 702<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=626" target="_blank" rel="noopener">Channel 626<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=174" target="_blank" rel="noopener">Channel 174<br> HD</a>
+<a href="/watch.php?id=57" target="_blank" rel="noopener">Channel 57<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=543" target="_blank" rel="noopener">Channel 543<br> HD</a>
+<a href="/watch.php?id=313" target="_blank" rel="noopener">Channel 313<br> HD</a>
+<a href="/watch.php?id=772" target="_blank" rel="noopener">Channel 772<br> HD</a>
+<a href="/watch.php?id=804" target="_blank" rel="noopener">Channel 804<br> HD</a>
+<a href="/watch.php?id=206" target="_blank" rel="noopener">Channel 206<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=92" target="_blank" rel="noopener">Channel 92<br> HD</a>
+<a href="/watch.php?id=516" target="_blank" rel="noopener">Channel 516<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=630" target="_blank" rel="noopener">Channel 630<br> HD</a>
+<a href="/watch.php?id=138" target="_blank" rel="noopener">Channel 138<br> HD</a>
+<a href="/watch.php?id=293" target="_blank" rel="noopener">Channel 293<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=23" target="_blank" rel="noopener">Channel 23<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=447" target="_blank" rel="noopener">Channel 447<br> HD</a>
+<a href="/watch.php?id=861" target="_blank" rel="noopener">Channel 861<br> HD</a>
+<a href="/watch.php?id=829" target="_blank" rel="noopener">Channel 829<br> HD</a>
+<a href="/watch.php?id=70" target="_blank" rel="noopener">Channel 70<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=870" target="_blank" rel="noopener">Channel 870<br> HD</a>
+<a href="/watch.php?id=425" target="_blank" rel="noopener">Channel 425<br> HD</a>
+<a href="/watch.php?id=364" target="_blank" rel="noopener">Channel 364<br> HD</a>
+<a href="/watch.php?id=364" target="_blank" rel="noopener">Channel 364<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=375" target="_blank" rel="noopener">Channel 375<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=225" target="_blank" rel="noopener">Channel 225<br> HD</a>
+<a href="/watch.php?id=264" target="_blank" rel="noopener">Channel 264<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=490" target="_blank" rel="noopener">Channel 490<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=214" target="_blank" rel="noopener">Channel 214<br> HD</a>
+<a href="/watch.php?id=818" target="_blank" rel="noopener">Channel 818<br> HD</a>
+<a href="/watch.php?id=136" target="_blank" rel="noopener">Channel 136<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=549" target="_blank" rel="noopener">Channel 549<br> HD</a>
+<a href="/watch.php?id=886" target="_blank" rel="noopener">Channel 886<br> HD</a>
+<a href="/watch.php?id=25" target="_blank" rel="noopener">Channel 25<br> HD</a>
+<a href="/watch.php?id=135" target="_blank" rel="noopener">Channel 135<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=719" target="_blank" rel="noopener">Channel 719<br> HD</a>
+<a href="/watch.php?id=640" target="_blank" rel="noopener">Channel 640<br> HD</a>
+<a href="/watch.php?id=447" target="_blank" rel="noopener">Channel 447<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=249" target="_blank" rel="noopener">Channel 249<br> HD</a>
+<a href="/watch.php?id=504" target="_blank" rel="noopener">Channel 504<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:30</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=650" target="_blank" rel="noopener">Channel 650<br> HD</a>
+<a href="/watch.php?id=640" target="_blank" rel="noopener">Channel 640<br> HD</a>
+<a href="/watch.php?id=444" target="_blank" rel="noopener">Channel 444<br> HD</a>
+<a href="/watch.php?id=410" target="_blank" rel="noopener">Channel 410<br> HD</a>
+<a href="/watch.php?id=567" target="_blank" rel="noopener">Channel 567<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=436" target="_blank" rel="noopener">Channel 436<br> HD</a>
+<a href="/watch.php?id=131" target="_blank" rel="noopener">Channel 131<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=207" target="_blank" rel="noopener">Channel 207<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=521" target="_blank" rel="noopener">Channel 521<br> HD</a>
+<a href="/watch.php?id=850" target="_blank" rel="noopener">Channel 850<br> HD</a>
+<a href="/watch.php?id=786" target="_blank" rel="noopener">Channel 786<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Darts <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=576" target="_blank" rel="noopener">Channel 576<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=769" target="_blank" rel="noopener">Channel 769<br> HD</a>
+<a href="/watch.php?id=97" target="_blank" rel="noopener">Channel 97<br> HD</a>
+<a href="/watch.php?id=291" target="_blank" rel="noopener">Channel 291<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=29" target="_blank" rel="noopener">Channel 29<br> HD</a>
+<a href="/watch.php?id=491" target="_blank" rel="noopener">Channel 491<br> HD</a>
+<a href="/watch.php?id=597" target="_blank" rel="noopener">Channel 597<br> HD</a>
+<a href="/watch.php?id=737" target="_blank" rel="noopener">Channel 737<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=821" target="_blank" rel="noopener">Channel 821<br> HD</a>
+<a href="/watch.php?id=862" target="_blank" rel="noopener">Channel 862<br> HD</a>
+<a href="/watch.php?id=791" target="_blank" rel="noopener">Channel 791<br> HD</a>
+<a href="/watch.php?id=239" target="_blank" rel="noopener">Channel 239<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=87" target="_blank" rel="noopener">Channel 87<br> HD</a>
+<a href="/watch.php?id=256" target="_blank" rel="noopener">Channel 256<br> HD</a>
+<a href="/watch.php?id=689" target="_blank" rel="noopener">Channel 689<br> HD</a>
+<a href="/watch.php?id=41" target="_blank" rel="noopener">Channel 41<br> HD</a>
+<a href="/watch.php?id=466" target="_blank" rel="noopener">Channel 466<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=788" target="_blank" rel="noopener">Channel 788<br> HD</a>
+<a href="/watch.php?id=44" target="_blank" rel="noopener">Channel 44<br> HD</a>
+<a href="/watch.php?id=70" target="_blank" rel="noopener">Channel 70<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:30</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=316" target="_blank" rel="noopener">Channel 316<br> HD</a>
+<a href="/watch.php?id=93" target="_blank" rel="noopener">Channel 93<br> HD</a>
+<a href="/watch.php?id=551" target="_blank" rel="noopener">Channel 551<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=643" target="_blank" rel="noopener">Channel 643<br> HD</a>
+<a href="/watch.php?id=364" target="_blank" rel="noopener">Channel 364<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=650" target="_blank" rel="noopener">Channel 650<br> HD</a>
+<a href="/watch.php?id=791" target="_blank" rel="noopener">Channel 791<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=602" target="_blank" rel="noopener">Channel 602<br> HD</a>
+<a href="/watch.php?id=5" target="_blank" rel="noopener">Channel 5<br> HD</a>
+<a href="/watch.php?id=673" target="_blank" rel="noopener">Channel 673<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=248" target="_blank" rel="noopener">Channel 248<br> HD</a>
+<a href="/watch.php?id=882" target="_blank" rel="noopener">Channel 882<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=142" target="_blank" rel="noopener">Channel 142<br> HD</a>
+<a href="/watch.php?id=169" target="_blank" rel="noopener">Channel 169<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=40" target="_blank" rel="noopener">Channel 40<br> HD</a>
+<a href="/watch.php?id=457" target="_blank" rel="noopener">Channel 457<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=739" target="_blank" rel="noopener">Channel 739<br> HD</a>
+<a href="/watch.php?id=653" target="_blank" rel="noopener">Channel 653<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=86" target="_blank" rel="noopener">Channel 86<br> HD</a>
+<a href="/watch.php?id=71" target="_blank" rel="noopener">Channel 71<br> HD</a>
+<a href="/watch.php?id=73" target="_blank" rel="noopener">Channel 73<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=470" target="_blank" rel="noopener">Channel 470<br> HD</a>
+<a href="/watch.php?id=11" target="_blank" rel="noopener">Channel 11<br> HD</a>
+<a href="/watch.php?id=616" target="_blank" rel="noopener">Channel 616<br> HD</a>
+<a href="/watch.php?id=172" target="_blank" rel="noopener">Channel 172<br> HD</a>
+<a href="/watch.php?id=470" target="_blank" rel="noopener">Channel 470<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=250" target="_blank" rel="noopener">Channel 250<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=271" target="_blank" rel="noopener">Channel 271<br> HD</a>
+<a href="/watch.php?id=358" target="_blank" rel="noopener">Channel 358<br> HD</a>
+<a href="/watch.php?id=273" target="_blank" rel="noopener">Channel 273<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=44" target="_blank" rel="noopener">Channel 44<br> HD</a>
+<a href="/watch.php?id=212" target="_blank" rel="noopener">Channel 212<br> HD</a>
+<a href="/watch.php?id=79" target="_blank" rel="noopener">Channel 79<br> HD</a>
+<a href="/watch.php?id=324" target="_blank" rel="noopener">Channel 324<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=690" target="_blank" rel="noopener">Channel 690<br> HD</a>
+<a href="/watch.php?id=891" target="_blank" rel="noopener">Channel 891<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=639" target="_blank" rel="noopener">Channel 639<br> HD</a>
+<a href="/watch.php?id=611" target="_blank" rel="noopener">Channel 611<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=233" target="_blank" rel="noopener">Channel 233<br> HD</a>
+<a href="/watch.php?id=851" target="_blank" rel="noopener">Channel 851<br> HD</a>
+<a href="/watch.php?id=487" target="_blank" rel="noopener">Channel 487<br> HD</a>
+<a href="/watch.php?id=178" target="_blank" rel="noopener">Channel 178<br> HD</a>
+<a href="/watch.php?id=858" target="_blank" rel="noopener">Channel 858<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=893" target="_blank" rel="noopener">Channel 893<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=553" target="_blank" rel="noopener">Channel 553<br> HD</a>
+<a href="/watch.php?id=268" target="_blank" rel="noopener">Channel 268<br> HD</a>
+<a href="/watch.php?id=200" target="_blank" rel="noopener">Channel 200<br> HD</a>
+<a href="/watch.php?id=408" target="_blank" rel="noopener">Channel 408<br> HD</a>
+<a href="/watch.php?id=9" target="_blank" rel="noopener">Channel 9<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=543" target="_blank" rel="noopener">Channel 543<br> HD</a>
+<a href="/watch.php?id=542" target="_blank" rel="noopener">Channel 542<br> HD</a>
+<a href="/watch.php?id=547" target="_blank" rel="noopener">Channel 547<br> HD</a>
+<a href="/watch.php?id=477" target="_blank" rel="noopener">Channel 477<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=404" target="_blank" rel="noopener">Channel 404<br> HD</a>
+<a href="/watch.php?id=137" target="_blank" rel="noopener">Channel 137<br> HD</a>
+<a href="/watch.php?id=633" target="_blank" rel="noopener">Channel 633<br> HD</a>
+<a href="/watch.php?id=214" target="_blank" rel="noopener">Channel 214<br> HD</a>
+<a href="/watch.php?id=539" target="_blank" rel="noopener">Channel 539<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=225" target="_blank" rel="noopener">Channel 225<br> HD</a>
+<a href="/watch.php?id=327" target="_blank" rel="noopener">Channel 327<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=804" target="_blank" rel="noopener">Channel 804<br> HD</a>
+<a href="/watch.php?id=67" target="_blank" rel="noopener">Channel 67<br> HD</a>
+<a href="/watch.php?id=818" target="_blank" rel="noopener">Channel 818<br> HD</a>
+<a href="/watch.php?id=706" target="_blank" rel="noopener">Channel 706<br> HD</a>
+<a href="/watch.php?id=36" target="_blank" rel="noopener">Channel 36<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=279" target="_blank" rel="noopener">Channel 279<br> HD</a>
+<a href="/watch.php?id=607" target="_blank" rel="noopener">Channel 607<br> HD</a>
+<a href="/watch.php?id=46" target="_blank" rel="noopener">Channel 46<br> HD</a>
+<a href="/watch.php?id=223" target="_blank" rel="noopener">Channel 223<br> HD</a>
+<a href="/watch.php?id=199" target="_blank" rel="noopener">Channel 199<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=24" target="_blank" rel="noopener">Channel 24<br> HD</a>
+<a href="/watch.php?id=584" target="_blank" rel="noopener">Channel 584<br> HD</a>
+<a href="/watch.php?id=274" target="_blank" rel="noopener">Channel 274<br> HD</a>
+<a href="/watch.php?id=196" target="_blank" rel="noopener">Channel 196<br> HD</a>
+<a href="/watch.php?id=549" target="_blank" rel="noopener">Channel 549<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Rugby Union <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=169" target="_blank" rel="noopener">Channel 169<br> HD</a>
+<a href="/watch.php?id=54" target="_blank" rel="noopener">Channel 54<br> HD</a>
+<a href="/watch.php?id=674" target="_blank" rel="noopener">Channel 674<br> HD</a>
+<a href="/watch.php?id=862" target="_blank" rel="noopener">Channel 862<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=859" target="_blank" rel="noopener">Channel 859<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=180" target="_blank" rel="noopener">Channel 180<br> HD</a>
+<a href="/watch.php?id=839" target="_blank" rel="noopener">Channel 839<br> HD</a>
+<a href="/watch.php?id=224" target="_blank" rel="noopener">Channel 224<br> HD</a>
+<a href="/watch.php?id=580" target="_blank" rel="noopener">Channel 580<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=894" target="_blank" rel="noopener">Channel 894<br> HD</a>
+<a href="/watch.php?id=230" target="_blank" rel="noopener">Channel 230<br> HD</a>
+<a href="/watch.php?id=65" target="_blank" rel="noopener">Channel 65<br> HD</a>
+<a href="/watch.php?id=131" target="_blank" rel="noopener">Channel 131<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=677" target="_blank" rel="noopener">Channel 677<br> HD</a>
+<a href="/watch.php?id=377" target="_blank" rel="noopener">Channel 377<br> HD</a>
+<a href="/watch.php?id=444" target="_blank" rel="noopener">Channel 444<br> HD</a>
+<a href="/watch.php?id=837" target="_blank" rel="noopener">Channel 837<br> HD</a>
+<a href="/watch.php?id=879" target="_blank" rel="noopener">Channel 879<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=365" target="_blank" rel="noopener">Channel 365<br> HD</a>
+<a href="/watch.php?id=396" target="_blank" rel="noopener">Channel 396<br> HD</a>
+<a href="/watch.php?id=822" target="_blank" rel="noopener">Channel 822<br> HD</a>
+<a href="/watch.php?id=580" target="_blank" rel="noopener">Channel 580<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=704" target="_blank" rel="noopener">Channel 704<br> HD</a>
+<a href="/watch.php?id=889" target="_blank" rel="noopener">Channel 889<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=506" target="_blank" rel="noopener">Channel 506<br> HD</a>
+<a href="/watch.php?id=63" target="_blank" rel="noopener">Channel 63<br> HD</a>
+<a href="/watch.php?id=781" target="_blank" rel="noopener">Channel 781<br> HD</a>
+<a href="/watch.php?id=472" target="_blank" rel="noopener">Channel 472<br> HD</a>
+<a href="/watch.php?id=113" target="_blank" rel="noopener">Channel 113<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=694" target="_blank" rel="noopener">Channel 694<br> HD</a>
+<a href="/watch.php?id=38" target="_blank" rel="noopener">Channel 38<br> HD</a>
+<a href="/watch.php?id=284" target="_blank" rel="noopener">Channel 284<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:15</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=704" target="_blank" rel="noopener">Channel 704<br> HD</a>
+<a href="/watch.php?id=320" target="_blank" rel="noopener">Channel 320<br> HD</a>
+<a href="/watch.php?id=734" target="_blank" rel="noopener">Channel 734<br> HD</a>
+<a href="/watch.php?id=454" target="_blank" rel="noopener">Channel 454<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=514" target="_blank" rel="noopener">Channel 514<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=580" target="_blank" rel="noopener">Channel 580<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=301" target="_blank" rel="noopener">Channel 301<br> HD</a>
+<a href="/watch.php?id=758" target="_blank" rel="noopener">Channel 758<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=653" target="_blank" rel="noopener">Channel 653<br> HD</a>
+<a href="/watch.php?id=834" target="_blank" rel="noopener">Channel 834<br> HD</a>
+<a href="/watch.php?id=796" target="_blank" rel="noopener">Channel 796<br> HD</a>
+<a href="/watch.php?id=464" target="_blank" rel="noopener">Channel 464<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=501" target="_blank" rel="noopener">Channel 501<br> HD</a>
+<a href="/watch.php?id=577" target="_blank" rel="noopener">Channel 577<br> HD</a>
+<a href="/watch.php?id=86" target="_blank" rel="noopener">Channel 86<br> HD</a>
+<a href="/watch.php?id=687" target="_blank" rel="noopener">Channel 687<br> HD</a>
+<a href="/watch.php?id=35" target="_blank" rel="noopener">Channel 35<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=319" target="_blank" rel="noopener">Channel 319<br> HD</a>
+<a href="/watch.php?id=181" target="_blank" rel="noopener">Channel 181<br> HD</a>
+<a href="/watch.php?id=551" target="_blank" rel="noopener">Channel 551<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=466" target="_blank" rel="noopener">Channel 466<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=24" target="_blank" rel="noopener">Channel 24<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=184" target="_blank" rel="noopener">Channel 184<br> HD</a>
+<a href="/watch.php?id=238" target="_blank" rel="noopener">Channel 238<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=5" target="_blank" rel="noopener">Channel 5<br> HD</a>
+<a href="/watch.php?id=466" target="_blank" rel="noopener">Channel 466<br> HD</a>
+<a href="/watch.php?id=552" target="_blank" rel="noopener">Channel 552<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=690" target="_blank" rel="noopener">Channel 690<br> HD</a>
+<a href="/watch.php?id=532" target="_blank" rel="noopener">Channel 532<br> HD</a>
+<a href="/watch.php?id=449" target="_blank" rel="noopener">Channel 449<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=409" target="_blank" rel="noopener">Channel 409<br> HD</a>
+<a href="/watch.php?id=524" target="_blank" rel="noopener">Channel 524<br> HD</a>
+<a href="/watch.php?id=437" target="_blank" rel="noopener">Channel 437<br> HD</a>
+<a href="/watch.php?id=279" target="_blank" rel="noopener">Channel 279<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=484" target="_blank" rel="noopener">Channel 484<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=522" target="_blank" rel="noopener">Channel 522<br> HD</a>
+<a href="/watch.php?id=797" target="_blank" rel="noopener">Channel 797<br> HD</a>
+<a href="/watch.php?id=520" target="_blank" rel="noopener">Channel 520<br> HD</a>
+<a href="/watch.php?id=747" target="_blank" rel="noopener">Channel 747<br> HD</a>
+<a href="/watch.php?id=516" target="_blank" rel="noopener">Channel 516<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=356" target="_blank" rel="noopener">Channel 356<br> HD</a>
+<a href="/watch.php?id=725" target="_blank" rel="noopener">Channel 725<br> HD</a>
+<a href="/watch.php?id=468" target="_blank" rel="noopener">Channel 468<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=368" target="_blank" rel="noopener">Channel 368<br> HD</a>
+<a href="/watch.php?id=556" target="_blank" rel="noopener">Channel 556<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=727" target="_blank" rel="noopener">Channel 727<br> HD</a>
+<a href="/watch.php?id=898" target="_blank" rel="noopener">Channel 898<br> HD</a>
+<a href="/watch.php?id=400" target="_blank" rel="noopener">Channel 400<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=17" target="_blank" rel="noopener">Channel 17<br> HD</a>
+<a href="/watch.php?id=164" target="_blank" rel="noopener">Channel 164<br> HD</a>
+<a href="/watch.php?id=841" target="_blank" rel="noopener">Channel 841<br> HD</a>
+<a href="/watch.php?id=496" target="_blank" rel="noopener">Channel 496<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=59" target="_blank" rel="noopener">Channel 59<br> HD</a>
+<a href="/watch.php?id=177" target="_blank" rel="noopener">Channel 177<br> HD</a>
+<a href="/watch.php?id=70" target="_blank" rel="noopener">Channel 70<br> HD</a>
+<a href="/watch.php?id=98" target="_blank" rel="noopener">Channel 98<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=60" target="_blank" rel="noopener">Channel 60<br> HD</a>
+</div></div>
+</div></div>
+</div>
+<div class="schedule__day">
+<div class="schedule__dayTitle">Saturday 20th Oct 2025 - Schedule Time UK GMT</div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Soccer <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=610" target="_blank" rel="noopener">Channel 610<br> HD</a>
+<a href="/watch.php?id=449" target="_blank" rel="noopener">Channel 449<br> HD</a>
+<a href="/watch.php?id=114" target="_blank" rel="noopener">Channel 114<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=85" target="_blank" rel="noopener">Channel 85<br> HD</a>
+<a href="/watch.php?id=235" target="_blank" rel="noopener">Channel 235<br> HD</a>
+<a href="/watch.php?id=838" target="_blank" rel="noopener">Channel 838<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=727" target="_blank" rel="noopener">Channel 727<br> HD</a>
+<a href="/watch.php?id=746" target="_blank" rel="noopener">Channel 746<br> HD</a>
+<a href="/watch.php?id=764" target="_blank" rel="noopener">Channel 764<br> HD</a>
+<a href="/watch.php?id=447" target="_blank" rel="noopener">Channel 447<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=361" target="_blank" rel="noopener">Channel 361<br> HD</a>
+<a href="/watch.php?id=386" target="_blank" rel="noopener">Channel 386<br> HD</a>
+<a href="/watch.php?id=69" target="_blank" rel="noopener">Channel 69<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:15</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=545" target="_blank" rel="noopener">Channel 545<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=632" target="_blank" rel="noopener">Channel 632<br> HD</a>
+<a href="/watch.php?id=541" target="_blank" rel="noopener">Channel 541<br> HD</a>
+<a href="/watch.php?id=642" target="_blank" rel="noopener">Channel 642<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=870" target="_blank" rel="noopener">Channel 870<br> HD</a>
+<a href="/watch.php?id=768" target="_blank" rel="noopener">Channel 768<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=360" target="_blank" rel="noopener">Channel 360<br> HD</a>
+<a href="/watch.php?id=721" target="_blank" rel="noopener">Channel 721<br> HD</a>
+<a href="/watch.php?id=799" target="_blank" rel="noopener">Channel 799<br> HD</a>
+<a href="/watch.php?id=35" target="_blank" rel="noopener">Channel 35<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=219" target="_blank" rel="noopener">Channel 219<br> HD</a>
+<a href="/watch.php?id=406" target="_blank" rel="noopener">Channel 406<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=611" target="_blank" rel="noopener">Channel 611<br> HD</a>
+<a href="/watch.php?id=880" target="_blank" rel="noopener">Channel 880<br> HD</a>
+<a href="/watch.php?id=347" target="_blank" rel="noopener">Channel 347<br> HD</a>
+<a href="/watch.php?id=494" target="_blank" rel="noopener">Channel 494<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=869" target="_blank" rel="noopener">Channel 869<br> HD</a>
+<a href="/watch.php?id=570" target="_blank" rel="noopener">Channel 570<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=25" target="_blank" rel="noopener">Channel 25<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=731" target="_blank" rel="noopener">Channel 731<br> HD</a>
+<a href="/watch.php?id=555" target="_blank" rel="noopener">Channel 555<br> HD</a>
+<a href="/watch.php?id=524" target="_blank" rel="noopener">Channel 524<br> HD</a>
+<a href="/watch.php?id=278" target="_blank" rel="noopener">Channel 278<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=475" target="_blank" rel="noopener">Channel 475<br> HD</a>
+<a href="/watch.php?id=248" target="_blank" rel="noopener">Channel 248<br> HD</a>
+<a href="/watch.php?id=73" target="_blank" rel="noopener">Channel 73<br> HD</a>
+<a href="/watch.php?id=745" target="_blank" rel="noopener">Channel 745<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=653" target="_blank" rel="noopener">Channel 653<br> HD</a>
+<a href="/watch.php?id=58" target="_blank" rel="noopener">Channel 58<br> HD</a>
+<a href="/watch.php?id=298" target="_blank" rel="noopener">Channel 298<br> HD</a>
+<a href="/watch.php?id=354" target="_blank" rel="noopener">Channel 354<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=599" target="_blank" rel="noopener">Channel 599<br> HD</a>
+<a href="/watch.php?id=11" target="_blank" rel="noopener">Channel 11<br> HD</a>
+<a href="/watch.php?id=781" target="_blank" rel="noopener">Channel 781<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=833" target="_blank" rel="noopener">Channel 833<br> HD</a>
+<a href="/watch.php?id=700" target="_blank" rel="noopener">Channel 700<br> HD</a>
+<a href="/watch.php?id=458" target="_blank" rel="noopener">Channel 458<br> HD</a>
+<a href="/watch.php?id=875" target="_blank" rel="noopener">Channel 875<br> HD</a>
+<a href="/watch.php?id=703" target="_blank" rel="noopener">Channel 703<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=18" target="_blank" rel="noopener">Channel 18<br> HD</a>
+<a href="/watch.php?id=12" target="_blank" rel="noopener">Channel 12<br> HD</a>
+<a href="/watch.php?id=794" target="_blank" rel="noopener">Channel 794<br> HD</a>
+<a href="/watch.php?id=571" target="_blank" rel="noopener">Channel 571<br> HD</a>
+<a href="/watch.php?id=610" target="_blank" rel="noopener">Channel 610<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=753" target="_blank" rel="noopener">Channel 753<br> HD</a>
+<a href="/watch.php?id=42" target="_blank" rel="noopener">Channel 42<br> HD</a>
+<a href="/watch.php?id=147" target="_blank" rel="noopener">Channel 147<br> HD</a>
+<a href="/watch.php?id=827" target="_blank" rel="noopener">Channel 827<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=808" target="_blank" rel="noopener">Channel 808<br> HD</a>
+<a href="/watch.php?id=584" target="_blank" rel="noopener">Channel 584<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=798" target="_blank" rel="noopener">Channel 798<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=332" target="_blank" rel="noopener">Channel 332<br> HD</a>
+<a href="/watch.php?id=175" target="_blank" rel="noopener">Channel 175<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=658" target="_blank" rel="noopener">Channel 658<br> HD</a>
+<a href="/watch.php?id=81" target="_blank" rel="noopener">Channel 81<br> HD</a>
+<a href="/watch.php?id=620" target="_blank" rel="noopener">Channel 620<br> HD</a>
+<a href="/watch.php?id=603" target="_blank" rel="noopener">Channel 603<br> HD</a>
+<a href="/watch.php?id=631" target="_blank" rel="noopener">Channel 631<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=824" target="_blank" rel="noopener">Channel 824<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=281" target="_blank" rel="noopener">Channel 281<br> HD</a>
+<a href="/watch.php?id=128" target="_blank" rel="noopener">Channel 128<br> HD</a>
+<a href="/watch.php?id=262" target="_blank" rel="noopener">Channel 262<br> HD</a>
+<a href="/watch.php?id=10" target="_blank" rel="noopener">Channel 10<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=155" target="_blank" rel="noopener">Channel 155<br> HD</a>
+<a href="/watch.php?id=478" target="_blank" rel="noopener">Channel 478<br> HD</a>
+<a href="/watch.php?id=247" target="_blank" rel="noopener">Channel 247<br> HD</a>
+<a href="/watch.php?id=802" target="_blank" rel="noopener">Channel 802<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=835" target="_blank" rel="noopener">Channel 835<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=259" target="_blank" rel="noopener">Channel 259<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=863" target="_blank" rel="noopener">Channel 863<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=550" target="_blank" rel="noopener">Channel 550<br> HD</a>
+<a href="/watch.php?id=588" target="_blank" rel="noopener">Channel 588<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Tennis <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=811" target="_blank" rel="noopener">Channel 811<br> HD</a>
+<a href="/watch.php?id=817" target="_blank" rel="noopener">Channel 817<br> HD</a>
+<a href="/watch.php?id=579" target="_blank" rel="noopener">Channel 579<br> HD</a>
+<a href="/watch.php?id=685" target="_blank" rel="noopener">Channel 685<br> HD</a>
+<a href="/watch.php?id=176" target="_blank" rel="noopener">Channel 176<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=828" target="_blank" rel="noopener">Channel 828<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=893" target="_blank" rel="noopener">Channel 893<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=638" target="_blank" rel="noopener">Channel 638<br> HD</a>
+<a href="/watch.php?id=777" target="_blank" rel="noopener">Channel 777<br> HD</a>
+<a href="/watch.php?id=804" target="_blank" rel="noopener">Channel 804<br> HD</a>
+<a href="/watch.php?id=261" target="_blank" rel="noopener">Channel 261<br> HD</a>
+<a href="/watch.php?id=470" target="_blank" rel="noopener">Channel 470<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=657" target="_blank" rel="noopener">Channel 657<br> HD</a>
+<a href="/watch.php?id=682" target="_blank" rel="noopener">Channel 682<br> HD</a>
+<a href="/watch.php?id=798" target="_blank" rel="noopener">Channel 798<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=893" target="_blank" rel="noopener">Channel 893<br> HD</a>
+<a href="/watch.php?id=727" target="_blank" rel="noopener">Channel 727<br> HD</a>
+<a href="/watch.php?id=458" target="_blank" rel="noopener">Channel 458<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=117" target="_blank" rel="noopener">Channel 117<br> HD</a>
+<a href="/watch.php?id=383" target="_blank" rel="noopener">Channel 383<br> HD</a>
+<a href="/watch.php?id=259" target="_blank" rel="noopener">Channel 259<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=229" target="_blank" rel="noopener">Channel 229<br> HD</a>
+<a href="/watch.php?id=630" target="_blank" rel="noopener">Channel 630<br> HD</a>
+<a href="/watch.php?id=8" target="_blank" rel="noopener">Channel 8<br> HD</a>
+<a href="/watch.php?id=236" target="_blank" rel="noopener">Channel 236<br> HD</a>
+<a href="/watch.php?id=725" target="_blank" rel="noopener">Channel 725<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=686" target="_blank" rel="noopener">Channel 686<br> HD</a>
+<a href="/watch.php?id=352" target="_blank" rel="noopener">Channel 352<br> HD</a>
+<a href="/watch.php?id=438" target="_blank" rel="noopener">Channel 438<br> HD</a>
+<a href="/watch.php?id=639" target="_blank" rel="noopener">Channel 639<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=303" target="_blank" rel="noopener">Channel 303<br> HD</a>
+<a href="/watch.php?id=735" target="_blank" rel="noopener">Channel 735<br> HD</a>
+<a href="/watch.php?id=528" target="_blank" rel="noopener">Channel 528<br> HD</a>
+<a href="/watch.php?id=327" target="_blank" rel="noopener">Channel 327<br> HD</a>
+<a href="/watch.php?id=204" target="_blank" rel="noopener">Channel 204<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=356" target="_blank" rel="noopener">Channel 356<br> HD</a>
+<a href="/watch.php?id=263" target="_blank" rel="noopener">Channel 263<br> HD</a>
+<a href="/watch.php?id=893" target="_blank" rel="noopener">Channel 893<br> HD</a>
+<a href="/watch.php?id=2" target="_blank" rel="noopener">Channel 2<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=784" target="_blank" rel="noopener">Channel 784<br> HD</a>
+<a href="/watch.php?id=496" target="_blank" rel="noopener">Channel 496<br> HD</a>
+<a href="/watch.php?id=93" target="_blank" rel="noopener">Channel 93<br> HD</a>
+<a href="/watch.php?id=529" target="_blank" rel="noopener">Channel 529<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=415" target="_blank" rel="noopener">Channel 415<br> HD</a>
+<a href="/watch.php?id=146" target="_blank" rel="noopener">Channel 146<br> HD</a>
+<a href="/watch.php?id=118" target="_blank" rel="noopener">Channel 118<br> HD</a>
+<a href="/watch.php?id=683" target="_blank" rel="noopener">Channel 683<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=221" target="_blank" rel="noopener">Channel 221<br> HD</a>
+<a href="/watch.php?id=280" target="_blank" rel="noopener">Channel 280<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=765" target="_blank" rel="noopener">Channel 765<br> HD</a>
+<a href="/watch.php?id=258" target="_blank" rel="noopener">Channel 258<br> HD</a>
+<a href="/watch.php?id=581" target="_blank" rel="noopener">Channel 581<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=800" target="_blank" rel="noopener">Channel 800<br> HD</a>
+<a href="/watch.php?id=611" target="_blank" rel="noopener">Channel 611<br> HD</a>
+<a href="/watch.php?id=549" target="_blank" rel="noopener">Channel 549<br> HD</a>
+<a href="/watch.php?id=17" target="_blank" rel="noopener">Channel 17<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:15</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=659" target="_blank" rel="noopener">Channel 659<br> HD</a>
+<a href="/watch.php?id=236" target="_blank" rel="noopener">Channel 236<br> HD</a>
+<a href="/watch.php?id=75" target="_blank" rel="noopener">Channel 75<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=109" target="_blank" rel="noopener">Channel 109<br> HD</a>
+<a href="/watch.php?id=5" target="_blank" rel="noopener">Channel 5<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=352" target="_blank" rel="noopener">Channel 352<br> HD</a>
+<a href="/watch.php?id=603" target="_blank" rel="noopener">Channel 603<br> HD</a>
+<a href="/watch.php?id=809" target="_blank" rel="noopener">Channel 809<br> HD</a>
+<a href="/watch.php?id=708" target="_blank" rel="noopener">Channel 708<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=629" target="_blank" rel="noopener">Channel 629<br> HD</a>
+<a href="/watch.php?id=77" target="_blank" rel="noopener">Channel 77<br> HD</a>
+<a href="/watch.php?id=824" target="_blank" rel="noopener">Channel 824<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=792" target="_blank" rel="noopener">Channel 792<br> HD</a>
+<a href="/watch.php?id=290" target="_blank" rel="noopener">Channel 290<br> HD</a>
+<a href="/watch.php?id=735" target="_blank" rel="noopener">Channel 735<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=638" target="_blank" rel="noopener">Channel 638<br> HD</a>
+<a href="/watch.php?id=773" target="_blank" rel="noopener">Channel 773<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=434" target="_blank" rel="noopener">Channel 434<br> HD</a>
+<a href="/watch.php?id=409" target="_blank" rel="noopener">Channel 409<br> HD</a>
+<a href="/watch.php?id=637" target="_blank" rel="noopener">Channel 637<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:15</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=213" target="_blank" rel="noopener">Channel 213<br> HD</a>
+<a href="/watch.php?id=863" target="_blank" rel="noopener">Channel 863<br> HD</a>
+<a href="/watch.php?id=486" target="_blank" rel="noopener">Channel 486<br> HD</a>
+<a href="/watch.php?id=687" target="_blank" rel="noopener">Channel 687<br> HD</a>
+<a href="/watch.php?id=404" target="_blank" rel="noopener">Channel 404<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=221" target="_blank" rel="noopener">Channel 221<br> HD</a>
+<a href="/watch.php?id=672" target="_blank" rel="noopener">Channel 672<br> HD</a>
+<a href="/watch.php?id=317" target="_blank" rel="noopener">Channel 317<br> HD</a>
+<a href="/watch.php?id=571" target="_blank" rel="noopener">Channel 571<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=258" target="_blank" rel="noopener">Channel 258<br> HD</a>
+<a href="/watch.php?id=843" target="_blank" rel="noopener">Channel 843<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=534" target="_blank" rel="noopener">Channel 534<br> HD</a>
+<a href="/watch.php?id=329" target="_blank" rel="noopener">Channel 329<br> HD</a>
+<a href="/watch.php?id=216" target="_blank" rel="noopener">Channel 216<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=307" target="_blank" rel="noopener">Channel 307<br> HD</a>
+<a href="/watch.php?id=271" target="_blank" rel="noopener">Channel 271<br> HD</a>
+<a href="/watch.php?id=164" target="_blank" rel="noopener">Channel 164<br> HD</a>
+<a href="/watch.php?id=297" target="_blank" rel="noopener">Channel 297<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=397" target="_blank" rel="noopener">Channel 397<br> HD</a>
+<a href="/watch.php?id=690" target="_blank" rel="noopener">Channel 690<br> HD</a>
+<a href="/watch.php?id=453" target="_blank" rel="noopener">Channel 453<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=95" target="_blank" rel="noopener">Channel 95<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Basketball <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=426" target="_blank" rel="noopener">Channel 426<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:30</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=11" target="_blank" rel="noopener">Channel 11<br> HD</a>
+<a href="/watch.php?id=353" target="_blank" rel="noopener">Channel 353<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=533" target="_blank" rel="noopener">Channel 533<br> HD</a>
+<a href="/watch.php?id=86" target="_blank" rel="noopener">Channel 86<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=173" target="_blank" rel="noopener">Channel 173<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=297" target="_blank" rel="noopener">Channel 297<br> HD</a>
+<a href="/watch.php?id=645" target="_blank" rel="noopener">Channel 645<br> HD</a>
+<a href="/watch.php?id=169" target="_blank" rel="noopener">Channel 169<br> HD</a>
+<a href="/watch.php?id=45" target="_blank" rel="noopener">Channel 45<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=295" target="_blank" rel="noopener">Channel 295<br> HD</a>
+<a href="/watch.php?id=447" target="_blank" rel="noopener">Channel 447<br> HD</a>
+<a href="/watch.php?id=52" target="_blank" rel="noopener">Channel 52<br> HD</a>
+<a href="/watch.php?id=235" target="_blank" rel="noopener">Channel 235<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=209" target="_blank" rel="noopener">Channel 209<br> HD</a>
+<a href="/watch.php?id=594" target="_blank" rel="noopener">Channel 594<br> HD</a>
+<a href="/watch.php?id=524" target="_blank" rel="noopener">Channel 524<br> HD</a>
+<a href="/watch.php?id=691" target="_blank" rel="noopener">Channel 691<br> HD</a>
+<a href="/watch.php?id=92" target="_blank" rel="noopener">Channel 92<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=800" target="_blank" rel="noopener">Channel 800<br> HD</a>
+<a href="/watch.php?id=242" target="_blank" rel="noopener">Channel 242<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=224" target="_blank" rel="noopener">Channel 224<br> HD</a>
+<a href="/watch.php?id=262" target="_blank" rel="noopener">Channel 262<br> HD</a>
+<a href="/watch.php?id=797" target="_blank" rel="noopener">Channel 797<br> HD</a>
+<a href="/watch.php?id=2" target="_blank" rel="noopener">Channel 2<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=634" target="_blank" rel="noopener">Channel 634<br> HD</a>
+<a href="/watch.php?id=259" target="_blank" rel="noopener">Channel 259<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=305" target="_blank" rel="noopener">Channel 305<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=214" target="_blank" rel="noopener">Channel 214<br> HD</a>
+<a href="/watch.php?id=130" target="_blank" rel="noopener">Channel 130<br> HD</a>
+<a href="/watch.php?id=44" target="_blank" rel="noopener">Channel 44<br> HD</a>
+<a href="/watch.php?id=690" target="_blank" rel="noopener">Channel 690<br> HD</a>
+<a href="/watch.php?id=409" target="_blank" rel="noopener">Channel 409<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=745" target="_blank" rel="noopener">Channel 745<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=613" target="_blank" rel="noopener">Channel 613<br> HD</a>
+<a href="/watch.php?id=714" target="_blank" rel="noopener">Channel 714<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=581" target="_blank" rel="noopener">Channel 581<br> HD</a>
+<a href="/watch.php?id=740" target="_blank" rel="noopener">Channel 740<br> HD</a>
+<a href="/watch.php?id=24" target="_blank" rel="noopener">Channel 24<br> HD</a>
+<a href="/watch.php?id=226" target="_blank" rel="noopener">Channel 226<br> HD</a>
+<a href="/watch.php?id=416" target="_blank" rel="noopener">Channel 416<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=818" target="_blank" rel="noopener">Channel 818<br> HD</a>
+<a href="/watch.php?id=792" target="_blank" rel="noopener">Channel 792<br> HD</a>
+<a href="/watch.php?id=860" target="_blank" rel="noopener">Channel 860<br> HD</a>
+<a href="/watch.php?id=180" target="_blank" rel="noopener">Channel 180<br> HD</a>
+<a href="/watch.php?id=55" target="_blank" rel="noopener">Channel 55<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=228" target="_blank" rel="noopener">Channel 228<br> HD</a>
+<a href="/watch.php?id=94" target="_blank" rel="noopener">Channel 94<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=197" target="_blank" rel="noopener">Channel 197<br> HD</a>
+<a href="/watch.php?id=520" target="_blank" rel="noopener">Channel 520<br> HD</a>
+<a href="/watch.php?id=611" target="_blank" rel="noopener">Channel 611<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=635" target="_blank" rel="noopener">Channel 635<br> HD</a>
+<a href="/watch.php?id=264" target="_blank" rel="noopener">Channel 264<br> HD</a>
+<a href="/watch.php?id=730" target="_blank" rel="noopener">Channel 730<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=593" target="_blank" rel="noopener">Channel 593<br> HD</a>
+<a href="/watch.php?id=743" target="_blank" rel="noopener">Channel 743<br> HD</a>
+<a href="/watch.php?id=283" target="_blank" rel="noopener">Channel 283<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=224" target="_blank" rel="noopener">Channel 224<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:30</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=167" target="_blank" rel="noopener">Channel 167<br> HD</a>
+<a href="/watch.php?id=670" target="_blank" rel="noopener">Channel 670<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=264" target="_blank" rel="noopener">Channel 264<br> HD</a>
+<a href="/watch.php?id=218" target="_blank" rel="noopener">Channel 218<br> HD</a>
+<a href="/watch.php?id=651" target="_blank" rel="noopener">Channel 651<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=737" target="_blank" rel="noopener">Channel 737<br> HD</a>
+<a href="/watch.php?id=509" target="_blank" rel="noopener">Channel 509<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=633" target="_blank" rel="noopener">Channel 633<br> HD</a>
+<a href="/watch.php?id=203" target="_blank" rel="noopener">Channel 203<br> HD</a>
+<a href="/watch.php?id=294" target="_blank" rel="noopener">Channel 294<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=157" target="_blank" rel="noopener">Channel 157<br> HD</a>
+<a href="/watch.php?id=804" target="_blank" rel="noopener">Channel 804<br> HD</a>
+<a href="/watch.php?id=595" target="_blank" rel="noopener">Channel 595<br> HD</a>
+<a href="/watch.php?id=366" target="_blank" rel="noopener">Channel 366<br> HD</a>
+<a href="/watch.php?id=145" target="_blank" rel="noopener">Channel 145<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=794" target="_blank" rel="noopener">Channel 794<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=276" target="_blank" rel="noopener">Channel 276<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=836" target="_blank" rel="noopener">Channel 836<br> HD</a>
+<a href="/watch.php?id=893" target="_blank" rel="noopener">Channel 893<br> HD</a>
+<a href="/watch.php?id=442" target="_blank" rel="noopener">Channel 442<br> HD</a>
+<a href="/watch.php?id=434" target="_blank" rel="noopener">Channel 434<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=760" target="_blank" rel="noopener">Channel 760<br> HD</a>
+<a href="/watch.php?id=443" target="_blank" rel="noopener">Channel 443<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Ice Hockey <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=375" target="_blank" rel="noopener">Channel 375<br> HD</a>
+<a href="/watch.php?id=583" target="_blank" rel="noopener">Channel 583<br> HD</a>
+<a href="/watch.php?id=440" target="_blank" rel="noopener">Channel 440<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=623" target="_blank" rel="noopener">Channel 623<br> HD</a>
+<a href="/watch.php?id=206" target="_blank" rel="noopener">Channel 206<br> HD</a>
+<a href="/watch.php?id=116" target="_blank" rel="noopener">Channel 116<br> HD</a>
+<a href="/watch.php?id=235" target="_blank" rel="noopener">Channel 235<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=635" target="_blank" rel="noopener">Channel 635<br> HD</a>
+<a href="/watch.php?id=99" target="_blank" rel="noopener">Channel 99<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=388" target="_blank" rel="noopener">Channel 388<br> HD</a>
+<a href="/watch.php?id=646" target="_blank" rel="noopener">Channel 646<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=204" target="_blank" rel="noopener">Channel 204<br> HD</a>
+<a href="/watch.php?id=697" target="_blank" rel="noopener">Channel 697<br> HD</a>
+<a href="/watch.php?id=256" target="_blank" rel="noopener">Channel 256<br> HD</a>
+<a href="/watch.php?id=782" target="_blank" rel="noopener">Channel 782<br> HD</a>
+<a href="/watch.php?id=135" target="_blank" rel="noopener">Channel 135<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=381" target="_blank" rel="noopener">Channel 381<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=673" target="_blank" rel="noopener">Channel 673<br> HD</a>
+<a href="/watch.php?id=695" target="_blank" rel="noopener">Channel 695<br> HD</a>
+<a href="/watch.php?id=152" target="_blank" rel="noopener">Channel 152<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=429" target="_blank" rel="noopener">Channel 429<br> HD</a>
+<a href="/watch.php?id=275" target="_blank" rel="noopener">Channel 275<br> HD</a>
+<a href="/watch.php?id=784" target="_blank" rel="noopener">Channel 784<br> HD</a>
+<a href="/watch.php?id=830" target="_blank" rel="noopener">Channel 830<br> HD</a>
+<a href="/watch.php?id=134" target="_blank" rel="noopener">Channel 134<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=801" target="_blank" rel="noopener">Channel 801<br> HD</a>
+<a href="/watch.php?id=403" target="_blank" rel="noopener">Channel 403<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=249" target="_blank" rel="noopener">Channel 249<br> HD</a>
+<a href="/watch.php?id=209" target="_blank" rel="noopener">Channel 209<br> HD</a>
+<a href="/watch.php?id=75" target="_blank" rel="noopener">Channel 75<br> HD</a>
+<a href="/watch.php?id=699" target="_blank" rel="noopener">Channel 699<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=266" target="_blank" rel="noopener">Channel 266<br> HD</a>
+<a href="/watch.php?id=67" target="_blank" rel="noopener">Channel 67<br> HD</a>
+<a href="/watch.php?id=789" target="_blank" rel="noopener">Channel 789<br> HD</a>
+<a href="/watch.php?id=770" target="_blank" rel="noopener">Channel 770<br> HD</a>
+<a href="/watch.php?id=875" target="_blank" rel="noopener">Channel 875<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=673" target="_blank" rel="noopener">Channel 673<br> HD</a>
+<a href="/watch.php?id=581" target="_blank" rel="noopener">Channel 581<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=568" target="_blank" rel="noopener">Channel 568<br> HD</a>
+<a href="/watch.php?id=604" target="_blank" rel="noopener">Channel 604<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=230" target="_blank" rel="noopener">Channel 230<br> HD</a>
+<a href="/watch.php?id=455" target="_blank" rel="noopener">Channel 455<br> HD</a>
+<a href="/watch.php?id=692" target="_blank" rel="noopener">Channel 692<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=785" target="_blank" rel="noopener">Channel 785<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=680" target="_blank" rel="noopener">Channel 680<br> HD</a>
+<a href="/watch.php?id=738" target="_blank" rel="noopener">Channel 738<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=469" target="_blank" rel="noopener">Channel 469<br> HD</a>
+<a href="/watch.php?id=206" target="_blank" rel="noopener">Channel 206<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=624" target="_blank" rel="noopener">Channel 624<br> HD</a>
+<a href="/watch.php?id=226" target="_blank" rel="noopener">Channel 226<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=867" target="_blank" rel="noopener">Channel 867<br> HD</a>
+<a href="/watch.php?id=435" target="_blank" rel="noopener">Channel 435<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=385" target="_blank" rel="noopener">Channel 385<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=765" target="_blank" rel="noopener">Channel 765<br> HD</a>
+<a href="/watch.php?id=307" target="_blank" rel="noopener">Channel 307<br> HD</a>
+<a href="/watch.php?id=637" target="_blank" rel="noopener">Channel 637<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=430" target="_blank" rel="noopener">Channel 430<br> HD</a>
+<a href="/watch.php?id=250" target="_blank" rel="noopener">Channel 250<br> HD</a>
+<a href="/watch.php?id=664" target="_blank" rel="noopener">Channel 664<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=167" target="_blank" rel="noopener">Channel 167<br> HD</a>
+<a href="/watch.php?id=855" target="_blank" rel="noopener">Channel 855<br> HD</a>
+<a href="/watch.php?id=18" target="_blank" rel="noopener">Channel 18<br> HD</a>
+<a href="/watch.php?id=527" target="_blank" rel="noopener">Channel 527<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=661" target="_blank" rel="noopener">Channel 661<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=643" target="_blank" rel="noopener">Channel 643<br> HD</a>
+<a href="/watch.php?id=45" target="_blank" rel="noopener">Channel 45<br> HD</a>
+<a href="/watch.php?id=864" target="_blank" rel="noopener">Channel 864<br> HD</a>
+<a href="/watch.php?id=669" target="_blank" rel="noopener">Channel 669<br> HD</a>
+<a href="/watch.php?id=205" target="_blank" rel="noopener">Channel 205<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=463" target="_blank" rel="noopener">Channel 463<br> HD</a>
+<a href="/watch.php?id=150" target="_blank" rel="noopener">Channel 150<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=525" target="_blank" rel="noopener">Channel 525<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=376" target="_blank" rel="noopener">Channel 376<br> HD</a>
+<a href="/watch.php?id=216" target="_blank" rel="noopener">Channel 216<br> HD</a>
+<a href="/watch.php?id=39" target="_blank" rel="noopener">Channel 39<br> HD</a>
+<a href="/watch.php?id=543" target="_blank" rel="noopener">Channel 543<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=243" target="_blank" rel="noopener">Channel 243<br> HD</a>
+<a href="/watch.php?id=202" target="_blank" rel="noopener">Channel 202<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=846" target="_blank" rel="noopener">Channel 846<br> HD</a>
+<a href="/watch.php?id=860" target="_blank" rel="noopener">Channel 860<br> HD</a>
+<a href="/watch.php?id=824" target="_blank" rel="noopener">Channel 824<br> HD</a>
+<a href="/watch.php?id=791" target="_blank" rel="noopener">Channel 791<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Cricket <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=789" target="_blank" rel="noopener">Channel 789<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=813" target="_blank" rel="noopener">Channel 813<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=739" target="_blank" rel="noopener">Channel 739<br> HD</a>
+<a href="/watch.php?id=144" target="_blank" rel="noopener">Channel 144<br> HD</a>
+<a href="/watch.php?id=839" target="_blank" rel="noopener">Channel 839<br> HD</a>
+<a href="/watch.php?id=558" target="_blank" rel="noopener">Channel 558<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:15</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=684" target="_blank" rel="noopener">Channel 684<br> HD</a>
+<a href="/watch.php?id=764" target="_blank" rel="noopener">Channel 764<br> HD</a>
+<a href="/watch.php?id=368" target="_blank" rel="noopener">Channel 368<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=862" target="_blank" rel="noopener">Channel 862<br> HD</a>
+<a href="/watch.php?id=823" target="_blank" rel="noopener">Channel 823<br> HD</a>
+<a href="/watch.php?id=88" target="_blank" rel="noopener">Channel 88<br> HD</a>
+<a href="/watch.php?id=880" target="_blank" rel="noopener">Channel 880<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=599" target="_blank" rel="noopener">Channel 599<br> HD</a>
+<a href="/watch.php?id=365" target="_blank" rel="noopener">Channel 365<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=457" target="_blank" rel="noopener">Channel 457<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=753" target="_blank" rel="noopener">Channel 753<br> HD</a>
+<a href="/watch.php?id=668" target="_blank" rel="noopener">Channel 668<br> HD</a>
+<a href="/watch.php?id=225" target="_blank" rel="noopener">Channel 225<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=20" target="_blank" rel="noopener">Channel 20<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=273" target="_blank" rel="noopener">Channel 273<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=134" target="_blank" rel="noopener">Channel 134<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=396" target="_blank" rel="noopener">Channel 396<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=235" target="_blank" rel="noopener">Channel 235<br> HD</a>
+<a href="/watch.php?id=531" target="_blank" rel="noopener">Channel 531<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=826" target="_blank" rel="noopener">Channel 826<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=80" target="_blank" rel="noopener">Channel 80<br> HD</a>
+<a href="/watch.php?id=613" target="_blank" rel="noopener">Channel 613<br> HD</a>
+<a href="/watch.php?id=866" target="_blank" rel="noopener">Channel 866<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=411" target="_blank" rel="noopener">Channel 411<br> HD</a>
+<a href="/watch.php?id=143" target="_blank" rel="noopener">Channel 143<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:15</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=705" target="_blank" rel="noopener">Channel 705<br> HD</a>
+<a href="/watch.php?id=900" target="_blank" rel="noopener">Channel 900<br> HD</a>
+<a href="/watch.php?id=120" target="_blank" rel="noopener">Channel 120<br> HD</a>
+<a href="/watch.php?id=131" target="_blank" rel="noopener">Channel 131<br> HD</a>
+<a href="/watch.php?id=794" target="_blank" rel="noopener">Channel 794<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=8" target="_blank" rel="noopener">Channel 8<br> HD</a>
+<a href="/watch.php?id=149" target="_blank" rel="noopener">Channel 149<br> HD</a>
+<a href="/watch.php?id=718" target="_blank" rel="noopener">Channel 718<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=317" target="_blank" rel="noopener">Channel 317<br> HD</a>
+<a href="/watch.php?id=702" target="_blank" rel="noopener">Channel 702<br> HD</a>
+<a href="/watch.php?id=137" target="_blank" rel="noopener">Channel 137<br> HD</a>
+<a href="/watch.php?id=402" target="_blank" rel="noopener">Channel 402<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=300" target="_blank" rel="noopener">Channel 300<br> HD</a>
+<a href="/watch.php?id=487" target="_blank" rel="noopener">Channel 487<br> HD</a>
+<a href="/watch.php?id=191" target="_blank" rel="noopener">Channel 191<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=512" target="_blank" rel="noopener">Channel 512<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=475" target="_blank" rel="noopener">Channel 475<br> HD</a>
+<a href="/watch.php?id=3" target="_blank" rel="noopener">Channel 3<br> HD</a>
+<a href="/watch.php?id=806" target="_blank" rel="noopener">Channel 806<br> HD</a>
+<a href="/watch.php?id=653" target="_blank" rel="noopener">Channel 653<br> HD</a>
+<a href="/watch.php?id=252" target="_blank" rel="noopener">Channel 252<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=608" target="_blank" rel="noopener">Channel 608<br> HD</a>
+<a href="/watch.php?id=873" target="_blank" rel="noopener">Channel 873<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=93" target="_blank" rel="noopener">Channel 93<br> HD</a>
+<a href="/watch.php?id=339" target="_blank" rel="noopener">Channel 339<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:15</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=337" target="_blank" rel="noopener">Channel 337<br> HD</a>
+<a href="/watch.php?id=815" target="_blank" rel="noopener">Channel 815<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=586" target="_blank" rel="noopener">Channel 586<br> HD</a>
+<a href="/watch.php?id=365" target="_blank" rel="noopener">Channel 365<br> HD</a>
+<a href="/watch.php?id=170" target="_blank" rel="noopener">Channel 170<br> HD</a>
+<a href="/watch.php?id=186" target="_blank" rel="noopener">Channel 186<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=82" target="_blank" rel="noopener">Channel 82<br> HD</a>
+<a href="/watch.php?id=468" target="_blank" rel="noopener">Channel 468<br> HD</a>
+<a href="/watch.php?id=442" target="_blank" rel="noopener">Channel 442<br> HD</a>
+<a href="/watch.php?id=224" target="_blank" rel="noopener">Channel 224<br> HD</a>
+<a href="/watch.php?id=65" target="_blank" rel="noopener">Channel 65<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:30</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=402" target="_blank" rel="noopener">Channel 402<br> HD</a>
+<a href="/watch.php?id=860" target="_blank" rel="noopener">Channel 860<br> HD</a>
+<a href="/watch.php?id=378" target="_blank" rel="noopener">Channel 378<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">16:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=422" target="_blank" rel="noopener">Channel 422<br> HD</a>
+<a href="/watch.php?id=356" target="_blank" rel="noopener">Channel 356<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=338" target="_blank" rel="noopener">Channel 338<br> HD</a>
+<a href="/watch.php?id=9" target="_blank" rel="noopener">Channel 9<br> HD</a>
+<a href="/watch.php?id=231" target="_blank" rel="noopener">Channel 231<br> HD</a>
+<a href="/watch.php?id=312" target="_blank" rel="noopener">Channel 312<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Motorsport <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=864" target="_blank" rel="noopener">Channel 864<br> HD</a>
+<a href="/watch.php?id=594" target="_blank" rel="noopener">Channel 594<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=654" target="_blank" rel="noopener">Channel 654<br> HD</a>
+<a href="/watch.php?id=604" target="_blank" rel="noopener">Channel 604<br> HD</a>
+<a href="/watch.php?id=115" target="_blank" rel="noopener">Channel 115<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=254" target="_blank" rel="noopener">Channel 254<br> HD</a>
+<a href="/watch.php?id=480" target="_blank" rel="noopener">Channel 480<br> HD</a>
+<a href="/watch.php?id=442" target="_blank" rel="noopener">Channel 442<br> HD</a>
+<a href="/watch.php?id=56" target="_blank" rel="noopener">Channel 56<br> HD</a>
+<a href="/watch.php?id=145" target="_blank" rel="noopener">Channel 145<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=92" target="_blank" rel="noopener">Channel 92<br> HD</a>
+<a href="/watch.php?id=580" target="_blank" rel="noopener">Channel 580<br> HD</a>
+<a href="/watch.php?id=448" target="_blank" rel="noopener">Channel 448<br> HD</a>
+<a href="/watch.php?id=133" target="_blank" rel="noopener">Channel 133<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=741" target="_blank" rel="noopener">Channel 741<br> HD</a>
+<a href="/watch.php?id=868" target="_blank" rel="noopener">Channel 868<br> HD</a>
+<a href="/watch.php?id=371" target="_blank" rel="noopener">Channel 371<br> HD</a>
+<a href="/watch.php?id=545" target="_blank" rel="noopener">Channel 545<br> HD</a>
+<a href="/watch.php?id=534" target="_blank" rel="noopener">Channel 534<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=20" target="_blank" rel="noopener">Channel 20<br> HD</a>
+<a href="/watch.php?id=356" target="_blank" rel="noopener">Channel 356<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=425" target="_blank" rel="noopener">Channel 425<br> HD</a>
+<a href="/watch.php?id=170" target="_blank" rel="noopener">Channel 170<br> HD</a>
+<a href="/watch.php?id=804" target="_blank" rel="noopener">Channel 804<br> HD</a>
+<a href="/watch.php?id=241" target="_blank" rel="noopener">Channel 241<br> HD</a>
+<a href="/watch.php?id=1" target="_blank" rel="noopener">Channel 1<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=881" target="_blank" rel="noopener">Channel 881<br> HD</a>
+<a href="/watch.php?id=562" target="_blank" rel="noopener">Channel 562<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=273" target="_blank" rel="noopener">Channel 273<br> HD</a>
+<a href="/watch.php?id=236" target="_blank" rel="noopener">Channel 236<br> HD</a>
+<a href="/watch.php?id=370" target="_blank" rel="noopener">Channel 370<br> HD</a>
+<a href="/watch.php?id=341" target="_blank" rel="noopener">Channel 341<br> HD</a>
+<a href="/watch.php?id=749" target="_blank" rel="noopener">Channel 749<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=609" target="_blank" rel="noopener">Channel 609<br> HD</a>
+<a href="/watch.php?id=891" target="_blank" rel="noopener">Channel 891<br> HD</a>
+<a href="/watch.php?id=44" target="_blank" rel="noopener">Channel 44<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=749" target="_blank" rel="noopener">Channel 749<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=813" target="_blank" rel="noopener">Channel 813<br> HD</a>
+<a href="/watch.php?id=395" target="_blank" rel="noopener">Channel 395<br> HD</a>
+<a href="/watch.php?id=495" target="_blank" rel="noopener">Channel 495<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=435" target="_blank" rel="noopener">Channel 435<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=481" target="_blank" rel="noopener">Channel 481<br> HD</a>
+<a href="/watch.php?id=73" target="_blank" rel="noopener">Channel 73<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=884" target="_blank" rel="noopener">Channel 884<br> HD</a>
+<a href="/watch.php?id=477" target="_blank" rel="noopener">Channel 477<br> HD</a>
+<a href="/watch.php?id=477" target="_blank" rel="noopener">Channel 477<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=752" target="_blank" rel="noopener">Channel 752<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=738" target="_blank" rel="noopener">Channel 738<br> HD</a>
+<a href="/watch.php?id=303" target="_blank" rel="noopener">Channel 303<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=865" target="_blank" rel="noopener">Channel 865<br> HD</a>
+<a href="/watch.php?id=873" target="_blank" rel="noopener">Channel 873<br> HD</a>
+<a href="/watch.php?id=746" target="_blank" rel="noopener">Channel 746<br> HD</a>
+<a href="/watch.php?id=475" target="_blank" rel="noopener">Channel 475<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=275" target="_blank" rel="noopener">Channel 275<br> HD</a>
+<a href="/watch.php?id=486" target="_blank" rel="noopener">Channel 486<br> HD</a>
+<a href="/watch.php?id=506" target="_blank" rel="noopener">Channel 506<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=706" target="_blank" rel="noopener">Channel 706<br> HD</a>
+<a href="/watch.php?id=458" target="_blank" rel="noopener">Channel 458<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=780" target="_blank" rel="noopener">Channel 780<br> HD</a>
+<a href="/watch.php?id=719" target="_blank" rel="noopener">Channel 719<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:15</span>
+<span class="schedule__eventTitle">Lakers vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=525" target="_blank" rel="noopener">Channel 525<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=557" target="_blank" rel="noopener">Channel 557<br> HD</a>
+<a href="/watch.php?id=740" target="_blank" rel="noopener">Channel 740<br> HD</a>
+<a href="/watch.php?id=477" target="_blank" rel="noopener">Channel 477<br> HD</a>
+<a href="/watch.php?id=671" target="_blank" rel="noopener">Channel 671<br> HD</a>
+<a href="/watch.php?id=318" target="_blank" rel="noopener">Channel 318<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=445" target="_blank" rel="noopener">Channel 445<br> HD</a>
+<a href="/watch.php?id=685" target="_blank" rel="noopener">Channel 685<br> HD</a>
+<a href="/watch.php?id=691" target="_blank" rel="noopener">Channel 691<br> HD</a>
+<a href="/watch.php?id=593" target="_blank" rel="noopener">Channel 593<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=787" target="_blank" rel="noopener">Channel 787<br> HD</a>
+<a href="/watch.php?id=277" target="_blank" rel="noopener">Channel 277<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=704" target="_blank" rel="noopener">Channel 704<br> HD</a>
+<a href="/watch.php?id=639" target="_blank" rel="noopener">Channel 639<br> HD</a>
+<a href="/watch.php?id=426" target="_blank" rel="noopener">Channel 426<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=334" target="_blank" rel="noopener">Channel 334<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=841" target="_blank" rel="noopener">Channel 841<br> HD</a>
+<a href="/watch.php?id=859" target="_blank" rel="noopener">Channel 859<br> HD</a>
+<a href="/watch.php?id=233" target="_blank" rel="noopener">Channel 233<br> HD</a>
+<a href="/watch.php?id=522" target="_blank" rel="noopener">Channel 522<br> HD</a>
+<a href="/watch.php?id=328" target="_blank" rel="noopener">Channel 328<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=422" target="_blank" rel="noopener">Channel 422<br> HD</a>
+<a href="/watch.php?id=864" target="_blank" rel="noopener">Channel 864<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=140" target="_blank" rel="noopener">Channel 140<br> HD</a>
+<a href="/watch.php?id=74" target="_blank" rel="noopener">Channel 74<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category"><div class="schedule__catHeader">
+<div class="card__meta"> Darts <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=300" target="_blank" rel="noopener">Channel 300<br> HD</a>
+<a href="/watch.php?id=619" target="_blank" rel="noopener">Channel 619<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=124" target="_blank" rel="noopener">Channel 124<br> HD</a>
+<a href="/watch.php?id=760" target="_blank" rel="noopener">Channel 760<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=568" target="_blank" rel="noopener">Channel 568<br> HD</a>
+<a href="/watch.php?id=63" target="_blank" rel="noopener">Channel 63<br> HD</a>
+<a href="/watch.php?id=679" target="_blank" rel="noopener">Channel 679<br> HD</a>
+<a href="/watch.php?id=764" target="_blank" rel="noopener">Channel 764<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=114" target="_blank" rel="noopener">Channel 114<br> HD</a>
+<a href="/watch.php?id=59" target="_blank" rel="noopener">Channel 59<br> HD</a>
+<a href="/watch.php?id=368" target="_blank" rel="noopener">Channel 368<br> HD</a>
+<a href="/watch.php?id=663" target="_blank" rel="noopener">Channel 663<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=33" target="_blank" rel="noopener">Channel 33<br> HD</a>
+<a href="/watch.php?id=353" target="_blank" rel="noopener">Channel 353<br> HD</a>
+<a href="/watch.php?id=292" target="_blank" rel="noopener">Channel 292<br> HD</a>
+<a href="/watch.php?id=573" target="_blank" rel="noopener">Channel 573<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">23:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=294" target="_blank" rel="noopener">Channel 294<br> HD</a>
+<a href="/watch.php?id=524" target="_blank" rel="noopener">Channel 524<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=135" target="_blank" rel="noopener">Channel 135<br> HD</a>
+<a href="/watch.php?id=393" target="_blank" rel="noopener">Channel 393<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:15</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=28" target="_blank" rel="noopener">Channel 28<br> HD</a>
+<a href="/watch.php?id=773" target="_blank" rel="noopener">Channel 773<br> HD</a>
+<a href="/watch.php?id=272" target="_blank" rel="noopener">Channel 272<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=553" target="_blank" rel="noopener">Channel 553<br> HD</a>
+<a href="/watch.php?id=847" target="_blank" rel="noopener">Channel 847<br> HD</a>
+<a href="/watch.php?id=476" target="_blank" rel="noopener">Channel 476<br> HD</a>
+<a href="/watch.php?id=836" target="_blank" rel="noopener">Channel 836<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=128" target="_blank" rel="noopener">Channel 128<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=888" target="_blank" rel="noopener">Channel 888<br> HD</a>
+<a href="/watch.php?id=220" target="_blank" rel="noopener">Channel 220<br> HD</a>
+<a href="/watch.php?id=363" target="_blank" rel="noopener">Channel 363<br> HD</a>
+<a href="/watch.php?id=600" target="_blank" rel="noopener">Channel 600<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:45</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=327" target="_blank" rel="noopener">Channel 327<br> HD</a>
+<a href="/watch.php?id=194" target="_blank" rel="noopener">Channel 194<br> HD</a>
+<a href="/watch.php?id=9" target="_blank" rel="noopener">Channel 9<br> HD</a>
+<a href="/watch.php?id=131" target="_blank" rel="noopener">Channel 131<br> HD</a>
+<a href="/watch.php?id=484" target="_blank" rel="noopener">Channel 484<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=464" target="_blank" rel="noopener">Channel 464<br> HD</a>
+<a href="/watch.php?id=565" target="_blank" rel="noopener">Channel 565<br> HD</a>
+<a href="/watch.php?id=529" target="_blank" rel="noopener">Channel 529<br> HD</a>
+<a href="/watch.php?id=303" target="_blank" rel="noopener">Channel 303<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=832" target="_blank" rel="noopener">Channel 832<br> HD</a>
+<a href="/watch.php?id=795" target="_blank" rel="noopener">Channel 795<br> HD</a>
+<a href="/watch.php?id=853" target="_blank" rel="noopener">Channel 853<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">14:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=607" target="_blank" rel="noopener">Channel 607<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=617" target="_blank" rel="noopener">Channel 617<br> HD</a>
+<a href="/watch.php?id=326" target="_blank" rel="noopener">Channel 326<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=214" target="_blank" rel="noopener">Channel 214<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:00</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=579" target="_blank" rel="noopener">Channel 579<br> HD</a>
+<a href="/watch.php?id=473" target="_blank" rel="noopener">Channel 473<br> HD</a>
+<a href="/watch.php?id=834" target="_blank" rel="noopener">Channel 834<br> HD</a>
+<a href="/watch.php?id=513" target="_blank" rel="noopener">Channel 513<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=858" target="_blank" rel="noopener">Channel 858<br> HD</a>
+<a href="/watch.php?id=696" target="_blank" rel="noopener">Channel 696<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">05:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=668" target="_blank" rel="noopener">Channel 668<br> HD</a>
+<a href="/watch.php?id=655" target="_blank" rel="noopener">Channel 655<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:15</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=810" target="_blank" rel="noopener">Channel 810<br> HD</a>
+<a href="/watch.php?id=142" target="_blank" rel="noopener">Channel 142<br> HD</a>
+<a href="/watch.php?id=87" target="_blank" rel="noopener">Channel 87<br> HD</a>
+<a href="/watch.php?id=497" target="_blank" rel="noopener">Channel 497<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Lakers vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=662" target="_blank" rel="noopener">Channel 662<br> HD</a>
+<a href="/watch.php?id=517" target="_blank" rel="noopener">Channel 517<br> HD</a>
+<a href="/watch.php?id=698" target="_blank" rel="noopener">Channel 698<br> HD</a>
+<a href="/watch.php?id=704" target="_blank" rel="noopener">Channel 704<br> HD</a>
+<a href="/watch.php?id=447" target="_blank" rel="noopener">Channel 447<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">15:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=388" target="_blank" rel="noopener">Channel 388<br> HD</a>
+<a href="/watch.php?id=37" target="_blank" rel="noopener">Channel 37<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:45</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=159" target="_blank" rel="noopener">Channel 159<br> HD</a>
+<a href="/watch.php?id=400" target="_blank" rel="noopener">Channel 400<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Celtics vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=726" target="_blank" rel="noopener">Channel 726<br> HD</a>
+<a href="/watch.php?id=232" target="_blank" rel="noopener">Channel 232<br> HD</a>
+<a href="/watch.php?id=683" target="_blank" rel="noopener">Channel 683<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:45</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=157" target="_blank" rel="noopener">Channel 157<br> HD</a>
+<a href="/watch.php?id=818" target="_blank" rel="noopener">Channel 818<br> HD</a>
+<a href="/watch.php?id=616" target="_blank" rel="noopener">Channel 616<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:45</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=76" target="_blank" rel="noopener">Channel 76<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=899" target="_blank" rel="noopener">Channel 899<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:00</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=879" target="_blank" rel="noopener">Channel 879<br> HD</a>
+<a href="/watch.php?id=442" target="_blank" rel="noopener">Channel 442<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:30</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=846" target="_blank" rel="noopener">Channel 846<br> HD</a>
+<a href="/watch.php?id=703" target="_blank" rel="noopener">Channel 703<br> HD</a>
+</div></div>
+</div></div>
+<div class="schedule__category is-expanded"><div class="schedule__catHeader">
+<div class="card__meta"> Rugby Union <!-- c --></div></div><div class="schedule__events">
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=462" target="_blank" rel="noopener">Channel 462<br> HD</a>
+<a href="/watch.php?id=852" target="_blank" rel="noopener">Channel 852<br> HD</a>
+<a href="/watch.php?id=342" target="_blank" rel="noopener">Channel 342<br> HD</a>
+<a href="/watch.php?id=515" target="_blank" rel="noopener">Channel 515<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">21:00</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=418" target="_blank" rel="noopener">Channel 418<br> HD</a>
+<a href="/watch.php?id=786" target="_blank" rel="noopener">Channel 786<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">02:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=527" target="_blank" rel="noopener">Channel 527<br> HD</a>
+<a href="/watch.php?id=25" target="_blank" rel="noopener">Channel 25<br> HD</a>
+<a href="/watch.php?id=335" target="_blank" rel="noopener">Channel 335<br> HD</a>
+<a href="/watch.php?id=717" target="_blank" rel="noopener">Channel 717<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=54" target="_blank" rel="noopener">Channel 54<br> HD</a>
+<a href="/watch.php?id=45" target="_blank" rel="noopener">Channel 45<br> HD</a>
+<a href="/watch.php?id=296" target="_blank" rel="noopener">Channel 296<br> HD</a>
+<a href="/watch.php?id=164" target="_blank" rel="noopener">Channel 164<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">10:00</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=259" target="_blank" rel="noopener">Channel 259<br> HD</a>
+<a href="/watch.php?id=110" target="_blank" rel="noopener">Channel 110<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=197" target="_blank" rel="noopener">Channel 197<br> HD</a>
+<a href="/watch.php?id=80" target="_blank" rel="noopener">Channel 80<br> HD</a>
+<a href="/watch.php?id=135" target="_blank" rel="noopener">Channel 135<br> HD</a>
+<a href="/watch.php?id=293" target="_blank" rel="noopener">Channel 293<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">07:15</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=250" target="_blank" rel="noopener">Channel 250<br> HD</a>
+<a href="/watch.php?id=607" target="_blank" rel="noopener">Channel 607<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=375" target="_blank" rel="noopener">Channel 375<br> HD</a>
+<a href="/watch.php?id=668" target="_blank" rel="noopener">Channel 668<br> HD</a>
+<a href="/watch.php?id=653" target="_blank" rel="noopener">Channel 653<br> HD</a>
+<a href="/watch.php?id=175" target="_blank" rel="noopener">Channel 175<br> HD</a>
+<a href="/watch.php?id=277" target="_blank" rel="noopener">Channel 277<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">09:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=846" target="_blank" rel="noopener">Channel 846<br> HD</a>
+<a href="/watch.php?id=827" target="_blank" rel="noopener">Channel 827<br> HD</a>
+<a href="/watch.php?id=305" target="_blank" rel="noopener">Channel 305<br> HD</a>
+<a href="/watch.php?id=559" target="_blank" rel="noopener">Channel 559<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">04:30</span>
+<span class="schedule__eventTitle">Real Madrid vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=124" target="_blank" rel="noopener">Channel 124<br> HD</a>
+<a href="/watch.php?id=307" target="_blank" rel="noopener">Channel 307<br> HD</a>
+<a href="/watch.php?id=536" target="_blank" rel="noopener">Channel 536<br> HD</a>
+<a href="/watch.php?id=103" target="_blank" rel="noopener">Channel 103<br> HD</a>
+<a href="/watch.php?id=791" target="_blank" rel="noopener">Channel 791<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">12:00</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=832" target="_blank" rel="noopener">Channel 832<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">20:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Bayern München</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=711" target="_blank" rel="noopener">Channel 711<br> HD</a>
+<a href="/watch.php?id=481" target="_blank" rel="noopener">Channel 481<br> HD</a>
+<a href="/watch.php?id=481" target="_blank" rel="noopener">Channel 481<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:45</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=880" target="_blank" rel="noopener">Channel 880<br> HD</a>
+<a href="/watch.php?id=205" target="_blank" rel="noopener">Channel 205<br> HD</a>
+<a href="/watch.php?id=532" target="_blank" rel="noopener">Channel 532<br> HD</a>
+<a href="/watch.php?id=756" target="_blank" rel="noopener">Channel 756<br> HD</a>
+<a href="/watch.php?id=806" target="_blank" rel="noopener">Channel 806<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:15</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=504" target="_blank" rel="noopener">Channel 504<br> HD</a>
+<a href="/watch.php?id=234" target="_blank" rel="noopener">Channel 234<br> HD</a>
+<a href="/watch.php?id=50" target="_blank" rel="noopener">Channel 50<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">03:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=713" target="_blank" rel="noopener">Channel 713<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:30</span>
+<span class="schedule__eventTitle">Arsenal vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=461" target="_blank" rel="noopener">Channel 461<br> HD</a>
+<a href="/watch.php?id=453" target="_blank" rel="noopener">Channel 453<br> HD</a>
+<a href="/watch.php?id=838" target="_blank" rel="noopener">Channel 838<br> HD</a>
+<a href="/watch.php?id=472" target="_blank" rel="noopener">Channel 472<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=134" target="_blank" rel="noopener">Channel 134<br> HD</a>
+<a href="/watch.php?id=847" target="_blank" rel="noopener">Channel 847<br> HD</a>
+<a href="/watch.php?id=531" target="_blank" rel="noopener">Channel 531<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">13:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=106" target="_blank" rel="noopener">Channel 106<br> HD</a>
+<a href="/watch.php?id=855" target="_blank" rel="noopener">Channel 855<br> HD</a>
+<a href="/watch.php?id=6" target="_blank" rel="noopener">Channel 6<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">22:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=311" target="_blank" rel="noopener">Channel 311<br> HD</a>
+<a href="/watch.php?id=835" target="_blank" rel="noopener">Channel 835<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:15</span>
+<span class="schedule__eventTitle">Inter &amp; Co vs <b>Boca Juniors</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=695" target="_blank" rel="noopener">Channel 695<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">08:30</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=818" target="_blank" rel="noopener">Channel 818<br> HD</a>
+<a href="/watch.php?id=682" target="_blank" rel="noopener">Channel 682<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:15</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Arsenal</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=769" target="_blank" rel="noopener">Channel 769<br> HD</a>
+<a href="/watch.php?id=399" target="_blank" rel="noopener">Channel 399<br> HD</a>
+<a href="/watch.php?id=863" target="_blank" rel="noopener">Channel 863<br> HD</a>
+<a href="/watch.php?id=503" target="_blank" rel="noopener">Channel 503<br> HD</a>
+<a href="/watch.php?id=467" target="_blank" rel="noopener">Channel 467<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">19:30</span>
+<span class="schedule__eventTitle">Chelsea vs <b>Celtics</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=85" target="_blank" rel="noopener">Channel 85<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:45</span>
+<span class="schedule__eventTitle">Bayern München vs <b>Chelsea</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=765" target="_blank" rel="noopener">Channel 765<br> HD</a>
+<a href="/watch.php?id=388" target="_blank" rel="noopener">Channel 388<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">11:00</span>
+<span class="schedule__eventTitle">Lakers vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=874" target="_blank" rel="noopener">Channel 874<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">18:30</span>
+<span class="schedule__eventTitle">Celtics vs <b>Lakers</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=720" target="_blank" rel="noopener">Channel 720<br> HD</a>
+<a href="/watch.php?id=382" target="_blank" rel="noopener">Channel 382<br> HD</a>
+<a href="/watch.php?id=762" target="_blank" rel="noopener">Channel 762<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">00:00</span>
+<span class="schedule__eventTitle">Boca Juniors vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=309" target="_blank" rel="noopener">Channel 309<br> HD</a>
+<a href="/watch.php?id=280" target="_blank" rel="noopener">Channel 280<br> HD</a>
+<a href="/watch.php?id=60" target="_blank" rel="noopener">Channel 60<br> HD</a>
+<a href="/watch.php?id=686" target="_blank" rel="noopener">Channel 686<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">01:45</span>
+<span class="schedule__eventTitle">Celtics vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=855" target="_blank" rel="noopener">Channel 855<br> HD</a>
+<a href="/watch.php?id=722" target="_blank" rel="noopener">Channel 722<br> HD</a>
+<a href="/watch.php?id=439" target="_blank" rel="noopener">Channel 439<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">17:15</span>
+<span class="schedule__eventTitle">Celtics vs <b>Inter &amp; Co</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=524" target="_blank" rel="noopener">Channel 524<br> HD</a>
+<a href="/watch.php?id=43" target="_blank" rel="noopener">Channel 43<br> HD</a>
+</div></div>
+<div class="schedule__event"><div class="schedule__eventHeader">
+<span class="schedule__time" data-time="x">06:30</span>
+<span class="schedule__eventTitle">Lakers vs <b>Real Madrid</b></span></div>
+<div class="schedule__channels">
+<a href="/watch.php?id=759" target="_blank" rel="noopener">Channel 759<br> HD</a>
+<a href="/watch.php?id=115" target="_blank" rel="noopener">Channel 115<br> HD</a>
+</div></div>
+</div></div>
+</div>
+</main></body></html>
\ No newline at end of file
@@ -0,0 +1 @@
+{"server_key": "zeko"}
\ No newline at end of file
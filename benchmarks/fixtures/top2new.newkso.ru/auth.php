@@ -0,0 +1 @@
+{"status": "ok"}
\ No newline at end of file
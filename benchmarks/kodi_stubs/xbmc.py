@@ -0,0 +1,73 @@
+"""Stand-in for Kodi's xbmc module so the addon can run outside Kodi.
+
+Calls into Kodi are counted in calls, keyed by name, so benchmarks can
+report how many round trips a code path makes.
+"""
+import os
+from collections import Counter
+
+LOGDEBUG, LOGINFO, LOGWARNING, LOGERROR, LOGFATAL = 0, 1, 2, 3, 4
+
+calls = Counter()
+builtins = []
+log_level = int(os.environ.get('KODI_STUB_LOG_LEVEL', LOGWARNING))
+
+
+def log(message, level=LOGDEBUG):
+    calls['log'] += 1
+    if level >= log_level:
+        print(f'[xbmc] {message}')
+
+def executebuiltin(function, wait=False):
+    calls['executebuiltin'] += 1
+    builtins.append(function)
+
+def executeJSONRPC(request):
+    calls['executeJSONRPC'] += 1
+    builtins.append(request)
+    return '{"id": 1, "jsonrpc": "2.0", "result": "OK"}'
+
+def sleep(milliseconds):
+    calls['sleep'] += 1
+
+def getInfoLabel(label):
+    return ''
+
+def getCondVisibility(condition):
+    return False
+
+
+class Monitor:
+    def abortRequested(self):
+        return True
+
+    def waitForAbort(self, timeout=0):
+        return True
+
+
+class Player:
+    def play(self, item='', listitem=None, windowed=False, startpos=-1):
+        calls['Player.play'] += 1
+
+    def isPlaying(self):
+        return False
+
+    def stop(self):
+        pass
+
+
+class Actor:
+    def __init__(self, name='', role='', order=-1, thumbnail=''):
+        self.name = name
+        self.role = role
+        self.thumbnail = thumbnail
+
+
+class InfoTagVideo:
+    def __getattr__(self, name):
+        if not name.startswith('set'):
+            raise AttributeError(name)
+
+        def setter(*args, **kwargs):
+            calls[f'InfoTagVideo.{name}'] += 1
+        return setter
@@ -0,0 +1,53 @@
+"""Stand-in for Kodi's xbmcaddon module.
+
+Settings start from the defaults in the addon's resources/settings.xml and
+can be overridden through the module level settings dict.
+"""
+import os
+import xml.etree.ElementTree as ET
+
+ADDON_PATH = os.environ.get(
+    'KODI_STUB_ADDON_PATH',
+    os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, 'plugin.video.dlv2'))
+)
+settings = {}
+
+
+def _defaults() -> dict:
+    try:
+        root = ET.parse(os.path.join(ADDON_PATH, 'resources', 'settings.xml')).getroot()
+    except (OSError, ET.ParseError):
+        return {}
+    return {s.get('id'): s.get('default', '') for s in root.iter('setting') if s.get('id')}
+
+
+class Addon:
+    def __init__(self, id=None):
+        if not settings:
+            settings.update(_defaults())
+
+    def getAddonInfo(self, key):
+        return {
+            'id': 'plugin.video.dlv2',
+            'name': 'DaddyLive V2',
+            'version': '1.0.0',
+            'path': ADDON_PATH,
+            'profile': 'special://profile/addon_data/plugin.video.dlv2/',
+            'icon': os.path.join(ADDON_PATH, 'icon.png'),
+            'fanart': os.path.join(ADDON_PATH, 'fanart.jpg')
+        }.get(key, '')
+
+    def getSetting(self, key):
+        return str(settings.get(key, ''))
+
+    def getSettingBool(self, key):
+        return str(settings.get(key, '')).lower() == 'true' or settings.get(key) is True
+
+    def getSettingInt(self, key):
+        try:
+            return int(settings.get(key) or 0)
+        except ValueError:
+            return 0
+
+    def setSetting(self, key, value):
+        settings[key] = value
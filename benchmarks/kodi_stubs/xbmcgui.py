@@ -0,0 +1,103 @@
+"""Stand-in for Kodi's xbmcgui module. Dialog answers come from the module
+level input_text and select_index, and the open dialog's id from dialog_id,
+so a benchmark can script them."""
+from xbmc import InfoTagVideo, calls
+
+input_text = ''
+select_index = 0
+_window_properties = {}
+dialog_id = 9999
+
+
+def getCurrentWindowDialogId():
+    return dialog_id
+
+
+class ListItem:
+    def __init__(self, label='', label2='', path='', offscreen=False):
+        calls['ListItem'] += 1
+        self.label = label
+        self.path = path
+        self.properties = {}
+        self.art = {}
+        self.context_menu = []
+
+    def getVideoInfoTag(self):
+        return InfoTagVideo()
+
+    def setArt(self, values):
+        calls['ListItem.setArt'] += 1
+        self.art.update(values)
+
+    def setProperty(self, key, value):
+        calls['ListItem.setProperty'] += 1
+        self.properties[key] = value
+
+    def getProperty(self, key):
+        return self.properties.get(key, '')
+
+    def addContextMenuItems(self, items, replaceItems=False):
+        calls['ListItem.addContextMenuItems'] += 1
+        self.context_menu.extend(items)
+
+    def setMimeType(self, mimetype):
+        calls['ListItem.setMimeType'] += 1
+
+    def setPath(self, path):
+        self.path = path
+
+    def setLabel2(self, label):
+        pass
+
+
+class Dialog:
+    def notification(self, heading, message, icon='', time=5000, sound=True):
+        calls['Dialog.notification'] += 1
+
+    def ok(self, heading, message):
+        calls['Dialog.ok'] += 1
+        return True
+
+    def select(self, heading, options, autoclose=0, preselect=-1, useDetails=False):
+        calls['Dialog.select'] += 1
+        return select_index
+
+    def input(self, heading, defaultt='', type=0, option=0, autoclose=0):
+        calls['Dialog.input'] += 1
+        return input_text
+
+    def textviewer(self, heading, text, usemono=False):
+        calls['Dialog.textviewer'] += 1
+
+
+class DialogProgress:
+    def create(self, heading, message=''):
+        pass
+
+    def update(self, percent, message=''):
+        pass
+
+    def iscanceled(self):
+        return False
+
+    def close(self):
+        pass
+
+
+class DialogProgressBG(DialogProgress):
+    def isFinished(self):
+        return True
+
+
+class Window:
+    def __init__(self, existingWindowId=-1):
+        pass
+
+    def getProperty(self, key):
+        return _window_properties.get(key, '')
+
+    def setProperty(self, key, value):
+        _window_properties[key] = value
+
+    def clearProperty(self, key):
+        _window_properties.pop(key, None)
@@ -0,0 +1,29 @@
+"""Stand-in for Kodi's xbmcplugin module. Listed items are kept in items."""
+from xbmc import calls
+
+items = []
+resolved = []
+
+
+def addDirectoryItem(handle, url, listitem, isFolder=False, totalItems=0):
+    calls['addDirectoryItem'] += 1
+    items.append((url, listitem, isFolder))
+    return True
+
+def addDirectoryItems(handle, listing, totalItems=0):
+    calls['addDirectoryItems'] += 1
+    items.extend(listing)
+    return True
+
+def endOfDirectory(handle, succeeded=True, updateListing=False, cacheToDisc=True):
+    calls['endOfDirectory'] += 1
+
+def setContent(handle, content):
+    pass
+
+def setPluginCategory(handle, category):
+    pass
+
+def setResolvedUrl(handle, succeeded, listitem):
+    calls['setResolvedUrl'] += 1
+    resolved.append(listitem)
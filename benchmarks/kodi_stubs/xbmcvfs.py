@@ -0,0 +1,26 @@
+"""Stand-in for Kodi's xbmcvfs module. special:// paths map into KODI_STUB_HOME,
+a fresh temporary directory unless set."""
+import os
+import tempfile
+
+HOME = os.environ.get('KODI_STUB_HOME') or tempfile.mkdtemp(prefix='kodi-stub-')
+
+
+def translatePath(path):
+    if path.startswith('special://'):
+        return os.path.join(HOME, path[len('special://'):])
+    return path
+
+def exists(path):
+    return os.path.exists(translatePath(path))
+
+def mkdirs(path):
+    os.makedirs(translatePath(path), exist_ok=True)
+    return True
+
+def delete(path):
+    try:
+        os.remove(translatePath(path))
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,99 @@
+"""Write the site fixtures served by standin.py into benchmarks/fixtures.
+
+    python benchmarks/make_fixtures.py [--days 3] [--events 240]
+
+Files are laid out as fixtures/<host>/<path>. The pages copy the markup the
+scrapers and the resolver read from the live site, with generated content:
+index.php from bench_schedule_parser.generate, 24-7-channels.php from the
+bundled resources/channels.json, and one player chain for stream 51
+(player page, embed page with the auth bundle, auth.php, server_lookup.php
+and the playlist).
+"""
+import argparse
+import base64
+import json
+import os
+import re
+
+from bench_schedule_parser import generate
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.join(BENCH_DIR, os.pardir, 'plugin.video.dlv2')
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+
+SITE = 'dlhd.dad'
+EMBED = 'embed.fixture'
+AUTH = 'top2new.newkso.ru'
+SERVER_KEY = 'zeko'
+CHANNEL_ID = '51'
+FILLER = '<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>\n' * 40
+
+
+def write(path: str, content: str):
+    path = os.path.join(FIXTURES_DIR, path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(content)
+
+
+def channels_page() -> str:
+    with open(os.path.join(ADDON_DIR, 'resources', 'channels.json'), 'r', encoding='utf-8') as f:
+        channels = json.load(f)
+    cards = []
+    for channel in channels:
+        channel_id = re.search(r'(\d+)', channel['link']).group(1)
+        cards.append(
+            f'<a class="card" href="/watch.php?id={channel_id}" data-title="{channel["title"].lower()}">'
+            f'<div class="card__title">{channel["title"]}</div><div class="card__meta">ID: {channel_id}</div></a>'
+        )
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>24/7 Channels</title></head><body>'
+        f'{FILLER}<main><div class="grid">\n' + '\n'.join(cards) + '\n</div></main></body></html>'
+    )
+
+
+def player_page() -> str:
+    return (
+        f'<!DOCTYPE html><html><head><title>Stream {CHANNEL_ID}</title></head><body>{FILLER}'
+        f'<div class="player"><iframe id="thatframe" src="https://{EMBED}/premiumtv/daddyhd.php?id={CHANNEL_ID}" '
+        'width="100%" height="100%" allowfullscreen></iframe></div></body></html>'
+    )
+
+
+def embed_page() -> str:
+    parts = {
+        'b_ts': '1760800000',
+        'b_rnd': '8f14e45fceea167a',
+        'b_sig': '5a105e8b9d40e1329780d62ea2265d8a'
+    }
+    encoded = {k: base64.b64encode(v.encode('utf-8')).decode('ascii') for k, v in parts.items()}
+    bundle = base64.b64encode(json.dumps(encoded).encode('utf-8')).decode('ascii')
+    return (
+        f'<!DOCTYPE html><html><head><title>Player</title></head><body>{FILLER}<script>\n'
+        f'const CHANNEL_KEY = "premium{CHANNEL_ID}";\n'
+        f'const XKZK = "{bundle}";\n'
+        'fetchWithRetry(url, 3).then(start);\n</script></body></html>'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--days', type=int, default=3)
+    parser.add_argument('--events', type=int, default=240)
+    args = parser.parse_args()
+
+    write(f'{SITE}/index.php', generate(args.days, args.events))
+    write(f'{SITE}/24-7-channels.php', channels_page())
+    write(f'{SITE}/stream/stream-{CHANNEL_ID}.php', player_page())
+    write(f'{EMBED}/premiumtv/daddyhd.php', embed_page())
+    write(f'{EMBED}/server_lookup.php', json.dumps({'server_key': SERVER_KEY}))
+    write(f'{AUTH}/auth.php', json.dumps({'status': 'ok'}))
+    write(
+        f'{SERVER_KEY}new.newkso.ru/{SERVER_KEY}/premium{CHANNEL_ID}/mono.m3u8',
+        '#EXTM3U\n#EXT-X-VERSION:3\n#EXT-X-TARGETDURATION:4\n#EXT-X-MEDIA-SEQUENCE:1\n'
+        + ''.join(f'#EXTINF:4.000,\nsegment{i}.ts\n' for i in range(1, 7))
+    )
+
+
+if __name__ == '__main__':
+    main()
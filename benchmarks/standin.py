@@ -0,0 +1,77 @@
+"""Local stand-in for the site and its CDNs, serving benchmarks/fixtures.
+
+StandIn runs a threaded HTTP server on 127.0.0.1. route() mounts an adapter
+on a requests session that sends every request, whatever its host, to the
+stand-in as /<host>/<path>, so the addon's own urls are left untouched.
+"""
+import mimetypes
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from requests.adapters import HTTPAdapter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+CONTENT_TYPES = {'.php': 'text/html; charset=utf-8', '.m3u8': 'application/vnd.apple.mpegurl'}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        path = os.path.normpath(os.path.join(FIXTURES_DIR, unquote(urlsplit(self.path).path).lstrip('/')))
+        if not path.startswith(FIXTURES_DIR) or not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, 'rb') as f:
+            body = f.read()
+        ext = os.path.splitext(path)[1]
+        if ext == '.php' and body.lstrip()[:1] in (b'{', b'['):
+            content_type = 'application/json'
+        else:
+            content_type = CONTENT_TYPES.get(ext) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandIn:
+    def __init__(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+        self.server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.server.server_port}'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class StandInAdapter(HTTPAdapter):
+    def __init__(self, base_url: str, **kwargs):
+        self.base_url = base_url
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        query = f'?{parts.query}' if parts.query else ''
+        request.url = f'{self.base_url}/{parts.netloc}{parts.path}{query}'
+        kwargs['verify'] = False
+        return super().send(request, **kwargs)
+
+
+def route(session, base_url: str):
+    adapter = StandInAdapter(base_url, pool_connections=10, pool_maxsize=6)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
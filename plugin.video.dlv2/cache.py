@@ -0,0 +1,99 @@
+import json
+import os
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+
+def cache_key(url: str) -> str:
+    """'stream/stream-51.php' for https://host/stream/stream-51.php"""
+    return '/'.join(urlparse(url).path.strip('/').split('/')[-2:])
+
+
+class ResolveCache:
+    """Resolved m3u8 strings keyed by player type and stream php, persisted as json.
+
+    Entries carry the server_key and auth timestamp they were resolved with and
+    expire with the token, or after default_ttl when the resolver gave no timestamp.
+    The file is read again whenever another process has replaced it, so a
+    long-lived copy such as the service's sees their resolves and evictions.
+    """
+
+    def __init__(self, path: str, token_ttl: int=3600, default_ttl: int=600, margin: int=60):
+        self.path = path
+        self.token_ttl = token_ttl
+        self.default_ttl = default_ttl
+        self.margin = margin
+        self._entries = None
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def _file_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    @property
+    def entries(self) -> dict:
+        mtime = self._file_mtime()
+        if self._entries is None or mtime != self._mtime:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+            self._mtime = mtime
+        return self._entries
+
+    def _save(self):
+        now = time.time()
+        entries = {k: v for k, v in self._entries.items() if v.get('expires', 0) > now}
+        self._entries = entries
+        tmp_path = f'{self.path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.path)
+        self._mtime = self._file_mtime()
+
+    def expiry(self, ts: Optional[str]=None) -> float:
+        now = time.time()
+        try:
+            issued = float(ts)
+        except (TypeError, ValueError):
+            return now + self.default_ttl
+        if issued > 1e12:
+            issued /= 1000
+        return min(issued + self.token_ttl, now + self.token_ttl) - self.margin
+
+    def get(self, url: str, min_ttl: float=0) -> Optional[str]:
+        """Cached m3u8 for url if it is still valid for at least min_ttl seconds."""
+        entry = self.entries.get(cache_key(url))
+        if entry and entry.get('expires', 0) > time.time() + min_ttl:
+            return entry['m3u8']
+        return None
+
+    def expires(self, url: str) -> Optional[float]:
+        entry = self.entries.get(cache_key(url))
+        return entry.get('expires') if entry else None
+
+    def reload(self):
+        self._entries = None
+
+    def put(self, url: str, m3u8: str, server_key: str='', ts: Optional[str]=None):
+        with self._lock:
+            self.reload()
+            self.entries[cache_key(url)] = {
+                'm3u8': m3u8,
+                'server_key': server_key,
+                'ts': ts,
+                'expires': self.expiry(ts)
+            }
+            self._save()
+
+    def evict(self, url: str):
+        with self._lock:
+            self.reload()
+            if self.entries.pop(cache_key(url), None) is not None:
+                self._save()
@@ -0,0 +1,8 @@
+"""Fetching, parsing, searching and resolving without Kodi.
+
+Nothing in this package imports the xbmc modules or variables, so it runs
+in the addon and in a plain python process alike. Storage (a store.Store
+and a cache.ResolveCache), the http get and the log are handed in by the
+caller: functions.py wires them to the addon, core.server to a local
+HTTP API that several Kodi boxes can share.
+"""
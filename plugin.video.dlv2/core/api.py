@@ -0,0 +1,230 @@
+"""Schedule, channels, search and resolve over an injected store.
+
+Core is what the addon does without its UI: it refreshes the store from the
+site when the data has gone stale, reads listings and search results back
+out of it and resolves channels through a ResolveCache, so concurrent
+callers share one scrape and one resolve per player page. The module level
+functions are the pieces the addon's own refresh in functions.py and data.py
+shares with Core: requests, staleness, the per-mirror page fetches and
+saving their results.
+"""
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+import requests
+from requests import Response
+import search_index
+import session
+from cache import ResolveCache
+from schedule_parser import parse_schedule
+from store import Store
+from core import site, scrape, resolvers
+
+
+def _ignore(message: str):
+    pass
+
+def _request(url: str, stage: str, fallback: bool=False, **kwargs) -> Response:
+    return session.request(url, **kwargs)
+
+def http_get(url: str, referer: str='', headers=None, timeout=None, stream: bool=False, stage: str='',
+             request: Callable=_request, log: Callable=_ignore) -> Response:
+    """GET with the site headers and host timeouts, retried over plain http
+    when https cannot connect. request(url, stage, fallback, **kwargs) sends
+    it, through the shared session unless given."""
+    headers = dict(site.headers if headers is None else headers)
+    if referer:
+        headers['Referer'] = headers['Origin'] = referer
+    if timeout is None:
+        timeout = session.host_timeout(url, site.host_timeouts)
+    try:
+        return request(url, stage, headers=headers, timeout=timeout, stream=stream)
+    except requests.exceptions.ConnectionError as e:
+        if isinstance(e, requests.exceptions.Timeout) or not url.startswith('https'):
+            raise
+        log(f'https failed for {url}, retrying over http: {e}')
+        return request(
+            url.replace('https', 'http', 1), stage, fallback=True, headers=headers, timeout=timeout, verify=False, stream=stream
+        )
+
+def plain_http(url: str) -> str:
+    return url.replace('https://', 'http://', 1)
+
+def is_stale(store: Store, key: str, ttl: int) -> bool:
+    checked = store.get_meta(key)
+    return checked is None or time.time() - float(checked) > ttl
+
+def _fetch_page(get: Callable, store: Store, url: str, key: str, parse: Callable, stage: str):
+    """core.scrape.fetch_page against the validators stored under key."""
+    validators = json.loads(store.get_meta(key) or '{}')
+    return scrape.fetch_page(get, url, validators, parse, stage)
+
+def schedule_from(get: Callable, store: Store, url: str):
+    """(schedule, validators) of one schedule mirror, schedule None when the
+    page is unchanged. Raises when it has no events."""
+    schedule, validators = _fetch_page(get, store, url, 'schedule_page', parse_schedule, 'schedule')
+    if schedule is None:
+        return None, validators
+    if not schedule:
+        raise ValueError('no events found')
+    return schedule, validators
+
+def channels_from(get: Callable, store: Store, url: str):
+    """(channels, validators) of one 24-7-channels.php mirror, see
+    schedule_from."""
+    item_list, validators = _fetch_page(
+        get, store, url, 'channels_page', lambda chunks: scrape.parse_channels(''.join(chunks)), 'channels'
+    )
+    if item_list is None:
+        return None, validators
+    if not item_list:
+        raise ValueError('no channels found')
+    return item_list, validators
+
+def save_schedule(store: Store, schedule: Optional[dict], validators: Optional[dict], now: str) -> Optional[int]:
+    """Write a schedule fetch: schedule is None when the page was unchanged or
+    not fetched, validators None when it could not be fetched. Returns the
+    number of categories rewritten, or None when the schedule was kept."""
+    if schedule is None and not store.has_schedule():
+        schedule = {}
+    changed = None
+    if schedule is not None:
+        changed = store.update_schedule(schedule, now)
+    if validators is not None:
+        store.set_meta('schedule_page', json.dumps(validators))
+        store.set_meta('schedule_checked', now)
+    store.increment_meta('refresh_generation')
+    return changed
+
+def save_channels(store: Store, channels: Optional[list], validators: Optional[dict], now: str) -> bool:
+    """Write a channels fetch, see save_schedule. Returns whether the channel
+    list changed."""
+    changed = channels is not None and store.update_channels(channels, now)
+    if validators is not None:
+        store.set_meta('channels_page', json.dumps(validators))
+        store.set_meta('channels_checked', now)
+    store.increment_meta('refresh_generation')
+    return changed
+
+
+class Core:
+    """The site behind store and cache. get does every request, see http_get,
+    and log(message) reports what happened. channels_fallback is a json
+    channel list used while the site has never been reached."""
+
+    def __init__(self, store: Store, cache: Optional[ResolveCache]=None, get: Callable=http_get,
+                 log: Callable=_ignore, schedule_ttl: int=1800, channels_ttl: int=43200,
+                 channels_fallback: Optional[str]=None):
+        self.store = store
+        self.cache = cache
+        self.get = get
+        self.log = log
+        self.schedule_ttl = schedule_ttl
+        self.channels_ttl = channels_ttl
+        self.channels_fallback = channels_fallback
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._flights = {}
+
+    def _first(self, fetch: Callable, url: str):
+        """fetch(get, store, mirror) of url, then of its plain http mirror,
+        like functions.fetch_schedule without the hedging."""
+        error = None
+        for mirror in (url, plain_http(url)):
+            try:
+                return fetch(self.get, self.store, mirror)
+            except Exception as e:
+                self.log(f'{mirror} failed: {e}')
+                error = e
+        raise error
+
+    def refresh_schedule(self) -> bool:
+        try:
+            schedule, validators = self._first(schedule_from, site.schedule_url)
+        except Exception:
+            schedule, validators = None, None
+        changed = save_schedule(self.store, schedule, validators, str(time.time()))
+        if changed is not None:
+            self.log(f'Schedule refreshed, {changed} categories rewritten')
+        return validators is not None
+
+    def refresh_channels(self) -> bool:
+        try:
+            channels, validators = self._first(channels_from, site.channels_url)
+        except Exception:
+            channels, validators = None, None
+            if not self.store.has_channels() and self.channels_fallback:
+                with open(self.channels_fallback, 'r', encoding='utf-8') as f:
+                    channels = json.load(f)
+        if save_channels(self.store, channels, validators, str(time.time())):
+            self.log(f'Channels refreshed, {len(channels)} channels')
+        return validators is not None
+
+    def refresh(self, force: bool=False) -> bool:
+        """Refresh whatever has gone stale, or both with force. One refresh
+        runs at a time; callers arriving meanwhile wait for it and reuse its
+        result. Returns False if a site page could not be reached."""
+        with self._refresh_lock:
+            ok = True
+            if force or not self.store.has_schedule() or is_stale(self.store, 'schedule_checked', self.schedule_ttl):
+                ok = self.refresh_schedule() and ok
+            if force or not self.store.has_channels() or is_stale(self.store, 'channels_checked', self.channels_ttl):
+                ok = self.refresh_channels() and ok
+            return ok
+
+    def schedule(self) -> Dict[str, Dict[str, list]]:
+        self.refresh()
+        return self.store.schedule()
+
+    def channels(self, adult: bool=True) -> List[dict]:
+        """The 24/7 channels with the id resolve() takes."""
+        self.refresh()
+        return [dict(item, id=site.channel_id(item['link'])) for item in self.store.channels(adult)]
+
+    def search(self, query: str) -> Dict[str, list]:
+        keywords = search_index.keywords(query)
+        if not keywords:
+            return {'events': [], 'channels': []}
+        self.refresh()
+        return self.store.search(keywords)
+
+    def resolve_player(self, player_url: str) -> Optional[str]:
+        """m3u8 of one player page. Concurrent calls for the same page wait
+        for the first one and then read its result from the cache. A page's
+        flight is dropped once nobody is waiting on it."""
+        with self._lock:
+            flight = self._flights.setdefault(player_url, [threading.Lock(), 0])
+            flight[1] += 1
+        try:
+            with flight[0]:
+                if self.cache is not None and (m3u8 := self.cache.get(player_url)):
+                    return m3u8
+                m3u8, info = resolvers.resolve(player_url, self.get, self.log)
+                if m3u8 and self.cache is not None:
+                    self.cache.put(player_url, m3u8, **info)
+                return m3u8
+        finally:
+            with self._lock:
+                flight[1] -= 1
+                if not flight[1]:
+                    del self._flights[player_url]
+
+    def resolve(self, channel_id: str, player: Optional[str]=None) -> Optional[dict]:
+        """{'player_url', 'm3u8'} of a channel id as given by site.channel_id,
+        from its first player page that resolves, or from the player type
+        named by player only. None when the id is unknown or nothing resolved."""
+        if not (link := site.channel_link(channel_id)):
+            return None
+        players = site.player_links(link)
+        if player:
+            players = [p for p in players if p[1].split('/')[-2] == player]
+        for _, player_url in players:
+            try:
+                m3u8 = self.resolve_player(player_url)
+            except Exception as e:
+                self.log(f'Resolve {player_url} failed: {e}')
+                continue
+            if m3u8:
+                return {'player_url': player_url, 'm3u8': m3u8}
+        return None
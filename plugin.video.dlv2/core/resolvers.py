@@ -0,0 +1,164 @@
+"""Resolvers that get from a player page to a playable m3u8.
+
+resolve() reads the iframe url from the player page, unwraps one wrapper
+iframe and then tries the registered resolvers in the order they are
+registered, which decides which one wins on a page several of them match.
+A resolver names the iframe hosts it handles, if any, and the number of
+requests it still makes, which is logged with the winner. Pages and the
+decoded auth bundle are fetched once per resolve and shared by every
+resolver that reads them. The caller passes in the get that does the
+requests and, optionally, a log.
+"""
+import base64
+import json
+import re
+from collections import namedtuple
+from typing import Callable, Optional, Tuple
+from urllib.parse import parse_qsl, quote_plus, urlparse
+from bs4 import BeautifulSoup
+from core.site import user_agent
+
+
+Resolver = namedtuple('Resolver', 'name cost hosts fn')
+RESOLVERS = []
+WRAPPER_HOSTS = ('wikisport', 'lovecdn')
+AUTH_HOST = 'https://top2new.newkso.ru/'
+AUTH_PATH = ''.join(chr(b ^ 73) for b in [40, 60, 61, 33, 103, 57, 33, 57])
+
+_iframe_selector = 'iframe#thatframe, iframe.video'
+_channel_key_re = re.compile(r'const\s+CHANNEL_KEY\s*=\s*"([^"]+)"')
+_bundle_re = re.compile(r'const\s+[A-Z]+\s*=\s*"([^"]+)"')
+_atob_re = re.compile(r"atob\('([^']+)'\)")
+_init_url_re = re.compile(r'initUrl\s*=\s*"([^"]+)"')
+_plays_re = re.compile(r"var\s+PlayS\s*=\s*'([^']+)'")
+
+
+class ResolveContext:
+    """State of one resolve: the player url, the iframe url and referer the
+    resolvers start from and every page fetched so far."""
+
+    def __init__(self, url: str, get: Callable):
+        self.url = url
+        self.iframe = ''
+        self.referer = ''
+        self.get = get
+        self._pages = {}
+        self._bundle = None
+
+    def page(self, url: str, referer: str='', stage: str='', timeout=None) -> str:
+        key = (url, referer)
+        if key not in self._pages:
+            self._pages[key] = self.get(url, referer, timeout=timeout, stage=stage).text
+        return self._pages[key]
+
+    def iframe_page(self) -> str:
+        return self.page(self.iframe, self.referer, stage='bundle')
+
+    def host(self) -> str:
+        return urlparse(self.iframe).netloc
+
+    def bundle(self) -> dict:
+        """The base64 auth bundle of the iframe page, decoded."""
+        if self._bundle is None:
+            bundle = _bundle_re.search(self.iframe_page()).group(1)
+            parts = json.loads(base64.b64decode(bundle).decode('utf-8'))
+            self._bundle = {k: base64.b64decode(v).decode('utf-8') for k, v in parts.items()}
+        return self._bundle
+
+
+def resolver(cost: int, hosts: tuple=()):
+    """Register fn(ctx) -> (m3u8, info) or None after the resolvers already
+    registered. cost is the number of requests it makes after the player
+    page, counting the iframe page itself."""
+    def register(fn):
+        RESOLVERS.append(Resolver(fn.__name__, cost, hosts, fn))
+        return fn
+    return register
+
+def with_headers(m3u8: str, referer: str, origin: str='') -> str:
+    """m3u8 with the headers kodi should send, in its 'url|Header=value' form."""
+    origin = f'&Origin={origin}' if origin else ''
+    return f'{m3u8}|Referer={referer}{origin}&Connection=Keep-Alive&User-Agent={user_agent}'
+
+def origin_headers(ctx: ResolveContext, m3u8: str) -> str:
+    origin = f'https://{ctx.host()}'
+    return with_headers(m3u8, f'{origin}/', origin)
+
+
+@resolver(cost=0, hosts=('lovecdn',))
+def lovecdn(ctx: ResolveContext):
+    m3u8 = ctx.iframe.replace('embed.html', 'index.fmp4.m3u8')
+    return with_headers(m3u8, ctx.iframe), {}
+
+@resolver(cost=3)
+def channel_key(ctx: ResolveContext):
+    if not (match := _channel_key_re.search(ctx.iframe_page())):
+        return None
+    key = match.group(1)
+    parts = ctx.bundle()
+    auth_url = (
+        f'{AUTH_HOST}{AUTH_PATH}'
+        f'?channel_id={quote_plus(key)}&'
+        f'ts={quote_plus(parts["b_ts"])}&'
+        f'rnd={quote_plus(parts["b_rnd"])}&'
+        f'sig={quote_plus(parts["b_sig"])}'
+    )
+    ctx.get(auth_url, referer=ctx.iframe, stage='auth')
+
+    server_lookup_url = f'https://{ctx.host()}/server_lookup.php?channel_id={key}'
+    server_key = ctx.get(server_lookup_url, referer=ctx.iframe, stage='server_lookup').json()['server_key']
+    if server_key == 'top1/cdn':
+        m3u8 = f'https://top1.newkso.ru/top1/cdn/{key}/mono.m3u8'
+    else:
+        m3u8 = f'https://{server_key}new.newkso.ru/{server_key}/{key}/mono.m3u8'
+    return origin_headers(ctx, m3u8), {'server_key': server_key, 'ts': parts['b_ts']}
+
+@resolver(cost=2)
+def init_url(ctx: ResolveContext):
+    if not (match := _atob_re.search(ctx.iframe_page())):
+        return None
+    decoded = base64.b64decode(match.group(1)).decode('utf-8', errors='ignore')
+    if not (url := _init_url_re.search(decoded)):
+        return None
+    response = ctx.get(url.group(1), ctx.referer, stage='init_url')
+    m3u8 = base64.b64decode(response.text).decode('utf-8')
+    return with_headers(m3u8, ctx.iframe), {}
+
+@resolver(cost=1, hosts=('blogspot.com',))
+def blogspot(ctx: ResolveContext):
+    channel_id = dict(parse_qsl(urlparse(ctx.iframe).query)).get('id')
+    if not channel_id:
+        return None
+    pattern = rf'"{re.escape(channel_id)}"\s*:\s*\{{[^}}]*?url:\s*"([^"]+)"'
+    if match := re.search(pattern, ctx.iframe_page(), re.DOTALL):
+        return origin_headers(ctx, match.group(1)), {}
+
+@resolver(cost=1)
+def play_s(ctx: ResolveContext):
+    if match := _plays_re.search(ctx.iframe_page()):
+        return origin_headers(ctx, match.group(1)), {}
+
+
+def resolve(url: str, get: Callable, log: Optional[Callable]=None) -> Tuple[Optional[str], dict]:
+    """Resolve a player url with get(url, referer, timeout=, stage=) doing the
+    requests and log(message) told which resolver won. Returns (m3u8, info)
+    where info holds the server_key and auth timestamp used for caching, or
+    (None, {}) when no resolver handles it."""
+    ctx = ResolveContext(url, get)
+    soup = BeautifulSoup(ctx.page(url, stage='player'), 'html.parser')
+    ctx.iframe = soup.select_one(_iframe_selector)['src']
+
+    if any(host in ctx.host() for host in WRAPPER_HOSTS):
+        soup = BeautifulSoup(ctx.page(ctx.iframe, url, stage='iframe', timeout=(5, 60)), 'html.parser')
+        ctx.iframe = soup.find('iframe')['src']
+        ctx.referer = url
+
+    host = ctx.host()
+    for entry in RESOLVERS:
+        if entry.hosts and not any(h in host for h in entry.hosts):
+            continue
+        if result := entry.fn(ctx):
+            if log is not None:
+                log(f'Resolved {url} with {entry.name} (cost {entry.cost})')
+            return result
+    return None, {}
@@ -0,0 +1,83 @@
+"""Conditional page downloads and the 24/7 channel list parsers."""
+import hashlib
+from typing import Callable, Iterable, Optional, Tuple, TypeVar
+from urllib.parse import urlparse, parse_qsl, urljoin
+from bs4 import BeautifulSoup
+from core import site
+
+
+T = TypeVar('T')
+
+
+def fetch_page(get: Callable, url: str, validators: dict, parse: Callable[[Iterable[str]], T],
+               stage: str='') -> Tuple[Optional[T], dict]:
+    """Download url with get(url, headers=, stream=, stage=) and hand its text
+    chunks to parse as they arrive. Returns (parse's result, validators), or
+    (None, validators) when the page is unchanged since validators, either by
+    a 304 to If-None-Match/If-Modified-Since or by the same content hash."""
+    headers = dict(site.headers)
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    digest = hashlib.sha1()
+    with get(url, headers=headers, stream=True, stage=stage) as response:
+        if response.status_code == 304:
+            return None, validators
+        response.raise_for_status()
+        if response.encoding is None:
+            response.encoding = 'utf-8'
+
+        def chunks():
+            for chunk in response.iter_content(chunk_size=16384, decode_unicode=True):
+                digest.update(chunk.encode('utf-8'))
+                yield chunk
+
+        body = chunks()
+        result = parse(body)
+        for _ in body:
+            pass
+        new_validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'hash': digest.hexdigest()
+        }
+    if new_validators['hash'] == validators.get('hash'):
+        return None, new_validators
+    return result, new_validators
+
+def parse_channels(html: str) -> list:
+    item_list = []
+    soup = BeautifulSoup(html, 'html.parser')
+    for card in soup.select('.card'):
+        title = card.div.text
+        href = f"{site.base_url}{card['href']}"
+        channel_id = dict(parse_qsl(urlparse(href).query))['id']
+        link = f'/stream/stream-{channel_id}.php'
+        item = {
+            'title': title,
+            'link': link
+        }
+        if (img := card.find('img')) and (src := img.get('data-src') or img.get('src')):
+            item['logo'] = urljoin(f'{site.base_url}/', src)
+        item_list.append(item)
+    return item_list
+
+def parse_channels_old(html: str) -> list:
+    item_list = []
+    soup = BeautifulSoup(html, 'html.parser')
+    channels = []
+    for a in soup.find_all('a')[8:]:
+        title = a.text
+        link = a['href']
+        if link in channels:
+            continue
+        channels.append(link)
+        
+        item_list.append(
+            {
+                'title': title,
+                'link': link
+            }
+        )
+    return item_list
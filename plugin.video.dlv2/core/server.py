@@ -0,0 +1,133 @@
+"""Local HTTP API over core.api.Core.
+
+One warm process scrapes and resolves for every client on the network
+instead of each Kodi box doing it alone; set the addon's api_url to point
+its resolves here. Every answer is json:
+
+    GET /schedule              {day: {category: [event, ...]}}
+    GET /channels              [{'title', 'link', 'id'}, ...]
+    GET /search?q=real+madrid  {'events': [...], 'channels': [...]}
+    GET /resolve/<id>          {'player_url', 'm3u8'}, ?player=cast for one player type
+
+Run it from the addon folder:
+
+    python3 -m core.server --host 0.0.0.0 --port 8765 --data ~/.dlv2
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qsl, unquote, urlsplit
+from cache import ResolveCache
+from store import Store
+from core.api import Core
+
+
+DEFAULT_PORT = 8765
+REFRESH_INTERVAL = 300
+CHANNELS_FALLBACK = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resources', 'channels.json')
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        path = unquote(parts.path).rstrip('/')
+        query = dict(parse_qsl(parts.query))
+        core = self.server.core
+        try:
+            if path == '/schedule':
+                self.send_json(200, core.schedule())
+            elif path == '/channels':
+                self.send_json(200, core.channels())
+            elif path == '/search':
+                self.send_json(200, core.search(query.get('q', '')))
+            elif path.startswith('/resolve/'):
+                result = core.resolve(path[len('/resolve/'):], query.get('player'))
+                if result is None:
+                    self.send_json(404, {'error': 'no stream'})
+                else:
+                    self.send_json(200, result)
+            else:
+                self.send_json(404, {'error': 'not found'})
+        except Exception as e:
+            core.log(f'{self.path} failed: {e}')
+            self.send_json(500, {'error': str(e)})
+
+    def send_json(self, status: int, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ApiServer(ThreadingHTTPServer):
+    """Serves core on address and refreshes it every refresh_interval seconds
+    in the background, so requests seldom wait for the site."""
+    daemon_threads = True
+
+    def __init__(self, address: tuple, core: Core, refresh_interval: Optional[int]=REFRESH_INTERVAL):
+        super().__init__(address, ApiHandler)
+        self.core = core
+        self.refresh_interval = refresh_interval
+        self._stop = threading.Event()
+
+    def _refresher(self):
+        while not self._stop.is_set():
+            try:
+                self.core.refresh()
+            except Exception as e:
+                self.core.log(f'Refresh failed: {e}')
+            self._stop.wait(self.refresh_interval)
+
+    def serve_forever(self, poll_interval: float=0.5):
+        if self.refresh_interval:
+            threading.Thread(target=self._refresher, daemon=True).start()
+        super().serve_forever(poll_interval)
+
+    def shutdown(self):
+        self._stop.set()
+        super().shutdown()
+
+
+def log(message: str):
+    print(f"{time.strftime('%H:%M:%S')} {message}", file=sys.stderr, flush=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--data', default=os.path.join(os.path.expanduser('~'), '.dlv2'),
+                        help='folder for the store and the resolve cache')
+    parser.add_argument('--refresh', type=int, default=REFRESH_INTERVAL,
+                        help='seconds between background refreshes, 0 refreshes on request only')
+    args = parser.parse_args(argv)
+    os.makedirs(args.data, exist_ok=True)
+    core = Core(
+        Store(os.path.join(args.data, 'dlv2.db')),
+        ResolveCache(os.path.join(args.data, 'resolved.json')),
+        log=log,
+        channels_fallback=CHANNELS_FALLBACK
+    )
+    server = ApiServer((args.host, args.port), core, args.refresh)
+    log(f'Serving on http://{args.host}:{server.server_port}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Site urls, request headers and the player pages of a channel."""
+import re
+from typing import List, Optional
+from urllib.parse import urlparse
+
+
+base_url = 'https://dlhd.dad'
+base_url_old = 'https://daddylivestream.com'
+schedule_url = f'{base_url}/index.php'
+schedule_url_old = f'{base_url_old}/schedule/schedule-generated.json'
+schedule_url_old2 = f'{base_url}/schedule/schedule-generated.php'
+channels_url = f'{base_url}/24-7-channels.php'
+channels_url_old = f'{base_url_old}/24-7-channels.php'
+
+user_agent = 'Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Mobile Safari/537.36'
+headers = {
+    "User-Agent": user_agent,
+    "Referer": f'{base_url}/',
+    "Origin": f'{base_url}/'
+}
+host_timeouts = {
+    'newkso': (3.05, 10),
+    'lovecdn': (3.05, 10),
+    'wikisport': (5, 60),
+    urlparse(base_url).netloc: (5, 15),
+    urlparse(base_url_old).netloc: (5, 15)
+}
+
+PLAYER_TYPES = ['stream', 'cast', 'watch', 'plus', 'casting', 'player']
+
+_channel_id_re = re.compile(r'stream-(\d+)\.php|bet\.php\?id=(bet\d+)')
+_valid_id_re = re.compile(r'(bet)?\d+')
+
+
+def player_links(url: str) -> List[list]:
+    """[label, player_url] for every player page of a channel link."""
+    php = url.split('/')[-1]
+    return [[f'Link {index+1}', f'{base_url}/{a_type}/{php}'] for index, a_type in enumerate(PLAYER_TYPES)]
+
+def channel_id(link: str) -> Optional[str]:
+    """'51' for .../stream-51.php, 'bet12' for .../bet.php?id=bet12."""
+    if match := _channel_id_re.search(link):
+        return match.group(1) or match.group(2)
+    return None
+
+def channel_link(channel_id: str) -> Optional[str]:
+    """The channel link of an id from channel_id(), None for anything else."""
+    if not _valid_id_re.fullmatch(channel_id):
+        return None
+    if channel_id.startswith('bet'):
+        return f'/stream/bet.php?id={channel_id}'
+    return f'/stream/stream-{channel_id}.php'
@@ -0,0 +1,267 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime, date, timezone
+from urllib.parse import urlencode
+import xbmc
+import xbmcgui
+import xbmcvfs
+import variables as var
+import search_index
+from store import Store, CHANNEL_KINDS
+from core.api import is_stale
+from singleflight import FileLock, single_flight
+from ui import log
+
+
+class proxydt(datetime):
+
+    @classmethod
+    def strptime(cls, date_string, _format):
+        return datetime(*(time.strptime(date_string, _format)[:6]))
+
+
+datetime = proxydt
+_store = None
+_store_lock = threading.Lock()
+
+
+def read_file(file_path):
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.read()
+
+def get_store() -> Store:
+    global _store
+    with _store_lock:
+        if _store is None:
+            if not xbmcvfs.exists(var.profile_path):
+                xbmcvfs.mkdirs(var.profile_path)
+            _store = Store(var.db_path)
+            if _store.created:
+                migrate_json(_store)
+    return _store
+
+def migrate_json(store: Store):
+    """Import the json files used before the sqlite store, once."""
+    try:
+        if xbmcvfs.exists(var.schedule_path):
+            store.update_schedule(json.loads(read_file(var.schedule_path)), str(time.time()))
+        if xbmcvfs.exists(var.ch_path):
+            store.update_channels(json.loads(read_file(var.ch_path)), str(time.time()))
+        for fav_path in (var.fav_path, var.fav_old_path):
+            if xbmcvfs.exists(fav_path):
+                favourites = json.loads(read_file(fav_path))
+                for title, link in favourites:
+                    store.add_favourite(title, link)
+                if favourites:
+                    break
+    except Exception as e:
+        log(f'Failed to migrate json files: {e}')
+
+def refresh_in_background(store: Store):
+    """Start a separate plugin invocation that refreshes schedule and channels,
+    at most once every var.refresh_retry seconds."""
+    requested = store.get_meta('refresh_requested')
+    if requested is not None and time.time() - float(requested) < var.refresh_retry:
+        return
+    store.set_meta('refresh_requested', str(time.time()))
+    xbmc.executebuiltin(f'RunPlugin(plugin://{var.addon_id}/?mode=background_refresh)')
+
+def ensure_channels() -> Store:
+    store = get_store()
+    if not store.has_channels():
+        store.update_channels(json.loads(read_file(var.ch_bak_path)), str(time.time()))
+    if is_stale(store, 'channels_checked', var.channels_ttl):
+        refresh_in_background(store)
+    return store
+
+def show_adult() -> bool:
+    return var.get_setting('adult_pw') == 'xxXXxx'
+
+def read_channels():
+    return ensure_channels().channels(adult=show_adult())
+
+def read_channel_buckets() -> list:
+    return ensure_channels().channel_buckets(adult=show_adult())
+
+def read_channel_page(bucket, page: int, size: int):
+    """(channels, has_more) for page of bucket, every channel when bucket is
+    None. size 0 returns the whole bucket on one page."""
+    if not size:
+        return ensure_channels().channel_page(bucket, 0, -1, adult=show_adult()), False
+    channels = ensure_channels().channel_page(bucket, page * size, size + 1, adult=show_adult())
+    return channels[:size], len(channels) > size
+
+def ensure_schedule() -> Store:
+    """Store with a schedule in it. Only blocks on the very first fetch; after
+    that a stale schedule is served as is while a background refresh runs."""
+    store = get_store()
+    if not store.has_schedule():
+        from functions import write_schedule
+        single_flight(refresh_lock(), write_schedule, generation=refresh_generation)
+    elif is_stale(store, 'schedule_checked', var.schedule_ttl):
+        refresh_in_background(store)
+    return store
+
+def read_schedule() -> dict:
+    return ensure_schedule().schedule()
+
+def read_days() -> list:
+    return ensure_schedule().days()
+
+def read_categories(day: str) -> list:
+    return ensure_schedule().categories(day)
+
+def read_events(day: str, category: str) -> list:
+    return ensure_schedule().events(day, category)
+
+def get_search_results():
+    query = xbmcgui.Dialog().input('Enter search query:')
+    if not query:
+        var.system_exit()
+    keywords = search_index.keywords(query)
+    if not keywords:
+        return {'events': [], 'channels': []}
+    ensure_channels()
+    return ensure_schedule().search(keywords)
+
+def read_channel_logos(links: list) -> dict:
+    """{link: local logo file} for the channels of links whose logo is cached.
+    Nothing is downloaded here: logos not cached yet are queued for a
+    background fetch and their items keep the addon icon. A cached logo's
+    last use is only written again once it is var.logo_touch_interval old,
+    so browsing the same listings does not write to the store."""
+    if var.get_setting_bool('channel_logos') is False or not links:
+        return {}
+    store = get_store()
+    now = time.time()
+    paths = {}
+    files = []
+    wanted = []
+    for link, (logo, file, used) in store.channel_logos(links).items():
+        if file:
+            paths[link] = os.path.join(var.logo_path, file)
+            if now - used > var.logo_touch_interval:
+                files.append(file)
+        elif file is None or now - used > var.logo_retry:
+            wanted.append(logo)
+    if files:
+        store.touch_logos(files, now)
+    if wanted:
+        request_logos(wanted)
+    return paths
+
+def request_logos(urls: list):
+    """Queue logo urls for download by a separate plugin invocation. One is
+    started at most once every var.logo_request_interval seconds, also when
+    the queue already held every url, in case the last one died or never
+    ran. The queue is merged under its lock, as listings in other processes
+    and the fetch add to and take from it."""
+    store = get_store()
+    lock = profile_lock(var.logo_queue_lock_path, var.logo_queue_lock_ttl)
+    if not lock.acquire(timeout=var.logo_queue_wait):
+        return
+    try:
+        queued = set(json.loads(store.get_meta('logos_wanted') or '[]'))
+        if set(urls) - queued:
+            store.set_meta('logos_wanted', json.dumps(sorted(queued.union(urls))))
+        requested = store.get_meta('logos_requested')
+        if requested is not None and time.time() - float(requested) < var.logo_request_interval:
+            return
+        store.set_meta('logos_requested', str(time.time()))
+    finally:
+        lock.release()
+    xbmc.executebuiltin(f'RunPlugin(plugin://{var.addon_id}/?mode=fetch_logos)')
+
+def take_logos() -> list:
+    """Empty the logo queue and return the urls it held."""
+    store = get_store()
+    lock = profile_lock(var.logo_queue_lock_path, var.logo_queue_lock_ttl)
+    if not lock.acquire(timeout=var.logo_queue_wait):
+        return []
+    try:
+        wanted = json.loads(store.get_meta('logos_wanted') or '[]')
+        store.set_meta('logos_wanted', '[]')
+    finally:
+        lock.release()
+    return wanted
+
+def read_favourites() -> list:
+    return get_store().favourites()
+
+def read_favourite_links() -> set:
+    return get_store().favourite_links()
+
+def write_favourite(title, link):
+    get_store().add_favourite(title, link)
+
+def delete_favourite(link):
+    get_store().remove_favourite(link)
+
+def profile_lock(path: str, ttl: float) -> FileLock:
+    if not xbmcvfs.exists(var.profile_path):
+        xbmcvfs.mkdirs(var.profile_path)
+    return FileLock(path, ttl)
+
+def refresh_lock() -> FileLock:
+    return profile_lock(var.refresh_lock_path, var.refresh_lock_ttl)
+
+def refresh_generation() -> str:
+    return get_store().get_meta('refresh_generation') or '0'
+
+def request_prefetch(links: list):
+    """Pre-resolve links in a separate plugin invocation so listings are not held up."""
+    if links:
+        query = urlencode({'mode': 'prefetch', 'link': json.dumps(links)})
+        xbmc.executebuiltin(f'RunPlugin(plugin://{var.addon_id}/?{query})')
+
+def read_service_status() -> dict:
+    return json.loads(get_store().get_meta('service_status') or '{}')
+
+def write_service_status(status: dict):
+    status = json.dumps(status)
+    get_store().set_meta('service_status', status)
+    xbmcgui.Window(10000).setProperty(f'{var.addon_id}.service_status', status)
+
+def convert_utc_time_to_local(utc_time_str):
+    today = date.today()
+    datetime_str = f"{today} {utc_time_str}"
+    utc_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
+    local_time = utc_datetime.replace(tzinfo=timezone.utc).astimezone()
+    return local_time.strftime("%I:%M %p").lstrip('0')
+
+def local_start(event: dict) -> str:
+    """Local start time of an event from its stored UTC epoch. time.localtime
+    uses the zone libc loaded once for this process; events without an epoch
+    fall back to treating their time as today."""
+    if (starts := event.get('starts')) is not None:
+        return time.strftime('%I:%M %p', time.localtime(starts)).lstrip('0')
+    return convert_utc_time_to_local(event['time'])
+
+def read_live_events() -> list:
+    """Events that started within the last var.live_window seconds, oldest first."""
+    now = time.time()
+    return ensure_schedule().events_between(now - var.live_window, now + 1)
+
+def read_upcoming_events(hours: int) -> list:
+    now = time.time()
+    return ensure_schedule().events_between(now + 1, now + hours * 3600)
+
+def get_match_links(match):
+    """Player links of an event from the uid carried in its url. Urls saved
+    before events had uids carry the event title instead."""
+    store = get_store()
+    channels = store.event_channels(match)
+    if not channels and (item := store.event_by_title(match)):
+        channels = [
+            (kind, channel['channel_name'], channel['channel_id'])
+            for kind, key in enumerate(CHANNEL_KINDS) for channel in item[key]
+        ]
+    links = []
+    for kind, name, channel_id in channels:
+        if kind == 0:
+            links.append([name, f"/stream/stream-{channel_id}.php"])
+        else:
+            links.append([name, f"/stream/bet.php?id=bet{channel_id}"])
+    return links
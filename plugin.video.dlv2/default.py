@@ -1,8 +1,12 @@
+import time
+started = time.perf_counter()
 import sys
 from urllib.parse import parse_qsl
-from main import router
+from main import router, log_startup_time
 
 
 if __name__=='__main__':
-    router(dict(parse_qsl(sys.argv[2][1:])))
-    
\ No newline at end of file
+    imported = time.perf_counter()
+    params = dict(parse_qsl(sys.argv[2][1:]))
+    router(params)
+    log_startup_time(params.get('mode'), started, imported)
@@ -0,0 +1,124 @@
+"""M3U playlist and XMLTV guide for Kodi's IPTV Simple PVR client.
+
+Both files are written line by line from generators straight into a temp
+file that replaces the old one, so the guide never sits in memory as a
+whole and PVR never reads a half-written file. Playlist entries point back
+at this addon's play mode, so a channel is only resolved when it is tuned.
+write_exports() skips a file whose source has not changed since it was
+last written.
+"""
+import json
+import os
+import time
+from typing import Iterable, Iterator, List
+from urllib.parse import urlencode
+from xml.sax.saxutils import escape, quoteattr
+import xbmcvfs
+import variables as var
+from core import site
+from data import get_store, ensure_channels, ensure_schedule, show_adult
+from ui import log
+
+
+def export_dir() -> str:
+    folder = var.get_setting('export_folder')
+    return xbmcvfs.translatePath(folder) if folder else var.profile_path
+
+def m3u_path() -> str:
+    return os.path.join(export_dir(), var.export_m3u_name)
+
+def xmltv_path() -> str:
+    return os.path.join(export_dir(), var.export_xmltv_name)
+
+def tvg_id(channel_id: str) -> str:
+    return f'{channel_id}.{var.addon_id}'
+
+def export_channels() -> List[tuple]:
+    """(channel_id, title, link) of the 24/7 channels, adult ones only with
+    the adult password set."""
+    channels = []
+    for item in ensure_channels().channels(adult=show_adult()):
+        if stream_id := site.channel_id(item['link']):
+            channels.append((stream_id, item['title'], item['link']))
+    return channels
+
+def play_url(title: str, link: str) -> str:
+    query = urlencode({'mode': 'play', 'title': title, 'link': json.dumps([[title, link]])})
+    return f'plugin://{var.addon_id}/?{query}'
+
+def m3u_lines(channels: List[tuple]) -> Iterator[str]:
+    yield f'#EXTM3U url-tvg="{xmltv_path()}"\n'
+    for channel_id, title, link in channels:
+        name = title.replace('"', "'")
+        yield f'#EXTINF:-1 tvg-id="{tvg_id(channel_id)}" tvg-name="{name}" group-title="{var.addon_name}",{title}\n'
+        yield f'{play_url(title, link)}\n'
+
+def xmltv_time(epoch: float) -> str:
+    return time.strftime('%Y%m%d%H%M%S +0000', time.gmtime(epoch))
+
+def programme_lines(rows: Iterable[tuple], channel_ids: set) -> Iterator[str]:
+    """<programme> elements from programmes() rows. A programme ends when the
+    next one on its channel starts, or after var.export_programme_length."""
+    previous = None
+    for row in rows:
+        if row[0] not in channel_ids:
+            continue
+        if previous is not None:
+            yield programme(previous, row)
+        previous = row
+    if previous is not None:
+        yield programme(previous, None)
+
+def programme(row: tuple, following) -> str:
+    channel_id, starts, title, category = row
+    stop = starts + var.export_programme_length
+    if following is not None and following[0] == channel_id and starts < following[1] < stop:
+        stop = following[1]
+    return (
+        f'  <programme start="{xmltv_time(starts)}" stop="{xmltv_time(stop)}" channel={quoteattr(tvg_id(channel_id))}>\n'
+        f'    <title>{escape(title)}</title>\n'
+        f'    <category>{escape(category)}</category>\n'
+        '  </programme>\n'
+    )
+
+def xmltv_lines(channels: List[tuple]) -> Iterator[str]:
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield f'<tv generator-info-name={quoteattr(var.addon_id)}>\n'
+    for channel_id, title, _ in channels:
+        yield f'  <channel id={quoteattr(tvg_id(channel_id))}>\n'
+        yield f'    <display-name>{escape(title)}</display-name>\n'
+        yield '  </channel>\n'
+    yield from programme_lines(ensure_schedule().programmes(), {channel_id for channel_id, _, _ in channels})
+    yield '</tv>\n'
+
+def write_lines(path: str, lines: Iterable[str]):
+    """Stream lines into a temp file next to path and rename it over path."""
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+    os.replace(tmp_path, path)
+
+def write_exports(force: bool=False) -> List[str]:
+    """Rewrite the playlist and guide whose sources changed since the last
+    export, or both with force. Returns the paths written."""
+    store = get_store()
+    state = json.loads(store.get_meta('export_state') or '{}')
+    channels = export_channels()
+    channels_digest = f"{store.get_meta('channels_digest')}:{len(channels)}:{export_dir()}"
+    schedule_digest = store.schedule_digest()
+    if not os.path.isdir(export_dir()):
+        os.makedirs(export_dir(), exist_ok=True)
+    written = []
+    if force or state.get('m3u') != channels_digest or not os.path.exists(m3u_path()):
+        write_lines(m3u_path(), m3u_lines(channels))
+        state['m3u'] = channels_digest
+        written.append(m3u_path())
+    xmltv_digest = f'{channels_digest}:{schedule_digest}'
+    if force or state.get('xmltv') != xmltv_digest or not os.path.exists(xmltv_path()):
+        write_lines(xmltv_path(), xmltv_lines(channels))
+        state['xmltv'] = xmltv_digest
+        written.append(xmltv_path())
+    store.set_meta('export_state', json.dumps(state))
+    if written:
+        log(f"Exported {', '.join(written)}")
+    return written
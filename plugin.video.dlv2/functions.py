@@ -1,436 +1,378 @@
 import json
-import re
+import queue
 import traceback
 import time
-import base64
-from urllib.parse import quote_plus, urlparse, parse_qsl
-from datetime import datetime, date
-from typing import Union
+import threading
+from typing import Optional
 from concurrent.futures import ThreadPoolExecutor
 import requests
 from requests import Response
-from bs4 import BeautifulSoup
-from tzlocal import get_localzone
-import pytz
 import xbmc
-import xbmcgui
-import xbmcplugin
 import xbmcvfs
 import variables as var
-from models import Item
+import session
+import tracing
+import health
+import hedge
+from cache import ResolveCache, cache_key
+from core import resolvers
+from core.api import channels_from, http_get, plain_http, save_channels, save_schedule, schedule_from
+from core.scrape import parse_channels_old
+from core.site import channel_id, player_links
+from singleflight import single_flight
+# Listing and store helpers live in ui and data so directory listings can skip
+# this module.
+from ui import log, ok_dialog, get_multilink
+from data import get_store, read_file, refresh_lock, refresh_generation
 
 
-class proxydt(datetime):
+WATCH_MESSAGE = 'watch_playback'
 
-    @classmethod
-    def strptime(cls, date_string, _format):
-        return datetime(*(time.strptime(date_string, _format)[:6]))
+_resolve_cache = None
+_hop_state = threading.local()
 
 
-datetime = proxydt
+class ResolveCancelled(Exception):
+    pass
 
 
-def log(message: str):
-    return xbmc.log(str(message), xbmc.LOGINFO)
-
-def container_refresh():
-    xbmc.executebuiltin('Container.Refresh')
-
-def get(url: str, referer: str='', headers=None, timeout:int=10) -> Response:
-    headers = var.headers if headers is None else headers
-    if referer:
-        headers['Referer'] = headers['Origin'] = referer
+def _request(url: str, stage: str, fallback: bool=False, stream: bool=False, **kwargs) -> Response:
+    hop = tracing.start(url, stage, fallback)
     try:
-        return requests.get(url, headers=headers, timeout=timeout)
-        
-    except:
-        return requests.get(url.replace('https', 'http'), headers=headers, timeout=timeout, verify=False)
-
-def get_soup(response: str) -> BeautifulSoup:
-    return BeautifulSoup(response, 'html.parser')
-
-def set_info(liz: xbmcgui.ListItem, infolabels: dict, cast: list=None):
-    cast = cast or []
-    i = liz.getVideoInfoTag()
-    i.setMediaType(infolabels.get("mediatype", "video"))
-    i.setTitle(infolabels.get("title", "Unknown"))
-    i.setPlot(infolabels.get("plot", infolabels.get("title", "")))
-    i.setTagLine(infolabels.get("tagline", ""))
-    i.setPremiered(infolabels.get("premiered", ""))
-    i.setGenres(infolabels.get("genre", []))
-    i.setMpaa(infolabels.get("mpaa", ""))
-    i.setDirectors(infolabels.get("director", []))
-    i.setWriters(infolabels.get("writer", []))
-    i.setRating(infolabels.get("rating", 0))
-    i.setVotes(infolabels.get("votes", 0))
-    i.setStudios(infolabels.get("studio", []))
-    i.setCountries(infolabels.get("country", []))
-    i.setSet(infolabels.get("set", ""))
-    i.setTvShowStatus(infolabels.get("status", ""))
-    i.setDuration(infolabels.get("duration", 0))
-    i.setTrailer(infolabels.get("trailer", ""))
-
-    cast_list = []
-    for actor in cast:
-        cast_list.append(xbmc.Actor(
-            name=actor.get("name", ""),
-            role=actor.get("role", ""),
-            thumbnail=actor.get("thumbnail", "")
-        ))
-    i.setCast(cast_list)
-
-def create_listitem(item: Union[Item, dict]):
-    if isinstance(item, dict):
-        item = Item(**item)
-    is_folder = item.type == 'dir'
-    title = item.title
-    thumbnail = item.thumbnail
-    fanart = item.fanart
-    contextmenu = item.contextmenu
-    is_media = item.is_media
-    is_search = item.is_search
-    list_item = xbmcgui.ListItem(label=title)
-    list_item.setArt({'thumb': thumbnail, 'icon': thumbnail, 'poster': thumbnail, 'fanart': fanart})
-    infolabels = {
-        'mediatype': 'video',
-        'title': title,
-        'plot': title,
-    }
-    set_info(list_item, infolabels)
-    if is_folder is False and is_media is True and is_search is False:
-        list_item.setProperty('IsPlayable', 'true')
-    list_item.addContextMenuItems(contextmenu)
-    plugin_url = f'{var.plugin_url}?{item.url_encode()}'
-    xbmcplugin.addDirectoryItem(var.handle, plugin_url, list_item, is_folder)
-
-def ok_dialog(text: str):
-    xbmcgui.Dialog().ok(var.addon_name, text)
-
-def get_multilink(lists):
-    if len(lists) == 1:
-        return lists[1]
-    elif not lists:
-        var.notify_dialog(var.addon_name, 'No links were found.')
-        var.system_exit()
-        
-    labels = [l[0] for l in lists]
-    links = [l[1] for l in lists]
-    ret = xbmcgui.Dialog().select('Choose a Link', labels)
-    if ret == -1:
-        var.system_exit()
-    return links[ret]
-
-def write_file(file_path, string):
-    with open(file_path, 'w', encoding='utf-8', errors='ignore') as f:
-        f.write(string)
-
-def read_file(file_path):
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        return f.read()
+        response = session.request(url, stream=stream, **kwargs)
+    except Exception as e:
+        tracing.finish(hop, error=e)
+        raise
+    tracing.finish(hop, response, stream=stream)
+    return response
+
+def get(url: str, referer: str='', headers=None, timeout=None, stream: bool=False, stage: str='') -> Response:
+    """GET through the shared session. stage names the hop for tracing."""
+    cancel = getattr(_hop_state, 'cancel', None)
+    if cancel is not None and cancel.is_set():
+        raise ResolveCancelled(url)
+    return http_get(url, referer, headers, timeout, stream, stage, request=_request, log=log)
+
+def _channels_primary(url: str):
+    return channels_from(get, get_store(), url)
+
+def _channels_old():
+    response = get(var.channels_url_old, stage='channels_old')
+    response.raise_for_status()
+    item_list = parse_channels_old(response.text)
+    if not item_list:
+        raise ValueError('no channels found')
+    return item_list, {}
 
 def fetch_channels():
-    item_list = []
+    """(channels, validators). channels is None when 24-7-channels.php is unchanged,
+    validators is None when no mirror could be used and empty when the old
+    mirror was, so the primary page is fetched in full next time. Plain http
+    and the old mirror are hedged against the primary, see hedge.hedged."""
     try:
-        response = get(var.channels_url)
-        soup = get_soup(response.text)
-        for card in soup.select('.card'):
-            title = card.div.text
-            href = f"{var.base_url}{card['href']}"
-            channel_id = dict(parse_qsl(urlparse(href).query))['id']
-            link = f'/stream/stream-{channel_id}.php'
-            item_list.append(
-                {
-                    'title': title,
-                    'link': link
-                }
-            )
-            
+        _, result = hedge.hedged('channels', [
+            ('channels', lambda: _channels_primary(var.channels_url)),
+            ('channels_http', lambda: _channels_primary(plain_http(var.channels_url))),
+            ('channels_old', _channels_old)
+        ])
+        return result
     except Exception as e:
-        log(f'Error fetching channels json: {e}')
-        try:
-            response = get(var.channels_url_old)
-            soup = get_soup(response.text)
-            channels = []
-            for a in soup.find_all('a')[8:]:
-                title = a.text
-                link = a['href']
-                if link in channels:
-                    continue
-                channels.append(link)
-                
-                item_list.append(
-                    {
-                        'title': title,
-                        'link': link
-                    }
-                )
-                
-        except Exception as e:
-            log(f'Error fetch old format channels: {e}')
-            return json.loads(read_file(var.ch_bak_path))
-    return item_list
+        log(f'Error fetching channels: {e}')
+    if get_store().has_channels():
+        return None, None
+    return json.loads(read_file(var.ch_bak_path)), None
 
 def write_channels():
-    if not xbmcvfs.exists(var.profile_path):
-        xbmcvfs.mkdirs(var.profile_path)
-    items = fetch_channels()
-    write_file(var.ch_path, json.dumps(items))
+    items, validators = fetch_channels()
+    if save_channels(get_store(), items, validators, str(time.time())):
+        log(f'Channels refreshed, {len(items)} channels')
+    return validators is not None
 
-def read_channels():
-    if not xbmcvfs.exists(var.ch_path):
-        write_channels()
-    return json.loads(read_file(var.ch_path))
+def _schedule_from(url: str):
+    return schedule_from(get, get_store(), url)
 
 def fetch_schedule():
-    schedule_dict = {}
+    """(schedule, validators). schedule is None when index.php is unchanged or
+    could not be fetched, validators is None on failure. Plain http is hedged
+    against https, see hedge.hedged."""
     try:
-        response = get(var.schedule_url)
-        soup = get_soup(response.text)
-        for schedule in soup.select('.schedule__day'):
-            if categories := schedule.find_all(class_='schedule__category is-expanded'):
-                s_date = schedule.select_one('.schedule__dayTitle').get_text(strip=True)
-                s_date = s_date.split(' -', 1)[0].strip()
-                dict_date = schedule_dict[s_date] = {}
-            else:
-                continue
-            
-            for cat in categories:
-                cat_name = cat.select_one('.card__meta').get_text(strip=True)
-                events = dict_date[cat_name] = []
-                for event in cat.select('.schedule__event'):
-                    e_time = event.select_one('.schedule__time').get_text(strip=True)
-                    title = event.select_one('.schedule__eventTitle').get_text(strip=True)
-                    
-                    channels = []
-                    for channel in event.select_one('.schedule__channels').find_all('a'):
-                        link = f"{var.base_url}{channel['href']}"
-                        channel_id = dict(parse_qsl(urlparse(link).query))['id']
-                        channels.append({
-                            'channel_name': channel.get_text(strip=True),
-                            'channel_id': channel_id
-                        })
-                    
-                    events.append({
-                        'time': e_time,
-                        'event': title,
-                        'channels': channels,
-                        'channels2': []
-                    })
-                
+        _, result = hedge.hedged('schedule', [
+            ('schedule', lambda: _schedule_from(var.schedule_url)),
+            ('schedule_http', lambda: _schedule_from(plain_http(var.schedule_url)))
+        ])
     except Exception as e:
         log(f'Failed to fetch schedule: {e}')
-    
-    return json.dumps(schedule_dict, indent=2)
+        return None, None
+    return result
 
 def write_schedule():
-    if not xbmcvfs.exists(var.profile_path):
-        xbmcvfs.mkdirs(var.profile_path)
-    schedule = fetch_schedule()
-    write_file(var.schedule_path, schedule)
-
-def read_schedule() -> dict:
-    schedule = {}
-    if not xbmcvfs.exists(var.schedule_path):
-        write_schedule()
-    try:
-        schedule = json.loads(read_file(var.schedule_path))
-    except:
-        schedule = {}
-    return schedule
-
-def write_cat_schedule(string):
-    write_file(var.cat_schedule_path, string)
-
-def read_cat_schedule() -> list:
-    return json.loads(read_file(var.cat_schedule_path))
-
-def read_favourites() -> list:
-    if not xbmcvfs.exists(var.fav_path):
-        write_file(var.fav_path, json.dumps([]))
-    favourites = json.loads(read_file(var.fav_path))
-    if not favourites:
-        if xbmcvfs.exists(var.fav_old_path):
-            old_favs = json.loads(read_file(var.fav_old_path))
-            if old_favs:
-                write_file(var.fav_path, json.dumps(old_favs))
-                return old_favs
-    return favourites
-
-def write_favourite(title, link):
-    if not xbmcvfs.exists(var.profile_path):
-        xbmcvfs.mkdirs(var.profile_path)
-    items = read_favourites()
-    if link not in str(items):
-        items.append([title, link])
-    write_file(var.fav_path, json.dumps(items))
-
-def get_schedule_and_channels():
+    schedule, validators = fetch_schedule()
+    if (changed := save_schedule(get_store(), schedule, validators, str(time.time()))) is not None:
+        log(f'Schedule refreshed, {changed} categories rewritten')
+    return validators is not None
+
+def _refresh_schedule_and_channels() -> bool:
     with ThreadPoolExecutor() as executor:
-        executor.submit(write_schedule)
-        executor.submit(write_channels)
-
-def convert_utc_time_to_local(utc_time_str):
-        today = date.today()
-        datetime_str = f"{today} {utc_time_str}"
-        utc_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
-        utc_datetime = utc_datetime.replace(tzinfo=pytz.utc)
-        local_tz = get_localzone()
-        local_time = utc_datetime.astimezone(local_tz)
-        return local_time.strftime("%I:%M %p").lstrip('0')
-
-def get_match_links(match):
-    item = {}
-    schedule = read_cat_schedule()
-    for event in schedule:
-        if event['event'] == match:
-            item = event
-            break
-    links = []
-    channels = item.get('channels', [])
-    for channel in channels:
-        if isinstance(channel, dict):
-            links.append(
-                [
-                    channel.get('channel_name'),
-                    f"/stream/stream-{channel.get('channel_id')}.php"
-                ]
-            )
-    channels2 = item.get('channels2')
-    for channel in channels2:
-        if isinstance(channel, dict):
-            links.append(
-                [
-                    channel.get('channel_name'),
-                    f"/stream/bet.php?id=bet{channel.get('channel_id')}"
-                ]
-            )
-    return links
-
-def get_search_results():
-    stopwords = (
-        "a", "an", "and", "are", "as", "at", "be", "but", "by",
-        "for", "if", "in", "into", "is", "it", "no", "not", "of",
-        "on", "or", "such", "that", "the", "their", "then", "there",
-        "these", "they", "this", "to", "was", "will", "with"
+        futures = [executor.submit(write_schedule), executor.submit(write_channels)]
+    return all(future.result() for future in futures)
+
+def get_schedule_and_channels(wait: bool=True) -> bool:
+    """Refresh both, returns False if either site page could not be reached.
+
+    Only one process refreshes at a time. If another one is already at it this
+    either waits for it and returns without fetching again, or with wait=False
+    returns straight away and leaves the current data in place.
+    """
+    result = single_flight(
+        refresh_lock(), _refresh_schedule_and_channels, wait=wait,
+        timeout=var.refresh_lock_ttl, generation=refresh_generation
     )
-    query = xbmcgui.Dialog().input('Enter search query:')
-    if not query:
-        var.system_exit()
-    keywords = [k.lower() for k in query.split(' ') if k not in stopwords]
-
-    schedule = read_schedule()
-    
-    results = {}
-    events = results['events'] = []
-    channels = results['channels'] = []
-    for key in schedule.keys():
-        for cat in schedule[key].keys():
-            for event in schedule[key][cat]:
-                for keyword in keywords:
-                    if keyword.lower() in event['event'].lower() and event not in events:
-                        events.append(event)
-    
-    ch_list = read_channels()
-    for keyword in keywords:
-        for channel in ch_list:
-            if keyword.lower() in channel['title'].lower() and channel not in channels:
-                channels.append(channel)
-    return results
+    return result is not False
 
 def gather_streams(url):
-    php = url.split('/')[-1]
-    allowed = ['stream', 'cast', 'watch', 'plus', 'casting', 'player']
-    players = [[f'Link {index+1}', f'{var.base_url}/{a_type}/{php}'] for index, a_type in enumerate(allowed)]
+    players = health.rank(player_links(url))
     if var.get_setting_bool('autoplay') is True:
+        if var.get_setting_bool('resolve_cache') is True:
+            for _, link in players:
+                if get_resolve_cache().get(link):
+                    return link
         return players[0][1]
-    link = get_multilink(players)
+    link = get_multilink(health.annotate(players))
     if not link:
         var.system_exit()
     return link
 
+def get_resolve_cache() -> ResolveCache:
+    global _resolve_cache
+    if _resolve_cache is None:
+        if not xbmcvfs.exists(var.profile_path):
+            xbmcvfs.mkdirs(var.profile_path)
+        _resolve_cache = ResolveCache(var.resolve_cache_path, var.token_ttl, var.resolve_ttl)
+    return _resolve_cache
+
+def evict_resolved(url):
+    get_resolve_cache().evict(url)
+
+
+def request_watch(url, m3u8: str):
+    """Hand playback of a resolved url to the service's PlaybackWatcher, so the
+    plugin can return straight away. Call it before playback is started."""
+    xbmc.executeJSONRPC(json.dumps({
+        'jsonrpc': '2.0', 'id': 1, 'method': 'JSONRPC.NotifyAll',
+        'params': {
+            'sender': var.addon_id, 'message': WATCH_MESSAGE,
+            'data': {'url': url, 'm3u8': m3u8, 'since': time.time()}
+        }
+    }))
+
+def finish_watch(url, m3u8: str, ttfs: Optional[float]):
+    """Record a watched playback in the health scoreboard and evict its cached
+    resolve when it never started."""
+    health.record_playback(url, m3u8, ttfs)
+    if ttfs is None and var.get_setting_bool('resolve_cache') is True:
+        log(f'Playback failed for {cache_key(url)}, evicting cached stream')
+        evict_resolved(url)
+
+
+class PlaybackWatcher(xbmc.Player):
+    """Lives in the service. Times the playback last handed over by
+    request_watch until it starts, errors or passes var.playback_timeout."""
+
+    def __init__(self):
+        super().__init__()
+        self.pending = None
+        self.started_at = 0
+    
+    def watch(self, request: dict):
+        self.pending = request
+        if self.started_at >= request['since']:
+            self.finish(self.started_at)
+    
+    def deadline(self) -> Optional[float]:
+        return self.pending['since'] + var.playback_timeout if self.pending else None
+    
+    def finish(self, started: Optional[float]):
+        request, self.pending = self.pending, None
+        if request is not None:
+            ttfs = started - request['since'] if started is not None else None
+            finish_watch(request['url'], request['m3u8'], ttfs)
+    
+    def expire(self):
+        if self.pending and time.time() > self.deadline():
+            self.finish(None)
+    
+    def onAVStarted(self):
+        self.started_at = time.time()
+        self.finish(self.started_at)
+    
+    def onPlayBackError(self):
+        self.finish(None)
+
+
 def resolve_link(url):
-    m3u8 = None
+    use_cache = var.get_setting_bool('resolve_cache')
+    if use_cache and (m3u8 := get_resolve_cache().get(url)):
+        log(f'Resolve cache hit for {cache_key(url)}')
+        return m3u8
+    start = time.perf_counter()
     try:
-        url = gather_streams(url)
-        response = get(url)
-        soup = get_soup(response.text)
-        iframe = soup.select_one("iframe#thatframe, iframe.video")
-        
-        url2 = iframe['src']
-        
-        if 'wikisport' in url2 or 'lovecdn' in url2:
-            response = get(url2, url, timeout=60)
-            soup = get_soup(response.text)
-            url2 = soup.find('iframe')['src']
-        
-        if 'lovecdn' in url2:
-            m3u8 = url2.replace('embed.html', 'index.fmp4.m3u8')
-            referer = f'https://{urlparse(url2).netloc}'
-            m3u8 = f'{m3u8}|Referer={url2}&Connection=Keep-Alive&User-Agent={var.user_agent}'
-            return m3u8
-        
-        response = get(url2)
-        
-        if channel_key := re.search(r'const\s+CHANNEL_KEY\s*=\s*"([^"]+)"', response.text):
-            channel_key = channel_key.group(1)
-            #bundle = re.search(r'const\s+[A-Z]{4}\s*=\s*"([^"]+)"', response.text).group(1)
-            bundle = re.search(r'const\s+[A-Z]+\s*=\s*"([^"]+)"', response.text).group(1)
-            parts = json.loads(base64.b64decode(bundle).decode("utf-8"))
-            for k, v in parts.items():
-                parts[k] = base64.b64decode(v).decode("utf-8")
-            bx = [40, 60, 61, 33, 103, 57, 33, 57]
-            sc = ''.join(chr(b ^ 73) for b in bx)
-            host = "https://top2new.newkso.ru/"
-            auth_url = (
-                f'{host}{sc}'
-                f'?channel_id={quote_plus(channel_key)}&'
-                f'ts={quote_plus(parts["b_ts"])}&'
-                f'rnd={quote_plus(parts["b_rnd"])}&'
-                f'sig={quote_plus(parts["b_sig"])}'
-            )
-            get(auth_url, referer=url2)
-                
-            server_lookup_url = f"https://{urlparse(url2).netloc}/server_lookup.php?channel_id={channel_key}"
-            response = get(server_lookup_url, referer=url2).json()
-            server_key = response['server_key']
-            if server_key == "top1/cdn":
-                m3u8 = f"https://top1.newkso.ru/top1/cdn/{channel_key}/mono.m3u8"
-            else:
-                m3u8 = f"https://{server_key}new.newkso.ru/{server_key}/{channel_key}/mono.m3u8"
-            
-            referer = f'https://{urlparse(url2).netloc}'
-            m3u8 = f'{m3u8}|Referer={referer}/&Origin={referer}&Connection=Keep-Alive&User-Agent={var.user_agent}'
-        
-        elif match := re.search(r"atob\('([^']+)'\)", response.text):
-            b64_str = match.group(1)
-            decoded = base64.b64decode(b64_str).decode('utf-8', errors='ignore')
-            init_url = re.search(r'initUrl\s*=\s*"([^"]+)"', decoded)
-            if init_url:
-                m3u8 = init_url.group(1)
-                r_m3u8 = get(m3u8)
-                m3u8 = base64.b64decode(r_m3u8.text).decode("utf-8")
-                referer = f'https://{urlparse(url2).netloc}'
-                m3u8 = f'{m3u8}|Referer={url2}&Connection=Keep-Alive&User-Agent={var.user_agent}'
-        
-        
-        elif 'blogspot.com' in url2:
-            channel_id = dict(parse_qsl(urlparse(url2).query)).get('id')
-            pattern = rf'"{re.escape(channel_id)}"\s*:\s*\{{[^}}]*?url:\s*"([^"]+)"'
-            match = re.search(pattern, response.text, re.DOTALL)
-            if match:
-                m3u8 = match.group(1)
-                referer = f'https://{urlparse(url2).netloc}'
-                m3u8 = f'{m3u8}|Referer={referer}/&Origin={referer}&Connection=Keep-Alive&User-Agent={var.user_agent}'
-        
-        elif match := re.search(r"var\s+PlayS\s*=\s*'([^']+)'", response.text):
-            m3u8 = match.group(1)
-            referer = f'https://{urlparse(url2).netloc}'
-            m3u8 = f'{m3u8}|Referer={referer}/&Origin={referer}&Connection=Keep-Alive&User-Agent={var.user_agent}'
-            
+        m3u8, info = resolve_stream(url)
     except Exception:
+        tracing.span('resolve', url, time.perf_counter() - start, 'failed')
         ok_dialog(f'Error loading stream:\n{traceback.format_exc()}')
         log(f'Error loading stream:\n{traceback.format_exc()}')
         var.system_exit()
+    tracing.span('resolve', url, time.perf_counter() - start, 'ok' if m3u8 else 'no stream')
+    if m3u8 and use_cache:
+        get_resolve_cache().put(url, m3u8, **info)
     return m3u8
+
+def re_resolve(url) -> Optional[str]:
+    """Resolve url again and replace its cached stream. Unlike resolve_link
+    this never shows a dialog, for callers running in the service."""
+    evict_resolved(url)
+    m3u8, info = resolve_stream(url)
+    if m3u8:
+        get_resolve_cache().put(url, m3u8, **info)
+    return m3u8
+
+def split_m3u8(m3u8: str):
+    """Split a kodi 'url|Header=value&...' string into url and headers dict."""
+    url, _, header_str = m3u8.partition('|')
+    headers = {}
+    for pair in header_str.split('&'):
+        key, _, value = pair.partition('=')
+        if key and key != 'Connection':
+            headers[key] = value
+    return url, headers
+
+def is_reachable(m3u8: str, timeout=(3.05, 5)) -> bool:
+    url, headers = split_m3u8(m3u8)
+    try:
+        response = get(url, headers=headers, timeout=timeout, stage='playlist')
+    except requests.RequestException:
+        return False
+    return response.ok and '#EXTM3U' in response.text[:1024]
+
+def set_hop_cancel(cancel: Optional[threading.Event]):
+    """Make requests on this thread raise ResolveCancelled once cancel is set."""
+    _hop_state.cancel = cancel
+
+def _race_worker(label: str, url: str, cancel: threading.Event) -> dict:
+    set_hop_cancel(cancel)
+    start = time.perf_counter()
+    result = {'label': label, 'url': url, 'm3u8': None, 'outcome': 'failed'}
+    try:
+        m3u8, info = resolve_stream(url)
+        if not m3u8:
+            result['outcome'] = 'no stream'
+        elif cancel.is_set():
+            result['outcome'] = 'cancelled'
+        elif is_reachable(m3u8):
+            result.update(m3u8=m3u8, info=info, outcome='ok')
+        else:
+            result['outcome'] = 'unreachable'
+    except ResolveCancelled:
+        result['outcome'] = 'cancelled'
+    except Exception as e:
+        result['outcome'] = f'error: {e}'
+    finally:
+        set_hop_cancel(None)
+    result['elapsed'] = round(time.perf_counter() - start, 3)
+    tracing.span('resolve', url, result['elapsed'], result['outcome'])
+    return result
+
+def run_daemons(fn, jobs: list, workers: int, arrived: Optional[threading.Event]=None) -> queue.Queue:
+    """Call fn(*job) for every job on daemon threads, at most workers at a
+    time, and put each result on the returned queue, setting arrived after
+    each one; fn must not raise. Unlike pool threads, workers still blocked
+    in a request when the caller gives up do not hold up the end of the
+    plugin invocation."""
+    results = queue.Queue()
+    slots = threading.Semaphore(workers)
+
+    def run(job):
+        with slots:
+            results.put(fn(*job))
+        if arrived is not None:
+            arrived.set()
+
+    for job in jobs:
+        threading.Thread(target=run, args=(job,), daemon=True).start()
+    return results
+
+def race_streams(url, timeout: int=var.race_timeout):
+    """Resolve every player variant of url concurrently and return
+    (player_url, m3u8, report) for the first one with a reachable playlist.
+    Variants still running are cancelled at their next hop. report holds
+    label, url, elapsed seconds and outcome for each variant."""
+    players = health.rank(player_links(url))
+    use_cache = var.get_setting_bool('resolve_cache')
+    if use_cache:
+        for label, player_url in players:
+            if m3u8 := get_resolve_cache().get(player_url):
+                log(f'Resolve cache hit for {cache_key(player_url)}')
+                return player_url, m3u8, []
     
-    
\ No newline at end of file
+    cancel = threading.Event()
+    workers = max(1, min(len(players), var.get_setting_int('race_workers') or 3))
+    results = run_daemons(_race_worker, [(label, player_url, cancel) for label, player_url in players], workers)
+    deadline = time.monotonic() + timeout
+    report = []
+    winner = None
+    try:
+        while len(report) < len(players):
+            result = results.get(timeout=max(0, deadline - time.monotonic()))
+            report.append(result)
+            if result['outcome'] == 'ok':
+                winner = result
+                break
+    except queue.Empty:
+        log(f'Player race timed out after {timeout}s')
+    finally:
+        cancel.set()
+    
+    finished = [result['url'] for result in report]
+    for label, player_url in players:
+        if player_url not in finished:
+            report.append({'label': label, 'url': player_url, 'm3u8': None, 'outcome': 'cancelled', 'elapsed': None})
+    for result in report:
+        elapsed = f" in {result['elapsed']}s" if result['elapsed'] is not None else ''
+        log(f"Player race {result['label']} {cache_key(result['url'])}: {result['outcome']}{elapsed}")
+    if winner is None:
+        return None, None, report
+    if use_cache:
+        get_resolve_cache().put(winner['url'], winner['m3u8'], **winner['info'])
+    return winner['url'], winner['m3u8'], report
+
+def resolve_remote(api_url: str, url):
+    """Resolve a player url through a core.server at api_url. Returns (m3u8, {});
+    the server caches the token, so the local cache keeps it for resolve_ttl."""
+    channel = channel_id(url)
+    response = get(
+        f"{api_url.rstrip('/')}/resolve/{channel}?player={health.player_type(url)}",
+        headers={}, timeout=var.api_timeout, stage='api'
+    )
+    if response.status_code == 404:
+        return None, {}
+    response.raise_for_status()
+    return response.json()['m3u8'], {}
+
+def resolve_stream(url):
+    """Run the resolver chain for a player url. Returns (m3u8, info) where info
+    holds the server_key and auth timestamp used for caching. The outcome
+    goes into the health scoreboard unless the resolve was cancelled. With
+    api_url set the resolve is left to a core.server."""
+    start = time.perf_counter()
+    try:
+        if api_url := var.get_setting('api_url'):
+            m3u8, info = resolve_remote(api_url, url)
+        else:
+            m3u8, info = resolvers.resolve(url, get, lambda message: log(message, xbmc.LOGDEBUG))
+    except ResolveCancelled:
+        raise
+    except Exception:
+        health.record_resolve(url, time.perf_counter() - start, None)
+        raise
+    health.record_resolve(url, time.perf_counter() - start, m3u8)
+    return m3u8, info
@@ -0,0 +1,94 @@
+"""Health scoreboard for player types and the CDN servers they resolve to.
+
+Every resolve and every playback start folds into moving averages of
+resolve latency, failure rate and time to first frame, kept in the store
+per player type (stream, cast, ...) and per server host. rank() orders
+player links by their expected time to a playing stream, so autoplay, the
+player race and prefetch try the best one first, and annotate() adds the
+figures to the link picker.
+"""
+import time
+from typing import List, Optional
+from urllib.parse import urlparse
+import variables as var
+from data import get_store
+from ui import log
+
+
+PLAYER = 'player'
+SERVER = 'server'
+
+
+def enabled() -> bool:
+    return var.get_setting_bool('rank_players') is True
+
+def player_type(player_url: str) -> str:
+    return urlparse(player_url).path.strip('/').split('/')[0]
+
+def server_host(m3u8: str) -> str:
+    return urlparse(m3u8.partition('|')[0]).netloc
+
+def _record(kind: str, key: str, **kwargs):
+    try:
+        get_store().record_health(kind, key, var.health_alpha, time.time(), **kwargs)
+    except Exception as e:
+        log(f'Could not record {kind} health for {key}: {e}')
+
+def record_resolve(player_url: str, elapsed: float, m3u8: Optional[str]):
+    """A finished resolve of player_url. No m3u8 counts as a failure."""
+    if not m3u8:
+        _record(PLAYER, player_type(player_url), failed=True)
+        return
+    server = server_host(m3u8)
+    _record(PLAYER, player_type(player_url), latency=elapsed, detail=server)
+    _record(SERVER, server, latency=elapsed)
+
+def record_playback(player_url: str, m3u8: str, ttfs: Optional[float]):
+    """Playback of m3u8 started after ttfs seconds, or never when ttfs is None."""
+    failed = ttfs is None
+    _record(PLAYER, player_type(player_url), failed=failed, ttfs=ttfs)
+    _record(SERVER, server_host(m3u8), failed=failed, ttfs=ttfs)
+
+def score(stats: Optional[dict]) -> float:
+    """Expected seconds to a playing stream; lower is better. Failures cost
+    var.health_failure_penalty, untested candidates var.health_untested."""
+    if not stats:
+        return var.health_untested
+    latency = stats['latency'] if stats['latency'] is not None else var.health_untested / 2
+    ttfs = stats['ttfs'] if stats['ttfs'] is not None else var.health_untested / 2
+    return latency + ttfs + stats['failure'] * var.health_failure_penalty
+
+def player_score(stats: Optional[dict], servers: dict) -> float:
+    """Score of a player type, counting the failures of the server it last
+    resolved to on top of its own."""
+    value = score(stats)
+    if stats and (server := servers.get(stats['detail'])):
+        value += server['failure'] * var.health_failure_penalty / 2
+    return value
+
+def rank(players: List[list]) -> List[list]:
+    """[label, player_url] pairs best first. Ties keep their order."""
+    if not enabled():
+        return players
+    store = get_store()
+    stats, servers = store.health(PLAYER), store.health(SERVER)
+    return sorted(players, key=lambda p: player_score(stats.get(player_type(p[1])), servers))
+
+def annotate(players: List[list]) -> List[list]:
+    """players with their recent latency and failure rate added to each label."""
+    if not enabled():
+        return players
+    stats = get_store().health(PLAYER)
+    annotated = []
+    for label, player_url in players:
+        entry = stats.get(player_type(player_url))
+        if not entry:
+            annotated.append([f'{label}  (untested)', player_url])
+            continue
+        figures = [f"{entry['failure']:.0%} failed"]
+        if entry['latency'] is not None:
+            figures.insert(0, f"{entry['latency'] + (entry['ttfs'] or 0):.1f}s")
+        if entry['detail']:
+            figures.append(entry['detail'].split('.')[0])
+        annotated.append([f"{label}  ({', '.join(figures)})", player_url])
+    return annotated
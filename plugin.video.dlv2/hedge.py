@@ -0,0 +1,96 @@
+"""Hedged fetches across mirrors of the same page.
+
+hedged() starts the mirror that answered last time and, when it has not
+answered by its deadline, also starts the next one, taking whichever
+returns a valid result first. A mirror's deadline is the p95 of its recent
+fetch times from the store, so a slow mirror is hedged early and a fast one
+is left alone. A fallback that wins is tried first for the next
+var.hedge_preference_ttl seconds, after which the primary, the first
+mirror, leads again.
+"""
+import json
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+import variables as var
+from data import get_store
+from tracing import percentile
+from ui import log
+
+
+def _run(name: str, fn: Callable, results: queue.Queue):
+    """Put (name, elapsed, result, error) of fn on results."""
+    start = time.perf_counter()
+    try:
+        result, error = fn(), None
+    except Exception as e:
+        result, error = None, e
+    results.put((name, time.perf_counter() - start, result, error))
+
+def samples(name: str) -> List[float]:
+    return json.loads(get_store().get_meta(f'hedge_samples_{name}') or '[]')
+
+def record(name: str, elapsed: float):
+    recent = (samples(name) + [round(elapsed, 3)])[-var.hedge_samples:]
+    get_store().set_meta(f'hedge_samples_{name}', json.dumps(recent))
+
+def deadline(name: str) -> float:
+    """Seconds to wait for mirror name before starting the next one."""
+    recent = samples(name)
+    if len(recent) < var.hedge_min_samples:
+        return var.hedge_delay
+    return min(var.hedge_max_delay, max(var.hedge_min_delay, percentile(recent, 95)))
+
+def preferred(group: str) -> Optional[str]:
+    """The fallback mirror of group that won within var.hedge_preference_ttl."""
+    try:
+        name, since = json.loads(get_store().get_meta(f'hedge_{group}') or 'null')
+    except (TypeError, ValueError):
+        return None
+    return name if time.time() - since < var.hedge_preference_ttl else None
+
+def hedged(group: str, mirrors: List[Tuple[str, Callable]]):
+    """Run mirrors, pairs of (name, fn), until one fn returns. fn raises when
+    its mirror gave no usable result, which starts the next one right away.
+    Returns (name, result) of the first to succeed and re-raises the last
+    error when all of them fail. Every mirror runs on a daemon thread, so
+    one that loses keeps running in the background with its result dropped
+    but does not hold up the end of the plugin invocation."""
+    store = get_store()
+    primary = mirrors[0][0]
+    preference = preferred(group)
+    waiting = sorted(mirrors, key=lambda m: m[0] != preference)
+    results = queue.Queue()
+    running = 0
+    error = None
+
+    def start_next() -> float:
+        nonlocal running
+        name, fn = waiting.pop(0)
+        threading.Thread(target=_run, args=(name, fn, results), daemon=True).start()
+        running += 1
+        return deadline(name)
+
+    timeout = start_next()
+    while running:
+        try:
+            name, elapsed, result, e = results.get(timeout=timeout if waiting else None)
+        except queue.Empty:
+            log(f'{group}: no answer after {timeout:.2f}s, hedging with {waiting[0][0]}')
+            timeout = start_next()
+            continue
+        running -= 1
+        if e is not None:
+            log(f'{group}: {name} failed: {e}')
+            error = e
+            if waiting:
+                timeout = start_next()
+            continue
+        record(name, elapsed)
+        if name == primary and preference is not None:
+            store.set_meta(f'hedge_{group}', 'null')
+        elif name != primary and name != preference:
+            store.set_meta(f'hedge_{group}', json.dumps([name, time.time()]))
+        return name, result
+    raise error
@@ -0,0 +1,199 @@
+"""Link picker that checks an event's channels while it is open.
+
+pick() shows the picker straight away and meanwhile checks every channel on
+a small pool: it resolves the channel's best ranked players, times the
+playlist request and reads one segment for the stream's bitrate. Kodi's
+select dialog cannot be updated in place, so whenever results come in it is
+closed and reopened with dead channels dropped, working ones sorted by how
+fast their playlist answered and their figures added to the label. The
+highlighted channel is kept across reopens. The last reopen, once every
+channel is checked, waits for the user as usual.
+"""
+import re
+import threading
+import time
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin
+import requests
+import xbmc
+import xbmcgui
+import variables as var
+import functions as func
+import health
+
+
+SELECT_DIALOG = 12000
+CHECKING = 'checking'
+_bandwidth_re = re.compile(r'BANDWIDTH=(\d+)')
+_extinf_re = re.compile(r'#EXTINF:\s*([\d.]+)')
+
+
+def segment_bitrate(text: str, url: str, headers: dict) -> Optional[int]:
+    """Bits per second of the last segment of a media playlist, from its size
+    and EXTINF duration."""
+    segment = None
+    duration = None
+    for line in text.splitlines():
+        line = line.strip()
+        if match := _extinf_re.match(line):
+            duration = float(match.group(1))
+        elif line and not line.startswith('#') and duration:
+            segment = (urljoin(url, line), duration)
+    if segment is None:
+        return None
+    try:
+        with func.get(segment[0], headers=headers, timeout=var.link_check_timeout, stream=True, stage='segment') as response:
+            if not response.ok:
+                return None
+            size = int(response.headers.get('Content-Length') or 0)
+            if not size:
+                size = sum(len(chunk) for chunk in response.iter_content(chunk_size=65536))
+    except (requests.RequestException, ValueError):
+        return None
+    return int(size * 8 / segment[1])
+
+def probe(m3u8: str) -> Optional[Tuple[float, Optional[int]]]:
+    """(latency, bitrate) of a resolved m3u8: seconds until its playlist
+    loaded and bits per second, or None when the playlist does not load. A
+    master playlist gives the bitrate of its best variant."""
+    url, headers = func.split_m3u8(m3u8)
+    start = time.perf_counter()
+    try:
+        response = func.get(url, headers=headers, timeout=var.link_check_timeout, stage='playlist')
+    except requests.RequestException:
+        return None
+    latency = time.perf_counter() - start
+    text = response.text
+    if not response.ok or '#EXTM3U' not in text[:1024]:
+        return None
+    if bandwidths := _bandwidth_re.findall(text):
+        return latency, max(int(bandwidth) for bandwidth in bandwidths)
+    return latency, segment_bitrate(text, url, headers)
+
+def check(label: str, link: str, cancel: threading.Event) -> dict:
+    """Resolve and probe one channel link, trying its var.link_check_players
+    best ranked players. Working streams go into the resolve cache."""
+    func.set_hop_cancel(cancel)
+    result = {'label': label, 'link': link, 'player_url': None, 'm3u8': None, 'outcome': 'dead'}
+    cache = func.get_resolve_cache() if var.get_setting_bool('resolve_cache') is True else None
+    try:
+        for _, player_url in health.rank(func.player_links(link))[:var.link_check_players]:
+            try:
+                m3u8 = cache.get(player_url) if cache is not None else None
+                if not m3u8:
+                    m3u8, info = func.resolve_stream(player_url)
+                    if m3u8 and cache is not None:
+                        cache.put(player_url, m3u8, **info)
+            except func.ResolveCancelled:
+                result['outcome'] = 'cancelled'
+                break
+            except Exception as e:
+                func.log(f'Link check {label} {player_url} failed: {e}')
+                continue
+            if m3u8 and (figures := probe(m3u8)):
+                result.update(player_url=player_url, m3u8=m3u8, latency=figures[0], bitrate=figures[1], outcome='ok')
+                break
+    finally:
+        func.set_hop_cancel(None)
+    return result
+
+def entry_label(entry: dict) -> str:
+    if entry['outcome'] == CHECKING:
+        return f"{entry['label']}  (checking...)"
+    figures = [f"{entry['latency']:.1f}s"]
+    if entry['bitrate']:
+        figures.append(f"{entry['bitrate'] / 1e6:.1f} Mbps")
+    return f"{entry['label']}  ({', '.join(figures)})"
+
+def visible(entries: List[dict]) -> List[dict]:
+    """Working entries fastest first, then the ones still being checked in
+    their original order. Dead ones are left out."""
+    working = sorted((e for e in entries if e['outcome'] == 'ok'), key=lambda e: e['latency'])
+    return working + [e for e in entries if e['outcome'] == CHECKING]
+
+
+class PickerState:
+    """What the picker loop and its watcher thread share."""
+
+    def __init__(self):
+        self.arrived = threading.Event()
+        self.finished = False
+        self.open = False
+        self.reopen = False
+        self.position = -1
+
+
+def _watch(state: PickerState):
+    """Close the open picker shortly after results arrive, noting the
+    highlighted row, so the picker loop reopens it with them."""
+    while not state.finished:
+        state.arrived.wait()
+        time.sleep(var.link_check_settle)
+        if state.finished:
+            return
+        if not state.open or xbmcgui.getCurrentWindowDialogId() != SELECT_DIALOG:
+            continue
+        state.arrived.clear()
+        position = xbmc.getInfoLabel('Container(3).CurrentItem')
+        state.position = int(position) - 1 if position.isdigit() else -1
+        state.reopen = True
+        xbmc.executebuiltin('Dialog.Close(selectdialog,true)')
+
+def pick(links: List[list]) -> Optional[dict]:
+    """Let the user pick one of links, [label, link] pairs, while they are
+    checked. Returns the picked entry with its 'link', 'player_url' and
+    'm3u8', the last two None unless its check found a working stream, or
+    None when nothing was picked."""
+    by_link = {}
+    for label, link in links:
+        by_link.setdefault(link, {'label': label, 'link': link, 'player_url': None, 'm3u8': None, 'outcome': CHECKING})
+    entries = list(by_link.values())
+    cancel = threading.Event()
+    state = PickerState()
+
+    def run(label: str, link: str) -> dict:
+        try:
+            result = check(label, link, cancel)
+        except Exception as e:
+            func.log(f'Link check {label} failed: {e}')
+            result = {'label': label, 'link': link, 'player_url': None, 'm3u8': None, 'outcome': 'dead'}
+        return result
+
+    jobs = [(entry['label'], entry['link']) for entry in entries]
+    results = func.run_daemons(run, jobs, max(1, var.link_check_workers), state.arrived)
+    threading.Thread(target=_watch, args=(state,), daemon=True).start()
+    shown = []
+    picked = None
+    try:
+        while True:
+            state.arrived.clear()
+            while not results.empty():
+                result = results.get()
+                by_link[result['link']].update(result)
+            pending = sum(1 for e in entries if e['outcome'] == CHECKING)
+            highlighted = shown[state.position]['link'] if 0 <= state.position < len(shown) else None
+            shown = visible(entries)
+            if not shown:
+                var.notify_dialog(var.addon_name, 'No working links were found.', icon=var.addon_icon)
+                break
+            heading = 'Choose a Link'
+            if pending:
+                heading = f'{heading} ({len(entries) - pending}/{len(entries)} checked)'
+            preselect = next((i for i, e in enumerate(shown) if e['link'] == highlighted), -1)
+            state.reopen = False
+            state.open = pending > 0
+            ret = xbmcgui.Dialog().select(heading, [entry_label(e) for e in shown], preselect=preselect)
+            state.open = False
+            if ret >= 0:
+                picked = shown[ret]
+                break
+            if not state.reopen:
+                break
+    finally:
+        state.finished = True
+        state.arrived.set()
+        cancel.set()
+    if picked is not None:
+        report = ', '.join(f"{e['label']}: {e['outcome']}" for e in entries)
+        func.log(f"Link check picked {picked['label']} ({report})")
+    return picked
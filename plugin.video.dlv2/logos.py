@@ -0,0 +1,97 @@
+"""Channel logo cache.
+
+Listings only ever read logos that are already on disk, see
+data.read_channel_logos. The ones they miss are queued in the store and
+fetched here by a separate plugin invocation: in parallel on a small pool,
+shrunk to list thumbnail size when Pillow is available, and written to
+var.logo_path. The least recently listed logos are dropped once the cache
+grows past var.logo_cache_bytes.
+"""
+import hashlib
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+import variables as var
+import functions as func
+import data
+from singleflight import single_flight
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+IMAGE_TYPES = {'image/png': '.png', 'image/jpeg': '.jpg', 'image/gif': '.gif', 'image/webp': '.webp'}
+
+
+def shrink(body: bytes, ext: str) -> Tuple[bytes, str]:
+    """body scaled down to fit var.logo_size, as png. Unchanged without Pillow
+    or when the image cannot be read."""
+    if Image is None:
+        return body, ext
+    try:
+        with Image.open(io.BytesIO(body)) as image:
+            if max(image.size) <= var.logo_size:
+                return body, ext
+            image.thumbnail((var.logo_size, var.logo_size))
+            out = io.BytesIO()
+            image.save(out, 'PNG', optimize=True)
+            return out.getvalue(), '.png'
+    except Exception as e:
+        func.log(f'Could not scale logo: {e}')
+        return body, ext
+
+def download(url: str) -> Optional[str]:
+    """Fetch url into the cache and record it. Returns the file name, or None
+    after recording the failure so it is not retried for var.logo_retry."""
+    store = func.get_store()
+    try:
+        response = func.get(url, timeout=var.logo_timeout, stage='logo')
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+        if not response.ok or content_type not in IMAGE_TYPES:
+            raise ValueError(f'{response.status_code} {content_type}')
+        body, ext = shrink(response.content, IMAGE_TYPES[content_type])
+        file = f"{hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]}{ext}"
+        path = os.path.join(var.logo_path, file)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        func.log(f'Logo {url} failed: {e}')
+        store.put_logo(url, '', 0, time.time())
+        return None
+    store.put_logo(url, file, len(body), time.time())
+    return file
+
+def fetch_wanted() -> int:
+    """Download the queued logos that are not cached, then evict down to the
+    size cap. Returns how many were downloaded. Only one invocation fetches
+    at a time; one started meanwhile leaves the queue to it."""
+    lock = data.profile_lock(var.logo_fetch_lock_path, var.logo_fetch_lock_ttl)
+    return single_flight(lock, _fetch_wanted, wait=False) or 0
+
+def _fetch_wanted() -> int:
+    store = func.get_store()
+    wanted = data.take_logos()
+    cached = store.logo_entries(wanted)
+    now = time.time()
+    urls = [
+        url for url in wanted
+        if url not in cached or (not cached[url][0] and now - cached[url][1] > var.logo_retry)
+    ]
+    if not urls:
+        return 0
+    os.makedirs(var.logo_path, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=var.logo_workers) as executor:
+        fetched = sum(1 for file in executor.map(download, urls) if file)
+    for file in store.evict_logos(var.logo_cache_bytes):
+        try:
+            os.remove(os.path.join(var.logo_path, file))
+        except OSError:
+            pass
+    func.log(f'Fetched {fetched} of {len(urls)} channel logos')
+    return fetched
@@ -1,21 +1,53 @@
 import json
+import time
 from html.parser import unescape
+from urllib.parse import urlencode
+import xbmc
 import variables as var
-import functions as func
+import data
+import ui
 from models import Item, Category, Channel
 
 
+FAV_LABELS = {
+    'add_fav': 'Add to favourite channels',
+    'remove_fav': 'Remove from favourite channels'
+}
+_fav_queries = {}
+ALL_CHANNELS = 'all'
+
+
+def favourite_menu(title: str, link: str, is_favourite: bool, is_search: bool=False) -> list:
+    """Add/remove favourite context menu. The mode part of the url is encoded
+    once per listing, only title and link are encoded per item."""
+    mode = 'remove_fav' if is_favourite else 'add_fav'
+    if (mode, is_search) not in _fav_queries:
+        params = {'mode': mode, 'is_search': True} if is_search else {'mode': mode}
+        _fav_queries[(mode, is_search)] = urlencode(params)
+    query = f"{urlencode({'title': title, 'link': link})}&{_fav_queries[(mode, is_search)]}"
+    return [(FAV_LABELS[mode], f'RunPlugin({var.plugin_url}?{query})')]
+
 def main_menu():
-    func.create_listitem(
+    items = [
         Item(
             title='Channels',
             type='dir',
             mode='channels'
+        ),
+        Item(
+            title='Live Now',
+            type='dir',
+            mode='live'
+        ),
+        Item(
+            title='Starting Soon',
+            type='dir',
+            mode='upcoming'
         )
-    )
+    ]
     
-    for key in func.read_schedule():
-        func.create_listitem(
+    for key in data.read_days():
+        items.append(
             Item(
                 title=key.split(' -')[0].strip(),
                 type='dir',
@@ -24,7 +56,7 @@ def main_menu():
             )
         )
     
-    func.create_listitem(
+    items.append(
         Item(
             'Favourite Channels',
             type='dir',
@@ -32,7 +64,7 @@ def main_menu():
         )
     )
     
-    func.create_listitem(
+    items.append(
         Item(
             'Search',
             type='dir',
@@ -40,144 +72,186 @@ def main_menu():
         )
     )
     
-    func.create_listitem(
+    refresh_title = 'Refresh Schedule'
+    if last_refresh := data.read_service_status().get('last_success'):
+        refresh_title = f"{refresh_title} [COLOR grey](updated {time.strftime('%H:%M', time.localtime(last_refresh))})[/COLOR]"
+    items.append(
         Item(
-            'Refresh Schedule',
+            refresh_title,
             mode='refresh',
             is_media=False
         )
     )
+    ui.render_items(items)
 
-def get_channels(search_results: list=None):
-    password = var.get_setting('adult_pw')
-    saved_favs = func.read_favourites()
-    is_search = search_results is not None
-    items = func.read_channels() if is_search is False else search_results
-    for item in items:
-        title = item['title']
-        if '18+' in title and password != 'xxXXxx':
-            continue
-        link = item['link']
-        if link not in str(saved_favs):
-            cm_label = 'Add to favourite channels'
-            cm_mode = 'add_fav'
-        else:
-            cm_label = 'Remove from favourite channels'
-            cm_mode = 'remove_fav'
-        cm_item = Item(
-            title=title,
-            mode=cm_mode,
-            link=link,
+def channel_items(channels: list, is_search: bool=False) -> list:
+    saved_favs = data.read_favourite_links()
+    logos = data.read_channel_logos([item['link'] for item in channels])
+    return [
+        Channel(
+            title=item['title'],
+            link=json.dumps([[item['title'], item['link']]]),
+            thumbnail=logos.get(item['link'], var.addon_icon),
+            contextmenu=favourite_menu(item['title'], item['link'], item['link'] in saved_favs, is_search),
             is_search=is_search
-        )
-        cm_url = f'{var.plugin_url}?{cm_item.url_encode()}'
-        cm_url = f'RunPlugin({cm_url})'
-        link = json.dumps([[title, link]])
-        
-        func.create_listitem(
-            Channel(
-                title=title,
-                link=link,
-                contextmenu=[(cm_label, cm_url)],
-                is_search=is_search
-            )
-        )
+        ) for item in channels
+    ]
+
+def get_channels(search_results: list=None):
+    """Every channel on one page, or the channels found by a search."""
+    if search_results is None:
+        channels = data.read_channels()
+    else:
+        show_adult = data.show_adult()
+        channels = [item for item in search_results if show_adult or '18+' not in item['title']]
+    ui.render_items(channel_items(channels, search_results is not None))
+
+def get_channel_index():
+    """A-Z index of the channels with an All channels folder on top, or the
+    first page of all channels when the index is turned off."""
+    if var.get_setting_bool('channels_az') is False:
+        get_channel_page(ALL_CHANNELS, 0)
+        return
+    items = [Item(title='All channels', type='dir', mode='channel_page', title2=ALL_CHANNELS)]
+    for bucket, count in data.read_channel_buckets():
+        items.append(Item(title=f'{bucket} ({count})', type='dir', mode='channel_page', title2=bucket))
+    ui.render_items(items)
+
+def get_channel_page(bucket: str, page: int):
+    size = var.get_setting_int('channels_page_size')
+    channels, has_more = data.read_channel_page(None if bucket == ALL_CHANNELS else bucket, page, size)
+    items = channel_items(channels)
+    if has_more:
+        items.append(Item(title='Next page', type='dir', mode='channel_page', title2=bucket, page=page + 1))
+    ui.render_items(items)
 
 def get_categories(date):
-    for key in func.read_schedule()[date].keys():
-        func.create_listitem(
-            Category(
-                title=key,
-                title2=date,
-            )
-        )
+    ui.render_items(
+        Category(
+            title=key,
+            title2=date,
+        ) for key in data.read_categories(date)
+    )
 
-def get_matches(category, date, search_results: list=None):
-    is_search = search_results is not None
-    schedule = func.read_schedule()[date][category] if is_search is False else search_results
-    func.write_cat_schedule(json.dumps(schedule))
-    for match in schedule:
+def event_link(event: dict) -> str:
+    """Stream link of the first channel showing event, '' when it has none."""
+    for channel in event.get('channels', [])[:1]:
+        return f"/stream/stream-{channel['channel_id']}.php"
+    return ''
+
+def event_items(events: list, is_search: bool=False, show_category: bool=False) -> list:
+    items = []
+    logos = data.read_channel_logos([link for link in map(event_link, events) if link])
+    for match in events:
         title = match['event']
         clean_title = unescape(title)
-        start_time = match.get('time', '')
-        try:
-            clean_title = f'{func.convert_utc_time_to_local(start_time)} - {clean_title}' if start_time else clean_title
-        except:
-            pass
+        if match.get('time'):
+            try:
+                clean_title = f'{data.local_start(match)} - {clean_title}'
+            except:
+                pass
+        if show_category is True:
+            clean_title = f"{clean_title} [COLOR grey]({match['category']})[/COLOR]"
         
-        func.create_listitem(
+        items.append(
             Channel(
                 title=clean_title,
-                title2=title,
+                title2=match.get('uid') or title,
+                thumbnail=logos.get(event_link(match), var.addon_icon),
                 is_search=is_search
             )
         )
+    return items
+
+def get_matches(category, date, search_results: list=None):
+    is_search = search_results is not None
+    schedule = data.read_events(date, category) if is_search is False else search_results
+    ui.render_items(event_items(schedule, is_search=is_search))
+    
+    if is_search is False and var.get_setting_bool('prefetch_category') is True:
+        links = [link for link in map(event_link, schedule[:var.prefetch_category_events]) if link]
+        data.request_prefetch(links)
+
+def get_live():
+    ui.render_items(event_items(data.read_live_events(), show_category=True))
+
+def get_upcoming():
+    hours = var.get_setting_int('upcoming_hours') or 3
+    ui.render_items(event_items(data.read_upcoming_events(hours), show_category=True))
 
 def get_favourites():
-    items = func.read_favourites()
-    for title, link in items:
-        cm_label = 'Remove from favourite channels'
-        cm_mode = 'remove_fav'
-        cm_item = Item(
-            title=title,
-            mode=cm_mode,
-            link=link
-        )
-        cm_url = f'{var.plugin_url}?{cm_item.url_encode()}'
-        cm_url = f'RunPlugin({cm_url})'
-        func.create_listitem(
-            Channel(
-                title,
-                link=json.dumps([[title, link]]),
-                contextmenu=[(cm_label, cm_url)]
-            )
-        )
+    favourites = data.read_favourites()
+    logos = data.read_channel_logos([link for _, link in favourites])
+    ui.render_items(
+        Channel(
+            title,
+            link=json.dumps([[title, link]]),
+            thumbnail=logos.get(link, var.addon_icon),
+            contextmenu=favourite_menu(title, link, True)
+        ) for title, link in favourites
+    )
 
 def add_favourite(title, link, is_search: bool=False):
-    func.write_favourite(title, link)
+    data.write_favourite(title, link)
     if is_search is False:
         var.execute_builtin('Container.Refresh')
     var.notify_dialog(var.addon_name, f'{title} added to favourites', icon=var.addon_icon)
 
 def remove_favourite(title, link, is_search: bool=False):
-    items = func.read_favourites()
-    for item in items:
-        if link in item:
-            items.remove(item)
-    func.write_file(var.fav_path, json.dumps(items))
+    data.delete_favourite(link)
     if is_search is False:
         var.execute_builtin('Container.Refresh')
     var.notify_dialog(var.addon_name, f'{title} removed from favourites', icon=var.addon_icon)
 
 def refresh():
+    import functions as func
     var.progress_dialog.create(var.addon_name)
     var.progress_dialog.update(50, 'Refreshing schedule...')
     func.get_schedule_and_channels()
     var.progress_dialog.update(100, 'Refreshing schedule...Done!')
     var.sleep(500)
     var.notify_dialog(var.addon_name, 'Schedule refreshed.', icon=var.addon_icon)
-    func.container_refresh()
+    ui.container_refresh()
 
 def search():
-    results = func.get_search_results()
+    results = data.get_search_results()
     get_matches('', '', results['events'])
     get_channels(results['channels'])
 
 def play_video(name: str, url: str, icon: str, description, match, is_search: bool=False):
+    import functions as func
     if match is not None:
-        url = func.get_match_links(match)
+        url = data.get_match_links(match)
     url = json.loads(url) if isinstance(url, str) else url
-    if len(url) > 1:
-        url = func.get_multilink(url)
+    checked = None
+    if len(url) > 1 and var.get_setting_bool('check_links') is True:
+        import linkcheck
+        checked = linkcheck.pick(url)
+        url = checked['link'] if checked else None
+    elif len(url) > 1:
+        url = ui.get_multilink(url)
     else:
         url = url[0][1]
     if not url:
         var.system_exit()
     
-    url = func.resolve_link(url)
+    if checked and checked.get('m3u8'):
+        player_url, url = checked['player_url'], checked['m3u8']
+    elif var.get_setting_bool('race_players') is True:
+        player_url, url, report = func.race_streams(url)
+        if not url:
+            var.notify_dialog(var.addon_name, 'No working links were found.', icon=var.addon_icon)
+            var.system_exit()
+    else:
+        player_url = func.gather_streams(url)
+        url = func.resolve_link(player_url)
+    m3u8 = url
+    if var.get_setting_bool('hls_relay') is True:
+        import relay
+        url = relay.local_url(player_url, url) or url
     list_item = var.list_item(name, path=url)
     
-    func.set_info(list_item, {'title': name, 'plot': description})
+    ui.set_info(list_item, {'title': name, 'plot': description})
     list_item.setArt({'thumb': icon, 'icon': icon, 'poster': icon})
     list_item.setProperty('inputstream', 'inputstream.ffmpegdirect')
     list_item.setMimeType('application/x-mpegURL')
@@ -186,11 +260,25 @@ def play_video(name: str, url: str, icon: str, description, match, is_search: bo
         list_item.setProperty('inputstream.ffmpegdirect.stream_mode', 'timeshift')
     list_item.setProperty('inputstream.ffmpegdirect.manifest_type', 'hls')
     
+    if var.get_setting_bool('resolve_cache') is True or var.get_setting_bool('rank_players') is True:
+        func.request_watch(player_url, m3u8)
     if is_search is True:
         var.play(url, listitem=list_item)
     else:
         var.set_resolved_url(var.handle, True, listitem=list_item)
-        
+    
+
+def log_startup_time(mode, started: float, imported: float):
+    """Log how long this invocation took to import and run, and warn when a
+    directory listing went over its budget in var.startup_budgets."""
+    finished = time.perf_counter()
+    total = finished - started
+    message = f'mode {mode}: imports {(imported - started) * 1000:.0f} ms, total {total * 1000:.0f} ms'
+    budget = var.startup_budgets.get(mode)
+    if budget is not None and total > budget:
+        ui.log(f'{message}, over the {budget * 1000:.0f} ms budget', xbmc.LOGWARNING)
+    else:
+        ui.log(message)
 
 def router(params: dict):
     mode = params.get('mode')
@@ -200,12 +288,48 @@ def router(params: dict):
     thumbnail = params.get('thumbnail')
     is_search = params.get('is_search')
     is_search = is_search in (True, 'True')
+    page = int(params.get('page') or 0)
+    
+    if mode == 'background_refresh':
+        import functions as func
+        func.get_schedule_and_channels(wait=False)
+        return
+    
+    if mode == 'prefetch':
+        import prefetch
+        prefetch.prefetch_links(json.loads(link))
+        return
+    
+    if mode == 'fetch_logos':
+        import logos
+        logos.fetch_wanted()
+        return
+    
+    if mode == 'trace_summary':
+        import tracing
+        ui.text_dialog('Hop latency', tracing.summary())
+        return
+    
+    if mode == 'export':
+        import export
+        written = export.write_exports(force=True)
+        var.notify_dialog(var.addon_name, f'Wrote {len(written)} files for PVR.', icon=var.addon_icon)
+        return
+    
+    if mode == 'trace_clear':
+        import tracing
+        tracing.clear()
+        var.notify_dialog(var.addon_name, 'Recorded hops cleared.', icon=var.addon_icon)
+        return
     
     if mode is None:
         main_menu()
     
     elif mode == 'channels':
-        get_channels()
+        get_channel_index()
+    
+    elif mode == 'channel_page':
+        get_channel_page(title2, page)
     
     elif mode == 'categories':
         get_categories(title2)
@@ -216,6 +340,12 @@ def router(params: dict):
     elif mode == 'favourites':
         get_favourites()
     
+    elif mode == 'live':
+        get_live()
+    
+    elif mode == 'upcoming':
+        get_upcoming()
+    
     elif mode == 'add_fav':
         add_favourite(title, link, is_search=is_search)
     
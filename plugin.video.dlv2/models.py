@@ -15,10 +15,12 @@ class Item:
     is_media: bool = True
     is_search: bool = False
     title2: str = ''
+    page: int = 0
     
     
     def to_dict(self) -> Dict:
-        return {k: v for k, v in asdict(self).items() if v}
+        """Non-empty url parameters; the context menu is never read back from the url."""
+        return {k: v for k, v in vars(self).items() if v and k != 'contextmenu'}
     
     def full_dict(self) -> Dict:
         return asdict(self)
@@ -0,0 +1,97 @@
+import threading
+import time
+from typing import Callable, List, Optional
+import variables as var
+import functions as func
+import health
+from core import site
+
+
+class RateLimiter:
+    """Spaces calls to wait() at least interval seconds apart across threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+_limiter = RateLimiter(var.prefetch_rate)
+
+
+def _never() -> bool:
+    return False
+
+def prefetch_link(link: str, aborted: Callable[[], bool]=_never) -> bool:
+    """Warm the resolve cache for a stream link with the first player variant
+    that resolves to a reachable playlist. Skips links that are already warm
+    and stops before the next player once aborted() is true."""
+    cache = func.get_resolve_cache()
+    players = health.rank(func.player_links(link))
+    for _, player_url in players:
+        if cache.get(player_url, min_ttl=var.prefetch_min_ttl):
+            return True
+    for label, player_url in players:
+        _limiter.wait()
+        if aborted():
+            return False
+        start = time.perf_counter()
+        try:
+            m3u8, info = func.resolve_stream(player_url)
+        except Exception as e:
+            func.log(f'Prefetch {label} for {link} failed: {e}')
+            continue
+        if m3u8 and func.is_reachable(m3u8):
+            cache.put(player_url, m3u8, **info)
+            func.log(f'Prefetched {label} for {link} in {time.perf_counter() - start:.2f}s')
+            return True
+    return False
+
+def prefetch_links(links: List[str], aborted: Optional[Callable[[], bool]]=None) -> int:
+    """Pre-resolve links on at most var.prefetch_workers daemon threads.
+    Returns how many ended up warm. Nothing is resolved while the resolve
+    cache is off, as playback would not read the result, and links not yet
+    started are skipped once aborted() is true."""
+    if not links or var.get_setting_bool('resolve_cache') is not True:
+        return 0
+    aborted = aborted or _never
+    func.get_resolve_cache().reload()
+
+    def run(link: str) -> bool:
+        if aborted():
+            return False
+        try:
+            return prefetch_link(link, aborted)
+        except Exception as e:
+            func.log(f'Prefetch {link} failed: {e}')
+            return False
+
+    results = func.run_daemons(run, [(link,) for link in links], var.prefetch_workers)
+    return sum(results.get() for _ in links)
+
+def upcoming_favourites(window: int, now: float=None) -> List[str]:
+    """Favourite stream links with an event starting in the next window seconds,
+    or one that started within the last var.prefetch_grace seconds."""
+    now = time.time() if now is None else now
+    store = func.get_store()
+    favourite_ids = {}
+    for link in store.favourite_links():
+        if stream_id := site.channel_id(link):
+            favourite_ids[stream_id] = link
+    channel_ids = store.channel_events(list(favourite_ids), now - var.prefetch_grace, now + window)
+    return [favourite_ids[channel_id] for channel_id in channel_ids]
+
+def prefetch_favourites(aborted: Optional[Callable[[], bool]]=None) -> int:
+    window = (var.get_setting_int('prefetch_window') or 30) * 60
+    links = upcoming_favourites(window)
+    if links:
+        func.log(f'Pre-resolving {len(links)} favourite channels with events starting soon')
+    return prefetch_links(links, aborted)
@@ -0,0 +1,370 @@
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urljoin, urlsplit
+import xbmcgui
+import variables as var
+
+
+PLAYLIST_TYPE = 'application/vnd.apple.mpegurl'
+REFRESH_STATUSES = (401, 403, 404, 410)
+_uri_re = re.compile(r'URI="([^"]+)"')
+
+
+def relay_property() -> str:
+    return f'{var.addon_id}.relay'
+
+def local_url(player_url: str, m3u8: str) -> Optional[str]:
+    """Url of m3u8 through the service's relay, or None when the relay is not running."""
+    base = xbmcgui.Window(10000).getProperty(relay_property())
+    if not base:
+        return None
+    return f"{base}/open.m3u8?{urlencode({'player': player_url, 'src': m3u8})}"
+
+
+class SegmentBuffer:
+    """Bounded in-memory ring of segment bodies keyed by upstream url.
+
+    Oldest entries go first once max_segments or max_bytes is passed. A url
+    being downloaded is claimed so that a request for it waits for that
+    download instead of starting another one.
+    """
+
+    def __init__(self, max_segments: int, max_bytes: int):
+        self.max_segments = max_segments
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def claim(self, url: str) -> bool:
+        with self._lock:
+            if url in self._items or url in self._pending:
+                return False
+            self._pending[url] = threading.Event()
+            return True
+
+    def put(self, url: str, body: bytes, content_type: str):
+        with self._lock:
+            self._items[url] = (body, content_type)
+            self.size += len(body)
+            while self._items and (len(self._items) > self.max_segments or self.size > self.max_bytes):
+                _, (old, _) = self._items.popitem(last=False)
+                self.size -= len(old)
+            if event := self._pending.pop(url, None):
+                event.set()
+
+    def release(self, url: str):
+        with self._lock:
+            if event := self._pending.pop(url, None):
+                event.set()
+
+    def get(self, url: str, timeout: float) -> Optional[Tuple[bytes, str]]:
+        with self._lock:
+            item = self._items.get(url)
+            event = self._pending.get(url)
+        if item is None and event is not None and event.wait(timeout):
+            with self._lock:
+                item = self._items.get(url)
+        return item
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+
+class RelayStream:
+    """One channel played through the relay: its upstream playlist, the headers
+    the CDN wants, a segment buffer and the player url to re-resolve from."""
+
+    def __init__(self, sid: str, player_url: str, m3u8: str, relay: 'Relay'):
+        self.sid = sid
+        self.player_url = player_url
+        self.relay = relay
+        self.buffer = SegmentBuffer(var.relay_buffer_segments, var.relay_buffer_bytes)
+        self.variants = []
+        self.last_segment = None
+        self.last_used = time.time()
+        self.resolved_at = 0.0
+        self._resolve_lock = threading.Lock()
+        self._known = OrderedDict()
+        self._known_lock = threading.Lock()
+        self.opened_with = m3u8
+        self.set_source(m3u8)
+
+    def set_source(self, m3u8: str):
+        import functions as func
+        self.playlist_url, self.headers = func.split_m3u8(m3u8)
+        cache = func.get_resolve_cache()
+        cache.reload()
+        self.expires = cache.expires(self.player_url)
+        self.variants = []
+
+    def fetch(self, url: str):
+        import functions as func
+        return func.get(url, headers=self.headers, timeout=var.relay_timeout, stage='relay')
+
+    def re_resolve(self, reason: str) -> bool:
+        """Resolve the player url again and switch to its playlist. Playback
+        keeps going on the same local urls. At most one at a time, and not
+        more often than var.relay_resolve_interval."""
+        import functions as func
+        with self._resolve_lock:
+            if time.time() - self.resolved_at < var.relay_resolve_interval:
+                return False
+            self.resolved_at = time.time()
+            func.log(f'Relay re-resolving {self.player_url}: {reason}')
+            try:
+                m3u8 = func.re_resolve(self.player_url)
+            except Exception as e:
+                func.log(f'Relay re-resolve failed for {self.player_url}: {e}')
+                return False
+            if not m3u8:
+                return False
+            self.set_source(m3u8)
+            return True
+
+    def re_resolve_later(self, reason: str):
+        threading.Thread(target=self.re_resolve, args=(reason,), daemon=True).start()
+
+    def refresh_ahead(self):
+        """Re-resolve in the background shortly before the token runs out."""
+        if self.expires and time.time() > self.expires - var.relay_refresh_margin:
+            self.re_resolve_later('token expiring')
+
+    def remember(self, url: str):
+        """Allow /seg/ to fetch url, which a rewritten playlist points at. The
+        last var.relay_known_urls are kept, enough for a live window."""
+        with self._known_lock:
+            self._known[url] = None
+            self._known.move_to_end(url)
+            while len(self._known) > var.relay_known_urls:
+                self._known.popitem(last=False)
+
+    def knows(self, url: str) -> bool:
+        with self._known_lock:
+            return url in self._known
+
+    def playlist(self, variant: Optional[int]=None) -> Tuple[int, str]:
+        """(status, rewritten playlist) for the main playlist or one of its variants."""
+        self.last_used = time.time()
+        self.refresh_ahead()
+        for attempt in range(2):
+            if variant is None:
+                url = self.playlist_url
+            elif variant < len(self.variants):
+                url = self.variants[variant]
+            else:
+                self.playlist()
+                if variant >= len(self.variants):
+                    return 404, ''
+                url = self.variants[variant]
+            response = self.fetch(url)
+            if response.ok:
+                text, segments = self.rewrite(response.text, response.url, variant is None)
+                if segments:
+                    self.prefetch(segments)
+                return 200, text
+            if attempt or response.status_code not in REFRESH_STATUSES:
+                return response.status_code, ''
+            if not self.re_resolve(f'playlist returned {response.status_code}'):
+                return response.status_code, ''
+        return 502, ''
+
+    def rewrite(self, text: str, base_url: str, is_main: bool) -> Tuple[str, List[str]]:
+        """Point every uri in a playlist at the relay. Variant and rendition
+        playlists become /pl/<sid>/<index>.m3u8, segments, keys and init
+        sections /seg/<sid>?u=<upstream url>, which only serves the urls put
+        there."""
+        local = self.relay.url
+        segments = []
+        variants = [] if is_main else None
+        lines = []
+        next_is_variant = False
+
+        def playlist_uri(url: str) -> str:
+            if variants is None:
+                return segment_uri(url)
+            variants.append(url)
+            return f'{local}/pl/{self.sid}/{len(variants) - 1}.m3u8'
+
+        def segment_uri(url: str) -> str:
+            self.remember(url)
+            return f"{local}/seg/{self.sid}?u={quote(url, safe='')}"
+
+        for line in text.splitlines():
+            stripped = line.strip()
+            if not stripped:
+                lines.append(line)
+            elif stripped.startswith('#'):
+                if stripped.startswith('#EXT-X-STREAM-INF'):
+                    next_is_variant = True
+                if 'URI="' in stripped:
+                    if stripped.startswith(('#EXT-X-MEDIA:', '#EXT-X-I-FRAME-STREAM-INF')):
+                        to_local = playlist_uri
+                    else:
+                        to_local = segment_uri
+                    line = _uri_re.sub(lambda m: f'URI="{to_local(urljoin(base_url, m.group(1)))}"', stripped)
+                lines.append(line)
+            else:
+                url = urljoin(base_url, stripped)
+                if next_is_variant:
+                    lines.append(playlist_uri(url))
+                    next_is_variant = False
+                else:
+                    segments.append(url)
+                    lines.append(segment_uri(url))
+        if variants:
+            self.variants = variants
+        return '\n'.join(lines) + '\n', segments
+
+    def prefetch(self, segments: List[str]):
+        """Download the next var.relay_prefetch segments after the last one
+        played, or the last ones in the playlist before playback asks."""
+        count = max(1, var.get_setting_int('relay_prefetch') or 3)
+        if self.last_segment in segments:
+            start = segments.index(self.last_segment) + 1
+        else:
+            start = max(0, len(segments) - count)
+        for url in segments[start:start + count]:
+            if self.buffer.claim(url):
+                self.relay.executor.submit(self.download, url)
+
+    def download(self, url: str) -> Optional[Tuple[bytes, str]]:
+        try:
+            response = self.fetch(url)
+            if not response.ok:
+                if response.status_code in REFRESH_STATUSES:
+                    self.re_resolve_later(f'segment returned {response.status_code}')
+                return None
+            item = (response.content, response.headers.get('Content-Type', 'video/mp2t'))
+            self.buffer.put(url, *item)
+            return item
+        except Exception as e:
+            import functions as func
+            func.log(f'Relay segment failed: {e}')
+            return None
+        finally:
+            self.buffer.release(url)
+
+    def segment(self, url: str) -> Optional[Tuple[bytes, str]]:
+        self.last_used = time.time()
+        self.last_segment = url
+        item = self.buffer.get(url, timeout=var.relay_timeout[1])
+        if item is None and self.buffer.claim(url):
+            item = self.download(url)
+        return item
+
+
+class RelayHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    server_version = 'dlv2-relay'
+
+    def do_GET(self):
+        relay = self.server.relay
+        parts = urlsplit(self.path)
+        query = dict(parse_qsl(parts.query))
+        path = parts.path.strip('/').split('/')
+        try:
+            if path == ['open.m3u8'] and query.get('player') and query.get('src'):
+                stream = relay.open(query['player'], query['src'])
+                self.send_playlist(*stream.playlist())
+            elif len(path) == 3 and path[0] == 'pl' and (stream := relay.streams.get(path[1])):
+                self.send_playlist(*stream.playlist(int(path[2].split('.')[0])))
+            elif len(path) == 2 and path[0] == 'seg' and (stream := relay.streams.get(path[1])) and 'u' in query:
+                url = unquote(query['u'])
+                if not stream.knows(url):
+                    self.send_error(404)
+                    return
+                item = stream.segment(url)
+                if item is None:
+                    self.send_error(502)
+                else:
+                    self.send_body(200, *item)
+            else:
+                self.send_error(404)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except Exception as e:
+            import functions as func
+            func.log(f'Relay error for {self.path}: {e}')
+            self.send_error(502)
+
+    def send_playlist(self, status: int, text: str):
+        if status != 200:
+            self.send_error(status if status >= 400 else 502)
+            return
+        self.send_body(200, text.encode('utf-8'), PLAYLIST_TYPE, cache=False)
+
+    def send_body(self, status: int, body: bytes, content_type: str, cache: bool=True):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if not cache:
+            self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Relay:
+    """Localhost HLS relay hosted by the service.
+
+    Kodi plays /open.m3u8?player=<player url>&src=<resolved m3u8>. The relay
+    fetches playlists and segments through the shared keep-alive session with
+    the headers from the m3u8 string, rewrites playlists to point back at
+    itself, prefetches the next segments into a per-stream ring buffer and
+    re-resolves the player url when the token runs out.
+    """
+
+    def __init__(self, port: int=0):
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), RelayHandler)
+        self.server.daemon_threads = True
+        self.server.relay = self
+        self.url = f'http://127.0.0.1:{self.server.server_port}'
+        self.streams = {}
+        self.executor = ThreadPoolExecutor(max_workers=var.relay_workers)
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        xbmcgui.Window(10000).setProperty(relay_property(), self.url)
+
+    def stop(self):
+        xbmcgui.Window(10000).clearProperty(relay_property())
+        self.server.shutdown()
+        self.server.server_close()
+        self.executor.shutdown(wait=False)
+
+    def open(self, player_url: str, m3u8: str) -> RelayStream:
+        """Stream for player_url. Reloads of the same url keep the stream's own,
+        possibly re-resolved, playlist; a new play with a new m3u8 replaces it."""
+        sid = hashlib.sha1(player_url.encode('utf-8')).hexdigest()[:12]
+        with self._lock:
+            self.sweep()
+            stream = self.streams.get(sid)
+            if stream is None:
+                stream = self.streams[sid] = RelayStream(sid, player_url, m3u8, self)
+            elif m3u8 != stream.opened_with:
+                stream.opened_with = m3u8
+                stream.set_source(m3u8)
+            return stream
+
+    def sweep(self):
+        """Drop streams nobody has asked for in var.relay_idle seconds."""
+        cutoff = time.time() - var.relay_idle
+        for sid, stream in list(self.streams.items()):
+            if stream.last_used < cutoff:
+                stream.buffer.clear()
+                del self.streams[sid]
@@ -0,0 +1,191 @@
+from html.parser import HTMLParser
+from typing import Iterable, List, Optional
+from urllib.parse import urlparse, parse_qsl
+
+
+VOID_TAGS = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+))
+RAW_TEXT_TAGS = frozenset(('script', 'style', 'template'))
+CATEGORY_CLASS = 'schedule__category is-expanded'
+
+
+class _Node:
+    __slots__ = ('tag', 'role', 'text')
+
+    def __init__(self, tag: str, role: Optional[str]=None, text: Optional[List[str]]=None):
+        self.tag = tag
+        self.role = role
+        self.text = text
+
+
+class ScheduleParser(HTMLParser):
+    """Single forward pass over the index.php schedule markup.
+
+    Produces the same dict fetch_schedule used to build with BeautifulSoup:
+    {day: {category: [{'time', 'event', 'channels', 'channels2'}]}}.
+    Text is collected the way get_text(strip=True) does it, so feed() can be
+    called with chunks of the response as they arrive.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.schedule = {}
+        self._stack = []
+        self._data = []
+        self._collectors = []
+        self._day = None
+        self._day_title = None
+        self._categories = None
+        self._cat_name = None
+        self._event = None
+        self._channels_seen = False
+        self._in_channels = False
+        self._channel_id = None
+
+    def _flush(self):
+        if not self._data:
+            return
+        text = ''.join(self._data).strip()
+        self._data = []
+        if text:
+            for collector in self._collectors:
+                collector.append(text)
+
+    def _role(self, tag: str, attrs: dict) -> Optional[str]:
+        classes = (attrs.get('class') or '').split()
+        if not classes:
+            return 'channel' if tag == 'a' and self._in_channels else None
+        if 'schedule__day' in classes and self._day is None:
+            return 'day'
+        if self._day is None:
+            return None
+        if self._categories is None:
+            if ' '.join(classes) == CATEGORY_CLASS:
+                return 'category'
+            if 'schedule__dayTitle' in classes and self._day_title is None:
+                return 'day_title'
+            return None
+        if self._event is None:
+            if 'schedule__event' in classes:
+                return 'event'
+            if 'card__meta' in classes and self._cat_name is None:
+                return 'cat_name'
+            return None
+        if tag == 'a' and self._in_channels:
+            return 'channel'
+        if 'schedule__time' in classes and 'time' not in self._event:
+            return 'time'
+        if 'schedule__eventTitle' in classes and 'event' not in self._event:
+            return 'title'
+        if 'schedule__channels' in classes and not self._channels_seen:
+            return 'channels'
+        return None
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        attrs = dict(attrs)
+        role = self._role(tag, attrs)
+        text = None
+        if role == 'day':
+            self._day = {}
+        elif role == 'category':
+            self._categories = []
+            self._cat_name = None
+        elif role == 'event':
+            self._event = {}
+            self._channels_seen = False
+        elif role == 'channels':
+            self._channels_seen = True
+            self._in_channels = True
+            self._event['channels'] = []
+        elif role == 'channel':
+            href = attrs.get('href') or ''
+            self._channel_id = dict(parse_qsl(urlparse(href).query)).get('id')
+        if role in ('day_title', 'cat_name', 'time', 'title', 'channel'):
+            text = []
+            self._collectors.append(text)
+        if tag in VOID_TAGS:
+            if text is not None:
+                self._end(_Node(tag, role, text))
+            return
+        self._stack.append(_Node(tag, role, text))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        self._flush()
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index].tag == tag:
+                break
+        else:
+            return
+        while len(self._stack) > index:
+            self._end(self._stack.pop())
+
+    def handle_data(self, data):
+        if self._stack and self._stack[-1].tag in RAW_TEXT_TAGS:
+            return
+        self._data.append(data)
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def _end(self, node: _Node):
+        role = node.role
+        if node.text is not None:
+            self._collectors.remove(node.text)
+            text = ''.join(node.text)
+            if role == 'day_title':
+                self._day_title = text
+            elif role == 'cat_name':
+                self._cat_name = text
+            elif role == 'time':
+                self._event['time'] = text
+            elif role == 'title':
+                self._event['event'] = text
+            elif role == 'channel' and self._channel_id is not None:
+                self._event['channels'].append({
+                    'channel_name': text,
+                    'channel_id': self._channel_id
+                })
+        elif role == 'channels':
+            self._in_channels = False
+        elif role == 'event':
+            event = self._event
+            self._event = None
+            self._in_channels = False
+            self._categories.append({
+                'time': event.get('time', ''),
+                'event': event.get('event', ''),
+                'channels': event.get('channels', []),
+                'channels2': []
+            })
+        elif role == 'category':
+            self._day[self._cat_name or ''] = self._categories
+            self._categories = None
+            self._cat_name = None
+        elif role == 'day':
+            if self._day:
+                s_date = (self._day_title or '').split(' -', 1)[0].strip()
+                self.schedule[s_date] = self._day
+            self._day = None
+            self._day_title = None
+
+    def close(self):
+        super().close()
+        self._flush()
+        while self._stack:
+            self._end(self._stack.pop())
+
+
+def parse_schedule(chunks: Iterable[str]) -> dict:
+    parser = ScheduleParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    parser.close()
+    return parser.schedule
@@ -0,0 +1,29 @@
+import calendar
+import re
+import time
+from typing import Optional
+
+
+DAY_FORMATS = ('%A %d %B %Y', '%A %d %b %Y', '%d %B %Y', '%d %b %Y')
+_ordinal_re = re.compile(r'(\d+)(?:st|nd|rd|th)\b')
+_time_re = re.compile(r'^(\d{1,2}):(\d{2})$')
+
+
+def day_struct(day_title: str) -> Optional[time.struct_time]:
+    """Date of a schedule day heading such as 'Saturday 18th Oct 2025 - Schedule Time UK GMT'."""
+    cleaned = _ordinal_re.sub(r'\1', day_title.split(' -', 1)[0].strip())
+    for fmt in DAY_FORMATS:
+        try:
+            return time.strptime(cleaned, fmt)
+        except ValueError:
+            continue
+    return None
+
+def event_epoch(day_title: str, utc_time: str) -> Optional[int]:
+    """UTC epoch of an event from its day heading and 'HH:MM' start time."""
+    day = day_struct(day_title)
+    match = _time_re.match(utc_time.strip())
+    if day is None or match is None:
+        return None
+    hour, minute = int(match.group(1)), int(match.group(2))
+    return calendar.timegm((day.tm_year, day.tm_mon, day.tm_mday, hour, minute, 0))
@@ -0,0 +1,119 @@
+import re
+import sqlite3
+from html import unescape
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+STOPWORDS = frozenset((
+    "a", "an", "and", "are", "as", "at", "be", "but", "by",
+    "for", "if", "in", "into", "is", "it", "no", "not", "of",
+    "on", "or", "such", "that", "the", "their", "then", "there",
+    "these", "they", "this", "to", "was", "will", "with"
+))
+KIND_EVENT = 0
+KIND_CHANNEL = 1
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS search_tokens (
+    token TEXT NOT NULL,
+    kind INTEGER NOT NULL,
+    ref INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS search_tokens_token ON search_tokens (token);
+CREATE TABLE IF NOT EXISTS search_trigrams (
+    trigram TEXT NOT NULL,
+    token TEXT NOT NULL,
+    PRIMARY KEY (trigram, token)
+) WITHOUT ROWID;
+'''
+_word_re = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    return _word_re.findall(unescape(text).lower())
+
+def keywords(query: str) -> List[str]:
+    """Lowercased query words with stopwords removed, in query order."""
+    seen = []
+    for word in tokenize(query):
+        if word not in STOPWORDS and word not in seen:
+            seen.append(word)
+    return seen
+
+def trigrams(token: str) -> Set[str]:
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+def _add(conn: sqlite3.Connection, kind: int, rows: Iterable[Tuple[int, str]]):
+    tokens = {}
+    for ref, text in rows:
+        for token in set(tokenize(text)):
+            tokens.setdefault(token, []).append(ref)
+    conn.executemany(
+        'INSERT INTO search_tokens (token, kind, ref) VALUES (?, ?, ?)',
+        ((token, kind, ref) for token, refs in tokens.items() for ref in refs)
+    )
+    conn.executemany(
+        'INSERT OR IGNORE INTO search_trigrams (trigram, token) VALUES (?, ?)',
+        ((trigram, token) for token in tokens for trigram in trigrams(token))
+    )
+
+def _index(conn: sqlite3.Connection, kind: int, rows: Iterable[Tuple[int, str]]):
+    conn.execute('DELETE FROM search_tokens WHERE kind = ?', (kind,))
+    conn.execute('DELETE FROM search_trigrams WHERE token NOT IN (SELECT token FROM search_tokens)')
+    _add(conn, kind, rows)
+
+def _prune(conn: sqlite3.Connection, tokens: Iterable[str]):
+    """Drop the trigrams of those of tokens that are no longer indexed."""
+    orphans = [
+        token for token in tokens
+        if conn.execute('SELECT 1 FROM search_tokens WHERE token = ? LIMIT 1', (token,)).fetchone() is None
+    ]
+    conn.executemany(
+        'DELETE FROM search_trigrams WHERE trigram = ? AND token = ?',
+        ((trigram, token) for token in orphans for trigram in trigrams(token))
+    )
+
+def index_events(conn: sqlite3.Connection, event_ids: List[int]=None):
+    """Index all events, or only add event_ids on top of the existing tokens."""
+    if event_ids is None:
+        _index(conn, KIND_EVENT, conn.execute('SELECT id, event FROM events').fetchall())
+        return
+    for i in range(0, len(event_ids), 500):
+        chunk = event_ids[i:i + 500]
+        _add(conn, KIND_EVENT, conn.execute(
+            f'SELECT id, event FROM events WHERE id IN ({",".join("?" * len(chunk))})', chunk
+        ).fetchall())
+
+def unindex_events(conn: sqlite3.Connection, subquery: str, params: tuple=()):
+    """Drop tokens of the events selected by subquery, before those events are
+    deleted, and the trigrams of tokens no other row uses."""
+    removed = [row[0] for row in conn.execute(
+        f'SELECT DISTINCT token FROM search_tokens WHERE kind = ? AND ref IN ({subquery})', (KIND_EVENT, *params)
+    )]
+    conn.execute(f'DELETE FROM search_tokens WHERE kind = ? AND ref IN ({subquery})', (KIND_EVENT, *params))
+    _prune(conn, removed)
+
+def index_channels(conn: sqlite3.Connection):
+    _index(conn, KIND_CHANNEL, conn.execute('SELECT position, title FROM channels').fetchall())
+
+def _matches(conn: sqlite3.Connection, keyword: str) -> Set[Tuple[int, int]]:
+    matches = set(conn.execute(
+        'SELECT DISTINCT kind, ref FROM search_tokens WHERE token >= ? AND token < ?',
+        (keyword, f'{keyword}\U0010ffff')
+    ))
+    grams = trigrams(keyword)
+    if grams:
+        placeholders = ','.join('?' * len(grams))
+        matches.update(conn.execute(
+            'SELECT DISTINCT kind, ref FROM search_tokens WHERE instr(token, ?) > 0 AND token IN ('
+            f'SELECT token FROM search_trigrams WHERE trigram IN ({placeholders}) '
+            'GROUP BY token HAVING COUNT(*) = ?)', (keyword, *grams, len(grams))
+        ))
+    return matches
+
+def search(conn: sqlite3.Connection, words: List[str]) -> Dict[int, Dict[int, int]]:
+    """{kind: {ref: number of keywords matched}} for prefix and infix matches."""
+    hits = {KIND_EVENT: {}, KIND_CHANNEL: {}}
+    for keyword in words:
+        for kind, ref in _matches(conn, keyword):
+            hits[kind][ref] = hits[kind].get(ref, 0) + 1
+    return hits
@@ -1,8 +1,148 @@
-from functions import get_schedule_and_channels
+import json
+import random
+import threading
+import time
+from bisect import bisect_left
+import xbmc
 import variables as var
+import functions as func
+from data import write_service_status
+import prefetch
+
+
+def refresh_interval(now: float, starts: list) -> int:
+    """Seconds until the next refresh. starts is a sorted list of event epochs.
+    Many kickoffs in the dense window means the minimum interval, an empty
+    evening stretches towards the maximum, and a refresh is always due a
+    little before the next kickoff."""
+    min_interval = var.service_min_interval
+    max_interval = var.service_max_interval
+    index = bisect_left(starts, now)
+    if index == len(starts):
+        return max_interval
+    soon = bisect_left(starts, now + var.service_dense_window) - index
+    density = min(1, soon / var.service_dense_events)
+    interval = max_interval - (max_interval - min_interval) * density
+    lead = starts[index] - now - min_interval
+    return int(max(min_interval, min(max_interval, interval, lead)))
+
+def backoff_interval(failures: int) -> int:
+    delay = min(var.service_backoff_cap, var.service_backoff_base * 2 ** (failures - 1))
+    return int(delay * random.uniform(0.5, 1.5))
+
+
+class RefreshService(xbmc.Monitor):
+    def __init__(self):
+        super().__init__()
+        self.failures = 0
+        self.status = {}
+        self.relay = None
+        self.watcher = func.PlaybackWatcher()
+        self.jobs = {}
+        self.next_refresh = None
+    
+    def onNotification(self, sender, method, data):
+        if sender == var.addon_id and method == f'Other.{func.WATCH_MESSAGE}':
+            self.watcher.watch(json.loads(data))
+    
+    def refresh(self) -> bool:
+        start = time.time()
+        try:
+            ok = func.get_schedule_and_channels(wait=False)
+        except Exception as e:
+            func.log(f'Service refresh failed: {e}')
+            ok = False
+        self.failures = 0 if ok else self.failures + 1
+        self.status.update(
+            state='ok' if ok else 'failed',
+            last_refresh=start,
+            duration=round(time.time() - start, 3),
+            failures=self.failures
+        )
+        if ok:
+            self.status['last_success'] = start
+            self.export()
+        return ok
+    
+    def export(self):
+        if var.get_setting_bool('export_pvr') is False:
+            return
+        import export
+        try:
+            export.write_exports()
+        except Exception as e:
+            func.log(f'PVR export failed: {e}')
+    
+    def next_interval(self) -> int:
+        if self.failures:
+            return backoff_interval(self.failures)
+        return refresh_interval(time.time(), func.get_store().event_starts())
+    
+    def publish(self, interval: int):
+        self.status.update(interval=interval, next_refresh=time.time() + interval)
+        write_service_status(self.status)
+        func.log(f"Service refresh {self.status['state']} in {self.status['duration']}s, next in {interval}s")
+    
+    def refresh_job(self, notify: bool):
+        """Refresh, publish the status and set when the next refresh is due."""
+        self.refresh()
+        if notify and var.get_setting_bool('disable_notify') is False:
+            var.notify_dialog(var.addon_name, 'Schedule refreshed.', icon=var.addon_icon)
+        interval = self.next_interval()
+        self.publish(interval)
+        self.next_refresh = time.time() + interval
+    
+    def start_job(self, name: str, target, *args) -> bool:
+        """Run target on a daemon thread, so the monitor loop keeps answering
+        abort and playback while it works, unless the last job called name is
+        still running. Returns whether it was started."""
+        job = self.jobs.get(name)
+        if job is not None and job.is_alive():
+            return False
+        self.jobs[name] = threading.Thread(target=target, args=args, daemon=True)
+        self.jobs[name].start()
+        return True
+    
+    def prefetch(self):
+        if var.get_setting_bool('prefetch_favourites') is False:
+            return
+        try:
+            prefetch.prefetch_favourites(self.abortRequested)
+        except Exception as e:
+            func.log(f'Service prefetch failed: {e}')
+    
+    def start_relay(self):
+        if var.get_setting_bool('hls_relay') is False:
+            return
+        import relay
+        try:
+            self.relay = relay.Relay(var.get_setting_int('relay_port'))
+            self.relay.start()
+            func.log(f'HLS relay listening on {self.relay.url}')
+        except OSError as e:
+            func.log(f'HLS relay could not start: {e}')
+            self.relay = None
+    
+    def run(self):
+        self.start_relay()
+        self.start_job('refresh', self.refresh_job, True)
+        next_prefetch = time.time()
+        while not self.abortRequested():
+            self.watcher.expire()
+            now = time.time()
+            refreshing = self.next_refresh is None
+            if now >= next_prefetch and not refreshing and self.start_job('prefetch', self.prefetch):
+                next_prefetch = time.time() + var.prefetch_interval
+            if not refreshing and now >= self.next_refresh:
+                self.next_refresh = None
+                self.start_job('refresh', self.refresh_job, False)
+            wake = min(self.next_refresh or next_prefetch, next_prefetch, self.watcher.deadline() or next_prefetch)
+            if self.waitForAbort(max(1, min(wake - time.time(), var.playback_timeout))):
+                break
+        if self.relay is not None:
+            self.relay.stop()
+        func.get_store().close()
+
 
 if __name__ == '__main__':
-    get_schedule_and_channels()
-    if var.get_setting_bool('disable_notify') is False:
-        var.notify_dialog(var.addon_name, 'Schedule refreshed.', icon=var.addon_icon)
-    
\ No newline at end of file
+    RefreshService().run()
@@ -0,0 +1,69 @@
+import threading
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+import requests
+from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+Timeout = Union[float, Tuple[float, float]]
+
+POOL_HOSTS = 10
+POOL_SIZE = 6
+RETRIES = 2
+BACKOFF = 0.3
+RETRY_STATUSES = (500, 502, 503, 504)
+DEFAULT_TIMEOUT = (5, 10)
+
+_session = None
+_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=RETRIES,
+        connect=RETRIES,
+        read=0,
+        status=RETRIES,
+        backoff_factor=BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_HOSTS,
+        pool_maxsize=POOL_SIZE,
+        max_retries=retry
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def get_session() -> requests.Session:
+    """Shared keep-alive session. urllib3 keeps one connection pool per host."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+def host_timeout(url: str, timeouts: Dict[str, Timeout], default: Timeout=DEFAULT_TIMEOUT) -> Timeout:
+    """(connect, read) timeout for the first key contained in the host of url."""
+    host = urlparse(url).netloc
+    for key, timeout in timeouts.items():
+        if key in host:
+            return timeout
+    return default
+
+def request(url: str, headers: Optional[dict]=None, timeout: Timeout=DEFAULT_TIMEOUT, **kwargs) -> Response:
+    return get_session().get(url, headers=headers, timeout=timeout, **kwargs)
+
+def close():
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,91 @@
+import os
+import time
+from typing import Callable, Optional
+
+
+class FileLock:
+    """Cross-process lock backed by an O_EXCL lock file.
+
+    Works the same on every platform Kodi runs on. A lock file older than
+    stale_after seconds is treated as left behind by a killed process. The
+    file holds a token unique to its holder, so a stale lock is only removed
+    if it is still the one found stale, and a holder whose lock was broken
+    does not remove the next one's.
+    """
+
+    def __init__(self, path: str, stale_after: float=300):
+        self.path = path
+        self.stale_after = stale_after
+        self.held = False
+        self.token = None
+
+    def _read(self) -> Optional[str]:
+        try:
+            with open(self.path, 'r') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _break_stale(self):
+        try:
+            token = self._read()
+            if not token or time.time() - os.path.getmtime(self.path) <= self.stale_after:
+                return
+            if self._read() == token:
+                os.remove(self.path)
+        except OSError:
+            pass
+
+    def _try_acquire(self) -> bool:
+        try:
+            fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            self._break_stale()
+            return False
+        self.token = f'{os.getpid()} {os.urandom(8).hex()}'
+        with os.fdopen(fd, 'w') as f:
+            f.write(self.token)
+        self.held = True
+        return True
+
+    def acquire(self, timeout: float=0, poll: float=0.25) -> bool:
+        deadline = time.monotonic() + timeout
+        while not self._try_acquire():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll)
+        return True
+
+    def release(self):
+        if self.held:
+            self.held = False
+            if self._read() != self.token:
+                return
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def single_flight(lock: FileLock, fn: Callable, wait: bool=True, timeout: float=60,
+                  generation: Optional[Callable]=None):
+    """Call fn while holding lock, so only one process does the work.
+
+    If another process holds the lock, either return None right away
+    (wait=False) or wait for it to finish. generation() is read before
+    waiting and again once the lock is ours; if it moved on, the other
+    process already did the work and fn is skipped.
+    """
+    if not lock.acquire():
+        if not wait:
+            return None
+        before = generation() if generation else None
+        if not lock.acquire(timeout=timeout):
+            return None
+        if generation and generation() != before:
+            lock.release()
+            return None
+    try:
+        return fn()
+    finally:
+        lock.release()
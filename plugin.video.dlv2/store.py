@@ -0,0 +1,540 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+import search_index
+from schedule_time import event_epoch
+
+
+SCHEMA_VERSION = 8
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS days (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL UNIQUE,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY,
+    day_id INTEGER NOT NULL REFERENCES days(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    digest TEXT,
+    UNIQUE (day_id, name)
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    category_id INTEGER NOT NULL REFERENCES categories(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    time TEXT NOT NULL,
+    event TEXT NOT NULL,
+    starts INTEGER,
+    uid TEXT
+);
+CREATE INDEX IF NOT EXISTS events_category ON events (category_id, position);
+CREATE INDEX IF NOT EXISTS events_title ON events (event);
+CREATE INDEX IF NOT EXISTS events_starts ON events (starts);
+CREATE INDEX IF NOT EXISTS events_uid ON events (uid);
+CREATE TABLE IF NOT EXISTS event_channels (
+    event_id INTEGER NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+    kind INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    channel_name TEXT,
+    channel_id TEXT
+);
+CREATE INDEX IF NOT EXISTS event_channels_event ON event_channels (event_id, kind, position);
+CREATE INDEX IF NOT EXISTS event_channels_channel ON event_channels (channel_id);
+CREATE TABLE IF NOT EXISTS channels (
+    position INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    link TEXT NOT NULL,
+    bucket TEXT,
+    sort_key TEXT,
+    adult INTEGER NOT NULL DEFAULT 0,
+    logo TEXT
+);
+CREATE INDEX IF NOT EXISTS channels_link ON channels (link);
+CREATE INDEX IF NOT EXISTS channels_bucket ON channels (bucket, adult, sort_key);
+CREATE TABLE IF NOT EXISTS favourites (
+    link TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS health (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    latency REAL,
+    failure REAL NOT NULL,
+    ttfs REAL,
+    samples INTEGER NOT NULL,
+    detail TEXT,
+    updated REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE TABLE IF NOT EXISTS logos (
+    url TEXT PRIMARY KEY,
+    file TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS logos_used ON logos (used);
+'''
+CHANNEL_KINDS = ('channels', 'channels2')
+MAX_VARIABLES = 500
+DIGITS_BUCKET = '0-9'
+OTHER_BUCKET = '#'
+ADULT_MARK = '18+'
+
+
+def event_uid(day: str, e_time: str, title: str) -> str:
+    """Id of an event that stays the same across refreshes."""
+    return hashlib.sha1(f'{day}\n{e_time}\n{title}'.encode('utf-8')).hexdigest()[:16]
+
+
+def channel_bucket(title: str) -> str:
+    """A-Z index bucket of a channel title: its first letter, 0-9 or #."""
+    for char in title:
+        if char.isalnum():
+            if char.isdigit():
+                return DIGITS_BUCKET
+            char = char.upper()
+            return char if 'A' <= char <= 'Z' else OTHER_BUCKET
+    return OTHER_BUCKET
+
+def channel_row(position: int, title: str, link: str, logo: Optional[str]=None) -> tuple:
+    """channels row with the bucket, sort key and adult flag the index is built
+    on. Adult channels are filed under their name, not the 18+ mark."""
+    name = title.replace(ADULT_MARK, '').strip()
+    return position, title, link, channel_bucket(name), name.casefold(), int(ADULT_MARK in title), logo
+
+
+class Store:
+    """SQLite store for the schedule, 24/7 channels and favourite channels.
+
+    Connections are opened per thread. created is True when the schema was
+    set up by this instance, so callers know to migrate older json files.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self.created = False
+        conn = self.conn
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        if version < SCHEMA_VERSION:
+            with conn:
+                if 0 < version < 4:
+                    conn.execute('ALTER TABLE events ADD COLUMN starts INTEGER')
+                if 0 < version < 5:
+                    conn.execute('ALTER TABLE events ADD COLUMN uid TEXT')
+                if 0 < version < 7:
+                    conn.execute('ALTER TABLE channels ADD COLUMN bucket TEXT')
+                    conn.execute('ALTER TABLE channels ADD COLUMN sort_key TEXT')
+                    conn.execute('ALTER TABLE channels ADD COLUMN adult INTEGER NOT NULL DEFAULT 0')
+                if 0 < version < 8:
+                    conn.execute('ALTER TABLE channels ADD COLUMN logo TEXT')
+                conn.executescript(SCHEMA)
+                conn.executescript(search_index.SCHEMA)
+                if 0 < version < 3:
+                    conn.execute('ALTER TABLE categories ADD COLUMN digest TEXT')
+                if 0 < version < 5:
+                    conn.executemany('UPDATE events SET starts = ?, uid = ? WHERE id = ?', [
+                        (event_epoch(day, e_time), event_uid(day, e_time, title), event_id)
+                        for event_id, day, e_time, title in conn.execute(
+                            'SELECT e.id, d.title, e.time, e.event FROM events e '
+                            'JOIN categories c ON c.id = e.category_id JOIN days d ON d.id = c.day_id'
+                        ).fetchall()
+                    ])
+                if 0 < version < 7:
+                    conn.executemany('UPDATE channels SET bucket = ?, sort_key = ?, adult = ? WHERE position = ?', [
+                        channel_row(*row)[3:6] + (row[0],)
+                        for row in conn.execute('SELECT position, title, link FROM channels').fetchall()
+                    ])
+                if version == 1:
+                    search_index.index_events(conn)
+                    search_index.index_channels(conn)
+                conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            self.created = version == 0
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA foreign_keys = ON')
+            conn.execute('PRAGMA journal_mode = WAL')
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self.conn as conn:
+            conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def increment_meta(self, key: str) -> int:
+        with self.conn as conn:
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES (?, '0')", (key,))
+            conn.execute('UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = ?', (key,))
+        return int(self.get_meta(key))
+
+    def select_in(self, sql: str, ids: list, params: tuple=()) -> list:
+        """Run sql with its {ids} placeholder list filled in MAX_VARIABLES at a time,
+        after any params for placeholders that come before it."""
+        rows = []
+        for i in range(0, len(ids), MAX_VARIABLES):
+            chunk = ids[i:i + MAX_VARIABLES]
+            rows.extend(self.conn.execute(sql.format(ids=','.join('?' * len(chunk))), (*params, *chunk)))
+        return rows
+
+    def has_schedule(self) -> bool:
+        return self.get_meta('schedule_updated') is not None
+
+    def has_channels(self) -> bool:
+        return self.get_meta('channels_updated') is not None
+
+    def update_schedule(self, schedule: Dict[str, Dict[str, list]], updated: str) -> int:
+        """Write schedule, touching only the days and categories whose events
+        differ from what is stored. Returns the number of categories rewritten."""
+        changed = 0
+        new_event_ids = []
+        with self.conn as conn:
+            days = dict(conn.execute('SELECT title, id FROM days'))
+            for title, day_id in days.items():
+                if title not in schedule:
+                    search_index.unindex_events(
+                        conn, 'SELECT e.id FROM events e JOIN categories c ON c.id = e.category_id WHERE c.day_id = ?',
+                        (day_id,)
+                    )
+                    conn.execute('DELETE FROM days WHERE id = ?', (day_id,))
+                    changed += 1
+            for day_pos, (day, categories) in enumerate(schedule.items()):
+                day_id = days.get(day)
+                if day_id is None:
+                    day_id = conn.execute(
+                        'INSERT INTO days (title, position) VALUES (?, ?)', (day, day_pos)
+                    ).lastrowid
+                else:
+                    conn.execute('UPDATE days SET position = ? WHERE id = ?', (day_pos, day_id))
+                stored = {
+                    name: (cat_id, digest) for cat_id, name, digest in conn.execute(
+                        'SELECT id, name, digest FROM categories WHERE day_id = ?', (day_id,)
+                    )
+                }
+                for name, (cat_id, _) in stored.items():
+                    if name not in categories:
+                        search_index.unindex_events(conn, 'SELECT id FROM events WHERE category_id = ?', (cat_id,))
+                        conn.execute('DELETE FROM categories WHERE id = ?', (cat_id,))
+                        changed += 1
+                for cat_pos, (category, events) in enumerate(categories.items()):
+                    digest = hashlib.sha1(json.dumps(events, sort_keys=True).encode('utf-8')).hexdigest()
+                    cat_id, old_digest = stored.get(category, (None, None))
+                    if cat_id is None:
+                        cat_id = conn.execute(
+                            'INSERT INTO categories (day_id, name, position, digest) VALUES (?, ?, ?, ?)',
+                            (day_id, category, cat_pos, digest)
+                        ).lastrowid
+                    elif digest == old_digest:
+                        conn.execute('UPDATE categories SET position = ? WHERE id = ?', (cat_pos, cat_id))
+                        continue
+                    else:
+                        search_index.unindex_events(conn, 'SELECT id FROM events WHERE category_id = ?', (cat_id,))
+                        conn.execute('DELETE FROM events WHERE category_id = ?', (cat_id,))
+                        conn.execute(
+                            'UPDATE categories SET position = ?, digest = ? WHERE id = ?', (cat_pos, digest, cat_id)
+                        )
+                    new_event_ids.extend(self._insert_events(conn, cat_id, day, events))
+                    changed += 1
+            if new_event_ids:
+                search_index.index_events(conn, new_event_ids)
+            conn.execute(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', ('schedule_updated', updated)
+            )
+        return changed
+
+    def _insert_events(self, conn: sqlite3.Connection, cat_id: int, day: str, events: List[dict]) -> List[int]:
+        event_ids = []
+        for event_pos, event in enumerate(events):
+            e_time = event.get('time', '')
+            title = event.get('event', '')
+            event_id = conn.execute(
+                'INSERT INTO events (category_id, position, time, event, starts, uid) VALUES (?, ?, ?, ?, ?, ?)',
+                (cat_id, event_pos, e_time, title, event_epoch(day, e_time), event_uid(day, e_time, title))
+            ).lastrowid
+            event_ids.append(event_id)
+            conn.executemany(
+                'INSERT INTO event_channels (event_id, kind, position, channel_name, channel_id) VALUES (?, ?, ?, ?, ?)',
+                [
+                    (event_id, kind, ch_pos, channel.get('channel_name'), channel.get('channel_id'))
+                    for kind, key in enumerate(CHANNEL_KINDS)
+                    for ch_pos, channel in enumerate(event.get(key) or [])
+                    if isinstance(channel, dict)
+                ]
+            )
+        return event_ids
+
+    def days(self) -> List[str]:
+        return [row[0] for row in self.conn.execute('SELECT title FROM days ORDER BY position')]
+
+    def categories(self, day: str) -> List[str]:
+        return [row[0] for row in self.conn.execute(
+            'SELECT c.name FROM categories c JOIN days d ON d.id = c.day_id '
+            'WHERE d.title = ? ORDER BY c.position', (day,)
+        )]
+
+    def _event_dicts(self, rows) -> List[dict]:
+        events = []
+        by_id = {}
+        for event_id, e_time, title, starts, uid in rows:
+            event = by_id[event_id] = {
+                'time': e_time, 'event': title, 'starts': starts, 'uid': uid, 'channels': [], 'channels2': []
+            }
+            events.append(event)
+        for event_id, kind, name, channel_id in self.select_in(
+            'SELECT event_id, kind, channel_name, channel_id FROM event_channels '
+            'WHERE event_id IN ({ids}) ORDER BY event_id, kind, position', list(by_id)
+        ):
+            by_id[event_id][CHANNEL_KINDS[kind]].append({'channel_name': name, 'channel_id': channel_id})
+        return events
+
+    def events(self, day: str, category: str) -> List[dict]:
+        return self._event_dicts(self.conn.execute(
+            'SELECT e.id, e.time, e.event, e.starts, e.uid FROM events e '
+            'JOIN categories c ON c.id = e.category_id JOIN days d ON d.id = c.day_id '
+            'WHERE d.title = ? AND c.name = ? ORDER BY e.position', (day, category)
+        ))
+
+    def event_by_title(self, title: str) -> Optional[dict]:
+        events = self._event_dicts(self.conn.execute(
+            'SELECT id, time, event, starts, uid FROM events WHERE event = ? ORDER BY id LIMIT 1', (title,)
+        ))
+        return events[0] if events else None
+
+    def event_channels(self, uid: str) -> List[tuple]:
+        """(kind, channel name, channel id) of the event with uid, in listing order."""
+        return self.conn.execute(
+            'SELECT kind, channel_name, channel_id FROM event_channels '
+            'WHERE event_id = (SELECT MIN(id) FROM events WHERE uid = ?) ORDER BY kind, position', (uid,)
+        ).fetchall()
+
+    def event_starts(self) -> List[int]:
+        """UTC start epoch of every event whose day and time could be parsed, sorted."""
+        return [row[0] for row in self.conn.execute(
+            'SELECT starts FROM events WHERE starts IS NOT NULL ORDER BY starts'
+        )]
+
+    def events_between(self, start: float, end: float) -> List[dict]:
+        """Events starting in [start, end), by start time, each with its category.
+        A range scan over the events_starts index."""
+        rows = self.conn.execute(
+            'SELECT e.id, e.time, e.event, e.starts, e.uid, c.name FROM events e '
+            'JOIN categories c ON c.id = e.category_id '
+            'WHERE e.starts >= ? AND e.starts < ? ORDER BY e.starts, c.position, e.position', (int(start), int(end))
+        ).fetchall()
+        events = self._event_dicts(row[:5] for row in rows)
+        for event, row in zip(events, rows):
+            event['category'] = row[5]
+        return events
+
+    def channel_events(self, channel_ids: List[str], start: float, end: float) -> List[str]:
+        """Those of channel_ids showing an event that starts in [start, end], soonest first."""
+        rows = self.select_in(
+            'SELECT ec.channel_id, MIN(e.starts) FROM event_channels ec JOIN events e ON e.id = ec.event_id '
+            'WHERE ec.kind = 0 AND e.starts BETWEEN ? AND ? AND ec.channel_id IN ({ids}) '
+            'GROUP BY ec.channel_id', channel_ids, (int(start), int(end))
+        )
+        return [channel_id for channel_id, _ in sorted(rows, key=lambda row: row[1])]
+
+    def schedule(self) -> Dict[str, Dict[str, list]]:
+        schedule = {}
+        for day in self.days():
+            schedule[day] = {category: self.events(day, category) for category in self.categories(day)}
+        return schedule
+
+    def schedule_digest(self) -> str:
+        """Changes whenever any day or category of the schedule does."""
+        rows = self.conn.execute(
+            'SELECT d.title, c.name, c.digest FROM categories c JOIN days d ON d.id = c.day_id '
+            'ORDER BY d.position, c.position'
+        ).fetchall()
+        return hashlib.sha1(json.dumps(rows).encode('utf-8')).hexdigest()
+
+    def programmes(self) -> sqlite3.Cursor:
+        """(channel_id, starts, event, category) rows of every timed event on a
+        24/7 channel, by channel and start time."""
+        return self.conn.execute(
+            'SELECT DISTINCT ec.channel_id, e.starts, e.event, c.name FROM event_channels ec '
+            'JOIN events e ON e.id = ec.event_id JOIN categories c ON c.id = e.category_id '
+            'WHERE ec.kind = 0 AND e.starts IS NOT NULL ORDER BY ec.channel_id, e.starts'
+        )
+
+    def update_channels(self, channels: List[dict], updated: str) -> bool:
+        """Replace the channel list if it differs from the stored one."""
+        digest = hashlib.sha1(json.dumps(channels, sort_keys=True).encode('utf-8')).hexdigest()
+        with self.conn as conn:
+            if digest != self.get_meta('channels_digest'):
+                conn.execute('DELETE FROM channels')
+                conn.executemany(
+                    'INSERT INTO channels (position, title, link, bucket, sort_key, adult, logo) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [channel_row(pos, item['title'], item['link'], item.get('logo')) for pos, item in enumerate(channels)]
+                )
+                search_index.index_channels(conn)
+                conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', ('channels_digest', digest))
+                changed = True
+            else:
+                changed = False
+            conn.execute(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', ('channels_updated', updated)
+            )
+        return changed
+
+    def channels(self, adult: bool=True) -> List[dict]:
+        return [
+            {'title': title, 'link': link}
+            for title, link in self.conn.execute(
+                'SELECT title, link FROM channels WHERE adult <= ? ORDER BY position', (int(adult),)
+            )
+        ]
+
+    def channel_buckets(self, adult: bool=True) -> List[tuple]:
+        """(bucket, channel count) pairs, letters first, then 0-9 and #."""
+        rows = self.conn.execute(
+            'SELECT bucket, COUNT(*) FROM channels WHERE adult <= ? GROUP BY bucket', (int(adult),)
+        ).fetchall()
+        order = {DIGITS_BUCKET: 1, OTHER_BUCKET: 2}
+        return sorted(rows, key=lambda row: (order.get(row[0], 0), row[0]))
+
+    def channel_page(self, bucket: Optional[str], offset: int, limit: int, adult: bool=True) -> List[dict]:
+        """limit channels of bucket by title from offset, or of the whole list
+        in site order when bucket is None. A bucket is read off the
+        channels_bucket index, so its cost follows the bucket's size."""
+        if bucket is None:
+            sql = 'SELECT title, link FROM channels WHERE adult <= ? ORDER BY position LIMIT ? OFFSET ?'
+            params = (int(adult), limit, offset)
+        else:
+            sql = (
+                'SELECT title, link FROM channels WHERE bucket = ? AND adult <= ? '
+                'ORDER BY sort_key LIMIT ? OFFSET ?'
+            )
+            params = (bucket, int(adult), limit, offset)
+        return [{'title': title, 'link': link} for title, link in self.conn.execute(sql, params)]
+
+    def search(self, words: List[str]) -> Dict[str, list]:
+        """Events and channels matching any of words, ranked by the number of
+        words matched and then by start time or catalogue order."""
+        hits = search_index.search(self.conn, words)
+        event_hits = hits[search_index.KIND_EVENT]
+        channel_hits = hits[search_index.KIND_CHANNEL]
+        rows = self.select_in(
+            'SELECT e.id, e.time, e.event, e.starts, e.uid, d.position FROM events e '
+            'JOIN categories c ON c.id = e.category_id JOIN days d ON d.id = c.day_id '
+            'WHERE e.id IN ({ids})', list(event_hits)
+        )
+        rows.sort(key=lambda row: (-event_hits[row[0]], row[5], row[1]))
+        events = self._event_dicts(row[:5] for row in rows)
+        rows = self.select_in(
+            'SELECT position, title, link FROM channels WHERE position IN ({ids})', list(channel_hits)
+        )
+        rows.sort(key=lambda row: (-channel_hits[row[0]], row[0]))
+        channels = [{'title': title, 'link': link} for _, title, link in rows]
+        return {'events': events, 'channels': channels}
+
+    def favourites(self) -> List[list]:
+        return [list(row) for row in self.conn.execute('SELECT title, link FROM favourites ORDER BY position')]
+
+    def favourite_links(self) -> set:
+        return {row[0] for row in self.conn.execute('SELECT link FROM favourites')}
+
+    def add_favourite(self, title: str, link: str):
+        with self.conn as conn:
+            conn.execute(
+                'INSERT OR IGNORE INTO favourites (link, title, position) '
+                'VALUES (?, ?, (SELECT COALESCE(MAX(position), -1) + 1 FROM favourites))', (link, title)
+            )
+
+    def remove_favourite(self, link: str):
+        with self.conn as conn:
+            conn.execute('DELETE FROM favourites WHERE link = ?', (link,))
+
+    def record_health(self, kind: str, key: str, alpha: float, updated: float, failed: bool=False,
+                      latency: Optional[float]=None, ttfs: Optional[float]=None, detail: Optional[str]=None):
+        """Fold one observation into the moving averages of kind/key. Averages
+        given None are left as they are; the first value of one is taken as is."""
+        with self.conn as conn:
+            conn.execute(
+                'INSERT INTO health (kind, key, latency, failure, ttfs, samples, detail, updated) '
+                'VALUES (:kind, :key, :latency, :failure, :ttfs, 1, :detail, :updated) '
+                'ON CONFLICT (kind, key) DO UPDATE SET '
+                'latency = COALESCE(latency + :alpha * (excluded.latency - latency), excluded.latency, latency), '
+                'failure = failure + :alpha * (excluded.failure - failure), '
+                'ttfs = COALESCE(ttfs + :alpha * (excluded.ttfs - ttfs), excluded.ttfs, ttfs), '
+                'samples = samples + 1, detail = COALESCE(excluded.detail, detail), updated = excluded.updated',
+                {'kind': kind, 'key': key, 'alpha': alpha, 'failure': 1.0 if failed else 0.0,
+                 'latency': latency, 'ttfs': ttfs, 'detail': detail, 'updated': updated}
+            )
+
+    def health(self, kind: str) -> Dict[str, dict]:
+        rows = self.conn.execute(
+            'SELECT key, latency, failure, ttfs, samples, detail FROM health WHERE kind = ?', (kind,)
+        )
+        return {
+            key: {'latency': latency, 'failure': failure, 'ttfs': ttfs, 'samples': samples, 'detail': detail}
+            for key, latency, failure, ttfs, samples, detail in rows
+        }
+
+    def channel_logos(self, links: List[str]) -> Dict[str, tuple]:
+        """{link: (logo url, cached file, last used)} for those of links whose
+        channel has a logo url. file is None while the logo is not cached and
+        '' when its download failed at last used."""
+        return {
+            link: (logo, file, used) for link, logo, file, used in self.select_in(
+                'SELECT c.link, c.logo, l.file, l.used FROM channels c LEFT JOIN logos l ON l.url = c.logo '
+                'WHERE c.logo IS NOT NULL AND c.link IN ({ids})', links
+            )
+        }
+
+    def logo_entries(self, urls: List[str]) -> Dict[str, tuple]:
+        """{url: (file, used)} of those of urls in the logo cache. file is ''
+        for a download that failed at used."""
+        return {
+            url: (file, used) for url, file, used in
+            self.select_in('SELECT url, file, used FROM logos WHERE url IN ({ids})', urls)
+        }
+
+    def put_logo(self, url: str, file: str, size: int, used: float):
+        with self.conn as conn:
+            conn.execute('INSERT OR REPLACE INTO logos (url, file, size, used) VALUES (?, ?, ?, ?)', (url, file, size, used))
+
+    def touch_logos(self, files: List[str], used: float):
+        with self.conn as conn:
+            for i in range(0, len(files), MAX_VARIABLES):
+                chunk = files[i:i + MAX_VARIABLES]
+                conn.execute(f"UPDATE logos SET used = ? WHERE file IN ({','.join('?' * len(chunk))})", (used, *chunk))
+
+    def evict_logos(self, max_bytes: int) -> List[str]:
+        """Drop least recently used logos until the rest fit in max_bytes.
+        Returns the files dropped, for the caller to delete."""
+        evicted = []
+        with self.conn as conn:
+            total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM logos').fetchone()[0]
+            if total <= max_bytes:
+                return evicted
+            for url, file, size in conn.execute("SELECT url, file, size FROM logos WHERE file != '' ORDER BY used").fetchall():
+                if total <= max_bytes:
+                    break
+                conn.execute('DELETE FROM logos WHERE url = ?', (url,))
+                evicted.append(file)
+                total -= size
+        return evicted
@@ -0,0 +1,188 @@
+import json
+import math
+import os
+import socket
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+import variables as var
+
+
+_enabled = None
+_local = threading.local()
+_write_lock = threading.Lock()
+_installed = False
+
+
+def enabled() -> bool:
+    """Whether hop tracing is switched on, read once per invocation."""
+    global _enabled
+    if _enabled is None:
+        _enabled = var.get_setting_bool('trace_hops') is True
+        if _enabled:
+            _install()
+    return _enabled
+
+def _timed(attr: str, fn):
+    def wrapper(*args, **kwargs):
+        if not getattr(_local, 'active', False):
+            return fn(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            setattr(_local, attr, getattr(_local, attr, 0.0) + time.perf_counter() - start)
+    return wrapper
+
+def _install():
+    """Time name lookups and new connections made by the thread a hop runs on.
+    Reused keep-alive connections show up with zero dns and connect times."""
+    global _installed
+    if _installed:
+        return
+    from urllib3.util import connection
+    socket.getaddrinfo = _timed('dns', socket.getaddrinfo)
+    connection.create_connection = _timed('connect', connection.create_connection)
+    _installed = True
+
+
+class Hop:
+    __slots__ = ('url', 'stage', 'fallback', 'started')
+
+    def __init__(self, url: str, stage: str, fallback: bool):
+        self.url = url
+        self.stage = stage
+        self.fallback = fallback
+        self.started = time.perf_counter()
+
+
+def start(url: str, stage: str='', fallback: bool=False) -> Optional[Hop]:
+    if not enabled():
+        return None
+    _local.active = True
+    _local.dns = _local.connect = 0.0
+    return Hop(url, stage or 'other', fallback)
+
+def finish(hop: Optional[Hop], response=None, error: Exception=None, stream: bool=False):
+    """Record a hop started with start(). Streamed bodies are not read yet, so
+    their size comes from Content-Length and total stops at the headers."""
+    if hop is None:
+        return
+    total = time.perf_counter() - hop.started
+    dns = getattr(_local, 'dns', 0.0)
+    connect = max(0.0, getattr(_local, 'connect', 0.0) - dns)
+    _local.active = False
+    entry = {
+        'ts': round(time.time(), 3),
+        'stage': hop.stage,
+        'host': urlparse(hop.url).netloc,
+        'fallback': hop.fallback,
+        'dns': round(dns, 4),
+        'connect': round(connect, 4),
+        'total': round(total, 4)
+    }
+    if response is not None:
+        entry['status'] = response.status_code
+        entry['ttfb'] = round(response.elapsed.total_seconds(), 4)
+        if stream:
+            entry['bytes'] = int(response.headers.get('Content-Length') or 0) or None
+        else:
+            entry['bytes'] = len(response.content)
+    else:
+        entry['status'] = type(error).__name__ if error is not None else None
+    write(entry)
+
+def span(stage: str, url: str, elapsed: float, outcome: str):
+    """Record a whole stage, such as a full resolve, next to its hops."""
+    if enabled():
+        write({
+            'ts': round(time.time(), 3),
+            'stage': stage,
+            'host': urlparse(url).netloc,
+            'fallback': False,
+            'status': outcome,
+            'total': round(elapsed, 4)
+        })
+
+def write(entry: dict):
+    line = json.dumps(entry) + '\n'
+    with _write_lock:
+        try:
+            if os.path.getsize(var.metrics_path) + len(line) > var.metrics_max_bytes:
+                os.replace(var.metrics_path, f'{var.metrics_path}.1')
+        except OSError:
+            pass
+        try:
+            with open(var.metrics_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+        except OSError:
+            pass
+
+def read_entries() -> List[dict]:
+    entries = []
+    for path in (f'{var.metrics_path}.1', var.metrics_path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            continue
+    return entries
+
+def clear():
+    for path in (f'{var.metrics_path}.1', var.metrics_path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+def _succeeded(status) -> bool:
+    return status == 'ok' or (isinstance(status, int) and status < 400)
+
+def _rows(groups: Dict[str, List[dict]]) -> List[str]:
+    rows = []
+    for name, entries in sorted(groups.items()):
+        totals = [e['total'] for e in entries]
+        ttfbs = [e['ttfb'] for e in entries if e.get('ttfb') is not None]
+        connects = [e['dns'] + e['connect'] for e in entries if 'dns' in e]
+        failed = sum(1 for e in entries if not _succeeded(e.get('status')))
+        row = (
+            f'{name}: n={len(entries)} total p50 {percentile(totals, 50) * 1000:.0f} ms'
+            f' p95 {percentile(totals, 95) * 1000:.0f} ms'
+        )
+        if ttfbs:
+            row += f', ttfb p50 {percentile(ttfbs, 50) * 1000:.0f} ms p95 {percentile(ttfbs, 95) * 1000:.0f} ms'
+        if any(connects):
+            row += f', dns+connect p50 {percentile(connects, 50) * 1000:.0f} ms p95 {percentile(connects, 95) * 1000:.0f} ms'
+        if failed:
+            row += f', {failed} failed'
+        rows.append(row)
+    return rows
+
+def summary() -> str:
+    """p50/p95 per stage and per host over the recorded hops."""
+    entries = read_entries()
+    if not entries:
+        return 'No hops recorded yet. Enable hop tracing in the settings and play a few channels.'
+    by_stage = defaultdict(list)
+    by_host = defaultdict(list)
+    for entry in entries:
+        stage = f"{entry['stage']} (http fallback)" if entry.get('fallback') else entry['stage']
+        by_stage[stage].append(entry)
+        if 'dns' in entry:
+            by_host[entry['host']].append(entry)
+    lines = [f'{len(entries)} hops recorded', '', '[B]Per stage[/B]']
+    lines.extend(_rows(by_stage))
+    lines.extend(['', '[B]Per host[/B]'])
+    lines.extend(_rows(by_host))
+    return '\n'.join(lines)
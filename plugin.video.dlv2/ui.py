@@ -0,0 +1,94 @@
+from typing import Iterable, Tuple, Union
+import xbmc
+import xbmcgui
+import xbmcplugin
+import variables as var
+from models import Item
+
+
+INFO_SETTERS = (
+    ('tagline', 'setTagLine'),
+    ('premiered', 'setPremiered'),
+    ('genre', 'setGenres'),
+    ('mpaa', 'setMpaa'),
+    ('director', 'setDirectors'),
+    ('writer', 'setWriters'),
+    ('rating', 'setRating'),
+    ('votes', 'setVotes'),
+    ('studio', 'setStudios'),
+    ('country', 'setCountries'),
+    ('set', 'setSet'),
+    ('status', 'setTvShowStatus'),
+    ('duration', 'setDuration'),
+    ('trailer', 'setTrailer')
+)
+
+
+def log(message: str, level: int=xbmc.LOGINFO):
+    return xbmc.log(str(message), level)
+
+def container_refresh():
+    xbmc.executebuiltin('Container.Refresh')
+
+def set_info(liz: xbmcgui.ListItem, infolabels: dict, cast: list=None):
+    """Set media type, title and plot, plus only those other labels that have a value;
+    a new ListItem already holds the empty defaults."""
+    i = liz.getVideoInfoTag()
+    i.setMediaType(infolabels.get("mediatype", "video"))
+    i.setTitle(infolabels.get("title", "Unknown"))
+    i.setPlot(infolabels.get("plot", infolabels.get("title", "")))
+    for key, setter in INFO_SETTERS:
+        if value := infolabels.get(key):
+            getattr(i, setter)(value)
+    if cast:
+        i.setCast([
+            xbmc.Actor(
+                name=actor.get("name", ""),
+                role=actor.get("role", ""),
+                thumbnail=actor.get("thumbnail", "")
+            ) for actor in cast
+        ])
+
+def build_listitem(item: Union[Item, dict]) -> Tuple[str, xbmcgui.ListItem, bool]:
+    """(url, ListItem, is_folder) as taken by xbmcplugin.addDirectoryItems."""
+    if isinstance(item, dict):
+        item = Item(**item)
+    is_folder = item.type == 'dir'
+    title = item.title
+    thumbnail = item.thumbnail
+    list_item = xbmcgui.ListItem(label=title, offscreen=True)
+    list_item.setArt({'thumb': thumbnail, 'icon': thumbnail, 'poster': thumbnail, 'fanart': item.fanart})
+    set_info(list_item, {'title': title})
+    if is_folder is False and item.is_media is True and item.is_search is False:
+        list_item.setProperty('IsPlayable', 'true')
+    if item.contextmenu:
+        list_item.addContextMenuItems(item.contextmenu)
+    return f'{var.plugin_url}?{item.url_encode()}', list_item, is_folder
+
+def create_listitem(item: Union[Item, dict]):
+    xbmcplugin.addDirectoryItem(var.handle, *build_listitem(item))
+
+def render_items(items: Iterable[Union[Item, dict]]):
+    """Build every ListItem first and hand them to Kodi in one call."""
+    listing = [build_listitem(item) for item in items]
+    xbmcplugin.addDirectoryItems(var.handle, listing, len(listing))
+
+def ok_dialog(text: str):
+    xbmcgui.Dialog().ok(var.addon_name, text)
+
+def text_dialog(heading: str, text: str):
+    xbmcgui.Dialog().textviewer(f'{var.addon_name} - {heading}', text)
+
+def get_multilink(lists):
+    if len(lists) == 1:
+        return lists[1]
+    elif not lists:
+        var.notify_dialog(var.addon_name, 'No links were found.')
+        var.system_exit()
+        
+    labels = [l[0] for l in lists]
+    links = [l[1] for l in lists]
+    ret = xbmcgui.Dialog().select('Choose a Link', labels)
+    if ret == -1:
+        var.system_exit()
+    return links[ret]
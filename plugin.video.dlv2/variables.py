@@ -1,29 +1,17 @@
 import sys
 import os
-from urllib3.util import SKIP_HEADER
 import xbmc
 import xbmcaddon
 import xbmcplugin
 import xbmcgui
 import xbmcvfs
+# Site urls and headers live in core.site so the core runs without Kodi.
+from core.site import (
+    base_url, base_url_old, schedule_url, schedule_url_old, schedule_url_old2, channels_url, channels_url_old,
+    user_agent, headers, host_timeouts
+)
 
 
-base_url = 'https://dlhd.dad'
-base_url_old = 'https://daddylivestream.com'
-schedule_url = f'{base_url}/index.php'
-schedule_url_old = f'{base_url_old}/schedule/schedule-generated.json'
-schedule_url_old2 = f'{base_url}/schedule/schedule-generated.php'
-channels_url = f'{base_url}/24-7-channels.php'
-channels_url_old = f'{base_url_old}/24-7-channels.php'
-
-user_agent = 'Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Mobile Safari/537.36'
-headers = {
-    "User-Agent": user_agent,
-    "Referer": f'{base_url}/',
-    "Origin": f'{base_url}/'
-}
-skip_headers = {"Accept-Encoding": SKIP_HEADER}
-
 try:
     handle = int(sys.argv[1])
 except IndexError:
@@ -39,15 +27,92 @@ addon_icon = addon.getAddonInfo('icon')
 addon_fanart = addon.getAddonInfo('fanart')
 get_setting = addon.getSetting
 get_setting_bool = addon.getSettingBool
+get_setting_int = addon.getSettingInt
 end_directory = xbmcplugin.endOfDirectory
 
 
+db_path = os.path.join(profile_path, 'dlv2.db')
 schedule_path = os.path.join(profile_path, 'schedule.json')
-cat_schedule_path = os.path.join(profile_path, 'cat_schedule.json')
 fav_path = os.path.join(temp_path, 'favourites.json')
 fav_old_path = os.path.join(profile_path, 'favourites.json')
 ch_path = os.path.join(profile_path, 'channels.json')
 ch_bak_path = os.path.join(addon_path, 'resources', 'channels.json')
+resolve_cache_path = os.path.join(profile_path, 'resolved.json')
+refresh_lock_path = os.path.join(profile_path, 'refresh.lock')
+logo_queue_lock_path = os.path.join(profile_path, 'logos_queue.lock')
+logo_fetch_lock_path = os.path.join(profile_path, 'logos_fetch.lock')
+metrics_path = os.path.join(profile_path, 'metrics.jsonl')
+metrics_max_bytes = 1048576
+logo_path = os.path.join(profile_path, 'logos')
+refresh_lock_ttl = 300
+schedule_ttl = 1800
+channels_ttl = 43200
+refresh_retry = 300
+service_min_interval = 900
+service_max_interval = 14400
+service_dense_window = 7200
+service_dense_events = 10
+service_backoff_base = 60
+service_backoff_cap = 1800
+prefetch_interval = 300
+prefetch_workers = 2
+prefetch_rate = 1.0
+prefetch_min_ttl = 600
+prefetch_grace = 900
+prefetch_category_events = 3
+token_ttl = 3600
+resolve_ttl = 600
+playback_timeout = 30
+race_timeout = 45
+api_timeout = (3.05, 60)
+link_check_workers = 4
+link_check_players = 2
+link_check_timeout = (3.05, 5)
+link_check_settle = 0.3
+health_alpha = 0.3
+health_failure_penalty = 20
+health_untested = 6
+hedge_delay = 3.0
+hedge_min_delay = 0.5
+hedge_max_delay = 6.0
+hedge_samples = 20
+hedge_min_samples = 5
+hedge_preference_ttl = 3600
+export_m3u_name = 'dlv2.m3u'
+export_xmltv_name = 'dlv2.xml'
+export_programme_length = 7200
+logo_size = 256
+logo_cache_bytes = 32 * 1024 * 1024
+logo_workers = 4
+logo_timeout = (3.05, 10)
+logo_retry = 86400
+logo_touch_interval = 86400
+logo_request_interval = 60
+logo_queue_lock_ttl = 10
+logo_queue_wait = 1
+logo_fetch_lock_ttl = 600
+live_window = 10800
+relay_timeout = (3.05, 10)
+relay_workers = 4
+relay_buffer_segments = 16
+relay_buffer_bytes = 64 * 1024 * 1024
+relay_resolve_interval = 30
+relay_refresh_margin = 120
+relay_idle = 120
+relay_known_urls = 1024
+startup_budgets = {
+    None: 0.25,
+    'channels': 0.25,
+    'channel_page': 0.25,
+    'categories': 0.25,
+    'matches': 0.25,
+    'favourites': 0.25,
+    'add_fav': 0.25,
+    'remove_fav': 0.25,
+    'search': 0.5,
+    'live': 0.25,
+    'upcoming': 0.25
+}
 set_content = xbmcplugin.setContent
 set_category = xbmcplugin.setPluginCategory
 set_resolved_url = xbmcplugin.setResolvedUrl